@@ -0,0 +1,199 @@
+"""ベンチマーク用の合成Pythonコーパスの生成。
+
+ファイル数・1ファイルあたりの関数数・制御フローのネストの深さ・分岐の
+密度を指定して、構文的に正しいPythonモジュールを生成します。乱数は
+シードとファイルの番号から決まるため、同じ指定からは常に同じ内容の
+コーパスが生成されます。
+
+Usage:
+    python benchmarks/corpus.py OUT_DIR [--files 50] [--functions 20]
+        [--depth 3] [--branch-density 0.5] [--seed 0]
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import NamedTuple
+
+# 1ディレクトリあたりのファイル数(走査のベンチマークでディレクトリの階層も辿らせる)
+FILES_PER_PACKAGE = 25
+# 関数の本体を構成するブロックの数
+_BLOCKS_PER_FUNCTION = 3
+
+_CONDITIONS = (
+    "{x} > {n}",
+    "{x} % {n} == 0",
+    "{x} is None",
+    "not {x}",
+    "{x} in items",
+    "{x} > {n} and {x} < {m}",
+    "{x} == {n} or {x} == {m} or flag",
+)
+_SIMPLE_STATEMENTS = (
+    "{x} = {x} + {n}",
+    "items.append({x})",
+    "total += {x} * {n}",
+    "result = [{x} * k for k in range({n}) if k % 2]",
+    "value = {x} if flag else {n}",
+    "log.append(str({x}))",
+)
+
+
+class CorpusSpec(NamedTuple):
+    """生成するコーパスの形。"""
+
+    files: int = 50
+    functions: int = 20
+    depth: int = 3
+    branch_density: float = 0.5
+    seed: int = 0
+
+
+class _ModuleWriter:
+    """1つのモジュールのソースコードを組み立てます。"""
+
+    def __init__(self, rng: random.Random, spec: CorpusSpec) -> None:
+        self.rng = rng
+        self.spec = spec
+        self.lines: list[str] = []
+
+    def emit(self, indent: int, text: str) -> None:
+        self.lines.append("    " * indent + text)
+
+    def fill(self, template: str) -> str:
+        """テンプレートの変数と定数を埋めます。"""
+        n = self.rng.randint(1, 9)
+        return template.format(x=self.rng.choice("abxy"), n=n, m=n + 5)
+
+    def function(self, name: str, indent: int = 0) -> None:
+        """関数を1つ出力します。"""
+        self.emit(indent, f"def {name}(a, b=None, *items, flag=False, **options):")
+        self.emit(indent + 1, "x = y = total = 0")
+        self.emit(indent + 1, "log = []")
+        for _ in range(_BLOCKS_PER_FUNCTION):
+            self.block(indent + 1, self.spec.depth)
+        self.emit(indent + 1, "return total")
+        self.emit(0, "")
+
+    def block(self, indent: int, depth: int) -> None:
+        """単純な文を出力し、分岐の密度の確率で制御フローを1つ挟みます。
+
+        制御フローは1ブロックに高々1つなので、深さを増やしても
+        ファイルの大きさは指数的には増えません。
+        """
+        self.simple(indent)
+        if depth > 0 and self.rng.random() < self.spec.branch_density:
+            self.branch(indent, depth - 1)
+            self.simple(indent)
+
+    def simple(self, indent: int) -> None:
+        """単純な文を1〜2個出力します。"""
+        for _ in range(self.rng.randint(1, 2)):
+            self.emit(indent, self.fill(self.rng.choice(_SIMPLE_STATEMENTS)))
+
+    def branch(self, indent: int, depth: int) -> None:
+        """制御フローの文を1つ、ネストした本体と共に出力します。"""
+        kind = self.rng.choice(("if", "if", "for", "while", "try", "with"))
+        if kind == "if":
+            self.emit(indent, f"if {self.fill(self.rng.choice(_CONDITIONS))}:")
+            self.block(indent + 1, depth)
+            if self.rng.random() < 0.5:
+                self.emit(indent, f"elif {self.fill(self.rng.choice(_CONDITIONS))}:")
+                self.block(indent + 1, depth)
+            if self.rng.random() < 0.5:
+                self.emit(indent, "else:")
+                self.block(indent + 1, depth)
+        elif kind == "for":
+            self.emit(indent, f"for {self.rng.choice('ijk')} in items:")
+            self.block(indent + 1, depth)
+        elif kind == "while":
+            self.emit(indent, f"while {self.fill(self.rng.choice(_CONDITIONS))}:")
+            self.block(indent + 1, depth)
+            self.emit(indent + 1, "break")
+        elif kind == "try":
+            self.emit(indent, "try:")
+            self.block(indent + 1, depth)
+            self.emit(indent, "except (ValueError, KeyError):")
+            self.block(indent + 1, depth)
+        else:
+            self.emit(indent, "with open(str(a)) as handle:")
+            self.block(indent + 1, depth)
+
+    def module(self, index: int) -> str:
+        """関数とクラスのメソッドからなるモジュールを返します。"""
+        self.emit(0, f'"""Synthetic module {index}."""')
+        self.emit(0, "")
+        for number in range(self.spec.functions):
+            if number % 5 == 4:
+                # 5つに1つはクラスのメソッドにする
+                self.emit(0, f"class Handler{number}:")
+                self.function(f"handle_{number}", indent=1)
+            else:
+                self.function(f"function_{number}")
+        return "\n".join(self.lines) + "\n"
+
+
+def generate_module(spec: CorpusSpec, index: int) -> str:
+    """コーパスのindex番目のモジュールのソースコードを返します。"""
+    # 再現性のための乱数であり、暗号用途ではない
+    rng = random.Random(f"{spec.seed}:{index}")  # noqa: S311
+    return _ModuleWriter(rng, spec).module(index)
+
+
+def module_path(root: Path, index: int) -> Path:
+    """コーパスのindex番目のモジュールのパスを返します。"""
+    package = root / f"package_{index // FILES_PER_PACKAGE:03d}"
+    return package / f"module_{index:05d}.py"
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> list[Path]:
+    """コーパスをディレクトリに書き出します。
+
+    Args:
+        root: 書き出し先のディレクトリ
+        spec: コーパスの形
+
+    Returns:
+        書き出したファイルのパス(番号順)
+
+    """
+    paths = []
+    for index in range(spec.files):
+        path = module_path(root, index)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate_module(spec, index), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """コーパスの形を指定する引数を追加します。"""
+    defaults = CorpusSpec()
+    parser.add_argument("--files", type=int, default=defaults.files)
+    parser.add_argument("--functions", type=int, default=defaults.functions)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--branch-density", type=float, default=defaults.branch_density)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def spec_from_arguments(args: argparse.Namespace) -> CorpusSpec:
+    """解析済みの引数からコーパスの形を作ります。"""
+    return CorpusSpec(
+        args.files, args.functions, args.depth, args.branch_density, args.seed
+    )
+
+
+def main() -> None:
+    """コーパスを生成して、ファイル数と行数を表示します。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.out_dir, spec_from_arguments(args))
+    lines = sum(path.read_text(encoding="utf-8").count("\n") for path in paths)
+    print(f"{len(paths)} files, {lines} lines in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""ネストした関数の深さに対する解析時間のベンチマーク。
+
+深くネストしたクロージャ(デコレーターファクトリーなど)を生成し、
+組み込みエンジンとライブラリエンジンの解析時間を比較します。
+組み込みエンジンは内側の関数のスコアを外側の関数の計算に再利用するため、
+深さに対して線形に増加します。
+
+Usage:
+    python benchmarks/nesting.py [--depths 10,20,40,80] [--repeat 5]
+"""
+
+import argparse
+import math
+import time
+
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.infrastructure.calculators.concrete_calculators import (
+    ComplexityCalculatorFactory,
+)
+
+# Pythonのトークナイザーはインデントの深さを100未満に制限している
+MAX_DEPTH = 99
+DEFAULT_DEPTHS = "10,20,40,80"
+ENGINES = ("builtin", "library")
+
+
+def generate_nested_source(depth: int, statements_per_level: int = 3) -> str:
+    """指定した深さまで関数がネストしたソースコードを生成します。
+
+    Args:
+        depth: 関数のネストの深さ
+        statements_per_level: 各関数の本体に置く分岐の数
+
+    Returns:
+        Pythonソースコード
+
+    """
+    lines = []
+    for level in range(depth):
+        indent = "    " * level
+        lines.append(f"{indent}def level_{level}(x):")
+        for index in range(statements_per_level):
+            lines.append(f"{indent}    if x > {index} and x != {level}:")
+            lines.append(f"{indent}        x -= 1")
+    lines.append("    " * depth + "return x")
+    return "\n".join(lines) + "\n"
+
+
+def measure(engine: str, source: str, repeat: int) -> float:
+    """ソースコードの解析にかかる最短時間(秒)を計測します。"""
+    cyclomatic, cognitive = ComplexityCalculatorFactory.create_calculators(engine)
+    analyzer = ComplexityAnalyzer(cyclomatic, cognitive)
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analyzer._analyze_source("nested.py", source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scaling_exponent(depths: list[int], timings: list[float]) -> float:
+    """最小の深さと最大の深さの計測値から増加の次数を推定します。"""
+    return math.log(timings[-1] / timings[0]) / math.log(depths[-1] / depths[0])
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示します。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depths", default=DEFAULT_DEPTHS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    depths = sorted(int(value) for value in args.depths.split(","))
+    if depths[-1] > MAX_DEPTH:
+        parser.error(f"depth must be <= {MAX_DEPTH}")
+
+    timings: dict[str, list[float]] = {engine: [] for engine in ENGINES}
+    print(f"{'depth':>6} " + " ".join(f"{engine:>12}" for engine in ENGINES))
+    for depth in depths:
+        source = generate_nested_source(depth)
+        row = []
+        for engine in ENGINES:
+            elapsed = measure(engine, source, args.repeat)
+            timings[engine].append(elapsed)
+            row.append(f"{elapsed * 1000:>10.2f}ms")
+        print(f"{depth:>6} " + " ".join(row))
+
+    if len(depths) > 1:
+        for engine in ENGINES:
+            exponent = scaling_exponent(depths, timings[engine])
+            print(f"{engine}: time ~ depth^{exponent:.2f}")
+
+
+if __name__ == "__main__":
+    main()
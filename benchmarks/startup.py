@@ -0,0 +1,102 @@
+"""CLI起動時のインポート時間のベンチマーク。
+
+``python -X importtime`` で各シナリオを別プロセスとして実行し、
+トップレベルのインポートの累積時間の合計(最短値)と読み込まれた
+モジュール数を表示します。``--top`` を指定すると、最後の実行で
+累積時間が大きかったモジュールも表示します。
+
+Usage:
+    python benchmarks/startup.py [--repeat 5] [--top 10]
+"""
+
+import argparse
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+SINGLE_FILE_SOURCE = "def func(x):\n    if x:\n        return 1\n    return 0\n"
+
+
+class ImportProfile(NamedTuple):
+    """1回の実行のインポート時間の集計。"""
+
+    total_us: int
+    module_count: int
+    cumulative: list[tuple[int, str]]
+
+
+def scenarios(single_file: Path) -> dict[str, list[str]]:
+    """シナリオ名とcccyに渡す引数の対応を返します。"""
+    return {
+        "--help": ["--help"],
+        "check (1 file)": ["check", "--max-complexity", "10", str(single_file)],
+        "show-list (1 file)": ["show-list", str(single_file)],
+    }
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """``-X importtime`` の出力を集計します。
+
+    Args:
+        stderr: ``import time: self | cumulative | name`` 形式の行を含む標準エラー出力
+
+    Returns:
+        トップレベルのインポートの累積時間の合計(マイクロ秒)などの集計
+
+    """
+    total = 0
+    cumulative: list[tuple[int, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        cumulative.append((int(cumulative_us), name.strip()))
+        # 字下げされていないモジュールは、他のモジュールから読み込まれていない
+        if not name[1:].startswith(" "):
+            total += int(cumulative_us)
+    return ImportProfile(total, len(cumulative), sorted(cumulative, reverse=True))
+
+
+def profile(args: list[str]) -> ImportProfile:
+    """cccyのCLIを ``-X importtime`` 付きで1回実行します。"""
+    code = "from cccy.presentation.cli.main import main; main()"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return parse_importtime(completed.stderr)
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示します。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        single_file = Path(tmpdir) / "module.py"
+        single_file.write_text(SINGLE_FILE_SOURCE)
+
+        print(f"{'scenario':<20} {'imports':>10} {'modules':>8}")
+        for name, cli_args in scenarios(single_file).items():
+            best = math.inf
+            last = None
+            for _ in range(args.repeat):
+                last = profile(cli_args)
+                best = min(best, last.total_us)
+            assert last is not None
+            print(f"{name:<20} {best / 1000:>8.1f}ms {last.module_count:>8}")
+            for cumulative_us, module in last.cumulative[: args.top]:
+                print(f"    {cumulative_us / 1000:>8.1f}ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""解析の各段階とCLIのベンチマークスイート。
+
+合成コーパス(``corpus.py``)を生成し、ファイルの走査・構文解析・
+各カルキュレーター・ソースコードの解析・``OutputFormatter`` の各メソッド・
+CLIの実行(別プロセス)の時間を計測します。``--output`` で結果をJSONとして
+保存し、``--baseline`` で保存した結果と最短時間を比較します。比較では
+``--threshold`` を超えて遅くなったベンチマークがあれば終了コード1で
+終了します。
+
+Usage:
+    python benchmarks/suite.py [--repeat 5] [--filter 'format/*']
+        [--output results.json] [--baseline baseline.json] [--threshold 0.1]
+        [--files 50] [--functions 20] [--depth 3] [--branch-density 0.5]
+"""
+
+import argparse
+import ast
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from corpus import CorpusSpec, add_spec_arguments, generate_corpus, spec_from_arguments
+
+from cccy import get_version
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.interfaces.calculators import ComplexityCalculator
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.file_walker import PythonFileWalker
+from cccy.infrastructure.calculators.concrete_calculators import (
+    CognitiveComplexityCalculator,
+    ComplexityCalculatorFactory,
+    CyclomaticComplexityCalculator,
+)
+from cccy.infrastructure.calculators.fused_calculator import (
+    FunctionNode,
+    FusedComplexityCalculator,
+)
+from cccy.infrastructure.formatters.output import OutputFormatter
+
+# 結果のJSONの形式の版。形式を変えたら増やす
+SCHEMA_VERSION = 1
+ENGINES = ("builtin", "library")
+# CLIのシナリオ名とcccyに渡す引数。コーパスのディレクトリはこの後に続く
+CLI_SCENARIOS = {
+    "check": ["check", "--max-complexity", "1000", "--max-cognitive", "1000"],
+    "check-jobs": ["check", "--max-complexity", "1000", "--jobs", "auto"],
+    "show-list-json": ["show-list", "--format", "json"],
+    "show-functions-csv": ["show-functions", "--format", "csv"],
+    "show-summary": ["show-summary"],
+}
+
+
+class Benchmark(NamedTuple):
+    """計測する処理。"""
+
+    name: str
+    run: Callable[[], object]
+
+
+class Corpus(NamedTuple):
+    """生成したコーパスと、各段階の入力として前もって用意したデータ。"""
+
+    root: Path
+    sources: dict[str, str]
+    functions: list[FunctionNode]
+    results: list[FileComplexityResult]
+
+
+def load_corpus(root: Path, spec: CorpusSpec) -> Corpus:
+    """コーパスを生成し、ソースコード・構文木・解析結果を読み込みます。"""
+    paths = generate_corpus(root, spec)
+    sources = {str(path): path.read_text(encoding="utf-8") for path in paths}
+    trees = [ast.parse(source) for source in sources.values()]
+    functions = [
+        node
+        for tree in trees
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    analyzer = _create_analyzer("builtin")
+    results = []
+    for path, source in sources.items():
+        record = analyzer._analyze_source(path, source)
+        if record is not None:
+            results.append(record.to_result())
+    return Corpus(root, sources, functions, results)
+
+
+def _create_analyzer(engine: str) -> ComplexityAnalyzer:
+    cyclomatic, cognitive = ComplexityCalculatorFactory.create_calculators(engine)
+    return ComplexityAnalyzer(cyclomatic, cognitive)
+
+
+def _discover(root: Path) -> object:
+    return list(PythonFileWalker().walk(root))
+
+
+def _parse(corpus: Corpus) -> object:
+    return [ast.parse(source) for source in corpus.sources.values()]
+
+
+def _run_fused(corpus: Corpus) -> object:
+    # メモを持つため、計測ごとに新しいエンジンを使う
+    engine = FusedComplexityCalculator()
+    return [engine.calculate(node) for node in corpus.functions]
+
+
+def _run_calculator(calculator: ComplexityCalculator, corpus: Corpus) -> object:
+    return [calculator.calculate(node) for node in corpus.functions]
+
+
+def _analyze_sources(engine: str, corpus: Corpus) -> object:
+    analyzer = _create_analyzer(engine)
+    return [
+        analyzer._analyze_source(path, source)
+        for path, source in corpus.sources.items()
+    ]
+
+
+def _format(method: Callable[[list[FileComplexityResult]], Any], corpus: Corpus) -> str:
+    output = method(corpus.results)
+    # iter_* のメソッドは行を順に返すため、すべて取り出して計測する
+    return output if isinstance(output, str) else "\n".join(output)
+
+
+def _run_cli(args: list[str], corpus: Corpus) -> object:
+    code = "from cccy.presentation.cli.entry import run; run()"
+    completed = subprocess.run(
+        [sys.executable, "-c", code, *args, "--no-cache", str(corpus.root)],
+        capture_output=True,
+        check=False,
+        # リポジトリの設定ファイルを読み込まないよう、コーパスの中で実行する
+        cwd=corpus.root,
+        env={**os.environ, "CCCY_NO_DAEMON": "1"},
+    )
+    if completed.returncode not in (0, 1):
+        raise RuntimeError(completed.stderr.decode(errors="replace"))
+    return completed
+
+
+def formatter_methods() -> dict[str, Callable[[list[FileComplexityResult]], Any]]:
+    """``OutputFormatter`` の公開メソッドを名前順に返します。"""
+    return {
+        name: getattr(OutputFormatter, name)
+        for name in sorted(vars(OutputFormatter))
+        if not name.startswith("_")
+    }
+
+
+def benchmarks(corpus: Corpus) -> list[Benchmark]:
+    """すべてのベンチマークを返します。"""
+    cases = [
+        Benchmark("discovery", partial(_discover, corpus.root)),
+        Benchmark("parse", partial(_parse, corpus)),
+        Benchmark("calculator/fused", partial(_run_fused, corpus)),
+        Benchmark(
+            "calculator/mccabe",
+            partial(_run_calculator, CyclomaticComplexityCalculator(), corpus),
+        ),
+        Benchmark(
+            "calculator/cognitive_complexity",
+            partial(_run_calculator, CognitiveComplexityCalculator(), corpus),
+        ),
+    ]
+    cases.extend(
+        Benchmark(f"analyze/{engine}", partial(_analyze_sources, engine, corpus))
+        for engine in ENGINES
+    )
+    cases.extend(
+        Benchmark(f"format/{name}", partial(_format, method, corpus))
+        for name, method in formatter_methods().items()
+    )
+    cases.extend(
+        Benchmark(f"cli/{name}", partial(_run_cli, args, corpus))
+        for name, args in CLI_SCENARIOS.items()
+    )
+    return cases
+
+
+def measure(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """ベンチマークを繰り返し実行し、最短時間と中央値(秒)を返します。
+
+    ``timeit`` と同様に、計測中はガベージコレクションを止めます。前もって
+    用意した構文木などの多数のオブジェクトの走査が計測に混ざるのを防ぐためです。
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            benchmark.run()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "repeat": repeat,
+    }
+
+
+def environment() -> dict[str, Any]:
+    """結果の比較の参考になる実行環境の情報を返します。"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "cccy": get_version(),
+    }
+
+
+def corpus_summary(spec: CorpusSpec, corpus: Corpus) -> dict[str, Any]:
+    """コーパスの形と大きさを返します。"""
+    return {
+        **spec._asdict(),
+        "lines": sum(source.count("\n") for source in corpus.sources.values()),
+        "bytes": sum(len(source.encode()) for source in corpus.sources.values()),
+        "function_count": len(corpus.functions),
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """結果を基準と比較し、最短時間が閾値を超えて遅くなったものを返します。
+
+    Args:
+        current: 今回の結果
+        baseline: 基準の結果
+        threshold: 許容する遅延の割合(0.1なら10%まで)
+
+    Returns:
+        遅くなったベンチマークの名前のリスト
+
+    """
+    regressions = []
+    print(f"{'benchmark':<40} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, result in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            print(f"{name:<40} {'-':>10} {result['min'] * 1000:>8.2f}ms {'new':>7}")
+            continue
+        ratio = result["min"] / before["min"]
+        marker = " !" if ratio > 1 + threshold else ""
+        print(
+            f"{name:<40} {before['min'] * 1000:>8.2f}ms "
+            f"{result['min'] * 1000:>8.2f}ms {ratio:>6.2f}x{marker}"
+        )
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def check_comparable(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """基準の結果と比較できるか確認し、できなければ終了します。"""
+    if baseline.get("schema") != SCHEMA_VERSION:
+        sys.exit(f"baseline schema {baseline.get('schema')} is not {SCHEMA_VERSION}")
+    spec_fields = CorpusSpec._fields
+    if any(
+        current["corpus"][key] != baseline["corpus"].get(key) for key in spec_fields
+    ):
+        sys.exit("baseline was measured with a different corpus; regenerate it")
+
+
+def main() -> None:
+    """ベンチマークを実行して結果を表示します。"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--filter", action="append", default=[], help="fnmatch pattern of names"
+    )
+    parser.add_argument("--list", action="store_true", help="list benchmark names")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+
+    spec = spec_from_arguments(args)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        corpus = load_corpus(Path(tmpdir).resolve(), spec)
+        selected = [
+            benchmark
+            for benchmark in benchmarks(corpus)
+            if not args.filter
+            or any(fnmatch.fnmatch(benchmark.name, pattern) for pattern in args.filter)
+        ]
+        if args.list:
+            print("\n".join(benchmark.name for benchmark in selected))
+            return
+
+        report: dict[str, Any] = {
+            "schema": SCHEMA_VERSION,
+            "environment": environment(),
+            "corpus": corpus_summary(spec, corpus),
+            "benchmarks": {},
+        }
+        if baseline is not None:
+            check_comparable(report, baseline)
+        print(f"{'benchmark':<40} {'min':>10} {'median':>10}")
+        for benchmark in selected:
+            result = measure(benchmark, args.repeat)
+            report["benchmarks"][benchmark.name] = result
+            print(
+                f"{benchmark.name:<40} {result['min'] * 1000:>8.2f}ms "
+                f"{result['median'] * 1000:>8.2f}ms"
+            )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if baseline is not None:
+        print()
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,76 @@
 """Python complexity measurement tool."""
 
-import importlib.metadata
-
-# Public API exports
-from cccy.application.services.analysis_service import AnalyzerService
-from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
-from cccy.domain.exceptions.complexity_exceptions import (
-    AnalysisError,
-    CccyError,
-    ComplexityCalculationError,
-    ConfigurationError,
-    DirectoryAnalysisError,
-    FileAnalysisError,
-)
-from cccy.domain.interfaces.calculators import ComplexityCalculator
-from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
-from cccy.infrastructure.calculators.concrete_calculators import (
-    CognitiveComplexityCalculator,
-    ComplexityCalculatorFactory,
-    CyclomaticComplexityCalculator,
-)
-from cccy.infrastructure.config.manager import CccyConfig
-from cccy.infrastructure.formatters.output import OutputFormatter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cccy.application.services.analysis_service import AnalyzerService
+    from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
+    from cccy.domain.exceptions.complexity_exceptions import (
+        AnalysisError,
+        CccyError,
+        ComplexityCalculationError,
+        ConfigurationError,
+        DirectoryAnalysisError,
+        FileAnalysisError,
+        VersionControlError,
+    )
+    from cccy.domain.interfaces.calculators import ComplexityCalculator
+    from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+    from cccy.infrastructure.calculators.concrete_calculators import (
+        CognitiveComplexityCalculator,
+        ComplexityCalculatorFactory,
+        CyclomaticComplexityCalculator,
+    )
+    from cccy.infrastructure.calculators.fused_calculator import (
+        FusedComplexityCalculator,
+    )
+    from cccy.infrastructure.config.manager import CccyConfig
+    from cccy.infrastructure.formatters.output import OutputFormatter
+
+# Public API exports, imported on first access so that the CLI only pays for
+# the modules (pydantic, tabulate, mccabe, ...) a command actually uses.
+_LAZY_EXPORTS = {
+    "AnalysisError": "cccy.domain.exceptions.complexity_exceptions",
+    "AnalyzerService": "cccy.application.services.analysis_service",
+    "CccyConfig": "cccy.infrastructure.config.manager",
+    "CccyError": "cccy.domain.exceptions.complexity_exceptions",
+    "CognitiveComplexityCalculator": "cccy.infrastructure.calculators.concrete_calculators",
+    "ComplexityAnalyzer": "cccy.domain.services.complexity_analyzer",
+    "ComplexityCalculationError": "cccy.domain.exceptions.complexity_exceptions",
+    "ComplexityCalculator": "cccy.domain.interfaces.calculators",
+    "ComplexityCalculatorFactory": "cccy.infrastructure.calculators.concrete_calculators",
+    "ComplexityResult": "cccy.domain.entities.complexity",
+    "ConfigurationError": "cccy.domain.exceptions.complexity_exceptions",
+    "CyclomaticComplexityCalculator": "cccy.infrastructure.calculators.concrete_calculators",
+    "DirectoryAnalysisError": "cccy.domain.exceptions.complexity_exceptions",
+    "FileAnalysisError": "cccy.domain.exceptions.complexity_exceptions",
+    "FileComplexityResult": "cccy.domain.entities.complexity",
+    "FusedComplexityCalculator": "cccy.infrastructure.calculators.fused_calculator",
+    "OutputFormatter": "cccy.infrastructure.formatters.output",
+    "VersionControlError": "cccy.domain.exceptions.complexity_exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public API export on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazy exports."""
+    return sorted({*globals(), *_LAZY_EXPORTS})
 
 
 def get_version() -> str:
     """Get the package version from metadata."""
+    import importlib.metadata  # noqa: PLC0415
+
     try:
         return importlib.metadata.version("cccy")
     except importlib.metadata.PackageNotFoundError:
@@ -48,6 +93,8 @@ __all__ = [
     "DirectoryAnalysisError",
     "FileAnalysisError",
     "FileComplexityResult",
+    "FusedComplexityCalculator",
     "OutputFormatter",
+    "VersionControlError",
     "get_version",
 ]
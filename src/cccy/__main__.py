@@ -1,6 +1,6 @@
 """cccy をモジュールとして実行するためのエントリーポイント。"""
 
-from cccy.presentation.cli.main import main
+from cccy.presentation.cli.entry import run
 
 if __name__ == "__main__":
-    main()
+    run()
@@ -1,6 +1,7 @@
 """Service layer for complexity analysis operations."""
 
 import logging
+from collections.abc import Generator, Iterable, Iterator
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,7 @@ import click
 from cccy.domain.entities.complexity import FileComplexityResult
 from cccy.domain.interfaces.cli_services import AnalyzerServiceInterface
 from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.sharding import Shard
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,8 @@ class AnalyzerService(AnalyzerServiceInterface):
         exclude_patterns: Optional[list[str]] = None,
         include_patterns: Optional[list[str]] = None,
         verbose: bool = False,
+        *,
+        files: Optional[Iterable[Path]] = None,
     ) -> list[FileComplexityResult]:
         """指定されたパスを解析し、複雑度結果を返します。
 
@@ -41,6 +45,7 @@ class AnalyzerService(AnalyzerServiceInterface):
             exclude_patterns: 除外するグロブパターンのリスト
             include_patterns: 含めるグロブパターンのリスト
             verbose: 詳細出力を有効にする
+            files: 解析するファイルの絶対パス(Noneの場合は絞り込まない)
 
         Returns:
             FileComplexityResultオブジェクトのリスト
@@ -49,19 +54,99 @@ class AnalyzerService(AnalyzerServiceInterface):
             FileNotFoundError: 指定されたパスが存在しない場合
             PermissionError: ファイルを読み込めない場合
 
+        """
+        return list(
+            self.iter_analyze_paths(
+                paths,
+                recursive,
+                exclude_patterns,
+                include_patterns,
+                verbose,
+                files=files,
+            )
+        )
+
+    def iter_analyze_paths(
+        self,
+        paths: tuple[str, ...],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        verbose: bool = False,
+        *,
+        files: Optional[Iterable[Path]] = None,
+    ) -> Generator[FileComplexityResult, None, None]:
+        """指定されたパスを解析し、複雑度結果をファイルごとに返します。
+
+        結果は解析が終わったファイルから順に返されるため、出力を逐次
+        書き出せば解析対象の数によらずメモリ使用量は一定です。解析は結果の
+        消費に合わせて進み(並列実行時に先行するのはワーカー数に比例する
+        分まで)、ジェネレーターを途中で閉じると残りのパスは解析されません。
+
+        Args:
+            paths: 解析するパスのタプル
+            recursive: ディレクトリを再帰的に解析するかどうか
+            exclude_patterns: 除外するグロブパターンのリスト
+            include_patterns: 含めるグロブパターンのリスト
+            verbose: 詳細出力を有効にする
+            files: 解析するファイルの絶対パス(Noneの場合は絞り込まない)。
+                アナライザーの変更ファイルによる絞り込みと併せて適用されます
+
+        Yields:
+            パスの順序のFileComplexityResult
+
         """
         exclude_patterns = exclude_patterns or []
         include_patterns = include_patterns or []
-        all_results = []
+        selected = None if files is None else frozenset(files)
 
         for path_str in paths:
-            path = Path(path_str)
-            results = self._analyze_single_path(
-                path, recursive, exclude_patterns, include_patterns, verbose
+            yield from self._analyze_single_path(
+                Path(path_str),
+                recursive,
+                exclude_patterns,
+                include_patterns,
+                verbose,
+                files=selected,
             )
-            all_results.extend(results)
 
-        return all_results
+    def select_shard(
+        self,
+        paths: tuple[str, ...],
+        shard: Shard,
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+    ) -> frozenset[Path]:
+        """解析対象のファイルのうち、1つのシャードに割り当てられたものを返します。
+
+        解析と同じ規則でファイルを列挙してから分割するため、返された
+        ファイルを ``files`` に渡して解析した全シャードの結果を合わせると、
+        シャードを指定しない場合の結果と一致します。変更されたファイルなど
+        で対象がすでに絞り込まれている場合は、その中から分割します。
+
+        Args:
+            paths: 解析するパスのタプル
+            shard: 解析するシャード
+            recursive: ディレクトリを再帰的に解析するかどうか
+            exclude_patterns: 除外するグロブパターンのリスト
+            include_patterns: 含めるグロブパターンのリスト
+
+        Returns:
+            このシャードのファイルの絶対パス
+
+        """
+        files: list[Path] = []
+        for path in map(Path, paths):
+            if path.is_file() and self.analyzer.is_selected_file(path):
+                files.append(path)
+            elif path.is_dir():
+                files.extend(
+                    self.analyzer.iter_python_files(
+                        path, recursive, exclude_patterns, include_patterns
+                    )
+                )
+        return shard.select(files)
 
     def _analyze_single_path(
         self,
@@ -70,7 +155,9 @@ class AnalyzerService(AnalyzerServiceInterface):
         exclude_patterns: list[str],
         include_patterns: list[str],
         verbose: bool,
-    ) -> list[FileComplexityResult]:
+        *,
+        files: Optional[frozenset[Path]] = None,
+    ) -> Iterator[FileComplexityResult]:
         """単一のパス(ファイルまたはディレクトリ)を解析します。
 
         Args:
@@ -79,24 +166,28 @@ class AnalyzerService(AnalyzerServiceInterface):
             exclude_patterns: 除外するグロブパターンのリスト
             include_patterns: 含めるグロブパターンのリスト
             verbose: 詳細出力を有効にする
+            files: 解析するファイルの絶対パス(Noneの場合は絞り込まない)
 
-        Returns:
-            FileComplexityResultオブジェクトのリスト
+        Yields:
+            FileComplexityResultオブジェクト
 
         """
         if verbose:
             click.echo(f"Analyzing: {path}", err=True)
 
         try:
-            return self._process_path(
-                path, recursive, exclude_patterns, include_patterns, verbose
+            yield from self._process_path(
+                path,
+                recursive,
+                exclude_patterns,
+                include_patterns,
+                verbose,
+                files=files,
             )
         except PermissionError as e:
             self._handle_permission_error(path, e, verbose)
-            return []
         except Exception as e:
             self._handle_general_error(path, e, verbose)
-            return []
 
     def _process_path(
         self,
@@ -105,7 +196,9 @@ class AnalyzerService(AnalyzerServiceInterface):
         exclude_patterns: list[str],
         include_patterns: list[str],
         verbose: bool,
-    ) -> list[FileComplexityResult]:
+        *,
+        files: Optional[frozenset[Path]] = None,
+    ) -> Iterable[FileComplexityResult]:
         """パスのタイプに基づいてパスを処理します。
 
         Args:
@@ -114,21 +207,29 @@ class AnalyzerService(AnalyzerServiceInterface):
             exclude_patterns: 除外するグロブパターンのリスト
             include_patterns: 含めるグロブパターンのリスト
             verbose: 詳細出力を有効にする
+            files: 解析するファイルの絶対パス(Noneの場合は絞り込まない)
 
         Returns:
-            FileComplexityResultオブジェクトのリスト
+            FileComplexityResultオブジェクトのイテラブル
 
         Raises:
             FileNotFoundError: パスがファイルでもディレクトリでもない場合
 
         """
         if path.is_file():
+            if not self.analyzer.is_selected_file(path, files):
+                return []
             result = self._analyze_single_file(path, verbose)
             return [result] if result else []
 
         if path.is_dir():
             return self._analyze_directory(
-                path, recursive, exclude_patterns, include_patterns, verbose
+                path,
+                recursive,
+                exclude_patterns,
+                include_patterns,
+                verbose,
+                files=files,
             )
 
         raise FileNotFoundError(f"Path {path} is not a file or directory")
@@ -198,8 +299,10 @@ class AnalyzerService(AnalyzerServiceInterface):
         exclude_patterns: list[str],
         include_patterns: list[str],
         verbose: bool = False,
-    ) -> list[FileComplexityResult]:
-        """ディレクトリを解析します。
+        *,
+        files: Optional[frozenset[Path]] = None,
+    ) -> Iterator[FileComplexityResult]:
+        """ディレクトリを解析し、結果をファイルごとに返します。
 
         Args:
             directory: 解析するディレクトリ
@@ -207,30 +310,55 @@ class AnalyzerService(AnalyzerServiceInterface):
             exclude_patterns: 除外するグロブパターンのリスト
             include_patterns: 含めるグロブパターンのリスト
             verbose: 詳細出力を有効にする
+            files: 解析するファイルの絶対パス(Noneの場合は絞り込まない)
 
-        Returns:
-            FileComplexityResultオブジェクトのリスト
+        Yields:
+            パス順のFileComplexityResult
 
         """
+        count = 0
         try:
-            results = self.analyzer.analyze_directory(
+            for result in self.analyzer.iter_analyze_directory(
                 directory,
                 recursive=recursive,
                 exclude_patterns=exclude_patterns,
                 include_patterns=include_patterns,
-            )
-
-            if verbose:
-                click.echo(
-                    f"Found {len(results)} Python files in {directory}", err=True
-                )
-
-            return results
+                files=files,
+            ):
+                count += 1
+                yield result
         except Exception as e:
             logger.error(f"Error analyzing directory {directory}: {e}")
             if verbose:
                 click.echo(f"Error analyzing directory {directory}: {e}", err=True)
-            return []
+            return
+
+        if verbose:
+            click.echo(f"Found {count} Python files in {directory}", err=True)
+            self._report_utilization()
+
+    def _report_utilization(self) -> None:
+        """並列に解析した場合に、ワーカーごとの稼働状況を表示します。"""
+        executor = self.analyzer.executor
+        workers = executor.last_utilization if executor is not None else ()
+        if not workers:
+            return
+
+        busy = sum(worker.busy_seconds for worker in workers)
+        elapsed = workers[0].elapsed_seconds
+        overall = busy / (elapsed * len(workers)) if elapsed > 0 else 0.0
+        click.echo(
+            f"Worker utilization: {overall:.0%} across {len(workers)} workers "
+            f"in {elapsed:.2f}s",
+            err=True,
+        )
+        for worker in workers:
+            click.echo(
+                f"  worker {worker.worker}: {worker.files} files in "
+                f"{worker.chunks} chunks, busy {worker.busy_seconds:.2f}s "
+                f"({worker.utilization:.0%})",
+                err=True,
+            )
 
     def filter_failed_results(
         self,
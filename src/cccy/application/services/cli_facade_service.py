@@ -1,18 +1,25 @@
 """CLI layer facade service for clean architecture compliance."""
 
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from cccy.domain.entities.complexity import FileComplexityResult
 from cccy.domain.interfaces.cli_services import (
     AnalyzerFactoryInterface,
     AnalyzerServiceInterface,
+    CacheServiceInterface,
     ConfigServiceInterface,
     LoggingServiceInterface,
     OutputFormatterInterface,
     ResultFilterInterface,
+    ResultStoreFactoryInterface,
 )
+from cccy.domain.interfaces.stores import ResultStore
+from cccy.domain.services.analysis_stats import AnalysisStats
 from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
 
+if TYPE_CHECKING:
+    from cccy.domain.services.profiling import ProfileSession
+
 
 class CliFacadeService:
     """Facade service for CLI operations to maintain clean architecture."""
@@ -24,6 +31,8 @@ class CliFacadeService:
         analyzer_factory: AnalyzerFactoryInterface,
         output_formatter: OutputFormatterInterface,
         result_filter: ResultFilterInterface,
+        cache_service: CacheServiceInterface,
+        result_store_factory: ResultStoreFactoryInterface,
     ) -> None:
         """Initialize CLI facade with injected dependencies.
 
@@ -33,6 +42,8 @@ class CliFacadeService:
             analyzer_factory: Factory for creating analyzer instances
             output_formatter: Service for output formatting
             result_filter: Service for filtering results
+            cache_service: Service for result cache management
+            result_store_factory: Factory for opening stores of past runs
 
         """
         self._logging_service = logging_service
@@ -40,6 +51,8 @@ class CliFacadeService:
         self._analyzer_factory = analyzer_factory
         self._output_formatter = output_formatter
         self._result_filter = result_filter
+        self._cache_service = cache_service
+        self._result_store_factory = result_store_factory
 
     def setup_logging(self, level: str) -> None:
         """Set up logging configuration.
@@ -57,6 +70,11 @@ class CliFacadeService:
         exclude: Optional[tuple[str, ...]] = None,
         include: Optional[tuple[str, ...]] = None,
         paths: Optional[tuple[str, ...]] = None,
+        jobs: Optional[Union[int, str]] = None,
+        cache: Optional[bool] = None,
+        engine: Optional[str] = None,
+        default_excludes: Optional[bool] = None,
+        respect_gitignore: Optional[bool] = None,
     ) -> dict[str, Union[str, int, list[str], None]]:
         """Load configuration and merge with CLI options.
 
@@ -66,6 +84,11 @@ class CliFacadeService:
             exclude: CLI exclude patterns
             include: CLI include patterns
             paths: CLI paths
+            jobs: CLI worker count or "auto"
+            cache: CLI result cache switch
+            engine: CLI complexity engine
+            default_excludes: CLI default directory excludes switch
+            respect_gitignore: CLI .gitignore switch
 
         Returns:
             Merged configuration dictionary
@@ -77,21 +100,62 @@ class CliFacadeService:
             exclude=exclude,
             include=include,
             paths=paths,
+            jobs=jobs,
+            cache=cache,
+            engine=engine,
+            default_excludes=default_excludes,
+            respect_gitignore=respect_gitignore,
         )
 
     def create_analyzer_service(
-        self, max_complexity: Optional[int] = None
+        self,
+        max_complexity: Optional[int] = None,
+        jobs: Union[int, str] = 1,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        engine: str = "builtin",
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+        changed_since: Optional[str] = None,
+        staged: bool = False,
+        diff_ref: Optional[str] = None,
+        stats: Optional[AnalysisStats] = None,
+        profile: Optional["ProfileSession"] = None,
     ) -> tuple[ComplexityAnalyzer, AnalyzerServiceInterface]:
         """Create analyzer and service instances.
 
         Args:
             max_complexity: Analyzer max complexity threshold
+            jobs: Number of worker processes or "auto"
+            cache_dir: Result cache directory (None disables the cache)
+            cache_max_size: Maximum result cache size in bytes
+            engine: Complexity engine ("builtin" or "library")
+            default_excludes: Whether to skip virtualenv and cache directories
+            respect_gitignore: Whether to skip files ignored by git
+            changed_since: Analyze only files changed since this git revision
+            staged: Analyze only files with staged changes
+            diff_ref: Keep only functions touched by the diff against this revision
+            stats: Collect per-phase timings and counters into this (optional)
+            profile: Merge the profiles of parallel workers into this (optional)
 
         Returns:
             Tuple of (ComplexityAnalyzer, AnalyzerService)
 
         """
-        return self._analyzer_factory.create_analyzer_service(max_complexity)
+        return self._analyzer_factory.create_analyzer_service(
+            max_complexity,
+            jobs,
+            cache_dir,
+            cache_max_size,
+            engine,
+            default_excludes,
+            respect_gitignore,
+            changed_since,
+            staged,
+            diff_ref,
+            stats,
+            profile,
+        )
 
     def get_output_formatter(self) -> OutputFormatterInterface:
         """Get output formatter instance.
@@ -102,6 +166,39 @@ class CliFacadeService:
         """
         return self._output_formatter
 
+    def clear_cache(self) -> int:
+        """Remove all result cache entries.
+
+        Returns:
+            Number of removed entries
+
+        """
+        return self._cache_service.clear_cache()
+
+    def get_cache_stats(self) -> dict[str, Union[str, int]]:
+        """Get result cache statistics.
+
+        Returns:
+            Dictionary with directory, entries, total_size and max_size
+
+        """
+        return self._cache_service.get_cache_stats()
+
+    def open_result_store(self, location: str) -> ResultStore:
+        """Open the store of past analysis runs.
+
+        Args:
+            location: Database file of the store (created if it does not exist)
+
+        Returns:
+            ResultStore interface
+
+        Raises:
+            ResultStoreError: If the store cannot be opened
+
+        """
+        return self._result_store_factory.open_result_store(location)
+
     def filter_failed_results(
         self,
         results: list[FileComplexityResult],
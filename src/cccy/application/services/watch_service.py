@@ -0,0 +1,149 @@
+"""Service that keeps analysis results up to date as files change."""
+
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from cccy.application.services.analysis_service import AnalyzerService
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.interfaces.watchers import FileWatcher
+
+
+class WatchUpdate(NamedTuple):
+    """1回の再解析で更新された結果と削除されたファイル。"""
+
+    updated: tuple[FileComplexityResult, ...]
+    removed: tuple[str, ...]
+
+
+class WatchService:
+    """ファイルごとの解析結果を保持し、変更されたファイルだけを再解析するサービス。
+
+    変更の通知は短い間隔で続く限りまとめられるため、ブランチの切り替えの
+    ように大量のファイルが一度に変わった場合も、1回のまとまった(エグゼ
+    キューターがあれば並列の)再解析になります。
+    """
+
+    def __init__(
+        self,
+        service: AnalyzerService,
+        watcher: FileWatcher,
+        paths: Iterable[str],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        verbose: bool = False,
+        debounce: float = 0.2,
+        max_delay: float = 2.0,
+    ) -> None:
+        """サービスを初期化します。
+
+        Args:
+            service: 解析に使用するサービス
+            watcher: 変更を通知するウォッチャー
+            paths: 解析するパス
+            recursive: ディレクトリを再帰的に解析するかどうか
+            exclude_patterns: 除外するグロブパターンのリスト
+            include_patterns: 含めるグロブパターンのリスト
+            verbose: 詳細出力を有効にする
+            debounce: 変更の通知が途切れたとみなすまでの秒数
+            max_delay: 通知が続いても再解析を始めるまでの最大の秒数
+
+        """
+        self.service = service
+        self.watcher = watcher
+        self.paths = tuple(paths)
+        self.recursive = recursive
+        self.exclude_patterns = exclude_patterns or []
+        self.include_patterns = include_patterns or []
+        self.verbose = verbose
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._results: dict[Path, FileComplexityResult] = {}
+
+    @property
+    def results(self) -> list[FileComplexityResult]:
+        """現在の解析結果をファイルパス順に返します。"""
+        return sorted(self._results.values(), key=lambda result: result.file_path)
+
+    def scan(self) -> int:
+        """すべてのパスを解析し直します。
+
+        Returns:
+            解析したファイル数
+
+        """
+        self._results = {
+            Path(result.file_path).resolve(): result for result in self._analyze(None)
+        }
+        return len(self._results)
+
+    def wait_for_changes(self) -> set[Path]:
+        """変更があるまで待ち、続けて届く変更を1つにまとめて返します。
+
+        Returns:
+            変更されたファイルまたはディレクトリの絶対パスの集合
+
+        """
+        changes: set[Path] = set()
+        while not changes:
+            changes = self.watcher.read_changes()
+
+        deadline = time.monotonic() + self.max_delay
+        while (remaining := deadline - time.monotonic()) > 0:
+            more = self.watcher.read_changes(min(self.debounce, remaining))
+            if not more:
+                break
+            changes |= more
+        return changes
+
+    def apply(self, changes: set[Path]) -> WatchUpdate:
+        """変更されたパスに関係するファイルだけを再解析し、結果を更新します。
+
+        ファイル以外のパス(ディレクトリ、または削除されたパス)はその配下
+        全体が変わったものとして扱います。
+
+        Args:
+            changes: 変更されたファイルまたはディレクトリの絶対パス
+
+        Returns:
+            更新・削除されたファイル
+
+        """
+        files = {path for path in changes if path.is_file()}
+        trees = changes - files
+        for tree in trees:
+            if tree.is_dir():
+                files.update(file.resolve() for file in tree.rglob("*.py"))
+
+        affected = {
+            path
+            for path in self._results
+            if path in files or any(path.is_relative_to(tree) for tree in trees)
+        }
+
+        updated = []
+        for result in self._analyze(files) if files else []:
+            path = Path(result.file_path).resolve()
+            self._results[path] = result
+            affected.discard(path)
+            updated.append(result)
+
+        removed = [self._results.pop(path).file_path for path in affected]
+        return WatchUpdate(tuple(updated), tuple(sorted(removed)))
+
+    def close(self) -> None:
+        """ウォッチャーを閉じます。"""
+        self.watcher.close()
+
+    def _analyze(self, files: Optional[set[Path]]) -> list[FileComplexityResult]:
+        """パスを解析します(filesを指定した場合はそれらのファイルのみ)。"""
+        return self.service.analyze_paths(
+            self.paths,
+            self.recursive,
+            self.exclude_patterns,
+            self.include_patterns,
+            self.verbose,
+            files=files,
+        )
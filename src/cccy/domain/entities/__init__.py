@@ -5,9 +5,12 @@ from .complexity import (
     ComplexityResult,
     FileComplexityResult,
 )
+from .records import FileRecord, FunctionRecord
 
 __all__ = [
     "CccySettings",
     "ComplexityResult",
     "FileComplexityResult",
+    "FileRecord",
+    "FunctionRecord",
 ]
@@ -1,6 +1,6 @@
 """Pydantic models for data structures and configuration."""
 
-from typing import Any, Optional
+from typing import Any, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -112,11 +112,46 @@ class CccySettings(BaseSettings):
         },
         description="Thresholds for status classification",
     )
+    default_excludes: bool = Field(
+        default=True,
+        description="Skip virtualenv and cache directories while walking",
+    )
+    respect_gitignore: bool = Field(
+        default=False, description="Skip files and directories ignored by git"
+    )
+    jobs: Union[int, str] = Field(
+        default=1, description="Number of worker processes or 'auto' for CPU count"
+    )
+    engine: Literal["builtin", "library"] = Field(
+        default="builtin",
+        description="Complexity engine: built-in single-pass or mccabe/cognitive_complexity",
+    )
+    cache: bool = Field(default=False, description="Enable the on-disk result cache")
+    cache_dir: str = Field(
+        default=".cccy_cache", description="Directory of the on-disk result cache"
+    )
+    cache_max_size: int = Field(
+        default=256, ge=1, description="Maximum size of the result cache in MB"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="CCCY_", case_sensitive=False, validate_assignment=True
     )
 
+    @field_validator("jobs")
+    @classmethod
+    def validate_jobs(cls, v: Union[int, str]) -> Union[int, str]:
+        """ジョブ数が正の整数または"auto"であることを検証します。"""
+        if isinstance(v, str):
+            if v.lower() == "auto":
+                return "auto"
+            if not v.isdigit():
+                raise ValueError("jobs must be a positive integer or 'auto'")
+            v = int(v)
+        if v < 1:
+            raise ValueError("jobs must be >= 1")
+        return v
+
     @field_validator("status_thresholds")
     @classmethod
     def validate_status_thresholds(
@@ -0,0 +1,41 @@
+"""Rows read back from the store of past analysis runs."""
+
+from typing import NamedTuple
+
+# 問い合わせで並べ替え・比較に使用できる複雑度の指標
+METRICS = ("cyclomatic", "cognitive")
+
+
+class StoredRun(NamedTuple):
+    """記録した解析の実行。"""
+
+    run_id: int
+    created_at: str
+    command: str
+    engine: str
+    cccy_version: str
+    file_count: int
+    function_count: int
+
+
+class StoredFile(NamedTuple):
+    """記録した実行で解析したファイル。"""
+
+    run_id: int
+    file_path: str
+    function_count: int
+    total_cyclomatic: int
+    total_cognitive: int
+    max_cyclomatic: int
+    max_cognitive: int
+
+
+class StoredFunction(NamedTuple):
+    """記録した実行で解析した関数。"""
+
+    run_id: int
+    file_path: str
+    name: str
+    lineno: int
+    cyclomatic_complexity: int
+    cognitive_complexity: int
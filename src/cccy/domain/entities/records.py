@@ -0,0 +1,89 @@
+"""Lightweight result records used inside the analysis pipeline."""
+
+from typing import NamedTuple, Optional
+
+from cccy.domain.entities.complexity import FileComplexityResult
+
+
+class FunctionRecord(NamedTuple):
+    """解析パイプライン内で使用する、単一の関数の検証なしの解析結果。
+
+    フィールドは ``ComplexityResult`` と同じ名前・順序です。
+    """
+
+    name: str
+    cyclomatic_complexity: int
+    cognitive_complexity: int
+    lineno: int
+    col_offset: int
+    end_lineno: Optional[int] = None
+    end_col_offset: Optional[int] = None
+
+
+class FileRecord(NamedTuple):
+    """解析パイプライン内で使用する、単一ファイルの検証なしの解析結果。
+
+    Pydanticモデルの生成と検証は関数ごとに数マイクロ秒かかり、ワーカー
+    プロセスとの受け渡しでのpickleも重いため、解析・キャッシュ・並列実行の
+    間はこのタプルで結果を扱い、公開APIに返す直前に ``to_result`` で
+    ``FileComplexityResult`` に変換します。
+    """
+
+    file_path: str
+    functions: tuple[FunctionRecord, ...]
+
+    def to_result(self) -> FileComplexityResult:
+        """公開APIの ``FileComplexityResult`` に変換します。
+
+        Returns:
+            合計値と最大値を計算したFileComplexityResult
+
+        """
+        total_cyclomatic = total_cognitive = max_cyclomatic = max_cognitive = 0
+        for function in self.functions:
+            total_cyclomatic += function.cyclomatic_complexity
+            total_cognitive += function.cognitive_complexity
+            max_cyclomatic = max(max_cyclomatic, function.cyclomatic_complexity)
+            max_cognitive = max(max_cognitive, function.cognitive_complexity)
+
+        fields = FunctionRecord._fields
+        # 辞書のまま渡すと関数ごとのモデルの検証がpydantic-core内で一括で行われる
+        return FileComplexityResult.model_validate(
+            {
+                "file_path": self.file_path,
+                "functions": [
+                    dict(zip(fields, function)) for function in self.functions
+                ],
+                "total_cyclomatic": total_cyclomatic,
+                "total_cognitive": total_cognitive,
+                "max_cyclomatic": max_cyclomatic,
+                "max_cognitive": max_cognitive,
+            }
+        )
+
+    @classmethod
+    def from_result(cls, result: FileComplexityResult) -> "FileRecord":
+        """``FileComplexityResult`` からレコードを作成します。
+
+        Args:
+            result: 変換する解析結果
+
+        Returns:
+            同じ内容のFileRecord
+
+        """
+        return cls(
+            result.file_path,
+            tuple(
+                FunctionRecord(
+                    function.name,
+                    function.cyclomatic_complexity,
+                    function.cognitive_complexity,
+                    function.lineno,
+                    function.col_offset,
+                    function.end_lineno,
+                    function.end_col_offset,
+                )
+                for function in result.functions
+            ),
+        )
@@ -49,6 +49,12 @@ class DirectoryAnalysisError(AnalysisError):
         super().__init__(f"Error analyzing directory {directory_path}: {message}")
 
 
+class VersionControlError(CccyError):
+    """バージョン管理システムから情報を取得できない場合に発生します。"""
+
+    pass
+
+
 class ComplexityCalculationError(CccyError):
     """複雑度計算が失敗した場合に発生します。"""
 
@@ -66,3 +72,33 @@ class ComplexityCalculationError(CccyError):
         super().__init__(
             f"Error calculating {calculator_type} complexity for {function_name}: {message}"
         )
+
+
+class ReportError(CccyError):
+    """解析結果のレポートを読み込めない、または結合できない場合に発生します。"""
+
+    def __init__(self, source: str, message: str) -> None:
+        """レポートの名前とエラーメッセージで初期化します。
+
+        Args:
+            source: 問題のあるレポートの名前(ファイルパスなど)
+            message: エラーメッセージ
+
+        """
+        self.source = source
+        super().__init__(f"{source}: {message}")
+
+
+class ResultStoreError(CccyError):
+    """解析結果のストアを開けない、または読み書きできない場合に発生します。"""
+
+    def __init__(self, location: str, message: str) -> None:
+        """ストアの場所とエラーメッセージで初期化します。
+
+        Args:
+            location: ストアの場所(データベースファイルのパスなど)
+            message: エラーメッセージ
+
+        """
+        self.location = location
+        super().__init__(f"{location}: {message}")
@@ -1,13 +1,21 @@
 """Domain interfaces."""
 
+from .caches import ResultCache
 from .calculators import (
     CognitiveComplexityCalculator,
     ComplexityCalculator,
     CyclomaticComplexityCalculator,
 )
+from .executors import FileAnalysisExecutor
+from .vcs import ChangedFilesProvider
+from .watchers import FileWatcher
 
 __all__ = [
+    "ChangedFilesProvider",
     "CognitiveComplexityCalculator",
     "ComplexityCalculator",
     "CyclomaticComplexityCalculator",
+    "FileAnalysisExecutor",
+    "FileWatcher",
+    "ResultCache",
 ]
@@ -0,0 +1,32 @@
+"""Analysis result cache interfaces (ports)."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from cccy.domain.entities.records import FileRecord
+
+
+class ResultCache(ABC):
+    """ファイル内容のハッシュをキーとする解析結果キャッシュの抽象ベースクラス。"""
+
+    @abstractmethod
+    def get(self, content_hash: str) -> Optional[FileRecord]:
+        """キャッシュされた解析結果を取得します。
+
+        Args:
+            content_hash: ファイル内容のハッシュ値
+
+        Returns:
+            キャッシュされた結果、または存在しない場合はNone
+
+        """
+
+    @abstractmethod
+    def put(self, content_hash: str, record: FileRecord) -> None:
+        """解析結果をキャッシュに保存します。
+
+        Args:
+            content_hash: ファイル内容のハッシュ値
+            record: 保存する解析結果
+
+        """
@@ -1,10 +1,18 @@
 """CLI service interfaces for dependency injection."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Optional, TextIO, Union
 
 from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.interfaces.stores import ResultStore
+from cccy.domain.services.analysis_stats import AnalysisStats
 from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.sharding import Shard
+
+if TYPE_CHECKING:
+    from cccy.domain.services.profiling import ProfileSession
 
 
 class LoggingServiceInterface(ABC):
@@ -26,6 +34,11 @@ class ConfigServiceInterface(ABC):
         exclude: Optional[tuple[str, ...]] = None,
         include: Optional[tuple[str, ...]] = None,
         paths: Optional[tuple[str, ...]] = None,
+        jobs: Optional[Union[int, str]] = None,
+        cache: Optional[bool] = None,
+        engine: Optional[str] = None,
+        default_excludes: Optional[bool] = None,
+        respect_gitignore: Optional[bool] = None,
     ) -> dict[str, Union[str, int, list[str], None]]:
         """Load configuration and merge with CLI options."""
 
@@ -35,11 +48,43 @@ class AnalyzerFactoryInterface(ABC):
 
     @abstractmethod
     def create_analyzer_service(
-        self, max_complexity: Optional[int] = None
+        self,
+        max_complexity: Optional[int] = None,
+        jobs: Union[int, str] = 1,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        engine: str = "builtin",
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+        changed_since: Optional[str] = None,
+        staged: bool = False,
+        diff_ref: Optional[str] = None,
+        stats: Optional[AnalysisStats] = None,
+        profile: Optional["ProfileSession"] = None,
     ) -> tuple[ComplexityAnalyzer, "AnalyzerServiceInterface"]:
         """Create analyzer and service instances."""
 
 
+class CacheServiceInterface(ABC):
+    """Interface for result cache management service."""
+
+    @abstractmethod
+    def clear_cache(self) -> int:
+        """Remove all cache entries and return the number removed."""
+
+    @abstractmethod
+    def get_cache_stats(self) -> dict[str, Union[str, int]]:
+        """Return cache directory, entry count, total size and size limit."""
+
+
+class ResultStoreFactoryInterface(ABC):
+    """Interface for opening stores of past analysis runs."""
+
+    @abstractmethod
+    def open_result_store(self, location: str) -> ResultStore:
+        """Open the result store at location, creating it if it does not exist."""
+
+
 class AnalyzerServiceInterface(ABC):
     """Interface for analyzer service."""
 
@@ -51,9 +96,35 @@ class AnalyzerServiceInterface(ABC):
         exclude_patterns: Optional[list[str]] = None,
         include_patterns: Optional[list[str]] = None,
         verbose: bool = False,
+        *,
+        files: Optional[Iterable[Path]] = None,
     ) -> list[FileComplexityResult]:
         """Analyze specified paths and return complexity results."""
 
+    @abstractmethod
+    def iter_analyze_paths(
+        self,
+        paths: tuple[str, ...],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        verbose: bool = False,
+        *,
+        files: Optional[Iterable[Path]] = None,
+    ) -> Generator[FileComplexityResult, None, None]:
+        """Analyze specified paths and yield results as files finish."""
+
+    @abstractmethod
+    def select_shard(
+        self,
+        paths: tuple[str, ...],
+        shard: Shard,
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+    ) -> frozenset[Path]:
+        """Return the files assigned to one shard, to pass as ``files``."""
+
     @abstractmethod
     def filter_failed_results(
         self,
@@ -71,30 +142,109 @@ class OutputFormatterInterface(ABC):
     def format_table(self, results: list[FileComplexityResult]) -> str:
         """Format results as table."""
 
+    @abstractmethod
+    def write_table(self, results: list[FileComplexityResult], stream: TextIO) -> None:
+        """Write results as table to a text stream."""
+
     @abstractmethod
     def format_detailed_table(self, results: list[FileComplexityResult]) -> str:
         """Format results as detailed table."""
 
+    @abstractmethod
+    def write_detailed_table(
+        self, results: list[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results as detailed table to a text stream."""
+
     @abstractmethod
     def format_json(self, results: list[FileComplexityResult]) -> str:
         """Format results as JSON."""
 
+    @abstractmethod
+    def write_json(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results as JSON to a text stream, one file at a time."""
+
+    @abstractmethod
+    def iter_jsonl(self, results: Iterable[FileComplexityResult]) -> Iterator[str]:
+        """Format results as JSON Lines, one line per file."""
+
     @abstractmethod
     def format_csv(self, results: list[FileComplexityResult]) -> str:
         """Format results as CSV."""
 
+    @abstractmethod
+    def write_csv(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results as CSV to a text stream."""
+
     @abstractmethod
     def format_functions_json(self, results: list[FileComplexityResult]) -> str:
         """Format function-level results as JSON."""
 
+    @abstractmethod
+    def write_functions_json(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write function-level results as JSON to a text stream."""
+
+    @abstractmethod
+    def iter_functions_jsonl(
+        self, results: Iterable[FileComplexityResult]
+    ) -> Iterator[str]:
+        """Format function-level results as JSON Lines, one line per function."""
+
     @abstractmethod
     def format_functions_csv(self, results: list[FileComplexityResult]) -> str:
         """Format function-level results as CSV."""
 
+    @abstractmethod
+    def write_functions_csv(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write function-level results as CSV to a text stream."""
+
+    @abstractmethod
+    def format_rows(
+        self, headers: list[str], rows: Sequence[Sequence[object]], output_format: str
+    ) -> str:
+        """Format arbitrary rows as a table, JSON or CSV."""
+
+    @abstractmethod
+    def write_rows(
+        self,
+        headers: list[str],
+        rows: Sequence[Sequence[object]],
+        output_format: str,
+        stream: TextIO,
+    ) -> None:
+        """Write arbitrary rows as a table, JSON or CSV to a text stream."""
+
+    @abstractmethod
+    def write_columnar(
+        self,
+        results: Iterable[FileComplexityResult],
+        sink: BinaryIO,
+        output_format: str,
+        functions: bool = False,
+    ) -> int:
+        """Write results as Parquet or Arrow IPC, one row group at a time.
+
+        Raises ImportError before consuming any result if pyarrow is missing.
+        """
+
     @abstractmethod
     def format_summary(self, results: list[FileComplexityResult]) -> str:
         """Format results summary."""
 
+    @abstractmethod
+    def write_summary(
+        self, results: list[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results summary to a text stream."""
+
 
 class ResultFilterInterface(ABC):
     """Interface for result filtering service."""
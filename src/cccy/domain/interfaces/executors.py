@@ -0,0 +1,68 @@
+"""File analysis executor interfaces (ports)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from cccy.domain.entities.records import FileRecord
+    from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+
+
+class WorkerUtilization(NamedTuple):
+    """1つのワーカーの解析中の稼働状況。"""
+
+    worker: int
+    files: int
+    chunks: int
+    busy_seconds: float
+    elapsed_seconds: float
+
+    @property
+    def utilization(self) -> float:
+        """経過時間のうち解析していた時間の割合。"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / self.elapsed_seconds)
+
+
+class FileAnalysisExecutor(ABC):
+    """複数ファイルの解析を実行するエグゼキューターの抽象ベースクラス。"""
+
+    # 直近の解析でのワーカーごとの稼働状況。並列に解析しなかった場合は空
+    last_utilization: tuple[WorkerUtilization, ...] = ()
+
+    @abstractmethod
+    def execute(
+        self, analyzer: "ComplexityAnalyzer", files: list[Path]
+    ) -> list["FileRecord"]:
+        """ファイルのリストを解析します。
+
+        Args:
+            analyzer: 各ファイルの解析に使用するアナライザー
+            files: 解析するファイルパスのリスト
+
+        Returns:
+            入力ファイルと同じ順序の解析結果のレコードのリスト
+            (解析できなかったファイルは除く)
+
+        """
+
+    def iter_execute(
+        self, analyzer: "ComplexityAnalyzer", files: Iterable[Path]
+    ) -> Generator["FileRecord", None, None]:
+        """ファイルを解析し、結果を入力順に逐次返します。
+
+        既定の実装はすべてのファイルを ``execute`` で解析してから返します。
+        結果をファイルごとに返せるエグゼキューターはオーバーライドしてください。
+
+        Args:
+            analyzer: 各ファイルの解析に使用するアナライザー
+            files: 解析するファイルパス(ジェネレーターでもよい)
+
+        Yields:
+            入力ファイルと同じ順序の解析結果のレコード(解析できなかったファイルは除く)
+
+        """
+        yield from self.execute(analyzer, list(files))
@@ -0,0 +1,86 @@
+"""Analysis result store interfaces (ports)."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Optional
+
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.entities.history import StoredFile, StoredFunction, StoredRun
+
+
+class ResultStore(ABC):
+    """解析の実行ごとの結果を蓄積し、問い合わせるストアの抽象ベースクラス。
+
+    問い合わせの ``metric`` は ``METRICS`` のいずれか、``run_id`` が
+    Noneの場合は最新の実行を対象とします。
+    """
+
+    @abstractmethod
+    def save_run(
+        self,
+        results: Iterable[FileComplexityResult],
+        command: str,
+        engine: str = "",
+    ) -> int:
+        """解析結果を1回の実行として保存します。
+
+        Args:
+            results: 実行の解析結果
+            command: 実行したコマンドの名前
+            engine: 結果を計算した複雑度計算エンジン
+
+        Returns:
+            保存した実行のID
+
+        """
+
+    @abstractmethod
+    def list_runs(self, limit: Optional[int] = None) -> list[StoredRun]:
+        """記録した実行を新しい順に返します。
+
+        Args:
+            limit: 返す実行の最大数(Noneの場合はすべて)
+
+        """
+
+    @abstractmethod
+    def top_functions(
+        self, metric: str, limit: int, run_id: Optional[int] = None
+    ) -> list[StoredFunction]:
+        """実行のうち、指標の値が大きい順に関数を返します。
+
+        Args:
+            metric: 並べ替える指標
+            limit: 返す関数の最大数
+            run_id: 対象の実行のID
+
+        """
+
+    @abstractmethod
+    def files_over(
+        self, metric: str, threshold: int, run_id: Optional[int] = None
+    ) -> list[StoredFile]:
+        """実行のうち、関数の指標の最大値が閾値を超えるファイルを返します。
+
+        Args:
+            metric: 比較する指標
+            threshold: 閾値(この値を超えるファイルを返す)
+            run_id: 対象の実行のID
+
+        """
+
+    @abstractmethod
+    def function_history(
+        self, name: str, file_path: Optional[str] = None
+    ) -> list[StoredFunction]:
+        """関数の記録を実行の古い順に返します(複雑度の推移)。
+
+        Args:
+            name: 関数の名前
+            file_path: 関数を含むファイルのパス(Noneの場合はすべてのファイル)
+
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """ストアを閉じます。"""
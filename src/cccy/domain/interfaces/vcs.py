@@ -0,0 +1,43 @@
+"""Version control interfaces (ports)."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+
+class ChangedFilesProvider(ABC):
+    """バージョン管理システムから変更されたファイルを取得する抽象ベースクラス。"""
+
+    @abstractmethod
+    def changed_files(self, since: Optional[str], staged: bool) -> list[Path]:
+        """変更されたファイルを取得します。
+
+        Args:
+            since: 比較の基準となるリビジョン(Noneの場合はHEADまたはインデックス)
+            staged: ステージされた変更のみを対象にするかどうか
+
+        Returns:
+            変更されたファイルの絶対パスのリスト(削除されたファイルは除く)
+
+        Raises:
+            VersionControlError: 変更されたファイルを取得できない場合
+
+        """
+
+    @abstractmethod
+    def changed_lines(
+        self, since: Optional[str], staged: bool
+    ) -> dict[Path, list[tuple[int, int]]]:
+        """変更されたファイルごとに、変更後の内容で変更された行範囲を取得します。
+
+        Args:
+            since: 比較の基準となるリビジョン(Noneの場合はHEADまたはインデックス)
+            staged: ステージされた変更のみを対象にするかどうか
+
+        Returns:
+            ファイルの絶対パスから変更された行の閉区間(開始行, 終了行)のリストへの対応
+
+        Raises:
+            VersionControlError: 差分を取得できない場合
+
+        """
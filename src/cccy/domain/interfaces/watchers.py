@@ -0,0 +1,27 @@
+"""File system watcher interfaces (ports)."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+
+class FileWatcher(ABC):
+    """ファイルシステムの変更を通知するウォッチャーの抽象ベースクラス。"""
+
+    @abstractmethod
+    def read_changes(self, timeout: Optional[float] = None) -> set[Path]:
+        """変更があるまで待ち、変更されたパスを返します。
+
+        Args:
+            timeout: 待つ最大の秒数(Noneの場合は変更があるまで待つ)
+
+        Returns:
+            作成・変更・削除・名前変更されたファイルまたはディレクトリの
+            絶対パスの集合(時間内に変更がなかった場合は空)。ディレクトリの
+            パスは、その配下全体が変わった可能性があることを表します。
+
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """監視を終了し、リソースを解放します。"""
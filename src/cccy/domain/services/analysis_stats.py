@@ -0,0 +1,331 @@
+"""解析の段階ごとの時間と処理量を集計するモジュール。
+
+集計するアナライザー(``InstrumentedComplexityAnalyzer``)は集計を
+有効にした場合にだけ作られるため、無効な場合の解析には計測のための
+処理が一切入りません。
+"""
+
+import ast
+import copy
+import heapq
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, TypeVar, Union
+
+from cccy.domain.entities.records import FileRecord
+from cccy.domain.interfaces.caches import ResultCache
+from cccy.domain.interfaces.calculators import ComplexityCalculator
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+
+T = TypeVar("T")
+
+# 集計する段階(表示順)。analysisはファイルごとの解析のうち他の段階に
+# 含まれない処理(構文木の走査、ハッシュの計算など)、waitは並列実行時に
+# 親プロセスがワーカーの結果を待っていた時間、otherはどの段階にも
+# 含まれない時間
+PHASES = (
+    "config",
+    "discovery",
+    "read",
+    "cache",
+    "parse",
+    "cyclomatic",
+    "cognitive",
+    "analysis",
+    "wait",
+    "output",
+    "other",
+)
+# 報告する時間のかかったファイルの数の既定値
+DEFAULT_SLOWEST = 10
+
+
+class SlowFile(NamedTuple):
+    """解析に時間のかかったファイル。"""
+
+    seconds: float
+    file_path: str
+
+
+class AnalysisStats:
+    """段階ごとの経過時間とCPU時間、処理したファイル数などの集計。
+
+    時間は段階のスタックで計測します。ある段階の中で別の段階が始まると、
+    その間の時間は内側の段階にだけ加算されるため、1つのプロセスの中では
+    すべての段階の時間の合計が経過時間と一致します。並列に解析した場合は
+    ワーカーの集計が合算されるため、段階の時間の合計は経過時間を超えます。
+    """
+
+    def __init__(self, slowest: int = DEFAULT_SLOWEST) -> None:
+        """集計を初期化し、経過時間の計測を始めます。
+
+        Args:
+            slowest: 記録する時間のかかったファイルの数
+
+        """
+        self.slowest = slowest
+        self._started = time.perf_counter()
+        self._stack = ["other"]
+        self.reset()
+
+    def reset(self) -> None:
+        """時間とカウンターを0に戻します(経過時間の起点は変わりません)。"""
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        self.files = 0
+        self.skipped_files = 0
+        self.functions = 0
+        self.bytes_read = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.workers: set[int] = set()
+        self.slowest_files: list[SlowFile] = []
+        self._wall_mark = time.perf_counter()
+        self._cpu_mark = time.process_time()
+
+    def _charge(self) -> None:
+        """前回からの時間を実行中の段階に加算します。"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        phase = self._stack[-1]
+        self.wall[phase] += wall - self._wall_mark
+        self.cpu[phase] += cpu - self._cpu_mark
+        self._wall_mark, self._cpu_mark = wall, cpu
+
+    def start(self, phase: str) -> None:
+        """段階を始めます(実行中の段階は中断されます)。"""
+        self._charge()
+        self._stack.append(phase)
+
+    def stop(self) -> None:
+        """直近に始めた段階を終え、中断していた段階を再開します。"""
+        self._charge()
+        self._stack.pop()
+
+    def measure(self, phase: str, func: Callable[..., T], *args: Any) -> T:
+        """関数を呼び出し、その時間を段階に加算します。"""
+        self.start(phase)
+        try:
+            return func(*args)
+        finally:
+            self.stop()
+
+    def iter_measured(self, phase: str, iterable: Iterable[T]) -> Iterator[T]:
+        """要素を取り出すのにかかった時間を段階に加算しながら要素を返します。
+
+        要素を受け取った側の処理の時間は含みません。
+        """
+        iterator = iter(iterable)
+        while True:
+            self.start(phase)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.stop()
+            yield item
+
+    def record_file(
+        self, file_path: str, seconds: float, record: Optional[FileRecord]
+    ) -> None:
+        """1ファイルの解析を集計に加えます。
+
+        Args:
+            file_path: 解析したファイルのパス
+            seconds: 解析にかかった秒数
+            record: 解析結果(解析できなかった場合はNone)
+
+        """
+        if record is None:
+            self.skipped_files += 1
+        else:
+            self.files += 1
+            self.functions += len(record.functions)
+        self._push_slow_file(SlowFile(seconds, file_path))
+
+    def _push_slow_file(self, entry: SlowFile) -> None:
+        """時間のかかったファイルを上位slowest件まで保持します(最小ヒープ)。"""
+        if len(self.slowest_files) < self.slowest:
+            heapq.heappush(self.slowest_files, entry)
+        elif entry > self.slowest_files[0]:
+            heapq.heapreplace(self.slowest_files, entry)
+
+    def drain(self) -> "AnalysisStats":
+        """ここまでの集計を取り出し、この集計を0に戻します。
+
+        ワーカープロセスが解析したチャンクの集計を親プロセスに返すために
+        使用します。どの段階にも含まれない時間(次のチャンクを待っていた
+        時間)は取り出しません。
+        """
+        self._charge()
+        drained = copy.copy(self)
+        self.reset()
+        drained.wall["other"] = drained.cpu["other"] = 0.0
+        return drained
+
+    def merge(self, other: "AnalysisStats", worker: Optional[int] = None) -> None:
+        """別のプロセスの集計を合算します。
+
+        Args:
+            other: 合算する集計
+            worker: 集計したワーカーのプロセスID(オプション)
+
+        """
+        for phase in PHASES:
+            self.wall[phase] += other.wall[phase]
+            self.cpu[phase] += other.cpu[phase]
+        self.files += other.files
+        self.skipped_files += other.skipped_files
+        self.functions += other.functions
+        self.bytes_read += other.bytes_read
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.workers |= other.workers
+        if worker is not None:
+            self.workers.add(worker)
+        for entry in other.slowest_files:
+            self._push_slow_file(entry)
+
+    def to_dict(self) -> dict[str, Any]:
+        """集計をJSONに変換できる辞書として返します。
+
+        経過時間は集計の開始から現在まで(このプロセスのみ)、CPU時間は
+        ワーカーを含むすべての段階の合計です。
+        """
+        self._charge()
+        elapsed = time.perf_counter() - self._started
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "wall_seconds": elapsed,
+            "cpu_seconds": sum(self.cpu.values()),
+            "phases": {
+                phase: {
+                    "wall_seconds": self.wall[phase],
+                    "cpu_seconds": self.cpu[phase],
+                }
+                for phase in PHASES
+            },
+            "files": self.files,
+            "skipped_files": self.skipped_files,
+            "functions": self.functions,
+            "bytes_read": self.bytes_read,
+            "files_per_second": self.files / elapsed if elapsed > 0 else 0.0,
+            "functions_per_second": self.functions / elapsed if elapsed > 0 else 0.0,
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_rate": self.cache_hits / lookups if lookups else None,
+            },
+            "workers": len(self.workers),
+            "slowest_files": [
+                {"file_path": entry.file_path, "seconds": entry.seconds}
+                for entry in sorted(self.slowest_files, reverse=True)
+            ],
+        }
+
+
+class _TimedCalculator(ComplexityCalculator):
+    """計算にかかった時間を段階に加算するカルキュレーター。"""
+
+    def __init__(
+        self, calculator: ComplexityCalculator, stats: AnalysisStats, phase: str
+    ) -> None:
+        self.calculator = calculator
+        self.stats = stats
+        self.phase = phase
+
+    def calculate(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> int:
+        return self.stats.measure(self.phase, self.calculator.calculate, node)
+
+    @property
+    def name(self) -> str:
+        return self.calculator.name
+
+
+class _CountingResultCache(ResultCache):
+    """ヒットとミスを数え、参照にかかった時間を集計する結果キャッシュ。"""
+
+    def __init__(self, cache: ResultCache, stats: AnalysisStats) -> None:
+        self.cache = cache
+        self.stats = stats
+
+    def get(self, content_hash: str) -> Optional[FileRecord]:
+        record = self.stats.measure("cache", self.cache.get, content_hash)
+        if record is None:
+            self.stats.cache_misses += 1
+        else:
+            self.stats.cache_hits += 1
+        return record
+
+    def put(self, content_hash: str, record: FileRecord) -> None:
+        self.stats.measure("cache", self.cache.put, content_hash, record)
+
+
+class InstrumentedComplexityAnalyzer(ComplexityAnalyzer):
+    """解析の段階ごとの時間と処理量を集計するアナライザー。
+
+    ファイルの走査・読み込み・結果キャッシュの参照・構文解析・各カルキュ
+    レーターの時間を計ります。組み込みエンジンは両方の複雑度を一度の走査で
+    計算するため、その時間はcyclomaticに加算され、cognitiveはほぼ0になります。
+    """
+
+    def __init__(
+        self,
+        stats: AnalysisStats,
+        cyclomatic_calculator: ComplexityCalculator,
+        cognitive_calculator: ComplexityCalculator,
+        **options: Any,
+    ) -> None:
+        """集計先を指定してアナライザーを初期化します。
+
+        Args:
+            stats: 集計先
+            cyclomatic_calculator: 循環的複雑度カルキュレーター
+            cognitive_calculator: 認知的複雑度カルキュレーター
+            **options: ``ComplexityAnalyzer`` のその他の引数
+
+        """
+        super().__init__(
+            _TimedCalculator(cyclomatic_calculator, stats, "cyclomatic"),
+            _TimedCalculator(cognitive_calculator, stats, "cognitive"),
+            **options,
+        )
+        if self.result_cache is not None:
+            self.result_cache = _CountingResultCache(self.result_cache, stats)
+        self.stats: AnalysisStats = stats
+
+    def analyze_file_record(self, file_path: Union[str, Path]) -> Optional[FileRecord]:
+        """ファイルを解析し、その時間と結果を集計に加えます。"""
+        start = time.perf_counter()
+        record = self.stats.measure("analysis", super().analyze_file_record, file_path)
+        self.stats.record_file(str(file_path), time.perf_counter() - start, record)
+        return record
+
+    def iter_python_files(
+        self,
+        directory: Union[str, Path],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        *,
+        files: Optional[frozenset[Path]] = None,
+    ) -> Iterator[Path]:
+        """ファイルを列挙し、その時間をdiscoveryに加算します。"""
+        paths = super().iter_python_files(
+            directory, recursive, exclude_patterns, include_patterns, files=files
+        )
+        return self.stats.iter_measured("discovery", paths)
+
+    def _iter_analyze_files(self, files: Iterable[Path]) -> Iterator[FileRecord]:
+        """ファイルを解析し、結果を待つ時間を集計に加えます。"""
+        phase = "analysis" if self.executor is None else "wait"
+        return self.stats.iter_measured(phase, super()._iter_analyze_files(files))
+
+    def _read_bytes(self, file_path: Path) -> bytes:
+        data = self.stats.measure("read", super()._read_bytes, file_path)
+        self.stats.bytes_read += len(data)
+        return data
+
+    def _parse(self, source_code: str) -> ast.Module:
+        return self.stats.measure("parse", super()._parse, source_code)
@@ -0,0 +1,90 @@
+"""差分で変更された行の索引と、関数単位の絞り込み。"""
+
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Optional
+
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+
+
+def _merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """閉区間を開始行順に並べ、重なる・隣接する区間をまとめます。"""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class ChangedLines:
+    """ファイルごとの変更された行範囲(ハンク)の索引。
+
+    ハンクは構築時に一度だけ整列・併合され、互いに素な区間の列として
+    保持されます。関数の行範囲との重なりは、区間の終了行に対する二分探索
+    1回(O(log n))で判定できるため、巨大な差分でも問い合わせは安価です。
+    """
+
+    def __init__(self, hunks: Mapping[Path, Iterable[tuple[int, int]]]) -> None:
+        """索引を構築します。
+
+        Args:
+            hunks: ファイルの絶対パスから変更された行の閉区間(開始行, 終了行)への対応
+
+        """
+        self._starts: dict[Path, list[int]] = {}
+        self._ends: dict[Path, list[int]] = {}
+        for file_path, intervals in hunks.items():
+            merged = _merge_intervals(intervals)
+            self._starts[file_path] = [start for start, _ in merged]
+            self._ends[file_path] = [end for _, end in merged]
+
+    def files(self) -> list[Path]:
+        """変更されたファイルの絶対パスを返します。"""
+        return list(self._starts)
+
+    def overlaps(self, file_path: Path, start: int, end: int) -> bool:
+        """行範囲が変更された行と重なるか判定します。
+
+        Args:
+            file_path: ファイルの絶対パス
+            start: 範囲の開始行
+            end: 範囲の終了行(開始行を含む)
+
+        Returns:
+            範囲内のいずれかの行が変更されている場合はTrue
+
+        """
+        ends = self._ends.get(file_path)
+        if not ends:
+            return False
+        # 終了行がstart以上の最初の区間だけが重なりうる
+        index = bisect_left(ends, start)
+        return index < len(ends) and self._starts[file_path][index] <= end
+
+    def filter_record(self, record: FileRecord) -> FileRecord:
+        """変更された行に触れる関数のみを残した結果を返します。
+
+        Args:
+            record: ファイルの解析結果
+
+        Returns:
+            変更された行に触れる関数のみを持つ結果
+
+        """
+        file_path = Path(record.file_path).resolve()
+        return record._replace(
+            functions=tuple(
+                function
+                for function in record.functions
+                if self.overlaps(file_path, function.lineno, _end_line(function))
+            )
+        )
+
+
+def _end_line(function: FunctionRecord) -> int:
+    """関数の終了行を返します(不明な場合は開始行)。"""
+    end_lineno: Optional[int] = function.end_lineno
+    return end_lineno if end_lineno is not None else function.lineno
@@ -1,21 +1,43 @@
 """Pythonソースコードの複雑度解析モジュール。"""
 
 import ast
+import hashlib
+from collections.abc import Generator, Iterable, Iterator
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.domain.interfaces.caches import ResultCache
 from cccy.domain.interfaces.calculators import ComplexityCalculator
+from cccy.domain.interfaces.executors import FileAnalysisExecutor
+from cccy.domain.services.changed_lines import ChangedLines
+from cccy.domain.services.file_walker import PythonFileWalker
+
+if TYPE_CHECKING:
+    from cccy.domain.services.analysis_stats import AnalysisStats
+    from cccy.domain.services.profiling import ProfileSession
 
 
 class ComplexityAnalyzer:
     """複雑度メトリクスのためにPythonソースコードを解析します。"""
 
+    # 段階ごとの時間などの集計。集計するアナライザー(InstrumentedComplexityAnalyzer)のみ
+    stats: Optional["AnalysisStats"] = None
+    # ワーカープロセスでもプロファイルを取る場合のプロファイルの合算先
+    profile: Optional["ProfileSession"] = None
+
     def __init__(
         self,
         cyclomatic_calculator: ComplexityCalculator,
         cognitive_calculator: ComplexityCalculator,
         max_complexity: Optional[int] = None,
+        executor: Optional[FileAnalysisExecutor] = None,
+        result_cache: Optional[ResultCache] = None,
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+        changed_files: Optional[Iterable[Path]] = None,
+        changed_lines: Optional[ChangedLines] = None,
     ) -> None:
         """複雑度カルキュレーターを注入してアナライザーを初期化します。
 
@@ -23,11 +45,63 @@ class ComplexityAnalyzer:
             cyclomatic_calculator: 循環的複雑度カルキュレーター
             cognitive_calculator: 認知的複雑度カルキュレーター
             max_complexity: 許可される最大の循環的複雑度
+            executor: 複数ファイルの解析に使用するエグゼキューター(Noneの場合は逐次実行)
+            result_cache: ファイル内容のハッシュをキーとする結果キャッシュ(オプション)
+            default_excludes: 仮想環境やキャッシュなどのディレクトリを走査しないかどうか
+            respect_gitignore: gitが無視するファイルを解析対象から除外するかどうか
+            changed_files: 解析対象を絞り込む変更されたファイルの絶対パス
+                (Noneの場合は絞り込まない)
+            changed_lines: 結果の関数を変更された行に触れるものに絞り込む索引
+                (Noneの場合は絞り込まない)
 
         """
         self.max_complexity = max_complexity
         self.cyclomatic_calculator = cyclomatic_calculator
         self.cognitive_calculator = cognitive_calculator
+        self.executor = executor
+        self.result_cache = result_cache
+        self.default_excludes = default_excludes
+        self.respect_gitignore = respect_gitignore
+        self.changed_files = None if changed_files is None else frozenset(changed_files)
+        self.changed_lines = changed_lines
+
+    def is_selected_file(
+        self,
+        file_path: Union[str, Path],
+        files: Optional[frozenset[Path]] = None,
+    ) -> bool:
+        """変更ファイルによる絞り込みでファイルが解析対象に残るか判定します。
+
+        Args:
+            file_path: 判定するファイルのパス
+            files: さらに絞り込むファイルの絶対パス(Noneの場合は絞り込まない)
+
+        Returns:
+            絞り込みが無効、またはファイルが変更されている場合はTrue
+
+        """
+        selected = self.selected_files(files)
+        if selected is None:
+            return True
+        return Path(file_path).resolve() in selected
+
+    def selected_files(
+        self, files: Optional[frozenset[Path]] = None
+    ) -> Optional[frozenset[Path]]:
+        """変更ファイルによる絞り込みと ``files`` の両方に含まれるファイルを返します。
+
+        Args:
+            files: さらに絞り込むファイルの絶対パス(Noneの場合は絞り込まない)
+
+        Returns:
+            解析対象のファイルの絶対パス、または絞り込まない場合はNone
+
+        """
+        if files is None:
+            return self.changed_files
+        if self.changed_files is None:
+            return files
+        return files & self.changed_files
 
     def analyze_file(
         self, file_path: Union[str, Path]
@@ -40,6 +114,22 @@ class ComplexityAnalyzer:
         Returns:
             FileComplexityResultまたはファイルを解析できない場合はNone
 
+        """
+        record = self.analyze_file_record(file_path)
+        return record.to_result() if record is not None else None
+
+    def analyze_file_record(self, file_path: Union[str, Path]) -> Optional[FileRecord]:
+        """単一のPythonファイルを解析し、検証なしのレコードを返します。
+
+        エグゼキューターのワーカーなど、結果を公開APIに返す前に受け渡す
+        解析パイプライン内で使用します。
+
+        Args:
+            file_path: 解析するPythonファイルのパス
+
+        Returns:
+            FileRecordまたはファイルを解析できない場合はNone
+
         """
         file_path = Path(file_path)
 
@@ -50,13 +140,44 @@ class ComplexityAnalyzer:
             return None
 
         try:
-            with file_path.open(encoding="utf-8") as f:
-                source_code = f.read()
-
-            return self._analyze_source(str(file_path), source_code)
+            record = self._analyze_with_cache(
+                str(file_path), self._read_bytes(file_path)
+            )
         except (OSError, UnicodeDecodeError, SyntaxError):
             return None
 
+        if record is not None and self.changed_lines is not None:
+            # キャッシュには絞り込む前の結果を保存し、返す直前に絞り込む
+            return self.changed_lines.filter_record(record)
+        return record
+
+    def _analyze_with_cache(
+        self, file_path: str, source_bytes: bytes
+    ) -> Optional[FileRecord]:
+        """結果キャッシュがあれば参照し、ミスした場合のみソースを解析します。
+
+        Args:
+            file_path: ソースファイルのパス
+            source_bytes: ファイルの内容
+
+        Returns:
+            FileRecordまたは解析が失敗した場合はNone
+
+        """
+        if self.result_cache is None:
+            return self._analyze_source(file_path, source_bytes.decode("utf-8"))
+
+        content_hash = hashlib.sha256(source_bytes).hexdigest()
+        cached = self.result_cache.get(content_hash)
+        if cached is not None:
+            # 同じ内容の別ファイルの結果である可能性があるためパスを差し替える
+            return cached._replace(file_path=file_path)
+
+        record = self._analyze_source(file_path, source_bytes.decode("utf-8"))
+        if record is not None:
+            self.result_cache.put(content_hash, record)
+        return record
+
     def analyze_directory(
         self,
         directory: Union[str, Path],
@@ -76,90 +197,103 @@ class ComplexityAnalyzer:
             FileComplexityResultオブジェクトのリスト
 
         """
-        directory = Path(directory)
-        exclude_patterns = exclude_patterns or []
-        include_patterns = include_patterns or []
-
-        if not directory.exists() or not directory.is_dir():
-            return []
-
-        files_to_analyze = self._get_python_files(
-            directory, recursive, exclude_patterns, include_patterns
+        return list(
+            self.iter_analyze_directory(
+                directory, recursive, exclude_patterns, include_patterns
+            )
         )
-        return self._analyze_files(files_to_analyze)
 
-    def _get_python_files(
+    def iter_analyze_directory(
         self,
-        directory: Path,
-        recursive: bool,
-        exclude_patterns: list[str],
-        include_patterns: list[str],
-    ) -> list[Path]:
-        """ディレクトリから解析するPythonファイルのリストを取得します。
+        directory: Union[str, Path],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        *,
+        files: Optional[frozenset[Path]] = None,
+    ) -> Generator[FileComplexityResult, None, None]:
+        """ディレクトリ内のPythonファイルを解析し、結果をファイルごとに返します。
+
+        ファイルの列挙と解析は結果の消費に合わせて進むため、ディレクトリの
+        大きさによらずメモリ使用量は一定です。ジェネレーターを途中で閉じる
+        (``break`` や ``close()``)と、残りのファイルは解析されません。
 
         Args:
-            directory: 検索するディレクトリ
-            recursive: 再帰的に検索するかどうか
-            exclude_patterns: 除外するパターン
-            include_patterns: 含めるパターン(指定された場合、これらのみ)
+            directory: 解析するディレクトリ
+            recursive: サブディレクトリも解析するかどうか
+            exclude_patterns: 除外するグロブパターンのリスト
+            include_patterns: 含めるグロブパターンのリスト(指定した場合、これらのみが解析される)
+            files: 解析するファイルの絶対パス(Noneの場合は絞り込まない)
 
-        Returns:
-            解析するPythonファイルパスのリスト
+        Yields:
+            パス順のFileComplexityResult
 
         """
-        pattern = "**/*.py" if recursive else "*.py"
-        all_files = list(directory.glob(pattern))
+        directory = Path(directory)
+        if not directory.exists() or not directory.is_dir():
+            return
 
-        return [
-            file_path
-            for file_path in all_files
-            if self._should_include_file(file_path, exclude_patterns, include_patterns)
-        ]
+        paths = self.iter_python_files(
+            directory, recursive, exclude_patterns, include_patterns, files=files
+        )
+        for record in self._iter_analyze_files(paths):
+            yield record.to_result()
 
-    def _should_include_file(
-        self, file_path: Path, exclude_patterns: list[str], include_patterns: list[str]
-    ) -> bool:
-        """ファイルを解析に含めるかどうかを判定します。
+    def iter_python_files(
+        self,
+        directory: Union[str, Path],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        *,
+        files: Optional[frozenset[Path]] = None,
+    ) -> Iterator[Path]:
+        """ディレクトリから解析するPythonファイルを列挙します。
+
+        ``iter_analyze_directory`` が解析するファイルと同じファイルを、
+        解析せずに返します。
 
         Args:
-            file_path: ファイルのパス
+            directory: 検索するディレクトリ
+            recursive: 再帰的に検索するかどうか
             exclude_patterns: 除外するパターン
             include_patterns: 含めるパターン(指定された場合、これらのみ)
+            files: 列挙するファイルの絶対パス(Noneの場合は絞り込まない)
 
         Returns:
-            ファイルを含める必要がある場合はTrue
+            パス順の解析するPythonファイルパスのイテレーター
 
         """
-        # 除外されたファイルをスキップ
-        if any(file_path.match(pattern) for pattern in exclude_patterns):
-            return False
-
-        # インクルードパターンが指定されている場合、マッチするファイルのみを含める
-        if include_patterns:
-            return any(file_path.match(pattern) for pattern in include_patterns)
-
-        return True
+        directory = Path(directory)
+        walker = PythonFileWalker(
+            exclude_patterns or [],
+            include_patterns or [],
+            default_excludes=self.default_excludes,
+            respect_gitignore=self.respect_gitignore,
+        )
+        selected = self.selected_files(files)
+        if selected is not None:
+            # 変更ファイルだけを候補にすれば、ディレクトリ全体を走査せずに済む
+            return walker.filter_files(directory, selected, recursive)
+        return walker.walk(directory, recursive)
 
-    def _analyze_files(self, files: list[Path]) -> list[FileComplexityResult]:
-        """ファイルのリストを解析します。
+    def _iter_analyze_files(self, files: Iterable[Path]) -> Iterator[FileRecord]:
+        """ファイルを解析し、結果を入力順に逐次返します。
 
         Args:
-            files: 解析するファイルパスのリスト
+            files: 解析するファイルパス
 
         Returns:
-            解析結果のリスト
+            入力ファイルと同じ順序の解析結果のレコードのイテレーター
 
         """
-        results = []
-        for file_path in files:
-            result = self.analyze_file(file_path)
-            if result:
-                results.append(result)
-        return results
-
-    def _analyze_source(
-        self, file_path: str, source_code: str
-    ) -> Optional[FileComplexityResult]:
+        if self.executor is not None:
+            return self.executor.iter_execute(self, files)
+
+        records = map(self.analyze_file_record, files)
+        return (record for record in records if record is not None)
+
+    def _analyze_source(self, file_path: str, source_code: str) -> Optional[FileRecord]:
         """複雑度メトリクスのためにソースコードを解析します。
 
         Args:
@@ -167,54 +301,56 @@ class ComplexityAnalyzer:
             source_code: 解析するPythonソースコード
 
         Returns:
-            FileComplexityResultまたは解析が失敗した場合はNone
+            FileRecordまたは解析が失敗した場合はNone
 
         """
         try:
-            tree = ast.parse(source_code)
+            tree = self._parse(source_code)
         except SyntaxError:
             return None
 
+        return FileRecord(file_path, self.analyze_tree(tree))
+
+    def _read_bytes(self, file_path: Path) -> bytes:
+        """ファイルの内容を読み込みます。"""
+        return file_path.read_bytes()
+
+    def _parse(self, source_code: str) -> ast.Module:
+        """ソースコードを構文木に変換します。"""
+        return ast.parse(source_code)
+
+    def analyze_tree(self, tree: ast.AST) -> tuple[FunctionRecord, ...]:
+        """構文木に含まれるすべての関数の複雑度を計算します。
+
+        Args:
+            tree: 解析する構文木(モジュールまたはその一部の文)
+
+        Returns:
+            関数ごとのFunctionRecordのタプル(外側の関数が先)
+
+        """
         functions = []
-        total_cyclomatic = 0
-        total_cognitive = 0
-        max_cyclomatic = 0
-        max_cognitive = 0
 
+        # ast.walkは外側の関数を内側の関数より先に返すため、内側の関数の結果を
+        # メモするカルキュレーターは外側の関数の計算結果を再利用できる
         for node in ast.walk(tree):
             if isinstance(
                 node, (ast.FunctionDef, ast.AsyncFunctionDef)
             ):  # 関数と非同期関数
-                # カルキュレーターを使用して循環的複雑度を計算
-                cyclomatic = self.cyclomatic_calculator.calculate(node)
-
-                # カルキュレーターを使用して認知的複雑度を計算
-                cognitive = self.cognitive_calculator.calculate(node)
-
-                result = ComplexityResult(
-                    name=node.name,
-                    cyclomatic_complexity=cyclomatic,
-                    cognitive_complexity=cognitive,
-                    lineno=node.lineno,
-                    col_offset=node.col_offset,
-                    end_lineno=getattr(node, "end_lineno", None),
-                    end_col_offset=getattr(node, "end_col_offset", None),
+                # 関数ごとのPydanticモデルの検証は重いため、軽量なレコードで保持する
+                functions.append(
+                    FunctionRecord(
+                        node.name,
+                        self.cyclomatic_calculator.calculate(node),
+                        self.cognitive_calculator.calculate(node),
+                        node.lineno,
+                        node.col_offset,
+                        getattr(node, "end_lineno", None),
+                        getattr(node, "end_col_offset", None),
+                    )
                 )
 
-                functions.append(result)
-                total_cyclomatic += cyclomatic
-                total_cognitive += cognitive
-                max_cyclomatic = max(max_cyclomatic, cyclomatic)
-                max_cognitive = max(max_cognitive, cognitive)
-
-        return FileComplexityResult(
-            file_path=file_path,
-            functions=functions,
-            total_cyclomatic=total_cyclomatic,
-            total_cognitive=total_cognitive,
-            max_cyclomatic=max_cyclomatic,
-            max_cognitive=max_cognitive,
-        )
+        return tuple(functions)
 
     def should_fail(self, results: list[FileComplexityResult]) -> bool:
         """複雑度の闾値に基づいて解析が失敗すべきかどうかを判定します。
@@ -0,0 +1,272 @@
+"""解析対象のPythonファイルを列挙するディレクトリウォーカー。"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path, PurePosixPath
+from typing import Optional
+
+from cccy.domain.services.gitignore import GitIgnoreContext, create_gitignore_context
+from cccy.domain.services.glob import IGNORECASE, translate_glob_part
+
+# 既定で走査しない仮想環境・キャッシュのディレクトリ名
+# (名前は任意の深さで一致するため、build・distのようにソースのパッケージ
+# 名にもなり得る名前は含めず、--excludeでの指定に任せる)
+DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset(
+    {
+        ".bzr",
+        ".cccy_cache",
+        ".direnv",
+        ".eggs",
+        ".git",
+        ".hg",
+        ".ipynb_checkpoints",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".pytype",
+        ".ruff_cache",
+        ".svn",
+        ".tox",
+        ".venv",
+        "__pycache__",
+        "__pypackages__",
+        "node_modules",
+        "venv",
+    }
+)
+DEFAULT_EXCLUDE_DIR_SUFFIXES = (".egg-info",)
+
+_WILDCARD_PARTS = frozenset({"*", "**"})
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+def _translate_pattern(parts: tuple[str, ...]) -> str:
+    """グロブの構成要素の並びをパスの末尾に一致する正規表現に変換します。
+
+    ``Path.match`` と同様に、相対パターンはパスの右端から構成要素単位で
+    照合し、絶対パターンはパス全体と照合します。
+    """
+    if parts[0] == "/":
+        return "^/" + "/".join(translate_glob_part(part) for part in parts[1:]) + r"\Z"
+    return "(?:^|/)" + "/".join(translate_glob_part(part) for part in parts) + r"\Z"
+
+
+def _compile(regexes: list[str]) -> re.Pattern[str]:
+    """正規表現のリストを1つの選択パターンにまとめます。"""
+    if not regexes:
+        return _NEVER_MATCH
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes), IGNORECASE)
+
+
+class GlobMatcher:
+    """複数のグロブパターンを1つの正規表現にまとめたマッチャー。
+
+    ファイルの判定は ``Path.match`` と互換です。ディレクトリは、パターン
+    そのもの、または末尾の ``/*`` を除いたパターンに一致する場合に
+    配下全体が一致するとみなします。
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """パターンをコンパイルします。
+
+        Args:
+            patterns: グロブパターンのリスト
+
+        Raises:
+            ValueError: 空のパターンが含まれる場合
+
+        """
+        file_regexes: list[str] = []
+        directory_regexes: list[str] = []
+        for pattern in patterns:
+            parts = PurePosixPath(pattern.replace("\\", "/")).parts
+            if not parts:
+                raise ValueError(f"empty pattern: {pattern!r}")
+            file_regexes.append(_translate_pattern(parts))
+            directory_regexes.append(_translate_pattern(parts))
+            if len(parts) > 1 and parts[-1] in _WILDCARD_PARTS:
+                directory_regexes.append(_translate_pattern(parts[:-1]))
+
+        self.is_empty = not file_regexes
+        self._file_regex = _compile(file_regexes)
+        self._directory_regex = _compile(directory_regexes)
+
+    def match(self, path: str) -> bool:
+        """``/`` 区切りのファイルパスがいずれかのパターンに一致するか判定します。"""
+        return self._file_regex.search(path) is not None
+
+    def match_directory(self, path: str) -> bool:
+        """``/`` 区切りのディレクトリパスの配下全体が一致するか判定します。"""
+        return self._directory_regex.search(path) is not None
+
+
+def _prefix(directory: Path) -> str:
+    """ディレクトリ配下のパスを組み立てるための ``/`` 区切りの接頭辞を返します。"""
+    root = directory.as_posix()
+    return "" if root == "." else root.rstrip("/") + "/"
+
+
+def is_default_excluded_dir(name: str) -> bool:
+    """既定で走査しないディレクトリ名かどうかを判定します。"""
+    return name in DEFAULT_EXCLUDE_DIRS or name.endswith(DEFAULT_EXCLUDE_DIR_SUFFIXES)
+
+
+class PythonFileWalker:
+    """``os.scandir`` で走査し、除外されたディレクトリには降りないウォーカー。
+
+    ファイルはパス順(``sorted(directory.glob("**/*.py"))`` と同じ順序)で
+    逐次返されます。
+    """
+
+    def __init__(
+        self,
+        exclude_patterns: Optional[Iterable[str]] = None,
+        include_patterns: Optional[Iterable[str]] = None,
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+    ) -> None:
+        """ウォーカーを初期化します。
+
+        Args:
+            exclude_patterns: 除外するグロブパターンのリスト
+            include_patterns: 含めるグロブパターンのリスト(指定した場合、これらのみ)
+            default_excludes: 仮想環境やキャッシュなどのディレクトリを除外するかどうか
+            respect_gitignore: gitが無視するファイルとディレクトリを除外するかどうか
+
+        """
+        self.exclude = GlobMatcher(exclude_patterns or [])
+        self.include = GlobMatcher(include_patterns or [])
+        self.default_excludes = default_excludes
+        self.respect_gitignore = respect_gitignore
+
+    def walk(self, directory: Path, recursive: bool = True) -> Iterator[Path]:
+        """ディレクトリ内の解析対象のPythonファイルを返します。
+
+        Args:
+            directory: 走査するディレクトリ(これ自体は除外の対象になりません)
+            recursive: サブディレクトリも走査するかどうか
+
+        Yields:
+            解析対象のPythonファイルのパス
+
+        """
+        ignore = create_gitignore_context(directory) if self.respect_gitignore else None
+        yield from self._walk(str(directory), _prefix(directory), recursive, ignore)
+
+    def filter_files(
+        self, directory: Path, files: Iterable[Path], recursive: bool = True
+    ) -> Iterator[Path]:
+        """ディレクトリを走査せずに、候補のファイルから解析対象を選びます。
+
+        ``walk`` が返すファイルのうち ``files`` に含まれるものを、``walk`` と
+        同じパス表記・同じ順序で返します。変更されたファイルだけを解析する
+        場合など、候補が少ないときにディレクトリ全体の走査を省けます。
+
+        Args:
+            directory: 走査するディレクトリ
+            files: 候補のファイルの絶対パス(シンボリックリンク解決済み)
+            recursive: サブディレクトリのファイルも対象にするかどうか
+
+        Yields:
+            解析対象のPythonファイルのパス
+
+        """
+        root = directory.resolve()
+        relative_parts = [
+            file_path.relative_to(root).parts
+            for file_path in files
+            if file_path.is_relative_to(root)
+        ]
+
+        prefix = _prefix(directory)
+        ignore = (
+            create_gitignore_context(directory).enter_directory()
+            if self.respect_gitignore
+            else None
+        )
+        for parts in sorted(relative_parts):
+            if (recursive or len(parts) == 1) and self._accepts(prefix, parts, ignore):
+                yield Path(prefix + "/".join(parts))
+
+    def _walk(
+        self,
+        dir_path: str,
+        prefix: str,
+        recursive: bool,
+        ignore: Optional[GitIgnoreContext],
+    ) -> Iterator[Path]:
+        """1つのディレクトリを走査し、必要に応じてサブディレクトリに降ります。"""
+        entries = self._scan(dir_path)
+        if ignore is not None:
+            ignore = ignore.enter(entries)
+
+        for entry in entries:
+            yield from self._visit_entry(entry, prefix, recursive, ignore)
+
+    def _visit_entry(
+        self,
+        entry: os.DirEntry[str],
+        prefix: str,
+        recursive: bool,
+        ignore: Optional[GitIgnoreContext],
+    ) -> Iterator[Path]:
+        """ファイルであれば判定して返し、ディレクトリであれば走査します。"""
+        posix_path = prefix + entry.name
+        if not self._is_dir(entry):
+            if self._should_include(entry.name, posix_path, ignore):
+                yield Path(posix_path)
+        elif recursive and self._should_descend(entry.name, posix_path, ignore):
+            child = ignore.child(entry.name) if ignore is not None else None
+            yield from self._walk(entry.path, posix_path + "/", recursive, child)
+
+    def _accepts(
+        self,
+        prefix: str,
+        parts: tuple[str, ...],
+        ignore: Optional[GitIgnoreContext],
+    ) -> bool:
+        """``walk`` が相対パスのファイルを返すかどうかを判定します。"""
+        posix_path = prefix
+        for name in parts[:-1]:
+            if not self._should_descend(name, posix_path + name, ignore):
+                return False
+            if ignore is not None:
+                ignore = ignore.child(name).enter_directory()
+            posix_path += name + "/"
+        return self._should_include(parts[-1], posix_path + parts[-1], ignore)
+
+    def _scan(self, dir_path: str) -> list[os.DirEntry[str]]:
+        """ディレクトリのエントリを名前順に取得します(読めない場合は空)。"""
+        try:
+            with os.scandir(dir_path) as entries:
+                return sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            return []
+
+    def _is_dir(self, entry: os.DirEntry[str]) -> bool:
+        """シンボリックリンクではないディレクトリかどうかを判定します。"""
+        try:
+            return entry.is_dir(follow_symlinks=False)
+        except OSError:
+            return False
+
+    def _should_descend(
+        self, name: str, posix_path: str, ignore: Optional[GitIgnoreContext]
+    ) -> bool:
+        """サブディレクトリを走査するかどうかを判定します。"""
+        if self.default_excludes and is_default_excluded_dir(name):
+            return False
+        if self.exclude.match_directory(posix_path):
+            return False
+        return ignore is None or not ignore.is_ignored(name, is_dir=True)
+
+    def _should_include(
+        self, name: str, posix_path: str, ignore: Optional[GitIgnoreContext]
+    ) -> bool:
+        """ファイルを解析に含めるかどうかを判定します。"""
+        if not name.endswith(".py") or self.exclude.match(posix_path):
+            return False
+        if ignore is not None and ignore.is_ignored(name, is_dir=False):
+            return False
+        return self.include.is_empty or self.include.match(posix_path)
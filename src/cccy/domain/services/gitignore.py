@@ -0,0 +1,370 @@
+""".gitignoreのルールを解釈し、gitが無視するパスを判定するモジュール。
+
+各ディレクトリの.gitignoreは一度だけ解析し、リポジトリごとのトライ
+(ディレクトリ構造と同じ形の木)にキャッシュします。キャッシュは
+.gitignoreのmtimeで無効化されるため、同じプロセスで繰り返し走査しても
+変更が反映されます。
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from cccy.domain.services.glob import IGNORECASE, translate_glob_part
+
+GITIGNORE_FILE = ".gitignore"
+_GIT_DIR = ".git"
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+class GitIgnoreRule:
+    """.gitignoreの1行分のルール。"""
+
+    __slots__ = ("directory_only", "negated", "regex")
+
+    def __init__(
+        self, regex: re.Pattern[str], negated: bool, directory_only: bool
+    ) -> None:
+        self.regex = regex
+        self.negated = negated
+        self.directory_only = directory_only
+
+    def matches(self, path: str, is_dir: bool) -> bool:
+        """.gitignoreのディレクトリからの相対パスに一致するか判定します。"""
+        if self.directory_only and not is_dir:
+            return False
+        return self.regex.match(path) is not None
+
+
+def _strip_trailing_spaces(line: str) -> str:
+    """エスケープされていない末尾の空白を取り除きます。"""
+    while line.endswith(" ") and not line.endswith("\\ "):
+        line = line[:-1]
+    return line
+
+
+def _translate_gitignore_part(part: str, is_last: bool) -> str:
+    """.gitignoreのパターンの構成要素1つ分を正規表現に変換します。"""
+    if part == "**":
+        # 末尾の "/**" は配下すべて、それ以外は0個以上のディレクトリ
+        return ".*" if is_last else "(?:.*/)?"
+    return translate_glob_part(part) + ("" if is_last else "/")
+
+
+def _translate_gitignore_pattern(pattern: str) -> str:
+    """``/`` を含みうる.gitignoreのパターンを正規表現に変換します。"""
+    parts = pattern.split("/")
+    last = len(parts) - 1
+    return "".join(
+        _translate_gitignore_part(part, index == last)
+        for index, part in enumerate(parts)
+    )
+
+
+def parse_gitignore_line(line: str) -> Optional[GitIgnoreRule]:
+    """.gitignoreの1行をルールに変換します。
+
+    Args:
+        line: .gitignoreの1行(改行を含まない)
+
+    Returns:
+        GitIgnoreRule、または空行・コメントの場合はNone
+
+    """
+    line = _strip_trailing_spaces(line)
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated or line.startswith(("\\!", "\\#")):
+        line = line[1:]
+
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # 先頭または途中に "/" を含むパターンは.gitignoreのディレクトリに固定される
+    anchored = "/" in line
+    regex = _translate_gitignore_pattern(line.lstrip("/"))
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return GitIgnoreRule(re.compile(regex + r"\Z", IGNORECASE), negated, directory_only)
+
+
+class GitIgnoreRules:
+    """1つの.gitignore(または.git/info/exclude)のルールの集合。"""
+
+    def __init__(self, base: str, rules: list[GitIgnoreRule]) -> None:
+        """ルールの集合を初期化します。
+
+        Args:
+            base: リポジトリルートからの.gitignoreのディレクトリ("" はルート)
+            rules: ファイル内の順序のルール
+
+        """
+        self.base = base
+        self._prefix_length = len(base) + 1 if base else 0
+        self._reversed_rules = rules[::-1]
+        # 否定ルールがなければ、どれか1つに一致するかだけを調べればよい
+        self._any_rule: Optional[re.Pattern[str]] = None
+        if not any(rule.negated or rule.directory_only for rule in rules):
+            self._any_rule = re.compile(
+                "|".join(rule.regex.pattern for rule in rules) or _NEVER_MATCH.pattern,
+                IGNORECASE,
+            )
+
+    @classmethod
+    def from_lines(cls, base: str, lines: list[str]) -> "GitIgnoreRules":
+        """.gitignoreの行からルールの集合を作成します。"""
+        rules = [parse_gitignore_line(line) for line in lines]
+        return cls(base, [rule for rule in rules if rule is not None])
+
+    @classmethod
+    def from_file(cls, base: str, path: Path) -> "GitIgnoreRules":
+        """.gitignoreファイルを読み込みます(読めない場合はルールなし)。"""
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            text = ""
+        return cls.from_lines(base, text.splitlines())
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """リポジトリルートからの相対パスを判定します。
+
+        Args:
+            path: リポジトリルートからの ``/`` 区切りの相対パス
+            is_dir: パスがディレクトリかどうか
+
+        Returns:
+            無視される場合はTrue、否定ルールで再度含められる場合はFalse、
+            どのルールにも一致しない場合はNone
+
+        """
+        relative = path[self._prefix_length :]
+        if self._any_rule is not None:
+            return True if self._any_rule.match(relative) else None
+        for rule in self._reversed_rules:
+            if rule.matches(relative, is_dir):
+                return not rule.negated
+        return None
+
+
+class _IgnoreNode:
+    """トライの各ディレクトリに対応するノード。"""
+
+    __slots__ = ("children", "mtime_ns", "rules")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _IgnoreNode] = {}
+        self.mtime_ns: Optional[int] = None
+        self.rules: Optional[GitIgnoreRules] = None
+
+
+class GitIgnoreTree:
+    """リポジトリ内の.gitignoreをディレクトリごとにキャッシュするトライ。"""
+
+    def __init__(self, root: Path) -> None:
+        """トライを初期化します。
+
+        Args:
+            root: リポジトリのルートディレクトリ(絶対パス)
+
+        """
+        self.root = root
+        self._root_node = _IgnoreNode()
+        self._info_exclude = _IgnoreNode()
+
+    def rules_for(
+        self, relative_dir: str, mtime_ns: Optional[int] = None
+    ) -> Optional[GitIgnoreRules]:
+        """ディレクトリの.gitignoreのルールを取得します。
+
+        Args:
+            relative_dir: リポジトリルートからの ``/`` 区切りの相対パス
+            mtime_ns: 既知の.gitignoreのmtime(Noneの場合はstatで取得)
+
+        Returns:
+            GitIgnoreRules、または.gitignoreがない場合はNone
+
+        """
+        node = self._root_node
+        for name in filter(None, relative_dir.split("/")):
+            node = node.children.setdefault(name, _IgnoreNode())
+        path = self.root / relative_dir / GITIGNORE_FILE
+        return self._load(node, relative_dir, path, mtime_ns)
+
+    def ancestor_rules(self, relative_dir: str) -> list[GitIgnoreRules]:
+        """ディレクトリより上位に適用されるルールを浅い順に取得します。
+
+        Args:
+            relative_dir: リポジトリルートからの ``/`` 区切りの相対パス
+
+        Returns:
+            .git/info/excludeとルートから親ディレクトリまでの.gitignoreのルール
+
+        """
+        info_exclude = self.root / _GIT_DIR / "info" / "exclude"
+        chain = [self._load(self._info_exclude, "", info_exclude, None)]
+
+        parts = [name for name in relative_dir.split("/") if name]
+        for depth in range(len(parts)):
+            chain.append(self.rules_for("/".join(parts[:depth])))
+        return [rules for rules in chain if rules is not None]
+
+    def _load(
+        self,
+        node: _IgnoreNode,
+        base: str,
+        path: Path,
+        mtime_ns: Optional[int],
+    ) -> Optional[GitIgnoreRules]:
+        """mtimeが変わっている場合のみ.gitignoreを読み直します。"""
+        if mtime_ns is None:
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                node.mtime_ns, node.rules = None, None
+                return None
+
+        if node.mtime_ns != mtime_ns:
+            node.rules = GitIgnoreRules.from_file(base, path)
+            node.mtime_ns = mtime_ns
+        return node.rules
+
+
+class GitIgnoreContext:
+    """走査中のディレクトリに適用される.gitignoreのルールの連鎖。"""
+
+    __slots__ = ("chain", "relative_dir", "tree")
+
+    def __init__(
+        self, tree: GitIgnoreTree, relative_dir: str, chain: tuple[GitIgnoreRules, ...]
+    ) -> None:
+        """コンテキストを初期化します。
+
+        Args:
+            tree: リポジトリのトライ
+            relative_dir: リポジトリルートからのディレクトリの相対パス
+            chain: 浅い順に並んだ適用されるルール(このディレクトリ自身を除く)
+
+        """
+        self.tree = tree
+        self.relative_dir = relative_dir
+        self.chain = chain
+
+    def enter(self, entries: list[os.DirEntry[str]]) -> "GitIgnoreContext":
+        """ディレクトリのエントリに.gitignoreがあれば、そのルールを連鎖に加えます。
+
+        Args:
+            entries: ディレクトリのエントリ
+
+        Returns:
+            このディレクトリの.gitignoreを含むコンテキスト
+
+        """
+        entry = next((e for e in entries if e.name == GITIGNORE_FILE), None)
+        if entry is None:
+            return self
+        try:
+            mtime_ns = entry.stat().st_mtime_ns
+        except OSError:
+            return self
+        return self._with_rules(mtime_ns)
+
+    def enter_directory(self) -> "GitIgnoreContext":
+        """エントリを走査せずに、このディレクトリの.gitignoreを連鎖に加えます。
+
+        Returns:
+            このディレクトリの.gitignoreを含むコンテキスト
+
+        """
+        path = self.tree.root / self.relative_dir / GITIGNORE_FILE
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return self
+        return self._with_rules(mtime_ns)
+
+    def _with_rules(self, mtime_ns: int) -> "GitIgnoreContext":
+        """このディレクトリの.gitignoreのルールを加えたコンテキストを返します。"""
+        rules = self.tree.rules_for(self.relative_dir, mtime_ns)
+        if rules is None:
+            return self
+        return GitIgnoreContext(self.tree, self.relative_dir, (*self.chain, rules))
+
+    def child(self, name: str) -> "GitIgnoreContext":
+        """サブディレクトリのコンテキストを返します。"""
+        return GitIgnoreContext(self.tree, self._join(name), self.chain)
+
+    def is_ignored(self, name: str, is_dir: bool) -> bool:
+        """このディレクトリ直下のエントリをgitが無視するか判定します。
+
+        Args:
+            name: エントリ名
+            is_dir: エントリがディレクトリかどうか
+
+        Returns:
+            無視される場合はTrue
+
+        """
+        if is_dir and name == _GIT_DIR:
+            return True
+        path = self._join(name)
+        # 深い.gitignoreほど優先される
+        for rules in reversed(self.chain):
+            matched = rules.match(path, is_dir)
+            if matched is not None:
+                return matched
+        return False
+
+    def _join(self, name: str) -> str:
+        """リポジトリルートからのエントリの相対パスを返します。"""
+        return f"{self.relative_dir}/{name}" if self.relative_dir else name
+
+
+def find_repository_root(directory: Path) -> Optional[Path]:
+    """ディレクトリを含むgitリポジトリのルートを探します。
+
+    Args:
+        directory: 探索を始めるディレクトリ(絶対パス)
+
+    Returns:
+        リポジトリのルート、または見つからない場合はNone
+
+    """
+    for candidate in (directory, *directory.parents):
+        if (candidate / _GIT_DIR).exists():
+            return candidate
+    return None
+
+
+# プロセス内で共有するリポジトリルートごとのトライ
+_TREES: dict[Path, GitIgnoreTree] = {}
+
+
+def create_gitignore_context(directory: Path) -> GitIgnoreContext:
+    """ディレクトリを走査するための.gitignoreのコンテキストを作成します。
+
+    gitリポジトリの外では、走査するディレクトリをルートとみなして
+    その配下の.gitignoreのみを適用します。
+
+    Args:
+        directory: 走査を始めるディレクトリ
+
+    Returns:
+        ディレクトリ自身の.gitignoreを除く上位のルールを持つコンテキスト
+
+    """
+    directory = directory.resolve()
+    root = find_repository_root(directory) or directory
+    tree = _TREES.get(root)
+    if tree is None:
+        tree = _TREES[root] = GitIgnoreTree(root)
+
+    relative_dir = directory.relative_to(root).as_posix()
+    relative_dir = "" if relative_dir == "." else relative_dir
+    return GitIgnoreContext(
+        tree, relative_dir, tuple(tree.ancestor_rules(relative_dir))
+    )
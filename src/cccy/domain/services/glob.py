@@ -0,0 +1,65 @@
+"""パスの構成要素単位のグロブを正規表現に変換するモジュール。"""
+
+import os
+import re
+
+# Path.match と同様に、Windowsでは大文字と小文字を区別しない
+IGNORECASE = re.IGNORECASE if os.name == "nt" else 0
+
+_WILDCARD_TOKENS = {"*": "[^/]*", "?": "[^/]"}
+
+
+def _translate_bracket(part: str, start: int) -> tuple[str, int]:
+    """``[`` から始まる文字クラスを正規表現に変換します。
+
+    Args:
+        part: パターンの構成要素
+        start: ``[`` の次の位置
+
+    Returns:
+        (正規表現, 次に読む位置)のタプル
+
+    """
+    end = start
+    if end < len(part) and part[end] == "!":
+        end += 1
+    if end < len(part) and part[end] == "]":
+        end += 1
+    end = part.find("]", end)
+    if end < 0:
+        return re.escape("["), start
+
+    body = part[start:end].replace("\\", "\\\\")
+    if body.startswith("!"):
+        body = "^/" + body[1:]
+    elif body.startswith(("^", "[")):
+        body = "\\" + body
+    return f"[{body}]", end + 1
+
+
+def translate_glob_part(part: str) -> str:
+    """パスの構成要素1つ分のグロブを、``/`` をまたがない正規表現に変換します。
+
+    Args:
+        part: ``*``、``?``、``[...]`` を含みうるパスの構成要素
+
+    Returns:
+        正規表現文字列(``\\`` は次の1文字をエスケープします)
+
+    """
+    regex = []
+    index = 0
+    while index < len(part):
+        char = part[index]
+        index += 1
+        if char in _WILDCARD_TOKENS:
+            regex.append(_WILDCARD_TOKENS[char])
+        elif char == "[":
+            translated, index = _translate_bracket(part, index)
+            regex.append(translated)
+        elif char == "\\" and index < len(part):
+            regex.append(re.escape(part[index]))
+            index += 1
+        else:
+            regex.append(re.escape(char))
+    return "".join(regex)
@@ -0,0 +1,210 @@
+"""編集中のソースコードをトップレベルの定義単位で再解析するモジュール。"""
+
+import ast
+import io
+import tokenize
+from typing import NamedTuple
+
+from cccy.domain.entities.records import FunctionRecord
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+
+
+class _Block(NamedTuple):
+    """トップレベルの文1つが占める行範囲(1始まりの閉区間)とその関数。
+
+    構文エラーのある範囲は ``valid`` がFalseのブロック1つにまとめ、
+    その範囲に以前あった関数の結果を保持します。
+    """
+
+    start: int
+    end: int
+    functions: tuple[FunctionRecord, ...]
+    valid: bool = True
+
+
+def split_lines(source: str) -> list[str]:
+    """ソースを改行(\\n、\\r\\n、\\r)を残したまま行に分割します。
+
+    ``str.splitlines`` はPythonの構文では改行でない文字(改ページなど)でも
+    分割するため、行番号がastと一致しなくなります。
+    """
+    return io.StringIO(source, newline="").readlines()
+
+
+def _common_affixes(old: list[str], new: list[str]) -> tuple[int, int]:
+    """2つの行のリストで共通する先頭と末尾の行数を返します(重なりなし)。"""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def _is_unterminated(source: str) -> bool:
+    """文字列・括弧・行継続が末尾まで閉じていないかどうかを判定します。"""
+    try:
+        for _ in tokenize.generate_tokens(io.StringIO(source).readline):
+            pass
+    except tokenize.TokenError:
+        return True
+    except SyntaxError:  # インデントの不整合などは範囲内で完結したエラー
+        return False
+    return False
+
+
+def _shift(block: _Block, delta: int) -> _Block:
+    """ブロックとその関数の行番号をずらします。"""
+    if delta == 0:
+        return block
+    return _Block(
+        block.start + delta,
+        block.end + delta,
+        tuple(
+            function._replace(
+                lineno=function.lineno + delta,
+                end_lineno=None
+                if function.end_lineno is None
+                else function.end_lineno + delta,
+            )
+            for function in block.functions
+        ),
+        block.valid,
+    )
+
+
+class IncrementalSourceAnalyzer:
+    """1つのソースコードの解析結果を保持し、編集された定義だけを再解析します。
+
+    前回の内容との差分の行を含むトップレベルの文と、その前後の文だけを
+    切り出して構文解析し、それ以外の文の結果は行番号をずらして再利用します。
+    切り出した範囲に構文エラーがある場合は、その範囲を以前の結果のまま
+    残すため、入力途中の定義があってもファイルの他の部分は更新されます。
+    閉じていない文字列や括弧が範囲の外まで続く場合に限り、より広い範囲を
+    解析し直します。
+    """
+
+    def __init__(self, analyzer: ComplexityAnalyzer) -> None:
+        """解析器を初期化します。
+
+        Args:
+            analyzer: 関数の複雑度の計算に使用するアナライザー
+
+        """
+        self.analyzer = analyzer
+        self.lines: list[str] = []
+        self._blocks: list[_Block] = []
+
+    @property
+    def functions(self) -> tuple[FunctionRecord, ...]:
+        """関数の解析結果を行順に返します。
+
+        構文エラーのある範囲については、その範囲が最後に構文解析できた
+        ときの結果を返します。
+        """
+        return tuple(function for block in self._blocks for function in block.functions)
+
+    @property
+    def is_valid(self) -> bool:
+        """現在の内容全体が構文解析できたかどうか。"""
+        return all(block.valid for block in self._blocks)
+
+    def update(self, source: str) -> bool:
+        """新しい内容で解析結果を更新します。
+
+        Args:
+            source: ソースコード全体
+
+        Returns:
+            内容全体が構文解析できた場合はTrue
+
+        """
+        lines = split_lines(source)
+        prefix, suffix = _common_affixes(self.lines, lines)
+        if prefix == len(lines) == len(self.lines):
+            return self.is_valid
+
+        delta = len(lines) - len(self.lines)
+        before, changed, after = self._partition(prefix + 1, len(self.lines) - suffix)
+        start = before[-1].end + 1 if before else 1
+        end = after[0].start + delta - 1 if after else len(lines)
+
+        try:
+            middle = self._parse_blocks(lines, start, end)
+        except SyntaxError:
+            before, middle, after = self._recover(
+                lines, (start, end), before, changed, after
+            )
+
+        self.lines = lines
+        self._blocks = before + middle + [_shift(block, delta) for block in after]
+        return self.is_valid
+
+    def _partition(
+        self, first_changed: int, last_changed: int
+    ) -> tuple[list[_Block], list[_Block], list[_Block]]:
+        """ブロックを変更(旧い行番号)の前・変更に関わるもの・後に分けます。
+
+        変更の前のブロックは、その次のブロックも変更の前から始まる場合に
+        限り影響を受けません(変更がインデントされた行の追加であれば、
+        直前の文の本体の続きになるため)。構文エラーの範囲の開始行は文の
+        開始行ではないため、その範囲の行は直前の文の続きである場合があり、
+        構文エラーの範囲の直前のブロックも変更に関わるものとします。変更の
+        直後のブロックも、追加されたデコレーターが付く場合があるため変更に
+        関わるものとします。
+        """
+        blocks = self._blocks
+        first = 0
+        while first + 1 < len(blocks) and blocks[first + 1].start < first_changed:
+            first += 1
+        while first > 0 and not blocks[first].valid:
+            first -= 1
+        last = first
+        while last < len(blocks) and blocks[last].start <= last_changed:
+            last += 1
+        last = min(last + 1, len(blocks))
+        return blocks[:first], blocks[first:last], blocks[last:]
+
+    def _recover(
+        self,
+        lines: list[str],
+        region: tuple[int, int],
+        before: list[_Block],
+        changed: list[_Block],
+        after: list[_Block],
+    ) -> tuple[list[_Block], list[_Block], list[_Block]]:
+        """切り出した範囲を構文解析できない場合の前・範囲・後のブロックを返します。"""
+        start, end = region
+        if _is_unterminated("".join(lines[start - 1 : end])):
+            # 閉じていない文字列などは後続の行で閉じられている場合がある。
+            # 前に構文エラーの範囲があれば、そこで開いたものかもしれない
+            reparse_from = start if all(block.valid for block in before) else 1
+            try:
+                middle = self._parse_blocks(lines, reparse_from, len(lines))
+            except SyntaxError:
+                pass
+            else:
+                return (before if reparse_from == start else []), middle, []
+
+        functions = tuple(function for block in changed for function in block.functions)
+        return before, [_Block(start, end, functions, valid=False)], after
+
+    def _parse_blocks(self, lines: list[str], start: int, end: int) -> list[_Block]:
+        """行範囲を構文解析し、トップレベルの文ごとのブロックに分けます。
+
+        Raises:
+            SyntaxError: 行範囲が単独で構文解析できない場合
+
+        """
+        tree = ast.parse("".join(lines[start - 1 : end]))
+        offset = start - 1
+        blocks = []
+        for node in tree.body:
+            decorators = getattr(node, "decorator_list", [])
+            first = min([node.lineno] + [d.lineno for d in decorators])
+            last = getattr(node, "end_lineno", None) or node.lineno
+            block = _Block(first, last, self.analyzer.analyze_tree(node))
+            blocks.append(_shift(block, offset))
+        return blocks
@@ -0,0 +1,250 @@
+"""コマンド全体のプロファイルを取るモジュール。
+
+親プロセスはコマンドの実行中ずっと、``cProfile`` による関数ごとの集計と、
+別スレッドから一定間隔でスタックを採取するサンプリングの両方で
+プロファイルを取ります。並列に解析する場合は各ワーカーがチャンクごとに
+取ったプロファイルを合算します。結果は ``pstats`` の形式と、
+フレームグラフのツール(flamegraph.pl、speedscopeなど)が読める
+折りたたんだスタックの形式で取り出せます。
+
+``cProfile`` は呼び出し元と呼び出し先の組ごとの時間しか記録せず、再帰を
+含むスタック(構文木の走査やimport)を復元できないため、折りたたんだ
+スタックはサンプリングから作ります。
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, NamedTuple, Optional
+
+# スタックを採取する間隔(秒)。実際の間隔は解析中のスレッドがGILを
+# 手放す間隔(sys.getswitchinterval)で決まることが多いため、各採取には
+# 前回の採取からの経過時間を重みとして加算する
+SAMPLE_INTERVAL = 0.001
+# 折りたたんだスタックの値の単位はマイクロ秒
+_UNITS_PER_SECOND = 1_000_000
+# ワーカーのスタックの先頭に置くフレーム
+WORKER_FRAME = "<worker processes>"
+
+# pstatsの関数のキー(ファイル名と行番号と関数名)ごとの集計
+_RawStats = dict[tuple[str, int, str], Any]
+# 外側から順に並べたフレームの表記ごとの、採取した時間の合計(秒)
+_Stacks = dict[tuple[str, ...], float]
+
+
+class WorkerProfile(NamedTuple):
+    """ワーカーが1チャンクの解析で取ったプロファイル(pickleできる)。"""
+
+    stats: _RawStats
+    stacks: _Stacks
+
+
+class _RawProfile(cProfile.Profile):
+    """ワーカーが返したプロファイルを ``pstats.Stats`` に読み込ませるための入れ物。"""
+
+    def __init__(self, stats: _RawStats) -> None:
+        super().__init__()
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        """``pstats.Stats`` が呼び出す(集計済みのため何もしない)。"""
+
+
+class StackSampler:
+    """別スレッドから一定間隔でスレッドのスタックを採取します。
+
+    スタックごとに、採取した間隔の経過時間(秒)を合計します。
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        """サンプラーを初期化します(採取は ``start`` で始まります)。
+
+        Args:
+            interval: 採取の間隔(秒)
+
+        """
+        self.interval = interval
+        self.stacks: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        self._labels: dict[CodeType, str] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._root: Optional[FrameType] = None
+
+    def start(self, root: Optional[FrameType] = None) -> None:
+        """呼び出したスレッドのスタックの採取を始めます。
+
+        Args:
+            root: 採取するスタックの最も外側のフレーム(Noneの場合はスレッドの最初のフレーム)
+
+        """
+        self._root = root
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(threading.get_ident(),),
+            name="cccy-profile-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """採取を止め、採取のスレッドの終了を待ちます。"""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, thread_id: int) -> None:
+        """スタックを採取し続けます(採取のスレッドで実行)。"""
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self.stacks[self._stack(frame)] += now - last
+            last = now
+
+    def _stack(self, frame: Optional[FrameType]) -> tuple[str, ...]:
+        """フレームから外側に向かって辿ったスタックを、外側から順に返します。"""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = frame_label(
+                    code.co_filename, code.co_firstlineno, code.co_name
+                )
+            labels.append(label)
+            frame = None if frame is self._root else frame.f_back
+        return tuple(reversed(labels))
+
+
+class ProfileSession:
+    """親プロセスのプロファイルと、ワーカーのプロファイルの合算。
+
+    ワーカーへは中身を持たない状態で渡され(pickleでもforkでも)、
+    ワーカーは ``start`` と ``drain`` でチャンクごとのプロファイルを
+    親プロセスに返します。
+    """
+
+    def __init__(self) -> None:
+        """プロファイラーを用意します(計測は ``start`` で始まります)。"""
+        self.reset()
+
+    def reset(self) -> None:
+        """計測中であれば止め、プロファイルを空にします。
+
+        forkしたワーカーは親プロセスで計測中のプロファイラーを引き継ぐため、
+        ワーカーの初期化で呼び出します(採取のスレッドはforkで引き継がれません)。
+        """
+        profiler = getattr(self, "profiler", None)
+        if profiler is not None:
+            profiler.disable()
+        self.profiler = cProfile.Profile()
+        self.sampler = StackSampler()
+        self.worker_stats = pstats.Stats()
+        self.worker_stacks: defaultdict[tuple[str, ...], float] = defaultdict(float)
+        self.workers: set[int] = set()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """プロファイラーはpickleできないため、空の状態で渡します。"""
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """空のプロファイルとして復元します。"""
+        self.reset()
+
+    def start(self) -> None:
+        """呼び出したスレッドの計測を始めます。
+
+        折りたたんだスタックは、この関数を呼び出した関数から始まります。
+        """
+        self.sampler.start(sys._getframe(1))
+        self.profiler.enable()
+
+    def stop(self) -> None:
+        """計測を止めます。"""
+        self.profiler.disable()
+        self.sampler.stop()
+
+    def drain(self) -> WorkerProfile:
+        """計測を止めてここまでのプロファイルを取り出し、空にします。
+
+        ワーカーが解析したチャンクのプロファイルを親プロセスに返すために
+        使用します。
+        """
+        self.stop()
+        self.profiler.create_stats()
+        profile = WorkerProfile(self.profiler.stats, dict(self.sampler.stacks))
+        self.profiler = cProfile.Profile()
+        self.sampler = StackSampler()
+        return profile
+
+    def merge(self, profile: WorkerProfile, worker: Optional[int] = None) -> None:
+        """ワーカーのプロファイルを合算します。
+
+        Args:
+            profile: ``drain`` で取り出したプロファイル
+            worker: プロファイルを取ったワーカーのプロセスID(オプション)
+
+        """
+        if profile.stats:
+            self.worker_stats.add(_RawProfile(profile.stats))
+        for stack, seconds in profile.stacks.items():
+            self.worker_stacks[stack] += seconds
+        if worker is not None:
+            self.workers.add(worker)
+
+    def to_pstats(self) -> pstats.Stats:
+        """親プロセスとワーカーのプロファイルを合算した ``pstats.Stats`` を返します。"""
+        self.profiler.create_stats()
+        stats = pstats.Stats()
+        # pstats.Statsは空のプロファイルを読み込めない
+        for raw in (self.profiler.stats, self.worker_stats.stats):  # type: ignore[attr-defined]
+            if raw:
+                stats.add(_RawProfile(dict(raw)))
+        return stats
+
+    def iter_collapsed_stacks(self) -> Iterator[str]:
+        """フレームグラフ用の折りたたんだスタックを1行ずつ返します。
+
+        ``frame;frame;frame 123`` の形式で、値は採取した時間(マイクロ秒)です。
+        親プロセスのスタックに続けて、ワーカーのスタックを ``WORKER_FRAME``
+        の下にまとめて返します。
+        """
+        yield from collapse_stacks(self.sampler.stacks)
+        yield from collapse_stacks(self.worker_stacks, (WORKER_FRAME,))
+
+
+def collapse_stacks(stacks: _Stacks, prefix: tuple[str, ...] = ()) -> list[str]:
+    """スタックごとの時間を折りたたんだスタックの行に変換します。
+
+    Args:
+        stacks: スタックごとの時間(秒)
+        prefix: すべてのスタックの先頭に置くフレーム
+
+    Returns:
+        スタックの辞書順の行(1マイクロ秒に満たないスタックは除く)
+
+    """
+    lines = []
+    for stack, seconds in sorted(stacks.items()):
+        weight = int(seconds * _UNITS_PER_SECOND)
+        if weight > 0:
+            lines.append(f"{';'.join((*prefix, *stack))} {weight}")
+    return lines
+
+
+def frame_label(filename: str, line: int, name: str) -> str:
+    """関数をスタックのフレームの表記 ``name (file.py:line)`` に変換します。
+
+    ファイルのディレクトリは除き(``pstats`` の ``strip_dirs`` と同様)、
+    区切り文字のセミコロンはコロンに置き換えます。
+    """
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ":")
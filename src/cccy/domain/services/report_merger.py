@@ -0,0 +1,91 @@
+"""シャードごとに出力された解析結果のレポートを結合するモジュール。"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.domain.exceptions.complexity_exceptions import ReportError
+
+
+def _function_record(data: dict[str, Any]) -> FunctionRecord:
+    """レポートの関数のオブジェクトをFunctionRecordに変換します。"""
+    return FunctionRecord(
+        name=data["name"],
+        cyclomatic_complexity=data["cyclomatic_complexity"],
+        cognitive_complexity=data["cognitive_complexity"],
+        lineno=data["line"],
+        col_offset=0,  # レポートには列が含まれない
+        end_lineno=data.get("end_line"),
+    )
+
+
+def _file_result(data: Any) -> FileComplexityResult:
+    """レポートのファイルのオブジェクトをFileComplexityResultに変換します。
+
+    合計値と最大値は関数の結果から計算し直します。
+    """
+    record = FileRecord(
+        data["file_path"],
+        tuple(_function_record(function) for function in data["functions"]),
+    )
+    return record.to_result()
+
+
+def parse_report(text: str, source: str = "<report>") -> list[FileComplexityResult]:
+    """``show-list --format json`` または ``--format jsonl`` の出力を読み込みます。
+
+    Args:
+        text: レポートの内容
+        source: エラーメッセージに含めるレポートの名前
+
+    Returns:
+        レポートに含まれるファイルの結果
+
+    Raises:
+        ReportError: ファイルレベルのJSONレポートとして読み込めない場合
+
+    """
+    try:
+        if text.lstrip().startswith("["):
+            objects = json.loads(text)
+        else:
+            objects = [json.loads(line) for line in text.splitlines() if line.strip()]
+        return [_file_result(data) for data in objects]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ReportError(
+            source,
+            f"not a file-level JSON report of 'cccy show-list --format json' ({e})",
+        ) from e
+
+
+def merge_reports(
+    reports: Iterable[tuple[str, list[FileComplexityResult]]],
+) -> list[FileComplexityResult]:
+    """複数のレポートの結果を1つの結果にまとめます。
+
+    同じファイルの同じ結果が複数のレポートにある場合は1つにまとめるため、
+    結果の件数は解析されたファイルの数と一致します。
+
+    Args:
+        reports: レポートの名前と結果の組
+
+    Returns:
+        ファイルパス順の結果
+
+    Raises:
+        ReportError: 同じファイルの異なる結果が複数のレポートにある場合
+
+    """
+    merged: dict[str, tuple[str, FileComplexityResult]] = {}
+    for source, results in reports:
+        for result in results:
+            previous = merged.setdefault(result.file_path, (source, result))
+            if previous[1] != result:
+                raise ReportError(
+                    source,
+                    f"conflicting results for {result.file_path} "
+                    f"(also reported by {previous[0]})",
+                )
+    return [merged[path][1] for path in sorted(merged)]
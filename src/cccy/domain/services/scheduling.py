@@ -0,0 +1,66 @@
+"""ファイルの大きさに基づいて解析の作業をワーカーに割り振るモジュール。"""
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional
+
+# ファイルの大きさによらず1ファイルごとにかかるコストをバイト数に換算した値
+FILE_OVERHEAD = 1024
+# 1チャンクあたりの最大ファイル数
+MAX_CHUNK_SIZE = 64
+# 1チャンクあたりの最小の重み(小さいファイルのチャンクのIPCの回数を抑える)
+_MIN_CHUNK_WEIGHT = 16 * 1024
+# 残りの作業をワーカー1つあたりいくつのチャンクに分けるか
+_CHUNKS_PER_WORKER = 4
+
+
+def file_weight(path: Path) -> int:
+    """ファイルの解析にかかる時間の目安(バイト数に換算した値)を返します。"""
+    try:
+        return path.stat().st_size + FILE_OVERHEAD
+    except OSError:
+        return FILE_OVERHEAD
+
+
+def plan_chunks(
+    weights: Sequence[int], workers: int, chunk_size: Optional[int] = None
+) -> list[list[int]]:
+    """ファイルを重いものから順に、ワーカーに送るチャンクに分けます。
+
+    重いファイルを先に送ることで(LPTスケジューリング)、最後に大きい
+    ファイルが1つだけ残って他のワーカーが待つことを防ぎます。チャンクの
+    重みは残りの作業量に比例して小さくなるため、重いファイルはそれだけで
+    1つのチャンクになり、終盤の多数の小さいファイルは細かいチャンクに
+    分かれて空いたワーカーに順に行き渡ります。
+
+    Args:
+        weights: ファイルごとの重み
+        workers: ワーカー数
+        chunk_size: 1チャンクあたりのファイル数(Noneの場合は重みから決定)
+
+    Returns:
+        チャンクごとの、weightsの添字のリスト(送る順)
+
+    """
+    order = sorted(range(len(weights)), key=lambda index: (-weights[index], index))
+    if chunk_size:
+        return [
+            order[start : start + chunk_size]
+            for start in range(0, len(order), chunk_size)
+        ]
+
+    remaining = sum(weights)
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    chunk_weight = 0
+    for index in order:
+        chunk.append(index)
+        chunk_weight += weights[index]
+        target = max(_MIN_CHUNK_WEIGHT, remaining // (workers * _CHUNKS_PER_WORKER))
+        if chunk_weight >= target or len(chunk) >= MAX_CHUNK_SIZE:
+            chunks.append(chunk)
+            remaining -= chunk_weight
+            chunk, chunk_weight = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
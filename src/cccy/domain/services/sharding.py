@@ -0,0 +1,97 @@
+"""解析対象のファイルを複数のジョブに分割するモジュール。"""
+
+import hashlib
+import heapq
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from cccy.domain.services.scheduling import file_weight
+
+
+def _stable_key(path: Path) -> str:
+    """どのマシンでも同じになるファイルの並び替えのキーを返します。
+
+    カレントディレクトリからの相対パスのハッシュを使うため、チェックアウト
+    先のディレクトリが異なるCIのジョブ間でも同じ値になります。
+    """
+    try:
+        name = path.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        name = path.as_posix()
+    return hashlib.sha1(name.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def assign_shards(files: Iterable[Path], count: int) -> dict[Path, int]:
+    """ファイルを大きさの合計がなるべく均等になるように分割します。
+
+    大きいファイルから順に、その時点で合計が最も小さいシャードに割り当て
+    ます。大きさが同じファイルの順序はパスのハッシュで決めるため、同じ
+    ファイルの集合からは常に同じ割り当てになります。
+
+    Args:
+        files: 分割するファイルのパス
+        count: シャードの数
+
+    Returns:
+        ファイルの絶対パスから0始まりのシャード番号への辞書
+
+    """
+    paths = {path.resolve() for path in files}
+    weighted = sorted(
+        ((file_weight(path), _stable_key(path), path) for path in paths),
+        key=lambda item: (-item[0], item[1]),
+    )
+    loads = [(0, index) for index in range(count)]
+    assignments = {}
+    for weight, _, path in weighted:
+        load, index = heapq.heappop(loads)
+        assignments[path] = index
+        heapq.heappush(loads, (load + weight, index))
+    return assignments
+
+
+class Shard(NamedTuple):
+    """``INDEX/COUNT`` 形式で指定される、ファイル全体のうちの1つの部分。
+
+    ``number`` がINDEX(1始まり)、``total`` がCOUNTで、1からCOUNTまでの
+    すべてのシャードを合わせると各ファイルがちょうど1回ずつ解析されます。
+    """
+
+    number: int
+    total: int
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """``INDEX/COUNT`` 形式の文字列を解析します。
+
+        Raises:
+            ValueError: 形式が正しくない、またはINDEXが1からCOUNTの範囲外の場合
+
+        """
+        index, separator, count = value.partition("/")
+        if not (separator and index.isdigit() and count.isdigit()):
+            raise ValueError(f"{value!r} is not in INDEX/COUNT format")
+        shard = cls(int(index), int(count))
+        if not 1 <= shard.number <= shard.total:
+            raise ValueError(f"shard index must be between 1 and {shard.total}")
+        return shard
+
+    def select(self, files: Iterable[Path]) -> frozenset[Path]:
+        """ファイルのうちこのシャードに割り当てられたものを返します。
+
+        Args:
+            files: 全シャードで共通の、解析対象のファイルのパス
+
+        Returns:
+            このシャードのファイルの絶対パス
+
+        """
+        assignments = assign_shards(files, self.total)
+        return frozenset(
+            path for path, index in assignments.items() if index == self.number - 1
+        )
+
+    def __str__(self) -> str:
+        """``INDEX/COUNT`` 形式の文字列を返します。"""
+        return f"{self.number}/{self.total}"
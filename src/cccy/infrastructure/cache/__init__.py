@@ -0,0 +1 @@
+"""Analysis result cache infrastructure."""
@@ -0,0 +1,246 @@
+"""ディスク上の解析結果キャッシュ。"""
+
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.domain.interfaces.caches import ResultCache
+from cccy.domain.interfaces.calculators import ComplexityCalculator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE_MB = 256
+
+# 書き込み量がこの割合(上限比)に達するごとに容量チェックを行う
+_PRUNE_INTERVAL_RATIO = 0.1
+_ENTRY_SUFFIX = ".json"
+# エントリの形式を変えた場合に古いエントリを読まないよう、キーに含める
+_ENTRY_FORMAT = "records-1"
+
+
+class CacheStats(BaseModel):
+    """キャッシュの統計情報。"""
+
+    directory: str
+    entries: int
+    total_size: int
+    max_size: int
+
+
+def _encode_record(record: FileRecord) -> bytes:
+    """レコードをフィールド名を含まないコンパクトなJSONに変換します。"""
+    return json.dumps(
+        [record.file_path, [list(function) for function in record.functions]],
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _decode_function(values: list[Any]) -> FunctionRecord:
+    """JSONの配列から関数のレコードを復元します。"""
+    function = FunctionRecord(*values)
+    name, *numbers = function
+    if not isinstance(name, str) or not all(
+        isinstance(number, int) or number is None for number in numbers
+    ):
+        raise TypeError(f"malformed cache entry: {values!r}")
+    return function
+
+
+def _decode_record(data: bytes) -> FileRecord:
+    """JSONからレコードを復元します。
+
+    Raises:
+        ValueError: JSONとして不正な場合
+        TypeError: フィールドの数または型が異なる場合
+
+    """
+    file_path, functions = json.loads(data)
+    if not isinstance(file_path, str):
+        raise TypeError(f"malformed cache entry: {file_path!r}")
+    return FileRecord(file_path, tuple(map(_decode_function, functions)))
+
+
+class FileSystemResultCache(ResultCache):
+    """エントリごとにJSONファイルを保存するLRUキャッシュ。
+
+    エントリの最終アクセス時刻はファイルのmtimeで管理し、容量上限を
+    超えた場合は最も古くアクセスされたエントリから削除します。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        namespace: str,
+        max_size: Optional[int] = None,
+    ) -> None:
+        """キャッシュを初期化します。
+
+        Args:
+            cache_dir: キャッシュディレクトリ
+            namespace: キーに含める名前空間(バージョンとカルキュレーターの組)
+            max_size: キャッシュの最大サイズ(バイト、Noneの場合はデフォルト)
+
+        """
+        self.cache_dir = Path(cache_dir)
+        self.namespace = namespace
+        self.max_size = max_size or DEFAULT_MAX_SIZE_MB * 1024 * 1024
+        self._bytes_since_prune = 0
+
+    @staticmethod
+    def build_namespace(*calculators: ComplexityCalculator) -> str:
+        """cccyのバージョンとカルキュレーターの組から名前空間を作成します。
+
+        Args:
+            calculators: 結果の計算に使用するカルキュレーター
+
+        Returns:
+            名前空間文字列
+
+        """
+        try:
+            version = importlib.metadata.version("cccy")
+        except importlib.metadata.PackageNotFoundError:
+            version = "unknown"
+        names = ",".join(
+            f"{type(calculator).__module__}.{type(calculator).__qualname__}"
+            for calculator in calculators
+        )
+        return f"cccy-{version}|{names}"
+
+    def get(self, content_hash: str) -> Optional[FileRecord]:
+        """キャッシュされた解析結果を取得します。"""
+        entry_path = self._entry_path(content_hash)
+        try:
+            record = _decode_record(entry_path.read_bytes())
+            os.utime(entry_path)  # LRUのためにアクセス時刻を更新
+        except (OSError, ValueError, TypeError):
+            return None
+        return record
+
+    def put(self, content_hash: str, record: FileRecord) -> None:
+        """解析結果をキャッシュに保存します。"""
+        entry_path = self._entry_path(content_hash)
+        data = _encode_record(record)
+        try:
+            self._ensure_cache_dir()
+            entry_path.parent.mkdir(exist_ok=True)
+            self._write_atomic(entry_path, data)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {entry_path}: {e}")
+            return
+
+        self._bytes_since_prune += len(data)
+        if self._bytes_since_prune >= self.max_size * _PRUNE_INTERVAL_RATIO:
+            self.prune()
+
+    def prune(self) -> int:
+        """容量上限を超えている場合に古いエントリを削除します。
+
+        Returns:
+            削除したエントリ数
+
+        """
+        self._bytes_since_prune = 0
+        entries = self._scan_entries()
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """すべてのキャッシュエントリを削除します。
+
+        Returns:
+            削除したエントリ数
+
+        """
+        removed = len(self._scan_entries())
+        if self.cache_dir.is_dir():
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        return removed
+
+    def stats(self) -> CacheStats:
+        """キャッシュの統計情報を取得します。
+
+        Returns:
+            CacheStatsインスタンス
+
+        """
+        entries = self._scan_entries()
+        return CacheStats(
+            directory=str(self.cache_dir),
+            entries=len(entries),
+            total_size=sum(size for _, size, _ in entries),
+            max_size=self.max_size,
+        )
+
+    def _entry_path(self, content_hash: str) -> Path:
+        """内容ハッシュに対応するエントリファイルのパスを返します。"""
+        key = hashlib.sha256(
+            f"{_ENTRY_FORMAT}|{self.namespace}|{content_hash}".encode()
+        ).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _ensure_cache_dir(self) -> None:
+        """キャッシュディレクトリとその.gitignoreを作成します。"""
+        if self.cache_dir.is_dir():
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / ".gitignore").write_text(
+            "# Automatically created by cccy.\n*\n", encoding="utf-8"
+        )
+
+    def _write_atomic(self, entry_path: Path, data: bytes) -> None:
+        """一時ファイル経由でエントリを書き込みます(並列ワーカー対策)。"""
+        fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            Path(tmp_name).replace(entry_path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _scan_entries(self) -> list[tuple[float, int, Path]]:
+        """すべてのエントリの(mtime, サイズ, パス)を取得します。"""
+        entries: list[tuple[float, int, Path]] = []
+        if not self.cache_dir.is_dir():
+            return entries
+
+        for bucket in os.scandir(self.cache_dir):
+            if bucket.is_dir():
+                entries.extend(self._scan_bucket(bucket.path))
+
+        return entries
+
+    def _scan_bucket(self, bucket_path: str) -> list[tuple[float, int, Path]]:
+        """単一のバケットディレクトリ内のエントリを取得します。"""
+        entries: list[tuple[float, int, Path]] = []
+        for entry in os.scandir(bucket_path):
+            if not entry.name.endswith(_ENTRY_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return entries
@@ -0,0 +1,102 @@
+"""プロセス内に保持する解析結果キャッシュ。"""
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from cccy.domain.entities.records import FileRecord
+from cccy.domain.interfaces.caches import ResultCache
+
+
+class MemoryResultCache(ResultCache):
+    """エントリ数に上限のあるメモリ上のLRUキャッシュ。
+
+    デーモンのように同じプロセスで何度も解析を行う場合に、ファイルを
+    読んでハッシュを計算するだけで結果を再利用できます。並列実行で
+    ワーカープロセスに渡す際はエントリを複製せず、空のキャッシュとして
+    渡します。
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """キャッシュを初期化します。
+
+        Args:
+            max_entries: 保持するエントリの最大数
+
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, FileRecord] = OrderedDict()
+
+    def __len__(self) -> int:
+        """保持しているエントリ数を返します。"""
+        return len(self._entries)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """ワーカープロセスにはエントリを含めずに渡します。"""
+        return {"max_entries": self.max_entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """空のキャッシュとして復元します。"""
+        self.max_entries = state["max_entries"]
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, content_hash: str) -> Optional[FileRecord]:
+        """キャッシュされた解析結果を取得します。"""
+        record = self._entries.get(content_hash)
+        if record is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(content_hash)
+        self.hits += 1
+        return record
+
+    def put(self, content_hash: str, record: FileRecord) -> None:
+        """解析結果をキャッシュに保存し、上限を超えた古いエントリを削除します。"""
+        self._entries[content_hash] = record
+        self._entries.move_to_end(content_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        """すべてのエントリを削除します。
+
+        Returns:
+            削除したエントリ数
+
+        """
+        removed = len(self._entries)
+        self._entries.clear()
+        return removed
+
+
+class TieredResultCache(ResultCache):
+    """高速なキャッシュを優先し、ミスした場合に低速なキャッシュを参照する組み合わせ。"""
+
+    def __init__(self, primary: ResultCache, secondary: ResultCache) -> None:
+        """キャッシュを初期化します。
+
+        Args:
+            primary: 先に参照するキャッシュ(メモリ上のキャッシュなど)
+            secondary: primaryにない場合に参照するキャッシュ(ディスク上のキャッシュなど)
+
+        """
+        self.primary = primary
+        self.secondary = secondary
+
+    def get(self, content_hash: str) -> Optional[FileRecord]:
+        """primary、secondaryの順に参照し、secondaryの結果はprimaryにも保存します。"""
+        record = self.primary.get(content_hash)
+        if record is not None:
+            return record
+        record = self.secondary.get(content_hash)
+        if record is not None:
+            self.primary.put(content_hash, record)
+        return record
+
+    def put(self, content_hash: str, record: FileRecord) -> None:
+        """両方のキャッシュに保存します。"""
+        self.primary.put(content_hash, record)
+        self.secondary.put(content_hash, record)
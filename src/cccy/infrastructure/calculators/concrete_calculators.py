@@ -4,10 +4,12 @@ import ast
 import logging
 from typing import ClassVar, Union
 
-import mccabe
-from cognitive_complexity.api import get_cognitive_complexity
-
 from cccy.domain.interfaces.calculators import ComplexityCalculator
+from cccy.infrastructure.calculators.fused_calculator import (
+    FusedCognitiveComplexityCalculator,
+    FusedComplexityCalculator,
+    FusedCyclomaticComplexityCalculator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,10 @@ class CyclomaticComplexityCalculator(ComplexityCalculator):
             ComplexityCalculationError: 計算が失敗し、厳密モードが有効な場合
 
         """
+        # The library engine is optional at startup: the default builtin engine
+        # never imports mccabe or cognitive_complexity.
+        import mccabe  # noqa: PLC0415
+
         try:
             # Create a temporary module with just this function
             module = ast.Module(body=[node], type_ignores=[])
@@ -70,6 +76,10 @@ class CognitiveComplexityCalculator(ComplexityCalculator):
             ComplexityCalculationError: 計算が失敗し、厳密モードが有効な場合
 
         """
+        from cognitive_complexity.api import (  # noqa: PLC0415
+            get_cognitive_complexity,
+        )
+
         try:
             complexity = get_cognitive_complexity(node)
             return int(complexity) if complexity is not None else 0
@@ -116,6 +126,35 @@ class ComplexityCalculatorFactory:
 
         return cls._calculators[calculator_type]()
 
+    @classmethod
+    def create_calculators(
+        cls, engine: str = "builtin"
+    ) -> tuple[ComplexityCalculator, ComplexityCalculator]:
+        """循環的複雑度と認知的複雑度のカルキュレーターの組を作成します。
+
+        Args:
+            engine: "builtin"(一度の走査で両方を計算する組み込みエンジン)
+                    または"library"(mccabe/cognitive_complexityライブラリ)
+
+        Returns:
+            (循環的複雑度カルキュレーター, 認知的複雑度カルキュレーター)のタプル
+
+        Raises:
+            ValueError: engineがサポートされていない場合
+
+        """
+        if engine == "library":
+            return CyclomaticComplexityCalculator(), CognitiveComplexityCalculator()
+        if engine == "builtin":
+            shared = FusedComplexityCalculator()
+            return (
+                FusedCyclomaticComplexityCalculator(shared),
+                FusedCognitiveComplexityCalculator(shared),
+            )
+        raise ValueError(
+            f"Unknown calculator engine: {engine}. Available engines: builtin, library"
+        )
+
     @classmethod
     def get_available_types(cls) -> list[str]:
         """利用可能なカルキュレータータイプのリストを取得します。
@@ -0,0 +1,347 @@
+"""循環的複雑度と認知的複雑度を一度の走査で計算する組み込みカルキュレーター。
+
+スコアは mccabe (PathGraphingAstVisitor) および cognitive_complexity ライブラリと
+同一になるように、それぞれの規則を再現しています。
+
+- 循環的複雑度: 1 + 制御フローグラフ上で可視な文の分岐数
+  (if/for/while: +1、try: +1 + except節の数、ネストした関数: +1)。
+  mccabe と同様に finally 節や match/try* の本体、式の内部は数えません。
+- 認知的複雑度: 制御フロー(if/for/while/三項演算子/except)ごとにネストの深さに
+  応じた加算、論理演算子の連鎖、再帰呼び出しに対する +1。
+
+ネストした関数のスコアは内側から外側へ合成するため、各ノードの走査は一度だけです。
+"""
+
+import ast
+import logging
+import weakref
+from collections.abc import Sequence
+from typing import Optional, Union, cast
+
+from cccy.domain.interfaces.calculators import (
+    CognitiveComplexityCalculator,
+    CyclomaticComplexityCalculator,
+)
+
+logger = logging.getLogger(__name__)
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_COGNITIVE_BREAKERS = (ast.If, ast.For, ast.While, ast.IfExp, ast.ExceptHandler)
+_MCCABE_BRANCHES = (ast.If, ast.For, ast.AsyncFor, ast.While)
+
+# mccabe が制御フローグラフとして辿る文のフィールド
+_MCCABE_BODY_FIELDS: dict[type[ast.AST], frozenset[str]] = {
+    ast.If: frozenset({"body", "orelse"}),
+    ast.For: frozenset({"body", "orelse"}),
+    ast.AsyncFor: frozenset({"body", "orelse"}),
+    ast.While: frozenset({"body", "orelse"}),
+    ast.Try: frozenset({"body", "handlers", "orelse"}),
+    ast.ExceptHandler: frozenset({"body"}),
+    ast.FunctionDef: frozenset({"body"}),
+    ast.AsyncFunctionDef: frozenset({"body"}),
+    ast.ClassDef: frozenset({"body"}),
+    ast.With: frozenset({"body"}),
+    ast.AsyncWith: frozenset({"body"}),
+}
+_NO_FIELDS: frozenset[str] = frozenset()
+
+
+def _is_decorator(node: ast.AST) -> bool:
+    """cognitive_complexity がデコレーターとみなす関数形状かどうかを判定します。"""
+    return (
+        isinstance(node, ast.FunctionDef)
+        and len(node.body) == 2
+        and isinstance(node.body[0], ast.FunctionDef)
+        and isinstance(node.body[1], ast.Return)
+    )
+
+
+def _is_elif_chain(node: ast.AST) -> bool:
+    """else節が単一のif文(elif)であるif文かどうかを判定します。"""
+    return (
+        isinstance(node, ast.If)
+        and len(node.orelse) == 1
+        and isinstance(node.orelse[0], ast.If)
+    )
+
+
+def _mccabe_increment(node: ast.AST) -> int:
+    """制御フローグラフ上で可視な文が循環的複雑度に加える値を返します。"""
+    if isinstance(node, (*_MCCABE_BRANCHES, *_FUNCTION_NODES)):
+        return 1
+    if isinstance(node, ast.Try):
+        return 1 + len(node.handlers)
+    return 0
+
+
+class _FunctionFrame:
+    """単一関数の本体に対する集計値。
+
+    認知的複雑度は関数本体の開始ネストレベル n に対する一次式
+    ``constant + slope * n`` (n == 0 の場合のみ ``elif_at_top`` を加算)として
+    保持します。これにより、内側の関数の集計値を外側の関数の任意の
+    ネストレベルにそのまま合成できます。
+    """
+
+    __slots__ = (
+        "branches",
+        "constant",
+        "elif_at_top",
+        "has_recursive_call",
+        "name",
+        "slope",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.branches = 0
+        self.constant = 0
+        self.slope = 0
+        self.elif_at_top = 0
+        self.has_recursive_call = False
+
+    def cognitive_at_top(self) -> int:
+        """関数単体として評価した場合の認知的複雑度を返します。"""
+        recursion = 1 if self.has_recursive_call else 0
+        return self.constant + self.elif_at_top + recursion
+
+
+class _TreeScorer:
+    """最も外側の関数を一度だけ走査し、ネストした関数の集計値も同時に求めます。
+
+    内側の関数の集計値は走査の帰りがけに外側の関数へ合成されるため、
+    ネストの深さにかかわらず各ノードの訪問回数は一定です。
+    """
+
+    def __init__(self) -> None:
+        self.frames: dict[ast.AST, _FunctionFrame] = {}
+        # 再帰呼び出しの判定対象となる、走査中の関数の名前ごとのフレーム
+        self._open_frames: dict[str, list[_FunctionFrame]] = {}
+
+    def score(self, node: FunctionNode) -> None:
+        """関数ノードとその内側の関数を集計します。"""
+        # 最も外側の関数のヘッダーは認知的複雑度に含まれないため捨てフレームで受ける
+        self._visit_function(node, _FunctionFrame(""), 0, visible=False)
+
+    def _visit(
+        self, node: ast.AST, frame: _FunctionFrame, nesting: int, visible: bool
+    ) -> None:
+        """ノードとその子孫を走査します。
+
+        Args:
+            node: 走査するノード
+            frame: ノードを含む最も内側の関数のフレーム
+            nesting: frameの本体を基準とした認知的複雑度のネストレベル
+            visible: mccabeの制御フローグラフ上で可視かどうか
+
+        """
+        self._check_call(node)
+        if isinstance(node, _FUNCTION_NODES):
+            self._visit_function(node, frame, nesting, visible)
+            return
+        if isinstance(node, ast.BoolOp):
+            self._visit_bool_op(node, frame)
+            return
+
+        if visible:
+            frame.branches += _mccabe_increment(node)
+        nesting = self._score_cognitive(node, frame, nesting)
+        body_fields = _MCCABE_BODY_FIELDS.get(type(node), _NO_FIELDS)
+
+        for field in node._fields:
+            self._visit_field(
+                getattr(node, field, None),
+                frame,
+                nesting,
+                visible and field in body_fields,
+            )
+
+    def _visit_field(
+        self, value: object, frame: _FunctionFrame, nesting: int, visible: bool
+    ) -> None:
+        """単一のノードまたはノードリストであるフィールドの値を走査します。"""
+        if isinstance(value, ast.AST):
+            self._visit(value, frame, nesting, visible)
+        elif isinstance(value, list):
+            self._visit_list(value, frame, nesting, visible)
+
+    def _visit_list(
+        self,
+        items: Sequence[object],
+        frame: _FunctionFrame,
+        nesting: int,
+        visible: bool,
+    ) -> None:
+        """フィールドのノードリストを走査します。"""
+        for item in items:
+            if isinstance(item, ast.AST):
+                self._visit(item, frame, nesting, visible)
+
+    def _visit_function(
+        self, node: FunctionNode, parent: _FunctionFrame, nesting: int, visible: bool
+    ) -> None:
+        """関数を新しいフレームで集計し、結果を外側のフレームに合成します。"""
+        frame = self._open_frame(node)
+
+        # デコレーターや引数などのヘッダーは外側の関数の一部として数える
+        for field in node._fields:
+            if field != "body":
+                self._visit_field(
+                    getattr(node, field, None), parent, nesting + 1, False
+                )
+
+        self._visit_list(node.body, frame, 0, True)
+        self._close_frame(node, frame)
+
+        # 内側の関数の本体は外側から見てネストレベル nesting + 1 (>= 1) にある
+        parent.constant += frame.constant + frame.slope * (nesting + 1)
+        parent.slope += frame.slope
+        if visible:
+            parent.branches += 1 + frame.branches
+
+    def _visit_bool_op(self, node: ast.BoolOp, frame: _FunctionFrame) -> None:
+        """論理演算子の連鎖を数えます(子孫の制御フローは数えません)。"""
+        for child in ast.walk(node):
+            if isinstance(child, ast.BoolOp):
+                frame.constant += 1
+            self._check_call(child)
+
+    def _score_cognitive(
+        self, node: ast.AST, frame: _FunctionFrame, nesting: int
+    ) -> int:
+        """ノード自身の認知的複雑度を加算し、子のネストレベルを返します。"""
+        if _is_elif_chain(node):
+            self._score_elif(frame, nesting)
+            return nesting
+        if isinstance(node, _COGNITIVE_BREAKERS):
+            nesting += 1
+            has_else = isinstance(node, (ast.If, ast.For, ast.While)) and node.orelse
+            frame.constant += nesting + (1 if has_else else 0)
+            frame.slope += 1
+            return nesting
+        if isinstance(node, ast.Lambda):
+            return nesting + 1
+        return nesting
+
+    def _score_elif(self, frame: _FunctionFrame, nesting: int) -> None:
+        """elifの連鎖に max(1, 基準 + nesting) を加算します。"""
+        # nesting >= 1 であれば基準ネストレベルに対する一次式になる
+        if nesting == 0:
+            frame.elif_at_top += 1
+        else:
+            frame.constant += nesting
+        frame.slope += 1
+
+    def _open_frame(self, node: FunctionNode) -> _FunctionFrame:
+        """関数のフレームを作成し、再帰呼び出しの判定対象に登録します。"""
+        frame = _FunctionFrame(node.name)
+        self._open_frames.setdefault(node.name, []).append(frame)
+        return frame
+
+    def _close_frame(self, node: FunctionNode, frame: _FunctionFrame) -> None:
+        """関数の走査を終え、フレームを結果に記録します。"""
+        frames = self._open_frames.get(frame.name)
+        if frames and frames[-1] is frame:
+            frames.pop()
+        self.frames[node] = frame
+
+    def _check_call(self, node: ast.AST) -> None:
+        """名前による呼び出しであれば、同名の走査中の関数を再帰ありとします。"""
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            # 一度記録したフレームは外すため、各フレームの記録は一度だけ
+            for frame in self._open_frames.pop(node.func.id, ()):
+                frame.has_recursive_call = True
+
+
+class FusedComplexityCalculator:
+    """循環的複雑度と認知的複雑度を一度の走査で計算するエンジン。
+
+    関数を計算する際にはその内側の関数の結果も同じ走査で求めてメモします。
+    アナライザーは外側の関数から順に計算を要求するため、ネストした関数が
+    外側の関数ごとに再走査されることはなく、cyclomatic と cognitive の
+    ビューから続けて呼び出しても走査は一度で済みます。
+    """
+
+    def __init__(self) -> None:
+        """エンジンを初期化します。"""
+        # ASTが破棄されると対応するエントリも自動的に消える
+        self._frames: weakref.WeakKeyDictionary[ast.AST, _FunctionFrame] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __getstate__(self) -> dict[str, object]:
+        """メモを除いた状態を返します(ワーカープロセスへの受け渡し用)。"""
+        return {}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """空のメモで状態を復元します。"""
+        self.__init__()  # type: ignore[misc]
+
+    def calculate(self, node: FunctionNode) -> tuple[int, int]:
+        """関数ノードの循環的複雑度と認知的複雑度を計算します。
+
+        Args:
+            node: 関数を表すAST要素
+
+        Returns:
+            (循環的複雑度, 認知的複雑度)のタプル
+
+        """
+        try:
+            return self._calculate(node)
+        except Exception as e:
+            logger.warning(f"Failed to calculate complexity for {node.name}: {e}")
+            return 1, 0
+
+    def _calculate(self, node: FunctionNode) -> tuple[int, int]:
+        """メモを参照し、未計算であれば関数ノードを走査します。"""
+        frame = self._frames.get(node)
+        if frame is None:
+            scorer = _TreeScorer()
+            scorer.score(node)
+            self._frames.update(scorer.frames)
+            frame = scorer.frames[node]
+
+        # cognitive_complexity はデコレーター形状の関数を内側の関数として評価する。
+        # mccabe では外側の各階層がネストした関数として +1 される(branchesに含まれる)。
+        root: FunctionNode = node
+        while _is_decorator(root):
+            root = cast("ast.FunctionDef", root.body[0])
+
+        return 1 + frame.branches, self._frames[root].cognitive_at_top()
+
+
+class FusedCyclomaticComplexityCalculator(CyclomaticComplexityCalculator):
+    """組み込みエンジンによる循環的複雑度のカルキュレーター。"""
+
+    def __init__(self, engine: Optional[FusedComplexityCalculator] = None) -> None:
+        """カルキュレーターを初期化します。
+
+        Args:
+            engine: 共有する計算エンジン(Noneの場合は新規作成)
+
+        """
+        self.engine = engine or FusedComplexityCalculator()
+
+    def calculate(self, node: FunctionNode) -> int:
+        """関数ノードの循環的複雑度を計算します。"""
+        return self.engine.calculate(node)[0]
+
+
+class FusedCognitiveComplexityCalculator(CognitiveComplexityCalculator):
+    """組み込みエンジンによる認知的複雑度のカルキュレーター。"""
+
+    def __init__(self, engine: Optional[FusedComplexityCalculator] = None) -> None:
+        """カルキュレーターを初期化します。
+
+        Args:
+            engine: 共有する計算エンジン(Noneの場合は新規作成)
+
+        """
+        self.engine = engine or FusedComplexityCalculator()
+
+    def calculate(self, node: FunctionNode) -> int:
+        """関数ノードの認知的複雑度を計算します。"""
+        return self.engine.calculate(node)[1]
@@ -1,5 +1,6 @@
 """Configuration management for cccy."""
 
+import os
 from pathlib import Path
 from typing import Optional, Union
 
@@ -9,6 +10,32 @@ from cccy.domain.entities.complexity import CccySettings
 from cccy.infrastructure.config.loaders import ConfigLoaderFactory
 from cccy.infrastructure.config.merger import ConfigMerger, ConfigValidator
 
+# デーモンのように同じプロセスで何度も設定を読む場合のために、
+# pyproject.tomlのパスと内容、CCCY_で始まる環境変数ごとに検証済みの設定を保持する
+_SETTINGS_CACHE_SIZE = 16
+_SettingsKey = tuple[Path, bytes, tuple[tuple[str, str], ...]]
+_settings_cache: dict[_SettingsKey, CccySettings] = {}
+# CccySettingsが読み込む環境変数の接頭辞。大文字と小文字は区別しない
+_ENV_PREFIX = "CCCY_"
+
+
+def _settings_environment() -> tuple[tuple[str, str], ...]:
+    """設定に影響するCCCY_で始まる環境変数を、名前の順に返します。"""
+    return tuple(
+        sorted(
+            (name.upper(), value)
+            for name, value in os.environ.items()
+            if name.upper().startswith(_ENV_PREFIX)
+        )
+    )
+
+
+def _remember_settings(key: _SettingsKey, settings: CccySettings) -> None:
+    """検証済みの設定を保持します(上限を超えた場合は最も古いものを捨てます)。"""
+    if len(_settings_cache) >= _SETTINGS_CACHE_SIZE:
+        _settings_cache.pop(next(iter(_settings_cache)))
+    _settings_cache[key] = settings
+
 
 class CccyConfig:
     """cccyの設定ローダー。"""
@@ -44,15 +71,45 @@ class CccyConfig:
         return loader.load_config(self.config_path)
 
     def _get_settings(self) -> CccySettings:
-        """Pydantic設定インスタンスを取得します。"""
-        if self._settings is None:
-            config_data = self._load_config()
-            try:
-                self._settings = CccySettings.from_toml_config(config_data)
-            except ValidationError as e:
-                # Convert validation error to user-friendly message
-                raise ValueError(f"Configuration error in pyproject.toml: {e}") from e
-        return self._settings
+        """Pydantic設定インスタンスを取得します。
+
+        同じ内容のpyproject.tomlを既に読み込んでいる場合は、TOMLの解析と
+        検証を省いてその設定を再利用します。
+        """
+        if self._settings is not None:
+            return self._settings
+
+        key = self._settings_cache_key()
+        settings = _settings_cache.get(key) if key is not None else None
+        if settings is None:
+            settings = self._parse_settings()
+            if key is not None:
+                _remember_settings(key, settings)
+        self._settings = settings
+        return settings
+
+    def _settings_cache_key(self) -> Optional[_SettingsKey]:
+        """設定のキャッシュのキーを返します(読めない場合はNone)。
+
+        キーはpyproject.tomlのパスと内容、および環境変数で、環境変数で
+        設定を上書きした実行が以前の設定を再利用しないようにします。
+        """
+        if not self.config_path:
+            return None
+        try:
+            content = self.config_path.read_bytes()
+        except OSError:
+            return None
+        return self.config_path, content, _settings_environment()
+
+    def _parse_settings(self) -> CccySettings:
+        """pyproject.tomlを読み込んで設定を検証します。"""
+        config_data = self._load_config()
+        try:
+            return CccySettings.from_toml_config(config_data)
+        except ValidationError as e:
+            # Convert validation error to user-friendly message
+            raise ValueError(f"Configuration error in pyproject.toml: {e}") from e
 
     def get_max_complexity(self) -> Optional[int]:
         """最大循環的複雑度闾値を取得します。"""
@@ -78,6 +135,30 @@ class CccyConfig:
         """ステータス分類闾値を取得します。"""
         return self._get_settings().status_thresholds
 
+    def get_jobs(self) -> Union[int, str]:
+        """ワーカー数または"auto"を取得します。"""
+        return self._get_settings().jobs
+
+    def get_engine(self) -> str:
+        """複雑度計算エンジン("builtin"または"library")を取得します。"""
+        return self._get_settings().engine
+
+    def get_cache_dir(self) -> Path:
+        """結果キャッシュのディレクトリを取得します。
+
+        相対パスはpyproject.tomlのあるディレクトリ(見つからない場合は
+        カレントディレクトリ)を基準に解決されます。
+        """
+        cache_dir = Path(self._get_settings().cache_dir)
+        if cache_dir.is_absolute():
+            return cache_dir
+        base_dir = self.config_path.parent if self.config_path else Path.cwd()
+        return base_dir / cache_dir
+
+    def get_cache_max_size(self) -> int:
+        """結果キャッシュの最大サイズ(バイト)を取得します。"""
+        return self._get_settings().cache_max_size * 1024 * 1024
+
     def merge_with_cli_options(
         self,
         max_complexity: Optional[int] = None,
@@ -85,6 +166,11 @@ class CccyConfig:
         exclude: Optional[list[str]] = None,
         include: Optional[list[str]] = None,
         paths: Optional[list[str]] = None,
+        jobs: Optional[Union[int, str]] = None,
+        cache: Optional[bool] = None,
+        engine: Optional[str] = None,
+        default_excludes: Optional[bool] = None,
+        respect_gitignore: Optional[bool] = None,
     ) -> dict[str, Union[str, int, list[str], None]]:
         """設定をCLIオプションとマージし、CLIが優先されます。"""
         settings = self._get_settings()
@@ -95,7 +181,14 @@ class CccyConfig:
             exclude=exclude,
             include=include,
             paths=paths,
+            jobs=jobs,
+            cache=cache,
+            engine=engine,
+            default_excludes=default_excludes,
+            respect_gitignore=respect_gitignore,
         )
+        merged_config["cache_dir"] = str(self.get_cache_dir())
+        merged_config["cache_max_size"] = self.get_cache_max_size()
 
         # 設定値の検証
         max_complexity_val = merged_config["max_complexity"]
@@ -120,4 +213,8 @@ class CccyConfig:
         if paths_val and isinstance(paths_val, list):
             ConfigValidator.validate_paths(paths_val)
 
+        jobs_val = merged_config["jobs"]
+        if isinstance(jobs_val, (int, str)):
+            ConfigValidator.validate_jobs(jobs_val)
+
         return merged_config
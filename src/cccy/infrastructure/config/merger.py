@@ -24,6 +24,11 @@ class ConfigMerger:
         exclude: Optional[list[str]] = None,
         include: Optional[list[str]] = None,
         paths: Optional[list[str]] = None,
+        jobs: Optional[Union[int, str]] = None,
+        cache: Optional[bool] = None,
+        engine: Optional[str] = None,
+        default_excludes: Optional[bool] = None,
+        respect_gitignore: Optional[bool] = None,
     ) -> dict[str, Union[str, int, list[str], None]]:
         """設定をCLIオプションとマージし、CLIが優先されます。
 
@@ -33,6 +38,11 @@ class ConfigMerger:
             exclude: CLIで指定された除外パターン
             include: CLIで指定された包含パターン
             paths: CLIで指定されたパス
+            jobs: CLIで指定されたワーカー数または"auto"
+            cache: CLIで指定された結果キャッシュの有効/無効
+            engine: CLIで指定された複雑度計算エンジン
+            default_excludes: CLIで指定された既定の除外ディレクトリの有効/無効
+            respect_gitignore: CLIで指定された.gitignoreの尊重の有効/無効
 
         Returns:
             マージされた設定辞書
@@ -48,6 +58,17 @@ class ConfigMerger:
             "exclude": self._merge_list(exclude, self.settings.exclude),
             "include": self._merge_list(include, self.settings.include),
             "paths": self._merge_list(paths, self.settings.paths),
+            "jobs": jobs if jobs is not None else self.settings.jobs,
+            "engine": engine if engine is not None else self.settings.engine,
+            "default_excludes": default_excludes
+            if default_excludes is not None
+            else self.settings.default_excludes,
+            "respect_gitignore": respect_gitignore
+            if respect_gitignore is not None
+            else self.settings.respect_gitignore,
+            "cache": cache if cache is not None else self.settings.cache,
+            "cache_dir": self.settings.cache_dir,
+            "cache_max_size": self.settings.cache_max_size,
         }
 
     def _merge_value(
@@ -104,6 +125,30 @@ class ConfigValidator:
         if max_cognitive is not None and max_cognitive < 0:
             raise ValueError(f"max_cognitive must be >= 0, got {max_cognitive}")
 
+    @staticmethod
+    def validate_jobs(jobs: Union[int, str, None]) -> None:
+        """ジョブ数の妥当性を検証します。
+
+        Args:
+            jobs: ワーカー数または"auto"
+
+        Raises:
+            ValueError: ジョブ数が無効な場合
+
+        """
+        if jobs is None or (isinstance(jobs, str) and jobs.lower() == "auto"):
+            return
+
+        if isinstance(jobs, str):
+            if not jobs.isdigit():
+                raise ValueError(
+                    f"jobs must be a positive integer or 'auto', got {jobs}"
+                )
+            jobs = int(jobs)
+
+        if jobs < 1:
+            raise ValueError(f"jobs must be >= 1, got {jobs}")
+
     @staticmethod
     def validate_paths(paths: list[str]) -> None:
         """パスの妥当性を検証します。
@@ -0,0 +1 @@
+"""File analysis executors infrastructure."""
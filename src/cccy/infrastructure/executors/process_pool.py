@@ -0,0 +1,364 @@
+"""ProcessPoolExecutorを使用した並列ファイル解析エグゼキューター。"""
+
+import os
+import time
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import chain, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Optional, Union
+
+from cccy.domain.entities.records import FileRecord
+from cccy.domain.interfaces.executors import FileAnalysisExecutor, WorkerUtilization
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.scheduling import file_weight, plan_chunks
+
+if TYPE_CHECKING:
+    from cccy.domain.services.analysis_stats import AnalysisStats
+    from cccy.domain.services.profiling import ProfileSession, WorkerProfile
+
+# 1ワーカーあたりの、まとめて大きさを調べて送る順を決めるファイル数
+_WINDOW_PER_WORKER = 256
+# 1ワーカーあたりの投入済みで未回収のチャンク数の上限(メモリ使用量の上限)
+_PENDING_PER_WORKER = 2
+
+# ワーカープロセスごとに一度だけ構築されるアナライザー
+_worker_analyzer: Optional[ComplexityAnalyzer] = None
+
+
+def resolve_worker_count(jobs: Union[int, str, None]) -> int:
+    """ジョブ指定を実際のワーカー数に解決します。
+
+    Args:
+        jobs: ワーカー数、"auto"(CPU数)、またはNone(1)
+
+    Returns:
+        1以上のワーカー数
+
+    Raises:
+        ValueError: jobsが不正な値の場合
+
+    """
+    if jobs is None:
+        return 1
+    if isinstance(jobs, str) and jobs.lower() == "auto":
+        return os.cpu_count() or 1
+    if isinstance(jobs, str) and not jobs.isdigit():
+        raise ValueError(f"jobs must be a positive integer or 'auto', got {jobs}")
+
+    count = int(jobs)
+    if count < 1:
+        raise ValueError(f"jobs must be >= 1, got {count}")
+    return count
+
+
+def _init_worker(analyzer: ComplexityAnalyzer) -> None:
+    """ワーカープロセスを初期化します。
+
+    Args:
+        analyzer: ワーカー内で再利用するアナライザー
+
+    """
+    global _worker_analyzer  # noqa: PLW0603
+    _worker_analyzer = analyzer
+    if analyzer.stats is not None:
+        # 親プロセスで集計済みの値を二重に数えないよう、0から集計する
+        analyzer.stats.reset()
+    if analyzer.profile is not None:
+        # forkした場合は親プロセスで計測中のプロファイラーを引き継いでいる
+        analyzer.profile.reset()
+
+
+class _ChunkResult(NamedTuple):
+    """ワーカープロセスから返されるチャンクの解析結果。"""
+
+    worker: int
+    busy_seconds: float
+    records: list[Optional[FileRecord]]
+    # 集計が有効な場合の、このチャンクの解析の集計
+    stats: Optional["AnalysisStats"] = None
+    # プロファイルを取る場合の、このチャンクの解析のプロファイル
+    profile: Optional["WorkerProfile"] = None
+
+
+class _Chunk(NamedTuple):
+    """ワーカーに送るファイルと、その入力での位置。"""
+
+    window_start: int
+    indices: list[int]
+    paths: list[str]
+
+
+def _analyze_chunk(chunk: list[str]) -> _ChunkResult:
+    """ワーカープロセス内でファイルのチャンクを解析します。
+
+    結果はpickleが安価な検証なしのレコードのまま親プロセスに返します。
+
+    Args:
+        chunk: 解析するファイルパスのリスト
+
+    Returns:
+        ワーカーのプロセスID、解析にかかった秒数、チャンクと同じ順序の解析結果、
+        集計が有効な場合はチャンクの解析の集計、プロファイルを取る場合は
+        チャンクの解析のプロファイル
+
+    """
+    if _worker_analyzer is None:
+        raise RuntimeError("Worker analyzer is not initialized")
+    profile = _worker_analyzer.profile
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    records = [_worker_analyzer.analyze_file_record(path) for path in chunk]
+    busy_seconds = time.perf_counter() - start
+    stats = _worker_analyzer.stats
+    return _ChunkResult(
+        os.getpid(),
+        busy_seconds,
+        records,
+        None if stats is None else stats.drain(),
+        None if profile is None else profile.drain(),
+    )
+
+
+class ProcessPoolFileAnalysisExecutor(FileAnalysisExecutor):
+    """ファイルをチャンク単位でワーカープロセスに分配するエグゼキューター。"""
+
+    def __init__(self, max_workers: int, chunk_size: Optional[int] = None) -> None:
+        """エグゼキューターを初期化します。
+
+        Args:
+            max_workers: 最大ワーカープロセス数
+            chunk_size: 1チャンクあたりのファイル数(Noneの場合は自動決定)
+
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def execute(
+        self, analyzer: ComplexityAnalyzer, files: list[Path]
+    ) -> list[FileRecord]:
+        """ファイルのリストを並列に解析します。
+
+        Args:
+            analyzer: ワーカーに渡すアナライザー
+            files: 解析するファイルパスのリスト
+
+        Returns:
+            入力ファイルと同じ順序の解析結果のリスト
+
+        """
+        return list(self.iter_execute(analyzer, files))
+
+    def iter_execute(
+        self, analyzer: ComplexityAnalyzer, files: Iterable[Path]
+    ) -> Generator[FileRecord, None, None]:
+        """ファイルを並列に解析し、結果を入力順に逐次返します。
+
+        ファイルはワーカー数に比例する数ずつ先読みして大きさを調べ、その中で
+        大きいものから順にワーカーに送ります(``plan_chunks``)。結果は入力
+        順に並べ直して返すため、先行して解析・保持されるのは先読みした範囲の
+        2つ分までで、ファイル数によらずメモリ使用量は一定です。結果の消費が
+        遅ければ投入も止まり、ジェネレーターを途中で閉じると未着手の
+        チャンクは取り消されます。
+
+        Args:
+            analyzer: ワーカーに渡すアナライザー
+            files: 解析するファイルパス(ジェネレーターでもよい)
+
+        Yields:
+            入力ファイルと同じ順序の解析結果(解析できなかったファイルは除く)
+
+        """
+        self.last_utilization = ()
+        paths = iter(files)
+        window_size = self.max_workers * _WINDOW_PER_WORKER
+        head = list(islice(paths, window_size))
+        if self.max_workers == 1 or len(head) <= 1:
+            yield from self._iter_serial(analyzer, chain(head, paths))
+            return
+
+        workers = min(self.max_workers, len(head))
+        windows = chain([head], _iter_windows(paths, window_size))
+        chunks = _iter_scheduled_chunks(windows, workers, self.chunk_size)
+        monitor = _UtilizationMonitor(analyzer.stats, analyzer.profile)
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(analyzer,)
+        )
+        try:
+            yield from _iter_in_order(
+                pool, chunks, workers * _PENDING_PER_WORKER, window_size, monitor
+            )
+        finally:
+            # 途中で消費をやめた場合は、まだ始まっていないチャンクを取り消す
+            pool.shutdown(wait=True, cancel_futures=True)
+            self.last_utilization = monitor.report()
+
+    def _iter_serial(
+        self, analyzer: ComplexityAnalyzer, files: Iterable[Path]
+    ) -> Iterator[FileRecord]:
+        """現在のプロセスでファイルを逐次解析します。"""
+        for file_path in files:
+            result = analyzer.analyze_file_record(file_path)
+            if result is not None:
+                yield result
+
+
+class _UtilizationMonitor:
+    """チャンクの結果からワーカーごとの稼働状況を集計します。
+
+    集計先やプロファイルの合算先を指定すると、ワーカーが返したチャンクの
+    解析の集計やプロファイルも合算します。
+    """
+
+    def __init__(
+        self,
+        stats: Optional["AnalysisStats"] = None,
+        profile: Optional["ProfileSession"] = None,
+    ) -> None:
+        self.stats = stats
+        self.profile = profile
+        self.started = time.perf_counter()
+        self.finished = self.started
+        self.workers: dict[int, tuple[int, int, float]] = {}
+
+    def record(self, result: _ChunkResult) -> None:
+        """完了したチャンクを集計に加えます。"""
+        files, chunks, busy = self.workers.get(result.worker, (0, 0, 0.0))
+        self.workers[result.worker] = (
+            files + len(result.records),
+            chunks + 1,
+            busy + result.busy_seconds,
+        )
+        if self.stats is not None and result.stats is not None:
+            self.stats.merge(result.stats, result.worker)
+        if self.profile is not None and result.profile is not None:
+            self.profile.merge(result.profile, result.worker)
+        self.finished = time.perf_counter()
+
+    def report(self) -> tuple[WorkerUtilization, ...]:
+        """ワーカーごとの稼働状況をプロセスID順に返します。"""
+        elapsed = self.finished - self.started
+        return tuple(
+            WorkerUtilization(worker, files, chunks, busy, elapsed)
+            for worker, (files, chunks, busy) in sorted(self.workers.items())
+        )
+
+
+def _iter_windows(files: Iterator[Path], window_size: int) -> Iterator[list[Path]]:
+    """ファイルを先読みする範囲ごとのリストに分けます。"""
+    window = list(islice(files, window_size))
+    while window:
+        yield window
+        window = list(islice(files, window_size))
+
+
+def _iter_scheduled_chunks(
+    windows: Iterable[list[Path]], workers: int, chunk_size: Optional[int]
+) -> Iterator[_Chunk]:
+    """先読みした範囲ごとに、大きいファイルから順にチャンクを作ります。
+
+    Args:
+        windows: 入力順のファイルを先読みする範囲ごとに分けたリスト
+        workers: ワーカー数
+        chunk_size: 1チャンクあたりのファイル数(Noneの場合は大きさから決定)
+
+    Yields:
+        送る順のチャンク(ファイルの位置は入力全体での添字)
+
+    """
+    window_start = 0
+    for window in windows:
+        weights = [file_weight(path) for path in window]
+        for chunk in plan_chunks(weights, workers, chunk_size):
+            yield _Chunk(
+                window_start,
+                [window_start + index for index in chunk],
+                [str(window[index]) for index in chunk],
+            )
+        window_start += len(window)
+
+
+def _iter_in_order(
+    pool: ProcessPoolExecutor,
+    chunks: Iterator[_Chunk],
+    max_pending: int,
+    lookahead: int,
+    monitor: Optional[_UtilizationMonitor] = None,
+) -> Iterator[FileRecord]:
+    """投入するチャンク数を制限しながら、結果を入力の順に返します。
+
+    チャンクは完了した順に回収し、入力順で次に返すファイルの結果が揃う
+    たびに返します。次に返すファイルからlookahead以上先の範囲のチャンクは、
+    そのファイルが返されるまで投入しません。
+
+    Args:
+        pool: チャンクを投入するプロセスプール
+        chunks: 送る順のチャンク
+        max_pending: 投入済みで未回収のチャンクの上限
+        lookahead: 次に返すファイルから先に投入してよい範囲のファイル数
+        monitor: ワーカーの稼働状況の集計先(オプション)
+
+    Yields:
+        入力の順序の解析結果(解析できなかったファイルは除く)
+
+    """
+    return iter(_InOrderResults(pool, chunks, max_pending, lookahead, monitor))
+
+
+class _InOrderResults:
+    """完了した順に回収したチャンクの結果を入力の順に並べ直します。"""
+
+    def __init__(
+        self,
+        pool: ProcessPoolExecutor,
+        chunks: Iterator[_Chunk],
+        max_pending: int,
+        lookahead: int,
+        monitor: Optional[_UtilizationMonitor],
+    ) -> None:
+        self.pool = pool
+        self.chunks = chunks
+        self.max_pending = max_pending
+        self.lookahead = lookahead
+        self.monitor = monitor
+        self.pending: dict[Future[_ChunkResult], list[int]] = {}
+        self.completed: dict[int, Optional[FileRecord]] = {}
+        self.next_index = 0
+        self.chunk = next(chunks, None)
+
+    def __iter__(self) -> Iterator[FileRecord]:
+        while self.chunk is not None or self.pending:
+            self._submit_ready()
+            self._collect()
+            yield from self._pop_ready()
+
+    def _submit_ready(self) -> None:
+        """上限と先読みの範囲が許す限りチャンクを投入します。"""
+        while (
+            self.chunk is not None
+            and len(self.pending) < self.max_pending
+            and self.chunk.window_start <= self.next_index + self.lookahead
+        ):
+            future = self.pool.submit(_analyze_chunk, self.chunk.paths)
+            self.pending[future] = self.chunk.indices
+            self.chunk = next(self.chunks, None)
+
+    def _collect(self) -> None:
+        """少なくとも1つのチャンクの完了を待ち、結果を回収します。"""
+        done, _ = wait(self.pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            result = future.result()
+            self.completed.update(zip(self.pending.pop(future), result.records))
+            if self.monitor is not None:
+                self.monitor.record(result)
+
+    def _pop_ready(self) -> Iterator[FileRecord]:
+        """入力順で次のファイルから、結果の揃っている分を返します。"""
+        while self.next_index in self.completed:
+            record = self.completed.pop(self.next_index)
+            self.next_index += 1
+            if record is not None:
+                yield record
@@ -0,0 +1,191 @@
+"""複雑度解析結果を列指向の形式(Parquet、Arrow IPC)で書き出すモジュール。
+
+データの分析基盤に読み込ませるための出力です。結果は解析が終わった
+ファイルから順に受け取り、一定の行数ごとに1つの行グループ(Arrow IPCでは
+レコードバッチ)として書き出すため、すべての結果をメモリに保持しません。
+パスとステータスは辞書エンコードし、複雑度と行・列の位置はint32で書き出します。
+
+pyarrowはオプションの依存関係(``pip install 'cccy[arrow]'``)です。
+"""
+
+from collections.abc import Iterable
+from typing import Any, BinaryIO
+
+from cccy.domain.entities.complexity import FileComplexityResult
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError as e:
+    raise ImportError(
+        "Parquet and Arrow output require pyarrow: pip install 'cccy[arrow]'"
+    ) from e
+
+# 列指向の出力フォーマット
+COLUMNAR_FORMATS = ("parquet", "arrow")
+# 1つの行グループに書き出すおおよその行数(ファイルの途中では分割しない)
+ROW_GROUP_SIZE = 65536
+
+# ステータスの列の辞書に入れる、get_statusが返す値
+_STATUSES = ("OK", "MEDIUM", "HIGH")
+_STATUS_DICTIONARY = pa.array(_STATUSES, pa.string())
+_DICTIONARY = pa.dictionary(pa.int32(), pa.string())
+
+# show-functionsの出力(1行が1つの関数)
+FUNCTION_SCHEMA = pa.schema(
+    [
+        pa.field("file_path", _DICTIONARY, nullable=False),
+        pa.field("function_name", pa.string(), nullable=False),
+        pa.field("line_number", pa.int32(), nullable=False),
+        pa.field("end_line_number", pa.int32()),
+        pa.field("col_offset", pa.int32(), nullable=False),
+        pa.field("end_col_offset", pa.int32()),
+        pa.field("cyclomatic_complexity", pa.int32(), nullable=False),
+        pa.field("cognitive_complexity", pa.int32(), nullable=False),
+        pa.field("file_status", _DICTIONARY, nullable=False),
+    ]
+)
+
+# show-listの出力(1行が1つのファイル)
+FILE_SCHEMA = pa.schema(
+    [
+        pa.field("file_path", _DICTIONARY, nullable=False),
+        pa.field("function_count", pa.int32(), nullable=False),
+        pa.field("total_cyclomatic", pa.int32(), nullable=False),
+        pa.field("total_cognitive", pa.int32(), nullable=False),
+        pa.field("max_cyclomatic", pa.int32(), nullable=False),
+        pa.field("max_cognitive", pa.int32(), nullable=False),
+        pa.field("status", _DICTIONARY, nullable=False),
+    ]
+)
+
+
+class _RowGroup:
+    """1つの行グループに書き出す列の値を貯めるバッファー。
+
+    パスは行グループごとの辞書に1回だけ追加し、各行はその番号を持ちます。
+    """
+
+    def __init__(self, schema: "pa.Schema") -> None:
+        self.schema = schema
+        self.paths: list[str] = []
+        self.columns: dict[str, list[Any]] = {name: [] for name in schema.names}
+        self.rows = 0
+
+    def add_file(self, result: FileComplexityResult) -> tuple[int, int]:
+        """ファイルのパスを辞書に追加し、パスとステータスの番号を返します。"""
+        self.paths.append(result.file_path)
+        return len(self.paths) - 1, _STATUSES.index(result.status)
+
+    def to_batch(self) -> "pa.RecordBatch":
+        """貯めた値をレコードバッチに変換します。"""
+        dictionaries = {
+            "file_path": pa.array(self.paths, pa.string()),
+            "file_status": _STATUS_DICTIONARY,
+            "status": _STATUS_DICTIONARY,
+        }
+        arrays = []
+        for field in self.schema:
+            values = self.columns[field.name]
+            if field.name in dictionaries:
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(values, pa.int32()), dictionaries[field.name]
+                    )
+                )
+            else:
+                arrays.append(pa.array(values, field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def _add_functions(group: _RowGroup, result: FileComplexityResult) -> None:
+    """ファイル内の関数を1行ずつ追加します(関数のないファイルは行を持ちません)。"""
+    if not result.functions:
+        return
+    path, status = group.add_file(result)
+    count = len(result.functions)
+    columns = group.columns
+    columns["file_path"].extend([path] * count)
+    columns["file_status"].extend([status] * count)
+    for func in result.functions:
+        columns["function_name"].append(func.name)
+        columns["line_number"].append(func.lineno)
+        columns["end_line_number"].append(func.end_lineno)
+        columns["col_offset"].append(func.col_offset)
+        columns["end_col_offset"].append(func.end_col_offset)
+        columns["cyclomatic_complexity"].append(func.cyclomatic_complexity)
+        columns["cognitive_complexity"].append(func.cognitive_complexity)
+    group.rows += count
+
+
+def _add_file(group: _RowGroup, result: FileComplexityResult) -> None:
+    """ファイルの集計を1行追加します。"""
+    path, status = group.add_file(result)
+    columns = group.columns
+    columns["file_path"].append(path)
+    columns["function_count"].append(len(result.functions))
+    columns["total_cyclomatic"].append(result.total_cyclomatic)
+    columns["total_cognitive"].append(result.total_cognitive)
+    columns["max_cyclomatic"].append(result.max_cyclomatic)
+    columns["max_cognitive"].append(result.max_cognitive)
+    columns["status"].append(status)
+    group.rows += 1
+
+
+def _open_writer(sink: BinaryIO, output_format: str, schema: "pa.Schema") -> Any:
+    """フォーマットに応じたライターを開きます。
+
+    Arrow IPCはバッチごとに辞書を置き換えられるストリーム形式で書き出します
+    (ファイル形式は列ごとに1つの辞書しか持てません)。
+    """
+    if output_format == "parquet":
+        return pq.ParquetWriter(sink, schema)
+    if output_format == "arrow":
+        return pa.ipc.new_stream(sink, schema)
+    raise ValueError(f"Unknown columnar format: {output_format}")
+
+
+def write_columnar(
+    results: Iterable[FileComplexityResult],
+    sink: BinaryIO,
+    output_format: str,
+    functions: bool = False,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> int:
+    """結果を列指向の形式で書き出します。
+
+    Args:
+        results: ファイル複雑度結果(ジェネレーターでもよい)
+        sink: 書き出し先のバイナリストリーム
+        output_format: parquetまたはarrow
+        functions: 関数ごとの行(``FUNCTION_SCHEMA``)を書き出すかどうか。
+            Falseの場合はファイルごとの行(``FILE_SCHEMA``)
+        row_group_size: 1つの行グループのおおよその行数
+
+    Returns:
+        書き出した行数
+
+    Raises:
+        ValueError: 不明なフォーマットが指定された場合
+
+    """
+    schema = FUNCTION_SCHEMA if functions else FILE_SCHEMA
+    add = _add_functions if functions else _add_file
+    writer = _open_writer(sink, output_format, schema)
+    group = _RowGroup(schema)
+    rows = 0
+    try:
+        for result in results:
+            add(group, result)
+            if group.rows >= row_group_size:
+                writer.write_batch(group.to_batch())
+                rows += group.rows
+                group = _RowGroup(schema)
+        if group.rows:
+            writer.write_batch(group.to_batch())
+            rows += group.rows
+    finally:
+        writer.close()
+    sink.flush()
+    return rows
@@ -0,0 +1,163 @@
+"""tabulateのgrid形式と同じテーブルを描画するモジュール。
+
+tabulateはセルごとに型を推定し、列ごとに何度も文字列を作り直すため、
+数万行の出力では解析そのものより時間がかかります。このモジュールは
+セルを1回だけ文字列に変換し、列の幅を1回の走査で求めて、行を直接
+ストリームに書き出します。
+
+出力がtabulateとバイト単位で一致することを保証できるのは、各列が
+整数だけ(右寄せ)、または文字列だけ(左寄せ)からなる場合です。
+それ以外のセル(None、浮動小数点数、数値や真偽値に見える文字列だけの列、
+ASCII以外の文字や制御文字、前後の空白を含む文字列など)を含むテーブルと、
+grid以外の形式は、tabulateで描画します。
+"""
+
+from collections.abc import Sequence
+from io import StringIO
+from typing import Optional, TextIO, cast
+
+# tabulateが見出しの幅に加える余白
+_HEADER_PADDING = 2
+# tabulateが真偽値とみなす文字列
+_BOOLEAN_STRINGS = frozenset({"True", "False"})
+# 列の文字列をまとめて検査するときの区切り。表示可能な文字でないものを使う
+_SEPARATOR = "\x00"
+
+
+def _is_plain(values: Sequence[str]) -> bool:
+    """文字列の表示幅が文字数と等しく、tabulateがそのまま出力するかどうか。
+
+    ASCIIの表示可能な文字だけからなり、前後に空白のない文字列です。
+    """
+    joined = _SEPARATOR + _SEPARATOR.join(values) + _SEPARATOR
+    return (
+        joined.isascii()
+        and joined.count(_SEPARATOR) == len(values) + 1
+        and joined.replace(_SEPARATOR, "").isprintable()
+        and f" {_SEPARATOR}" not in joined
+        and f"{_SEPARATOR} " not in joined
+    )
+
+
+def _is_text(value: str) -> bool:
+    """tabulateが文字列の列とみなす値(数値、真偽値、空文字列でない)かどうか。"""
+    if not value or value in _BOOLEAN_STRINGS:
+        return False
+    try:
+        float(value.replace(",", ""))
+    except ValueError:
+        return True
+    return False
+
+
+def _string_column(values: Sequence[object]) -> Optional[tuple[list[str], bool]]:
+    """列のセルを文字列に変換し、右寄せするかどうかを求めます。
+
+    Returns:
+        列のセルと右寄せ、またはtabulateと同じ出力を保証できない場合はNone
+
+    """
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        return list(map(str, values)), True
+    if not kinds or kinds == {str}:
+        strings = cast("list[str]", list(values))
+        if not strings or (_is_plain(strings) and any(map(_is_text, strings))):
+            return strings, False
+    return None
+
+
+def _string_columns(
+    rows: Sequence[Sequence[object]], headers: Sequence[str]
+) -> Optional[list[tuple[list[str], bool]]]:
+    """行を列ごとの文字列のセルに変換します。
+
+    Returns:
+        列ごとのセルと右寄せ、またはtabulateと同じ出力を保証できない場合はNone
+
+    """
+    if not _is_plain(headers) or any(len(row) != len(headers) for row in rows):
+        return None
+    transposed = zip(*rows) if rows else ([] for _ in headers)
+    columns = []
+    for values in transposed:
+        column = _string_column(values)
+        if column is None:
+            return None
+        columns.append(column)
+    return columns
+
+
+def _write_grid(
+    stream: TextIO,
+    columns: list[tuple[list[str], bool]],
+    headers: Sequence[str],
+) -> None:
+    """列ごとの文字列のセルをgrid形式でストリームに書き出します。"""
+    widths = [
+        max(len(header) + _HEADER_PADDING, max(map(len, cells), default=0))
+        for header, (cells, _) in zip(headers, columns)
+    ]
+    # Every row is padded by one C-level str.format call
+    template = (
+        "| "
+        + " | ".join(
+            f"{{:{'>' if right else '<'}{width}}}"
+            for width, (_, right) in zip(widths, columns)
+        )
+        + " |"
+    )
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    stream.write(separator + "\n" + template.format(*headers) + "\n")
+    stream.write("+" + "+".join("=" * (width + 2) for width in widths) + "+")
+    row_template = "\n" + template + "\n" + separator
+    for row in zip(*(cells for cells, _ in columns)):
+        stream.write(row_template.format(*row))
+    if not columns or not columns[0][0]:
+        stream.write("\n" + separator)
+
+
+def write_table(
+    stream: TextIO,
+    rows: Sequence[Sequence[object]],
+    headers: Sequence[str],
+    tablefmt: str = "grid",
+) -> None:
+    """行をテーブルとしてストリームに書き出します(末尾に改行は付けません)。
+
+    Args:
+        stream: 書き出し先のテキストストリーム
+        rows: 行の値
+        headers: 列の名前
+        tablefmt: tabulateの形式名(grid以外はtabulateで描画)
+
+    """
+    columns = _string_columns(rows, headers) if tablefmt == "grid" else None
+    if columns is None:
+        # tabulate is only imported for tables the built-in renderer cannot match
+        from tabulate import tabulate  # noqa: PLC0415
+
+        stream.write(str(tabulate(rows, headers=list(headers), tablefmt=tablefmt)))
+        return
+    _write_grid(stream, columns, headers)
+
+
+def render_table(
+    rows: Sequence[Sequence[object]],
+    headers: Sequence[str],
+    tablefmt: str = "grid",
+) -> str:
+    """行をテーブルの文字列に整形します(``write_table`` と同じ出力)。
+
+    Args:
+        rows: 行の値
+        headers: 列の名前
+        tablefmt: tabulateの形式名(grid以外はtabulateで描画)
+
+    Returns:
+        テーブルの文字列
+
+    """
+    output = StringIO()
+    write_table(output, rows, headers, tablefmt)
+    return output.getvalue()
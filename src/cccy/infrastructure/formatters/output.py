@@ -2,15 +2,117 @@
 
 import csv
 import json
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from io import StringIO
-
-from tabulate import tabulate
+from typing import Any, TextIO
 
 from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.infrastructure.formatters.grid import write_table
+
+# 結果が1件もない場合のテーブルと要約
+_NO_RESULTS = "No Python files analyzed."
+
+
+def _file_json_object(result: FileComplexityResult) -> dict[str, Any]:
+    """ファイルの結果をJSON出力用の後方互換な形式の辞書に変換します。"""
+    # Use Pydantic's model_dump and transform for legacy format compatibility
+    result_dict = result.model_dump()
+
+    # Transform functions to legacy format
+    functions = []
+    for func in result_dict["functions"]:
+        functions.append(
+            {
+                "name": func["name"],
+                "line": func["lineno"],  # Map lineno to line for backward compatibility
+                "cyclomatic_complexity": func["cyclomatic_complexity"],
+                "cognitive_complexity": func["cognitive_complexity"],
+                "end_line": func["end_lineno"],
+            }
+        )
+
+    # Transform to legacy format for backward compatibility
+    return {
+        "file_path": result_dict["file_path"],
+        "functions": functions,
+        "totals": {
+            "cyclomatic_complexity": result_dict["total_cyclomatic"],
+            "cognitive_complexity": result_dict["total_cognitive"],
+        },
+        "max_complexity": {
+            "cyclomatic": result_dict["max_cyclomatic"],
+            "cognitive": result_dict["max_cognitive"],
+        },
+        "status": result.status,  # Use property for status
+    }
+
+
+def _function_json_objects(result: FileComplexityResult) -> list[dict[str, Any]]:
+    """ファイル内の関数の結果を関数レベルのJSON出力用の辞書に変換します。"""
+    status = result.status
+    return [
+        {
+            "file_path": result.file_path,
+            "function_name": func.name,
+            "line_number": func.lineno,
+            "end_line_number": func.end_lineno,
+            "cyclomatic_complexity": func.cyclomatic_complexity,
+            "cognitive_complexity": func.cognitive_complexity,
+            "file_status": status,
+        }
+        for func in result.functions
+    ]
+
+
+def _write_json_array(objects: Iterable[dict[str, Any]], stream: TextIO) -> None:
+    """オブジェクトを1つずつ、``json.dumps(list, indent=2)`` と同じ配列として書き出します。"""
+    separator = "[\n  "
+    for obj in objects:
+        stream.write(separator)
+        stream.write(json.dumps(obj, indent=2, default=str).replace("\n", "\n  "))
+        separator = ",\n  "
+    stream.write("[]" if separator == "[\n  " else "\n]")
+
+
+def _to_string(write: Callable[..., None], *args: Any) -> str:
+    """``write_*`` の出力を文字列として返します。"""
+    output = StringIO()
+    write(*args, output)
+    return output.getvalue()
 
 
 class OutputFormatter:
-    """複雑度解析結果の出力フォーマッター。"""
+    """複雑度解析結果の出力フォーマッター。
+
+    ``write_*`` は出力をテキストストリームへ直接書き出し、出力全体の文字列を
+    作りません。``format_*`` は同じ出力を文字列として返します。どちらも
+    末尾に改行は付けません。
+    """
+
+    @staticmethod
+    def write_table(results: list[FileComplexityResult], stream: TextIO) -> None:
+        """結果をテーブルとして書き出します。
+
+        Args:
+            results: ファイル複雑度結果のリスト
+            stream: 書き出し先のテキストストリーム
+
+        """
+        if not results:
+            stream.write(_NO_RESULTS)
+            return
+
+        headers = ["File", "Cyclomatic", "Cognitive", "Status"]
+        rows = [
+            [
+                result.file_path,
+                result.max_cyclomatic,
+                result.max_cognitive,
+                result.status,
+            ]
+            for result in results
+        ]
+        write_table(stream, rows, headers)
 
     @staticmethod
     def format_table(results: list[FileComplexityResult]) -> str:
@@ -22,25 +124,51 @@ class OutputFormatter:
         Returns:
             フォーマットされたテーブル文字列
 
+        """
+        return _to_string(OutputFormatter.write_table, results)
+
+    @staticmethod
+    def write_detailed_table(
+        results: list[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """関数レベル情報を含む詳細テーブルとして結果を書き出します。
+
+        Args:
+            results: ファイル複雑度結果のリスト
+            stream: 書き出し先のテキストストリーム
+
         """
         if not results:
-            return "No Python files analyzed."
+            stream.write(_NO_RESULTS)
+            return
 
-        headers = ["File", "Cyclomatic", "Cognitive", "Status"]
-        rows = []
+        headers = ["Function", "Line", "Cyclomatic", "Cognitive"]
+        for index, result in enumerate(results):
+            # Sections after the first are separated by an empty line
+            if index:
+                stream.write("\n")
+            stream.write(f"\n=== {result.file_path} ===")
 
-        for result in results:
-            rows.append(
+            if not result.functions:
+                stream.write("\nNo functions found.")
+                continue
+
+            rows = [
                 [
-                    result.file_path,
-                    result.max_cyclomatic,
-                    result.max_cognitive,
-                    result.status,
+                    func.name,
+                    func.lineno,
+                    func.cyclomatic_complexity,
+                    func.cognitive_complexity,
                 ]
+                for func in result.functions
+            ]
+            stream.write("\n")
+            write_table(stream, rows, headers)
+            stream.write(
+                f"\nFile totals - Cyclomatic: {result.total_cyclomatic}, "
+                f"Cognitive: {result.total_cognitive}, Status: {result.status}"
             )
 
-        return str(tabulate(rows, headers=headers, tablefmt="grid"))
-
     @staticmethod
     def format_detailed_table(results: list[FileComplexityResult]) -> str:
         """関数レベル情報を含む詳細テーブルとして結果をフォーマットします。
@@ -52,38 +180,18 @@ class OutputFormatter:
             フォーマットされた詳細テーブル文字列
 
         """
-        if not results:
-            return "No Python files analyzed."
-
-        output = []
-
-        for result in results:
-            output.append(f"\n=== {result.file_path} ===")
+        return _to_string(OutputFormatter.write_detailed_table, results)
 
-            if not result.functions:
-                output.append("No functions found.")
-                continue
-
-            headers = ["Function", "Line", "Cyclomatic", "Cognitive"]
-            rows = []
-
-            for func in result.functions:
-                rows.append(
-                    [
-                        func.name,
-                        func.lineno,
-                        func.cyclomatic_complexity,
-                        func.cognitive_complexity,
-                    ]
-                )
+    @staticmethod
+    def write_json(results: Iterable[FileComplexityResult], stream: TextIO) -> None:
+        """結果をJSONの配列として、ファイルごとに書き出します。
 
-            output.append(str(tabulate(rows, headers=headers, tablefmt="grid")))
-            output.append(
-                f"File totals - Cyclomatic: {result.total_cyclomatic}, "
-                f"Cognitive: {result.total_cognitive}, Status: {result.status}"
-            )
+        Args:
+            results: ファイル複雑度結果(ジェネレーターでもよい)
+            stream: 書き出し先のテキストストリーム
 
-        return "\n".join(output)
+        """
+        _write_json_array(map(_file_json_object, results), stream)
 
     @staticmethod
     def format_json(results: list[FileComplexityResult]) -> str:
@@ -96,56 +204,32 @@ class OutputFormatter:
             JSONフォーマットされた文字列
 
         """
-        # Use Pydantic's model_dump and transform for legacy format compatibility
-        data = []
-        for result in results:
-            result_dict = result.model_dump()
-
-            # Transform functions to legacy format
-            functions = []
-            for func in result_dict["functions"]:
-                functions.append(
-                    {
-                        "name": func["name"],
-                        "line": func[
-                            "lineno"
-                        ],  # Map lineno to line for backward compatibility
-                        "cyclomatic_complexity": func["cyclomatic_complexity"],
-                        "cognitive_complexity": func["cognitive_complexity"],
-                        "end_line": func["end_lineno"],
-                    }
-                )
-
-            # Transform to legacy format for backward compatibility
-            transformed = {
-                "file_path": result_dict["file_path"],
-                "functions": functions,
-                "totals": {
-                    "cyclomatic_complexity": result_dict["total_cyclomatic"],
-                    "cognitive_complexity": result_dict["total_cognitive"],
-                },
-                "max_complexity": {
-                    "cyclomatic": result_dict["max_cyclomatic"],
-                    "cognitive": result_dict["max_cognitive"],
-                },
-                "status": result.status,  # Use property for status
-            }
-            data.append(transformed)
-        return json.dumps(data, indent=2, default=str)
+        return _to_string(OutputFormatter.write_json, results)
 
     @staticmethod
-    def format_csv(results: list[FileComplexityResult]) -> str:
-        """結果をCSVとしてフォーマットします。
+    def iter_jsonl(results: Iterable[FileComplexityResult]) -> Iterator[str]:
+        """結果をファイルごとに1行のJSON(JSON Lines)としてフォーマットします。
 
         Args:
-            results: ファイル複雑度結果のリスト
+            results: ファイル複雑度結果(ジェネレーターでもよい)
 
-        Returns:
-            CSVフォーマットされた文字列
+        Yields:
+            ``format_json`` の要素と同じ形式のオブジェクトを1つ含む行
+
+        """
+        for result in results:
+            yield json.dumps(_file_json_object(result), default=str)
+
+    @staticmethod
+    def write_csv(results: Iterable[FileComplexityResult], stream: TextIO) -> None:
+        """結果をCSVとして書き出します。
+
+        Args:
+            results: ファイル複雑度結果(ジェネレーターでもよい)
+            stream: 書き出し先のテキストストリーム
 
         """
-        output = StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(stream)
 
         # Write header
         writer.writerow(
@@ -163,21 +247,8 @@ class OutputFormatter:
 
         # Write data rows
         for result in results:
-            if result.functions:
-                for func in result.functions:
-                    writer.writerow(
-                        [
-                            result.file_path,
-                            func.name,
-                            func.lineno,
-                            func.cyclomatic_complexity,
-                            func.cognitive_complexity,
-                            result.max_cyclomatic,
-                            result.max_cognitive,
-                            result.status,
-                        ]
-                    )
-            else:
+            status = result.status
+            if not result.functions:
                 # File with no functions
                 writer.writerow(
                     [
@@ -188,11 +259,55 @@ class OutputFormatter:
                         0,
                         result.max_cyclomatic,
                         result.max_cognitive,
-                        result.status,
+                        status,
                     ]
                 )
+            writer.writerows(
+                [
+                    result.file_path,
+                    func.name,
+                    func.lineno,
+                    func.cyclomatic_complexity,
+                    func.cognitive_complexity,
+                    result.max_cyclomatic,
+                    result.max_cognitive,
+                    status,
+                ]
+                for func in result.functions
+            )
+
+    @staticmethod
+    def format_csv(results: list[FileComplexityResult]) -> str:
+        """結果をCSVとしてフォーマットします。
 
-        return output.getvalue()
+        Args:
+            results: ファイル複雑度結果のリスト
+
+        Returns:
+            CSVフォーマットされた文字列
+
+        """
+        return _to_string(OutputFormatter.write_csv, results)
+
+    @staticmethod
+    def write_functions_json(
+        results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """関数レベルの結果をJSONの配列として、関数ごとに書き出します。
+
+        Args:
+            results: ファイル複雑度結果(ジェネレーターでもよい)
+            stream: 書き出し先のテキストストリーム
+
+        """
+        _write_json_array(
+            (
+                function
+                for result in results
+                for function in _function_json_objects(result)
+            ),
+            stream,
+        )
 
     @staticmethod
     def format_functions_json(results: list[FileComplexityResult]) -> str:
@@ -205,37 +320,35 @@ class OutputFormatter:
             関数に焦点を当てたJSONフォーマットされた文字列
 
         """
-        data = []
+        return _to_string(OutputFormatter.write_functions_json, results)
 
-        for result in results:
-            for func in result.functions:
-                data.append(
-                    {
-                        "file_path": result.file_path,
-                        "function_name": func.name,
-                        "line_number": func.lineno,
-                        "end_line_number": func.end_lineno,
-                        "cyclomatic_complexity": func.cyclomatic_complexity,
-                        "cognitive_complexity": func.cognitive_complexity,
-                        "file_status": result.status,
-                    }
-                )
+    @staticmethod
+    def iter_functions_jsonl(results: Iterable[FileComplexityResult]) -> Iterator[str]:
+        """関数レベルの結果を関数ごとに1行のJSON(JSON Lines)としてフォーマットします。
+
+        Args:
+            results: ファイル複雑度結果(ジェネレーターでもよい)
+
+        Yields:
+            ``format_functions_json`` の要素と同じ形式のオブジェクトを1つ含む行
 
-        return json.dumps(data, indent=2, default=str)
+        """
+        for result in results:
+            for function in _function_json_objects(result):
+                yield json.dumps(function, default=str)
 
     @staticmethod
-    def format_functions_csv(results: list[FileComplexityResult]) -> str:
-        """関数レベルの結果をCSVとしてフォーマットします。
+    def write_functions_csv(
+        results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """関数レベルの結果をCSVとして書き出します。
 
         Args:
-            results: ファイル複雑度結果のリスト
-
-        Returns:
-            関数に焦点を当てたCSVフォーマットされた文字列
+            results: ファイル複雑度結果(ジェネレーターでもよい)
+            stream: 書き出し先のテキストストリーム
 
         """
-        output = StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(stream)
 
         # Write header
         writer.writerow(
@@ -252,56 +365,122 @@ class OutputFormatter:
 
         # Write data rows
         for result in results:
-            for func in result.functions:
-                writer.writerow(
-                    [
-                        result.file_path,
-                        func.name,
-                        func.lineno,
-                        func.end_lineno,
-                        func.cyclomatic_complexity,
-                        func.cognitive_complexity,
-                        result.status,
-                    ]
-                )
-
-        return output.getvalue()
+            status = result.status
+            writer.writerows(
+                [
+                    result.file_path,
+                    func.name,
+                    func.lineno,
+                    func.end_lineno,
+                    func.cyclomatic_complexity,
+                    func.cognitive_complexity,
+                    status,
+                ]
+                for func in result.functions
+            )
 
     @staticmethod
-    def format_summary(results: list[FileComplexityResult]) -> str:
-        """解析結果の要約をフォーマットします。
+    def format_functions_csv(results: list[FileComplexityResult]) -> str:
+        """関数レベルの結果をCSVとしてフォーマットします。
 
         Args:
             results: ファイル複雑度結果のリスト
 
         Returns:
-            要約文字列
+            関数に焦点を当てたCSVフォーマットされた文字列
+
+        """
+        return _to_string(OutputFormatter.write_functions_csv, results)
+
+    @staticmethod
+    def write_rows(
+        headers: list[str],
+        rows: Sequence[Sequence[object]],
+        output_format: str,
+        stream: TextIO,
+    ) -> None:
+        """ヘッダーと行からなる任意の表を書き出します。
+
+        Args:
+            headers: 列の名前
+            rows: 行の値
+            output_format: table、json、csvのいずれか
+            stream: 書き出し先のテキストストリーム
+
+        """
+        if output_format == "json":
+            _write_json_array((dict(zip(headers, row)) for row in rows), stream)
+        elif output_format == "csv":
+            writer = csv.writer(stream)
+            writer.writerow(headers)
+            writer.writerows(rows)
+        else:
+            write_table(stream, rows, headers)
+
+    @staticmethod
+    def format_rows(
+        headers: list[str], rows: Sequence[Sequence[object]], output_format: str
+    ) -> str:
+        """ヘッダーと行からなる任意の表をフォーマットします。
+
+        Args:
+            headers: 列の名前
+            rows: 行の値
+            output_format: table、json、csvのいずれか
+
+        Returns:
+            テーブル、列の名前をキーとするオブジェクトのJSON配列、またはCSV
+
+        """
+        return _to_string(OutputFormatter.write_rows, headers, rows, output_format)
+
+    @staticmethod
+    def write_summary(results: list[FileComplexityResult], stream: TextIO) -> None:
+        """解析結果の要約を書き出します。
+
+        Args:
+            results: ファイル複雑度結果のリスト
+            stream: 書き出し先のテキストストリーム
 
         """
         if not results:
-            return "No Python files analyzed."
+            stream.write(_NO_RESULTS)
+            return
 
         total_files = len(results)
         total_functions = sum(len(result.functions) for result in results)
 
         status_counts = {"OK": 0, "MEDIUM": 0, "HIGH": 0}
+        high_complexity_files = []
         for result in results:
-            status_counts[result.status] += 1
+            status = result.status
+            status_counts[status] += 1
+            if status == "HIGH":
+                high_complexity_files.append(result)
 
-        high_complexity_files = [r for r in results if r.status == "HIGH"]
-
-        summary_lines = [
-            f"Analyzed {total_files} files with {total_functions} functions",
+        stream.write(
+            f"Analyzed {total_files} files with {total_functions} functions\n"
             f"Status distribution: OK: {status_counts['OK']}, "
-            f"MEDIUM: {status_counts['MEDIUM']}, HIGH: {status_counts['HIGH']}",
-        ]
+            f"MEDIUM: {status_counts['MEDIUM']}, HIGH: {status_counts['HIGH']}"
+        )
 
         if high_complexity_files:
-            summary_lines.append("\nHigh complexity files:")
+            stream.write("\n\nHigh complexity files:")
             for result in high_complexity_files:
-                summary_lines.append(
-                    f"  {result.file_path} (max cyclomatic: {result.max_cyclomatic}, "
+                stream.write(
+                    f"\n  {result.file_path} (max cyclomatic: {result.max_cyclomatic}, "
                     f"max cognitive: {result.max_cognitive})"
                 )
 
-        return "\n".join(summary_lines)
+    @staticmethod
+    def format_summary(results: list[FileComplexityResult]) -> str:
+        """解析結果の要約をフォーマットします。
+
+        Args:
+            results: ファイル複雑度結果のリスト
+
+        Returns:
+            要約文字列
+
+        """
+        return _to_string(OutputFormatter.write_summary, results)
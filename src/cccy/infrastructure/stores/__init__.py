@@ -0,0 +1 @@
+"""Analysis result store infrastructure."""
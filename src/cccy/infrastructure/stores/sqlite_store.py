@@ -0,0 +1,336 @@
+"""解析結果を実行ごとに蓄積するSQLiteのストア。
+
+ファイルの解析結果(関数と複雑度)は結果のハッシュをキーとして1度だけ
+保存し、実行とファイルのパスの組から参照します。内容の変わらない
+ファイルは実行をまたいで同じ行を共有するため、毎回すべてのファイルを
+記録してもデータベースは変更されたファイルの分しか大きくなりません。
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.entities.history import (
+    METRICS,
+    StoredFile,
+    StoredFunction,
+    StoredRun,
+)
+from cccy.domain.exceptions.complexity_exceptions import ResultStoreError
+from cccy.domain.interfaces.stores import ResultStore
+
+# スキーマの版(PRAGMA user_version)。スキーマを変えたら増やす
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE runs (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    command TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    cccy_version TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    function_count INTEGER NOT NULL
+);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    result_hash TEXT NOT NULL UNIQUE,
+    function_count INTEGER NOT NULL,
+    total_cyclomatic INTEGER NOT NULL,
+    total_cognitive INTEGER NOT NULL,
+    max_cyclomatic INTEGER NOT NULL,
+    max_cognitive INTEGER NOT NULL
+);
+CREATE TABLE run_files (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files (id),
+    PRIMARY KEY (run_id, path)
+) WITHOUT ROWID;
+CREATE TABLE functions (
+    file_id INTEGER NOT NULL REFERENCES files (id),
+    name TEXT NOT NULL,
+    lineno INTEGER NOT NULL,
+    col_offset INTEGER NOT NULL,
+    end_lineno INTEGER,
+    end_col_offset INTEGER,
+    cyclomatic INTEGER NOT NULL,
+    cognitive INTEGER NOT NULL
+);
+CREATE INDEX run_files_path ON run_files (path, run_id);
+CREATE INDEX run_files_file ON run_files (file_id);
+CREATE INDEX files_max_cyclomatic ON files (max_cyclomatic);
+CREATE INDEX files_max_cognitive ON files (max_cognitive);
+CREATE INDEX functions_file ON functions (file_id);
+CREATE INDEX functions_name ON functions (name);
+CREATE INDEX functions_cyclomatic ON functions (cyclomatic);
+CREATE INDEX functions_cognitive ON functions (cognitive);
+"""
+
+# 問い合わせの対象の実行を選ぶ条件。IDがNoneの場合は最新の実行を選ぶ
+_RUN_FILTER = "rf.run_id = coalesce(?, (SELECT max(id) FROM runs))"
+
+_SELECT_FUNCTIONS = """
+SELECT rf.run_id, rf.path, fn.name, fn.lineno, fn.cyclomatic, fn.cognitive
+FROM run_files AS rf JOIN functions AS fn ON fn.file_id = rf.file_id
+"""
+
+_SELECT_FILES = """
+SELECT rf.run_id, rf.path, f.function_count, f.total_cyclomatic,
+       f.total_cognitive, f.max_cyclomatic, f.max_cognitive
+FROM run_files AS rf JOIN files AS f ON f.id = rf.file_id
+"""
+
+# functionsテーブルのfile_id以外の列の値の組
+_FunctionRow = tuple[str, int, int, Optional[int], Optional[int], int, int]
+
+
+def _function_rows(result: FileComplexityResult) -> list[_FunctionRow]:
+    """ファイルの結果をfunctionsテーブルの行の値に変換します。"""
+    return [
+        (
+            function.name,
+            function.lineno,
+            function.col_offset,
+            function.end_lineno,
+            function.end_col_offset,
+            function.cyclomatic_complexity,
+            function.cognitive_complexity,
+        )
+        for function in result.functions
+    ]
+
+
+def _result_hash(functions: Sequence[_FunctionRow]) -> str:
+    """ファイルの解析結果のハッシュを返します(ファイルのパスは含みません)。"""
+    data = json.dumps(functions, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _metric_column(metric: str) -> str:
+    """指標の名前を列の名前に変換します(SQLに埋め込むため検証します)。"""
+    if metric not in METRICS:
+        raise ValueError(f"unknown metric {metric!r}; expected one of {METRICS}")
+    return metric
+
+
+def _cccy_version() -> str:
+    try:
+        return importlib.metadata.version("cccy")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class SQLiteResultStore(ResultStore):
+    """SQLiteのデータベースファイルに解析結果を蓄積するストア。
+
+    1回の実行は1つのトランザクションで、``executemany`` による一括挿入で
+    保存します。同じデータベースに複数のプロセスが同時に保存しても、
+    SQLiteのロックにより実行ごとに順に書き込まれます。
+    """
+
+    def __init__(self, path: str) -> None:
+        """データベースを開き、なければスキーマを作成します。
+
+        Args:
+            path: データベースファイルのパス(":memory:"の場合はメモリ上)
+
+        Raises:
+            ResultStoreError: データベースを開けない場合、またはより新しい
+                cccyが作成したデータベースの場合
+
+        """
+        self.path = path
+        with self._errors():
+            # トランザクションはsave_runで明示的に開始する
+            self._connection = sqlite3.connect(path, isolation_level=None)
+            self._connection.execute("PRAGMA foreign_keys = ON")
+            self._migrate()
+
+    def _migrate(self) -> None:
+        """スキーマの版を確認し、新しいデータベースにはスキーマを作成します。"""
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version > SCHEMA_VERSION:
+            raise ResultStoreError(
+                self.path,
+                f"database schema {version} is newer than {SCHEMA_VERSION}; "
+                "upgrade cccy to use it",
+            )
+        if version == 0:
+            with self._transaction():
+                # executescriptは暗黙にコミットするため、文ごとに実行する
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        self._connection.execute(statement)
+                self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def _errors(self) -> Iterator[None]:
+        """SQLiteのエラーをResultStoreErrorに変換します。"""
+        try:
+            yield
+        except sqlite3.Error as e:
+            raise ResultStoreError(self.path, str(e)) from e
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """書き込みのロックを取ってトランザクションを開始します。"""
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def save_run(
+        self,
+        results: Iterable[FileComplexityResult],
+        command: str,
+        engine: str = "",
+    ) -> int:
+        """解析結果を1回の実行として保存します。
+
+        まだ保存されていない結果のファイルと関数だけを挿入し、実行の各
+        ファイルのパスから結果を参照します。
+        """
+        files: dict[str, tuple[FileComplexityResult, list[_FunctionRow]]] = {}
+        paths: list[tuple[str, str]] = []
+        function_count = 0
+        for result in results:
+            functions = _function_rows(result)
+            result_hash = _result_hash(functions)
+            files.setdefault(result_hash, (result, functions))
+            paths.append((result.file_path, result_hash))
+            function_count += len(functions)
+
+        with self._errors(), self._transaction() as connection:
+            run_id = connection.execute(
+                "INSERT INTO runs (created_at, command, engine, cccy_version, "
+                "file_count, function_count) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    command,
+                    engine,
+                    _cccy_version(),
+                    len(paths),
+                    function_count,
+                ),
+            ).lastrowid
+            stored = self._file_ids(files)
+            new = [result_hash for result_hash in files if result_hash not in stored]
+            connection.executemany(
+                "INSERT INTO files (result_hash, function_count, total_cyclomatic, "
+                "total_cognitive, max_cyclomatic, max_cognitive) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (result_hash) DO NOTHING",
+                (
+                    (
+                        result_hash,
+                        len(files[result_hash][1]),
+                        files[result_hash][0].total_cyclomatic,
+                        files[result_hash][0].total_cognitive,
+                        files[result_hash][0].max_cyclomatic,
+                        files[result_hash][0].max_cognitive,
+                    )
+                    for result_hash in new
+                ),
+            )
+            file_ids = {**stored, **self._file_ids(new)}
+            connection.executemany(
+                "INSERT INTO functions (file_id, name, lineno, col_offset, "
+                "end_lineno, end_col_offset, cyclomatic, cognitive) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (file_ids[result_hash], *function)
+                    for result_hash in new
+                    for function in files[result_hash][1]
+                ),
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO run_files (run_id, path, file_id) "
+                "VALUES (?, ?, ?)",
+                ((run_id, path, file_ids[result_hash]) for path, result_hash in paths),
+            )
+        assert run_id is not None
+        return run_id
+
+    def _file_ids(self, result_hashes: Iterable[str]) -> dict[str, int]:
+        """保存済みの結果のハッシュごとのファイルのIDを返します。
+
+        ハッシュの数がSQLの変数の上限を超えても問い合わせられるよう、
+        一時テーブルに入れて結合します。
+        """
+        connection = self._connection
+        connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lookup (result_hash TEXT PRIMARY KEY)"
+        )
+        connection.execute("DELETE FROM lookup")
+        connection.executemany(
+            "INSERT OR IGNORE INTO lookup VALUES (?)",
+            ((result_hash,) for result_hash in result_hashes),
+        )
+        return dict(
+            connection.execute(
+                "SELECT f.result_hash, f.id FROM files AS f "
+                "JOIN lookup USING (result_hash)"
+            ).fetchall()
+        )
+
+    def _query(self, sql: str, parameters: Sequence[Any]) -> list[Any]:
+        with self._errors():
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def list_runs(self, limit: Optional[int] = None) -> list[StoredRun]:
+        """記録した実行を新しい順に返します。"""
+        rows = self._query(
+            "SELECT id, created_at, command, engine, cccy_version, file_count, "
+            "function_count FROM runs ORDER BY id DESC LIMIT ?",
+            (-1 if limit is None else limit,),
+        )
+        return [StoredRun(*row) for row in rows]
+
+    def top_functions(
+        self, metric: str, limit: int, run_id: Optional[int] = None
+    ) -> list[StoredFunction]:
+        """実行のうち、指標の値が大きい順に関数を返します。"""
+        column = _metric_column(metric)
+        rows = self._query(
+            f"{_SELECT_FUNCTIONS} WHERE {_RUN_FILTER} "
+            f"ORDER BY fn.{column} DESC, rf.path, fn.lineno LIMIT ?",
+            (run_id, limit),
+        )
+        return [StoredFunction(*row) for row in rows]
+
+    def files_over(
+        self, metric: str, threshold: int, run_id: Optional[int] = None
+    ) -> list[StoredFile]:
+        """実行のうち、関数の指標の最大値が閾値を超えるファイルを返します。"""
+        column = _metric_column(metric)
+        rows = self._query(
+            f"{_SELECT_FILES} WHERE {_RUN_FILTER} AND f.max_{column} > ? "
+            f"ORDER BY f.max_{column} DESC, rf.path",
+            (run_id, threshold),
+        )
+        return [StoredFile(*row) for row in rows]
+
+    def function_history(
+        self, name: str, file_path: Optional[str] = None
+    ) -> list[StoredFunction]:
+        """関数の記録を実行の古い順に返します(複雑度の推移)。"""
+        rows = self._query(
+            f"{_SELECT_FUNCTIONS} WHERE fn.name = ? "
+            "AND (? IS NULL OR rf.path = ?) ORDER BY rf.run_id, rf.path, fn.lineno",
+            (name, file_path, file_path),
+        )
+        return [StoredFunction(*row) for row in rows]
+
+    def close(self) -> None:
+        """データベースを閉じます。"""
+        self._connection.close()
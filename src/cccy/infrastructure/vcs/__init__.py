@@ -0,0 +1 @@
+"""Version control infrastructure."""
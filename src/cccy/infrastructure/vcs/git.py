@@ -0,0 +1,183 @@
+"""gitコマンドを使用した変更ファイルの取得。"""
+
+import codecs
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from cccy.domain.exceptions.complexity_exceptions import VersionControlError
+from cccy.domain.interfaces.vcs import ChangedFilesProvider
+
+# 削除されたファイルは解析できないため、追加・コピー・変更・名前変更のみを対象にする
+_DIFF_FILTER = "--diff-filter=ACMR"
+_HUNK_HEADER = re.compile(rb"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+_FILE_HEADER_PREFIX = b"diff --git "
+_NEW_FILE_PREFIX = b"+++ "
+_HUNK_PREFIX = b"@@"
+
+
+def _decode_diff_path(raw: bytes) -> Optional[str]:
+    """``+++`` 行のパス(必要に応じてC言語形式で引用されたもの)を復号します。"""
+    if raw.startswith(b'"') and raw.endswith(b'"'):
+        raw = codecs.escape_decode(raw[1:-1])[0]
+    if not raw.startswith(b"b/"):
+        return None  # /dev/null
+    return os.fsdecode(raw[2:])
+
+
+def _hunk_lines(match: "re.Match[bytes]") -> tuple[int, int]:
+    """ハンクヘッダーから変更後の内容の行範囲を求めます。"""
+    start = int(match.group(1))
+    count = int(match.group(2) or 1)
+    if count == 0:
+        # 削除のみのハンクは直前の行(startは削除位置の前の行)に触れたとみなす
+        return max(start, 1), max(start, 1)
+    return start, start + count - 1
+
+
+def _file_hunks(
+    hunks: dict[Path, list[tuple[int, int]]], root: Path, line: bytes
+) -> Optional[list[tuple[int, int]]]:
+    """``+++`` 行のファイルのハンクを格納するリストを返します。"""
+    name = _decode_diff_path(line[len(_NEW_FILE_PREFIX) :].rstrip(b"\t"))
+    return None if name is None else hunks.setdefault(root / name, [])
+
+
+def _append_hunk(current: Optional[list[tuple[int, int]]], line: bytes) -> None:
+    """ハンクヘッダーの行範囲を現在のファイルのハンクに追加します。"""
+    match = _HUNK_HEADER.match(line)
+    if current is not None and match is not None:
+        current.append(_hunk_lines(match))
+
+
+def parse_unified_diff(output: bytes, root: Path) -> dict[Path, list[tuple[int, int]]]:
+    """``git diff -U0`` の出力から変更された行範囲を取り出します。
+
+    Args:
+        output: ``--src-prefix=a/ --dst-prefix=b/`` で出力された統合形式の差分
+        root: リポジトリのルート
+
+    Returns:
+        ファイルの絶対パスから変更された行の閉区間のリストへの対応
+
+    """
+    hunks: dict[Path, list[tuple[int, int]]] = {}
+    current: Optional[list[tuple[int, int]]] = None
+    # "+++ " で始まる追加行と区別するため、ファイルヘッダー内の行だけを見る
+    in_header = False
+    for line in output.split(b"\n"):
+        if line.startswith(_FILE_HEADER_PREFIX):
+            in_header, current = True, None
+        elif in_header and line.startswith(_NEW_FILE_PREFIX):
+            current = _file_hunks(hunks, root, line)
+        elif line.startswith(_HUNK_PREFIX):
+            in_header = False
+            _append_hunk(current, line)
+    return hunks
+
+
+class GitChangedFilesProvider(ChangedFilesProvider):
+    """``git diff --name-only -z`` の1回の呼び出しで変更ファイルを列挙します。"""
+
+    def __init__(self, cwd: Optional[Path] = None, git: str = "git") -> None:
+        """プロバイダーを初期化します。
+
+        Args:
+            cwd: gitを実行するディレクトリ(Noneの場合はカレントディレクトリ)
+            git: gitの実行ファイル
+
+        """
+        self.cwd = cwd
+        self.git = git
+
+    def changed_files(self, since: Optional[str], staged: bool) -> list[Path]:
+        """変更されたファイルを取得します。
+
+        ``since`` を指定した場合は、HEADとのマージベースからの変更を対象に
+        します(プルリクエストの差分と同じ範囲)。``staged`` の場合は
+        インデックスの内容を、それ以外は作業ツリーの内容を比較します。
+        追跡されていないファイルは含まれません。
+
+        Args:
+            since: 比較の基準となるリビジョン(Noneの場合はHEADまたはインデックス)
+            staged: ステージされた変更のみを対象にするかどうか
+
+        Returns:
+            変更されたファイルの絶対パスのリスト(削除されたファイルは除く)
+
+        Raises:
+            VersionControlError: gitが見つからない、またはgitコマンドが失敗した場合
+
+        """
+        root = self._repository_root()
+        output = self._run(*self._diff_args(since, staged, "--name-only", "-z"))
+        return [root / os.fsdecode(name) for name in output.split(b"\0") if name]
+
+    def changed_lines(
+        self, since: Optional[str], staged: bool
+    ) -> dict[Path, list[tuple[int, int]]]:
+        """変更されたファイルごとに、変更後の内容で変更された行範囲を取得します。
+
+        比較の範囲は ``changed_files`` と同じです。差分は ``-U0`` で1回だけ
+        取得し、ハンクヘッダーの変更後の行範囲を使用します。
+
+        Args:
+            since: 比較の基準となるリビジョン(Noneの場合はHEADまたはインデックス)
+            staged: ステージされた変更のみを対象にするかどうか
+
+        Returns:
+            ファイルの絶対パスから変更された行の閉区間(開始行, 終了行)のリストへの対応
+
+        Raises:
+            VersionControlError: gitが見つからない、またはgitコマンドが失敗した場合
+
+        """
+        root = self._repository_root()
+        output = self._run(
+            *self._diff_args(
+                since,
+                staged,
+                "-U0",
+                "--no-color",
+                "--no-ext-diff",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+            ),
+        )
+        return parse_unified_diff(output, root)
+
+    def _repository_root(self) -> Path:
+        """リポジトリのルートを取得します。"""
+        return Path(os.fsdecode(self._run("rev-parse", "--show-toplevel")).strip())
+
+    def _diff_args(
+        self, since: Optional[str], staged: bool, *options: str
+    ) -> list[str]:
+        """比較の範囲を指定したgit diffの引数を組み立てます。"""
+        args = ["diff", "--no-relative", _DIFF_FILTER, *options]
+        if staged:
+            args.append("--cached")
+        if since is not None:
+            args.extend(["--merge-base", since])
+        args.append("--")
+        return args
+
+    def _run(self, *args: str) -> bytes:
+        """gitコマンドを実行し、標準出力を返します。"""
+        try:
+            completed = subprocess.run(
+                # 非ASCIIのパスは引用させずにそのまま出力させる
+                [self.git, "-c", "core.quotePath=false", *args],
+                cwd=self.cwd,
+                capture_output=True,
+                check=False,
+            )
+        except OSError as e:
+            raise VersionControlError(f"failed to run {self.git}: {e}") from e
+
+        if completed.returncode != 0:
+            message = os.fsdecode(completed.stderr).strip()
+            raise VersionControlError(f"git {args[0]} failed: {message}")
+        return completed.stdout
@@ -0,0 +1 @@
+"""File system watcher infrastructure."""
@@ -0,0 +1,162 @@
+"""Linuxのinotifyを使用するウォッチャー。"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Callable, Optional
+
+from cccy.domain.interfaces.watchers import FileWatcher
+
+# <sys/inotify.h> の定数
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+# 書き込みの途中(IN_MODIFY)ではなく、書き終えた時点と名前の変化を監視する
+_WATCH_MASK = (
+    _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class InotifyFileWatcher(FileWatcher):
+    """ディレクトリごとにinotifyの監視を登録し、カーネルから変更を受け取るウォッチャー。
+
+    新しく作られたディレクトリは監視に追加し、その配下全体を変更として
+    報告します。イベントのキューがあふれた場合は監視対象全体を報告します。
+    """
+
+    def __init__(
+        self, roots: Iterable[Path], exclude_dir: Callable[[str], bool]
+    ) -> None:
+        """inotifyのインスタンスを作成し、監視対象のディレクトリを登録します。
+
+        ファイルを指定した場合は、そのファイルを含むディレクトリを監視します。
+
+        Args:
+            roots: 監視するディレクトリまたはファイル
+            exclude_dir: 監視しないディレクトリ名を判定する関数
+
+        Raises:
+            OSError: inotifyが使えない場合(Linux以外、監視数の上限など)
+
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.roots = [Path(root).resolve() for root in roots]
+        self.exclude_dir = exclude_dir
+        self._directories: dict[int, Path] = {}
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise self._error("inotify_init1")
+        try:
+            for root in self.roots:
+                self._watch_tree(root if root.is_dir() else root.parent)
+        except OSError:
+            self.close()
+            raise
+
+    def read_changes(self, timeout: Optional[float] = None) -> set[Path]:
+        """イベントが届くまで待ち、届いているイベントを変更されたパスにまとめます。"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            readable, _, _ = select.select([self._fd], [], [], _remaining(deadline))
+            if not readable:
+                return set()
+            changes = self._read_events()
+            if changes or _remaining(deadline) == 0:
+                return changes
+
+    def close(self) -> None:
+        """inotifyのインスタンスを閉じます。"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _error(self, function: str) -> OSError:
+        """libcの関数の失敗をOSErrorに変換します。"""
+        code = ctypes.get_errno()
+        return OSError(code, f"{function}: {os.strerror(code)}")
+
+    def _watch_tree(self, directory: Path) -> None:
+        """ディレクトリとその配下(除外するものを除く)を監視に登録します。"""
+        self._add_watch(directory)
+        for dir_path, dir_names, _ in os.walk(directory):
+            dir_names[:] = [name for name in dir_names if not self.exclude_dir(name)]
+            for name in dir_names:
+                self._add_watch(Path(dir_path) / name)
+
+    def _add_watch(self, directory: Path) -> None:
+        """1つのディレクトリを監視に登録します(既に消えている場合は無視します)。"""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd >= 0:
+            self._directories[wd] = directory
+            return
+        error = self._error("inotify_add_watch")
+        if error.errno not in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+            raise error
+
+    def _read_events(self) -> set[Path]:
+        """読み込めるイベントをすべて読み、変更されたパスに変換します。"""
+        changes: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return changes
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                changes |= self._handle_event(wd, mask, name)
+
+    def _handle_event(self, wd: int, mask: int, name: bytes) -> set[Path]:
+        """1つのイベントを変更されたパスに変換します。"""
+        if mask & _IN_Q_OVERFLOW:
+            return set(self.roots)  # 取りこぼしたイベントがあるため全体を報告する
+        directory = self._directories.get(wd)
+        if directory is None:
+            return set()
+        if mask & _IN_IGNORED:
+            del self._directories[wd]  # 監視していたディレクトリが削除された
+            return set()
+
+        path = directory / os.fsdecode(name) if name else directory
+        created_dir = mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO)
+        if created_dir and not self.exclude_dir(path.name):
+            self._watch_tree(path)
+        return {path}
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """期限までの残りの秒数を返します(期限がない場合はNone)。"""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
@@ -0,0 +1,108 @@
+"""ファイルの更新時刻とサイズを定期的に比較するウォッチャー。"""
+
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Callable, Optional
+
+from cccy.domain.interfaces.watchers import FileWatcher
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+# ファイルの絶対パスから(更新時刻, サイズ)への対応
+_Snapshot = dict[Path, tuple[int, int]]
+
+
+class PollingFileWatcher(FileWatcher):
+    """監視対象のPythonファイルを一定間隔で走査して変更を検出するウォッチャー。
+
+    inotifyが使えない環境(Linux以外、監視数の上限に達した場合など)の
+    フォールバックです。
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        exclude_dir: Callable[[str], bool],
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """ウォッチャーを初期化し、現在の状態を記録します。
+
+        Args:
+            roots: 監視するディレクトリまたはファイル
+            exclude_dir: 走査しないディレクトリ名を判定する関数
+            interval: 走査の間隔(秒)
+
+        """
+        self.roots = [Path(root).resolve() for root in roots]
+        self.exclude_dir = exclude_dir
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def read_changes(self, timeout: Optional[float] = None) -> set[Path]:
+        """変更があるか時間切れになるまで、一定間隔で走査します。"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = _remaining(deadline)
+            time.sleep(
+                self.interval if remaining is None else min(self.interval, remaining)
+            )
+            changes = self._rescan()
+            if changes or _remaining(deadline) == 0:
+                return changes
+
+    def close(self) -> None:
+        """何もしません(解放するリソースはありません)。"""
+
+    def _rescan(self) -> set[Path]:
+        """走査し直し、前回の走査から変わったファイルを返します。"""
+        snapshot = self._scan()
+        changes = {
+            path
+            for path in self._snapshot.keys() | snapshot.keys()
+            if self._snapshot.get(path) != snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changes
+
+    def _scan(self) -> _Snapshot:
+        """監視対象のすべてのPythonファイルの状態を記録します。"""
+        snapshot: _Snapshot = {}
+        for root in self.roots:
+            if root.is_dir():
+                self._scan_directory(str(root), snapshot)
+            else:
+                self._record(root, snapshot)
+        return snapshot
+
+    def _scan_directory(self, dir_path: str, snapshot: _Snapshot) -> None:
+        """ディレクトリを再帰的に走査します(読めないディレクトリは無視します)。"""
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    self._scan_entry(entry, snapshot)
+        except OSError:
+            return
+
+    def _scan_entry(self, entry: os.DirEntry[str], snapshot: _Snapshot) -> None:
+        """ディレクトリであれば降り、Pythonファイルであれば記録します。"""
+        if entry.is_dir(follow_symlinks=False):
+            if not self.exclude_dir(entry.name):
+                self._scan_directory(entry.path, snapshot)
+        elif entry.name.endswith(".py"):
+            self._record(Path(entry.path), snapshot)
+
+    @staticmethod
+    def _record(path: Path, snapshot: _Snapshot) -> None:
+        """ファイルの更新時刻とサイズを記録します(存在しない場合は記録しません)。"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """期限までの残りの秒数を返します(期限がない場合はNone)。"""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
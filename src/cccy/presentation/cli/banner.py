@@ -1,7 +1,5 @@
 """CLI バナー生成機能。"""
 
-import importlib.metadata
-
 
 def create_banner() -> str:
     """CLI バナーを動的バージョンで作成します。
@@ -10,6 +8,8 @@ def create_banner() -> str:
         フォーマットされたバナー文字列
 
     """
+    import importlib.metadata  # noqa: PLC0415
+
     try:
         version = importlib.metadata.version("cccy")
     except importlib.metadata.PackageNotFoundError:
@@ -1,22 +1,232 @@
 """CLI共通処理とオプション定義。"""
 
-from typing import Any, Callable, Optional, TypeVar
+import functools
+from collections.abc import Generator
+from contextlib import closing
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union, cast
 
 import click
 
+from cccy.domain.exceptions.complexity_exceptions import VersionControlError
 from cccy.presentation.cli.helpers import (
+    DB_KEY,
+    OUTPUT_KEY,
+    PROFILE_KEY,
+    STATS_KEY,
     create_analyzer_service,
+    current_profile,
+    current_stats,
+    display_stats,
+    get_cli_facade,
     handle_no_results,
+    handle_version_control_error,
     load_and_merge_config,
+    measure_phase,
+    record_results,
+    record_streamed_results,
+    write_profile,
 )
-from cccy.presentation.factories.service_factory import PresentationLayerServiceFactory
 from cccy.shared.type_helpers import get_list_value, get_optional_int_value
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cccy.domain.services.sharding import Shard
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def validate_jobs_option(
+    ctx: click.Context,  # noqa: ARG001
+    param: click.Parameter,  # noqa: ARG001
+    value: Optional[str],
+) -> Optional[Union[int, str]]:
+    """--jobsオプションの値を正の整数または"auto"に変換します。"""
+    if value is None or value.lower() == "auto":
+        return None if value is None else "auto"
+    if not value.isdigit() or int(value) < 1:
+        raise click.BadParameter(f"{value!r} is not a positive integer or 'auto'")
+    return int(value)
+
+
+def validate_shard_option(
+    ctx: click.Context,  # noqa: ARG001
+    param: click.Parameter,  # noqa: ARG001
+    value: Optional[str],
+) -> Optional["Shard"]:
+    """--shardオプションの値をShardに変換します。"""
+    if value is None:
+        return None
+    from cccy.domain.services.sharding import Shard  # noqa: PLC0415
+
+    try:
+        return Shard.parse(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+def shard_options(f: F) -> F:
+    """ファイルを分割して解析するためのCLIオプションデコレーター。"""
+    f = click.option(
+        "--shard",
+        metavar="INDEX/COUNT",
+        default=None,
+        callback=validate_shard_option,
+        help="Analyze only the INDEX-th of COUNT size-balanced parts of the files (e.g. 1/4); combine the JSON reports with merge-reports",
+    )(f)
+    return f  # noqa: RET504
+
+
+def stats_options(f: F) -> F:
+    """解析の段階ごとの時間と処理量を報告するCLIオプションデコレーター。
+
+    オプションを指定しない場合、コマンドは集計のための処理を一切行いません。
+    """
+
+    @functools.wraps(f)
+    def wrapper(
+        *args: Any, stats: bool, stats_file: Optional[str], **kwargs: Any
+    ) -> Any:
+        if not stats and stats_file is None:
+            return f(*args, **kwargs)
+        from cccy.domain.services.analysis_stats import (  # noqa: PLC0415
+            AnalysisStats,
+        )
+
+        collector = AnalysisStats()
+        click.get_current_context().meta[STATS_KEY] = collector
+        try:
+            return f(*args, **kwargs)
+        finally:
+            # 違反があって終了する場合も報告する
+            display_stats(collector, stats, stats_file)
+
+    wrapper = click.option(
+        "--stats-file",
+        metavar="PATH",
+        default=None,
+        help="Write the --stats statistics as JSON to PATH ('-' for stderr)",
+    )(wrapper)
+    wrapper = click.option(
+        "--stats",
+        is_flag=True,
+        help="Print time per phase, throughput, cache hit rate and the slowest files to stderr",
+    )(wrapper)
+    return cast("F", wrapper)
+
+
+def db_options(f: F) -> F:
+    """解析結果をデータベースに実行として記録するCLIオプションデコレーター。"""
+
+    @functools.wraps(f)
+    def wrapper(*args: Any, db: Optional[str], **kwargs: Any) -> Any:
+        if db is not None:
+            click.get_current_context().meta[DB_KEY] = db
+        return f(*args, **kwargs)
+
+    wrapper = click.option(
+        "--db",
+        metavar="PATH",
+        default=None,
+        help="Record the results as a run in the SQLite database PATH (see 'cccy query')",
+    )(wrapper)
+    return cast("F", wrapper)
+
+
+def output_options(f: F) -> F:
+    """レポートを標準出力ではなくファイルに書き出すCLIオプションデコレーター。"""
+
+    @functools.wraps(f)
+    def wrapper(*args: Any, output: Optional[str], **kwargs: Any) -> Any:
+        if output is not None:
+            click.get_current_context().meta[OUTPUT_KEY] = output
+        return f(*args, **kwargs)
+
+    wrapper = click.option(
+        "--output",
+        "-o",
+        metavar="FILE",
+        default=None,
+        help="Write the report to FILE instead of stdout",
+    )(wrapper)
+    return cast("F", wrapper)
+
+
+def profile_options(f: F) -> F:
+    """コマンド全体のプロファイルを書き出すCLIオプションデコレーター。
+
+    設定の読み込みから出力までを ``cProfile`` で計測し、並列実行時は
+    ワーカーのプロファイルも合算します。
+    """
+
+    @functools.wraps(f)
+    def wrapper(*args: Any, profile: Optional[str], **kwargs: Any) -> Any:
+        if profile is None:
+            return f(*args, **kwargs)
+        from cccy.domain.services.profiling import (  # noqa: PLC0415
+            ProfileSession,
+        )
+
+        session = ProfileSession()
+        click.get_current_context().meta[PROFILE_KEY] = session
+        session.start()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            # 違反があって終了する場合も書き出す
+            session.stop()
+            write_profile(session, profile)
+
+    wrapper = click.option(
+        "--profile",
+        metavar="OUT",
+        default=None,
+        help="Profile the command and write OUT.pstats and OUT.collapsed (flame graph stacks)",
+    )(wrapper)
+    return cast("F", wrapper)
+
+
 def common_options(f: F) -> F:
     """共通のCLIオプションデコレーター。"""
+    f = click.option(
+        "--jobs",
+        "-j",
+        default=None,
+        callback=validate_jobs_option,
+        help="Number of worker processes, or 'auto' for CPU count (default: 1)",
+    )(f)
+    f = click.option(
+        "--engine",
+        type=click.Choice(["builtin", "library"], case_sensitive=False),
+        default=None,
+        help="Complexity engine: builtin single-pass visitor or mccabe/cognitive_complexity libraries (default: builtin)",
+    )(f)
+    f = click.option(
+        "--default-excludes/--no-default-excludes",
+        default=None,
+        help="Skip virtualenv and cache directories such as .venv, .tox and node_modules (default: enabled)",
+    )(f)
+    f = click.option(
+        "--respect-gitignore/--no-respect-gitignore",
+        default=None,
+        help="Skip files and directories ignored by git (.gitignore, .git/info/exclude)",
+    )(f)
+    f = click.option(
+        "--staged",
+        is_flag=True,
+        help="Analyze only Python files with staged changes",
+    )(f)
+    f = click.option(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="Analyze only Python files changed since the merge base with REF (e.g. origin/main)",
+    )(f)
+    f = click.option(
+        "--cache/--no-cache",
+        default=None,
+        help="Reuse results of unchanged files from the on-disk cache",
+    )(f)
     f = click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")(f)
     f = click.option("--log-level", default="WARNING", help="Set logging level")(f)
     f = click.option(
@@ -58,9 +268,15 @@ def format_options(f: F) -> F:
     f = click.option(
         "--format",
         "output_format",
-        type=click.Choice(["table", "json", "csv", "detailed"], case_sensitive=False),
+        type=click.Choice(
+            ["table", "json", "jsonl", "csv", "detailed", "parquet", "arrow"],
+            case_sensitive=False,
+        ),
         default="table",
-        help="Output format: table|json|csv|detailed (default: table)",
+        help=(
+            "Output format: table|json|jsonl|csv|detailed|parquet|arrow "
+            "(default: table)"
+        ),
     )(f)
     return f  # noqa: RET504
 
@@ -76,17 +292,29 @@ class CommonProcessor:
         exclude: tuple[str, ...] = (),
         include: tuple[str, ...] = (),
         paths: tuple[str, ...] = (),
+        jobs: Optional[Union[int, str]] = None,
+        cache: Optional[bool] = None,
+        engine: Optional[str] = None,
+        default_excludes: Optional[bool] = None,
+        respect_gitignore: Optional[bool] = None,
     ) -> dict[str, Any]:
         """ログ設定と設定読み込みを実行します。"""
-        cli_facade = PresentationLayerServiceFactory.create_cli_facade()
+        cli_facade = measure_phase("config", get_cli_facade)
         cli_facade.setup_logging(level=log_level)
 
-        return load_and_merge_config(
+        return measure_phase(
+            "config",
+            load_and_merge_config,
             max_complexity=max_complexity,
             max_cognitive=max_cognitive,
             exclude=exclude,
             include=include,
             paths=paths,
+            jobs=jobs,
+            cache=cache,
+            engine=engine,
+            default_excludes=default_excludes,
+            respect_gitignore=respect_gitignore,
         )
 
     @staticmethod
@@ -108,6 +336,26 @@ class CommonProcessor:
             final_paths,
         )
 
+    @staticmethod
+    def extract_execution_options(merged_config: dict[str, Any]) -> dict[str, Any]:
+        """マージされた設定から解析の実行オプションを抽出します。
+
+        Returns:
+            jobs、cache_dir、cache_max_size、engine、default_excludes、respect_gitignoreを含む辞書
+
+        """
+        jobs = merged_config.get("jobs")
+        return {
+            "jobs": jobs if isinstance(jobs, (int, str)) else 1,
+            "cache_dir": (
+                merged_config.get("cache_dir") if merged_config.get("cache") else None
+            ),
+            "cache_max_size": merged_config.get("cache_max_size"),
+            "engine": str(merged_config.get("engine") or "builtin"),
+            "default_excludes": merged_config.get("default_excludes") is not False,
+            "respect_gitignore": merged_config.get("respect_gitignore") is True,
+        }
+
     @staticmethod
     def analyze_and_get_results(
         final_paths: list[str],
@@ -116,15 +364,160 @@ class CommonProcessor:
         final_include: list[str],
         verbose: bool,
         max_complexity: Optional[int] = None,
+        jobs: Union[int, str] = 1,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        engine: str = "builtin",
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+        changed_since: Optional[str] = None,
+        staged: bool = False,
+        diff_ref: Optional[str] = None,
+        shard: Optional["Shard"] = None,
     ) -> tuple[list[Any], Any]:
-        """解析を実行して結果を取得します。"""
-        analyzer, service = create_analyzer_service(max_complexity=max_complexity)
+        """解析を実行して結果を取得します。
 
+        シャードを指定した場合、そのシャードにファイルがなくても(シャード
+        の数がファイル数より多い場合など)エラーにはなりません。
+        """
+        service = CommonProcessor._create_service(
+            max_complexity=max_complexity,
+            jobs=jobs,
+            cache_dir=cache_dir,
+            cache_max_size=cache_max_size,
+            engine=engine,
+            default_excludes=default_excludes,
+            respect_gitignore=respect_gitignore,
+            changed_since=changed_since,
+            staged=staged,
+            diff_ref=diff_ref,
+        )
+
+        shard_files = CommonProcessor._select_shard(
+            service,
+            final_paths,
+            shard,
+            recursive=recursive,
+            final_exclude=final_exclude,
+            final_include=final_include,
+            verbose=verbose,
+        )
         all_results = service.analyze_paths(
-            tuple(final_paths), recursive, final_exclude, final_include, verbose
+            tuple(final_paths),
+            recursive,
+            final_exclude,
+            final_include,
+            verbose,
+            files=shard_files,
         )
 
-        if not all_results:
-            handle_no_results()
+        if not all_results and shard is None:
+            changed_only = changed_since is not None or diff_ref is not None or staged
+            handle_no_results(changed_only=changed_only)
 
+        record_results(all_results, engine)
         return all_results, service
+
+    @staticmethod
+    def iter_results(
+        final_paths: list[str],
+        recursive: bool,
+        final_exclude: list[str],
+        final_include: list[str],
+        verbose: bool,
+        **execution_options: Any,
+    ) -> Generator[Any, None, None]:
+        """解析を実行し、結果を解析が終わったファイルから順に返します。
+
+        サービスの作成(変更ファイルの取得を含む)は呼び出し時に行うため、
+        その失敗は結果を1件も出力する前に報告されます。
+
+        Args:
+            final_paths: 解析するパス
+            recursive: ディレクトリを再帰的に解析するかどうか
+            final_exclude: 除外するグロブパターン
+            final_include: 含めるグロブパターン
+            verbose: 詳細出力を有効にする
+            **execution_options: ``analyze_and_get_results`` と同じ実行オプション
+
+        Returns:
+            FileComplexityResultのジェネレーター(シャードの指定がなく、結果が1件も
+            ない場合は最後に終了)。
+            途中で閉じると、残りの解析と並列実行中の未着手の解析は取り消されます。
+            ``--db`` の記録は最後の結果を返した後に行います。
+
+        """
+        shard = execution_options.pop("shard", None)
+        service = CommonProcessor._create_service(**execution_options)
+        shard_files = CommonProcessor._select_shard(
+            service,
+            final_paths,
+            shard,
+            recursive=recursive,
+            final_exclude=final_exclude,
+            final_include=final_include,
+            verbose=verbose,
+        )
+        results = service.iter_analyze_paths(
+            tuple(final_paths),
+            recursive,
+            final_exclude,
+            final_include,
+            verbose,
+            files=shard_files,
+        )
+        engine = execution_options.get("engine", "builtin")
+        if shard is not None:
+            return record_streamed_results(results, engine)
+        changed_only = any(
+            execution_options.get(name)
+            for name in ("changed_since", "diff_ref", "staged")
+        )
+        return record_streamed_results(
+            CommonProcessor._exit_if_empty(results, changed_only), engine
+        )
+
+    @staticmethod
+    def _create_service(**options: Any) -> Any:
+        """解析サービスを作成します(gitの失敗はエラーとして終了します)。"""
+        try:
+            _, service = create_analyzer_service(
+                **options, stats=current_stats(), profile=current_profile()
+            )
+        except VersionControlError as e:
+            handle_version_control_error(e)
+        return service
+
+    @staticmethod
+    def _select_shard(
+        service: Any,
+        final_paths: list[str],
+        shard: Optional["Shard"],
+        *,
+        recursive: bool,
+        final_exclude: list[str],
+        final_include: list[str],
+        verbose: bool,
+    ) -> Optional[frozenset["Path"]]:
+        """シャードのファイルを列挙します(シャードの指定がない場合はNone)。"""
+        if shard is None:
+            return None
+        files: frozenset[Path] = service.select_shard(
+            tuple(final_paths), shard, recursive, final_exclude, final_include
+        )
+        if verbose:
+            click.echo(f"Shard {shard}: {len(files)} files", err=True)
+        return files
+
+    @staticmethod
+    def _exit_if_empty(
+        results: Generator[Any, None, None], changed_only: bool
+    ) -> Generator[Any, None, None]:
+        """結果をそのまま返し、1件もなかった場合は最後に終了します。"""
+        found = False
+        with closing(results):
+            for result in results:
+                found = True
+                yield result
+        if not found:
+            handle_no_results(changed_only=changed_only)
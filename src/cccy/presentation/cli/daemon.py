@@ -0,0 +1,298 @@
+"""cccyデーモンとの通信プロトコルとクライアント。
+
+このモジュールはコマンドを実行するたびに読み込まれるため、標準ライブラリ
+以外のモジュールを読み込みません。
+
+クライアントは接続ごとに1つのリクエストをJSONの1行として送り、デーモンは
+標準出力・標準エラー出力への書き込みをフレームとして逐次返し、最後に
+終了コードのフレームを返します。
+"""
+
+import io
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+from typing import Any, BinaryIO, Optional
+
+SOCKET_ENV = "CCCY_DAEMON_SOCKET"
+DISABLE_ENV = "CCCY_NO_DAEMON"
+# デーモンに転送する、設定を上書きするクライアントの環境変数の接頭辞
+FORWARDED_ENV_PREFIX = "CCCY_"
+
+# デーモンに転送する(結果がカレントディレクトリと引数だけで決まる)コマンド
+FORWARDED_COMMANDS = frozenset({"check", "show-list", "show-functions", "show-summary"})
+# 指定されていればこのプロセスで実行するオプション(--profileは
+# このプロセスの起動からの実行を計測するため)
+LOCAL_OPTIONS = ("--profile",)
+
+# デーモンがメモリ上に保持するファイルの解析結果の既定の最大数
+DEFAULT_CACHE_SIZE = 50_000
+
+# フレームのヘッダー: 種類(1バイト)とペイロードの長さ(4バイト)
+FRAME_HEADER = struct.Struct("!BI")
+FRAME_STDOUT = 1
+FRAME_STDERR = 2
+# 長さの代わりに終了コードを持ち、ペイロードのないフレーム
+FRAME_EXIT = 3
+# デーモンがリクエストを実行せずに拒否した理由のフレーム
+FRAME_REFUSED = 4
+
+# リクエストの形式を変更したときに上げるプロトコルのバージョン
+PROTOCOL_VERSION = 2
+# ソケットを置くディレクトリに求める権限
+SOCKET_DIRECTORY_MODE = 0o700
+
+
+class DaemonRefusedError(Exception):
+    """デーモンがリクエストの実行を拒否した場合の例外。"""
+
+
+def installation() -> dict[str, Any]:
+    """このプロセスのcccyのインストールを識別する値を返します。
+
+    パッケージのメタデータからバージョンを読むとコマンドの起動が数十ミリ秒
+    遅くなるため、インタプリタとこのモジュールのパス・更新時刻を使います。
+    ``pip install -U`` などでインストールし直すとファイルが書き直されるため、
+    バージョンが変わらない再インストールでも値が変わります。
+    """
+    return {
+        "protocol": PROTOCOL_VERSION,
+        # python3とpython3.11のような同じインタプリタへのリンクを同一とみなす
+        "executable": os.path.realpath(sys.executable),
+        "module": __file__,
+        "mtime": os.stat(__file__).st_mtime_ns,  # noqa: PTH116
+    }
+
+
+def is_supported() -> bool:
+    """このプラットフォームでUnixドメインソケットが使えるかどうかを判定します。"""
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> str:
+    """デーモンのソケットのパスを返します。
+
+    環境変数 ``CCCY_DAEMON_SOCKET`` が設定されていればその値、そうでなければ
+    ``$XDG_RUNTIME_DIR``(未設定の場合は ``$TMPDIR`` または ``/tmp``)の下の
+    ユーザーごとのディレクトリにあるソケットです。
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return configured
+    runtime_dir = (
+        os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"  # noqa: S108
+    )
+    return f"{runtime_dir}/cccy-{os.getuid()}/daemon.sock"
+
+
+def check_socket_directory(socket_path: str) -> None:
+    """ソケットのディレクトリを他のユーザーが用意できないことを確かめます。
+
+    ``/tmp`` のような共有のディレクトリでは、他のユーザーが先にディレクトリを
+    作成して偽のデーモンを待ち受けさせることができます。そのため、
+    シンボリックリンクでなく、このユーザーが所有し、権限が0700の
+    ディレクトリだけを使います。
+
+    Args:
+        socket_path: ソケットのパス
+
+    Raises:
+        PermissionError: ディレクトリが条件を満たさない場合
+        OSError: ディレクトリが存在しない場合
+
+    """
+    directory = os.path.dirname(socket_path) or "."  # noqa: PTH120
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) != SOCKET_DIRECTORY_MODE
+    ):
+        raise PermissionError(
+            f"insecure cccy daemon directory {directory}: it must be a directory "
+            "(not a symlink) owned by the current user with mode 0700"
+        )
+
+
+def connect(socket_path: str) -> socket.socket:
+    """デーモンのソケットに接続します。
+
+    Args:
+        socket_path: ソケットのパス
+
+    Returns:
+        接続済みのソケット
+
+    Raises:
+        PermissionError: ソケットのディレクトリが安全でない場合
+        OSError: デーモンが起動していない場合
+
+    """
+    check_socket_directory(socket_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def send_request(sock: socket.socket, request: dict[str, Any]) -> None:
+    """リクエストをJSONの1行として送信します。"""
+    sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+
+def relay_response(sock: socket.socket, stdout: BinaryIO, stderr: BinaryIO) -> int:
+    """デーモンの出力を受け取った順に書き出し、終了コードを返します。
+
+    Args:
+        sock: リクエストを送信したソケット
+        stdout: 標準出力のフレームの書き込み先
+        stderr: 標準エラー出力のフレームの書き込み先
+
+    Returns:
+        コマンドの終了コード
+
+    Raises:
+        ConnectionError: 終了コードを受け取る前に接続が切れた場合
+        DaemonRefusedError: デーモンがリクエストを拒否した場合
+
+    """
+    with sock.makefile("rb") as reader:
+        while True:
+            kind, value = _read_header(reader)
+            if kind == FRAME_EXIT:
+                return value
+            payload = reader.read(value)
+            if kind == FRAME_REFUSED:
+                raise DaemonRefusedError(payload.decode(errors="replace"))
+            stream = stdout if kind == FRAME_STDOUT else stderr
+            stream.write(payload)
+            stream.flush()
+
+
+def _read_header(reader: BinaryIO) -> tuple[int, int]:
+    """フレームのヘッダーを読み込み、種類と値を返します。"""
+    header = reader.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        raise ConnectionError("cccy daemon closed the connection")
+    kind, value = FRAME_HEADER.unpack(header)
+    return int(kind), int(value)
+
+
+def forward_to_daemon(
+    argv: list[str],
+    stdout: Optional[BinaryIO] = None,
+    stderr: Optional[BinaryIO] = None,
+) -> Optional[int]:
+    """デーモンが起動していれば、コマンドをデーモンで実行します。
+
+    Args:
+        argv: コマンドライン引数(プログラム名を除く)
+        stdout: 標準出力の書き込み先(Noneの場合は ``sys.stdout``)
+        stderr: 標準エラー出力の書き込み先(Noneの場合は ``sys.stderr``)
+
+    Returns:
+        デーモンで実行した場合は終了コード、転送しなかった場合はNone
+
+    """
+    if not argv or argv[0] not in FORWARDED_COMMANDS or _has_local_option(argv):
+        return None
+    if os.environ.get(DISABLE_ENV) or not is_supported():
+        return None
+
+    stderr = sys.stderr.buffer if stderr is None else stderr
+    sock = _connect_for_forwarding(stderr)
+    if sock is None:
+        return None
+
+    with sock:
+        return _run_in_daemon(
+            sock, argv, sys.stdout.buffer if stdout is None else stdout, stderr
+        )
+
+
+def _connect_for_forwarding(stderr: BinaryIO) -> Optional[socket.socket]:
+    """転送先のデーモンに接続します(接続できない場合はNone)。"""
+    try:
+        return connect(default_socket_path())
+    except PermissionError as e:
+        stderr.write(f"Warning: {e}; running in this process\n".encode())
+    except OSError:
+        pass  # デーモンが起動していない場合はこのプロセスで実行する
+    return None
+
+
+def _has_local_option(argv: list[str]) -> bool:
+    """このプロセスで実行すべきオプションが指定されているかどうかを判定します。"""
+    return any(
+        arg == option or arg.startswith(f"{option}=")
+        for arg in argv
+        for option in LOCAL_OPTIONS
+    )
+
+
+def client_environment() -> dict[str, str]:
+    """デーモンで実行するコマンドに渡すこのプロセスの環境変数を返します。"""
+    return {
+        name: value
+        for name, value in os.environ.items()
+        if name.upper().startswith(FORWARDED_ENV_PREFIX)
+    }
+
+
+def _run_in_daemon(
+    sock: socket.socket, argv: list[str], stdout: BinaryIO, stderr: BinaryIO
+) -> Optional[int]:
+    """接続済みのデーモンでコマンドを実行します(送信できない場合はNone)。"""
+    # pathlibの読み込みを避けるためos.getcwdを使う
+    request = {
+        "command": "run",
+        "argv": argv,
+        "cwd": os.getcwd(),  # noqa: PTH109
+        "env": client_environment(),
+        "color": sys.stdout.isatty(),
+        "installation": installation(),
+    }
+    try:
+        send_request(sock, request)
+    except OSError:
+        return None
+    try:
+        return relay_response(sock, stdout, stderr)
+    except DaemonRefusedError as e:
+        # 別のインストールのデーモンでは実行せず、このプロセスで実行する
+        stderr.write(f"Warning: {e}; running in this process\n".encode())
+        return None
+    except BrokenPipeError:
+        # 出力先が閉じられた(``| head`` など)場合はclickと同様に静かに終了する
+        return 1
+    except OSError as e:
+        stderr.write(f"Error: lost connection to the cccy daemon: {e}\n".encode())
+        return 1
+
+
+def request(socket_path: str, command: str) -> Optional[dict[str, Any]]:
+    """デーモンに管理用のコマンドを送り、JSONの応答を返します。
+
+    Args:
+        socket_path: ソケットのパス
+        command: "status"または"stop"
+
+    Returns:
+        デーモンの応答、またはデーモンが起動していない(終了中の)場合はNone
+
+    """
+    output = io.BytesIO()
+    try:
+        with connect(socket_path) as sock:
+            send_request(sock, {"command": command})
+            relay_response(sock, output, output)
+    except OSError:
+        return None
+    result: dict[str, Any] = json.loads(output.getvalue() or b"{}")
+    return result
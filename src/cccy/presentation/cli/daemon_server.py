@@ -0,0 +1,373 @@
+"""解析エンジンと結果を常駐させるcccyデーモン。
+
+デーモンは読み込み済みのモジュール、設定、メモリ上の結果キャッシュを
+保持したまま、転送されたコマンドをこのプロセス内で1つずつ実行します。
+"""
+
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import traceback
+from collections.abc import Iterator
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import click
+
+from cccy.presentation.cli.daemon import (
+    FORWARDED_ENV_PREFIX,
+    FRAME_EXIT,
+    FRAME_HEADER,
+    FRAME_REFUSED,
+    FRAME_STDERR,
+    FRAME_STDOUT,
+    check_socket_directory,
+    client_environment,
+    connect,
+    installation,
+    request,
+)
+
+# リクエストの行を受け取るまでの待ち時間(秒)と最大サイズ(バイト)
+_REQUEST_TIMEOUT = 5.0
+_MAX_REQUEST_SIZE = 1024 * 1024
+# バックグラウンドで起動したデーモンの準備ができるまで待つ秒数
+_START_TIMEOUT = 10.0
+
+
+class _FrameWriter(io.RawIOBase):
+    """書き込まれたバイト列をフレームとしてソケットに送るストリーム。"""
+
+    def __init__(self, connection: socket.socket, kind: int, tty: bool = False) -> None:
+        self._connection = connection
+        self._kind = kind
+        self._tty = tty
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        """転送元のクライアントの出力先が端末かどうかを返します。"""
+        return self._tty
+
+    def write(self, data: Any) -> int:
+        payload = bytes(data)
+        if payload:
+            self._connection.sendall(
+                FRAME_HEADER.pack(self._kind, len(payload)) + payload
+            )
+        return len(payload)
+
+
+def _text_stream(
+    connection: socket.socket, kind: int, tty: bool = False
+) -> io.TextIOWrapper:
+    """フレームとして送るテキストストリームを作成します。"""
+    return io.TextIOWrapper(
+        _FrameWriter(connection, kind, tty),  # type: ignore[arg-type]
+        encoding="utf-8",
+        errors="replace",
+        write_through=True,
+    )
+
+
+def _exit_code(code: Union[str, int, None]) -> int:
+    """``SystemExit`` のコードを終了コードに変換します。"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+    click.echo(code, err=True)
+    return 1
+
+
+@contextmanager
+def _client_environment(env: Any) -> Iterator[None]:
+    """コマンドの実行中、CCCY_で始まる環境変数をクライアントのものに置き換えます。
+
+    設定は環境変数でも上書きできるため、デーモンの起動時の環境変数ではなく、
+    コマンドを実行したクライアントの環境変数で設定を解決します。
+    """
+    saved = client_environment()
+    for name in saved:
+        del os.environ[name]
+    if isinstance(env, dict):
+        os.environ.update(
+            {
+                str(name): str(value)
+                for name, value in env.items()
+                if str(name).upper().startswith(FORWARDED_ENV_PREFIX)
+            }
+        )
+    try:
+        yield
+    finally:
+        for name in client_environment():
+            del os.environ[name]
+        os.environ.update(saved)
+
+
+def _package_version() -> str:
+    """インストールされているcccyのバージョンを返します。"""
+    import importlib.metadata  # noqa: PLC0415
+
+    try:
+        return importlib.metadata.version("cccy")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class DaemonServer:
+    """Unixドメインソケットでコマンドを受け付けるサーバー。
+
+    リクエストは到着順に1つずつ処理されるため、コマンドの実行中は
+    カレントディレクトリと標準出力をこのプロセス全体で切り替えられます。
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        cache_size: int,
+        idle_timeout: Optional[float] = None,
+    ) -> None:
+        """サーバーを初期化し、解析に必要なモジュールを読み込みます。
+
+        Args:
+            socket_path: 待ち受けるソケットのパス
+            cache_size: メモリ上に保持するファイルの解析結果の最大数
+            idle_timeout: リクエストがないまま経過すると終了する秒数(Noneの場合は終了しない)
+
+        """
+        from cccy.presentation.factories.service_factory import (  # noqa: PLC0415
+            PresentationLayerServiceFactory,
+        )
+
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self._factory = PresentationLayerServiceFactory
+        self._factory.enable_memory_cache(cache_size)
+        # 既定のエンジンの計算器などを読み込んでおく
+        self._factory.create_analyzer_factory().create_analyzer_service()
+        self._started = time.monotonic()
+        self._cwd = Path.cwd()
+        self._installation = installation()
+        self._version = _package_version()
+
+    def serve_forever(self) -> None:
+        """停止のリクエストを受けるか、待ち時間を超えるまでリクエストを処理します。"""
+        socket_file = Path(self.socket_path)
+        socket_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        check_socket_directory(self.socket_path)
+        socket_file.unlink(missing_ok=True)  # 異常終了したデーモンのソケット
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.socket_path)
+            socket_file.chmod(0o600)
+            server.listen()
+            server.settimeout(self.idle_timeout)
+            while self._accept(server):
+                pass
+        finally:
+            server.close()
+            socket_file.unlink(missing_ok=True)
+
+    def status(self) -> dict[str, Any]:
+        """デーモンの状態を返します。"""
+        return {
+            "pid": os.getpid(),
+            "socket": self.socket_path,
+            "version": self._version,
+            "executable": sys.executable,
+            "uptime": time.monotonic() - self._started,
+            "requests": self.requests,
+            "cache": self._factory.get_memory_cache_stats(),
+        }
+
+    def _accept(self, server: socket.socket) -> bool:
+        """1つの接続を処理します。
+
+        Returns:
+            次の接続を待つ場合はTrue、停止する場合はFalse
+
+        """
+        try:
+            connection, _ = server.accept()
+        except socket.timeout:
+            return False
+        with connection:
+            try:
+                return self._handle(connection)
+            except OSError:
+                return True  # クライアントが途中で切断した
+
+    def _handle(self, connection: socket.socket) -> bool:
+        """リクエストを読み込んで実行し、応答を送ります。"""
+        connection.settimeout(_REQUEST_TIMEOUT)
+        with connection.makefile("rb") as reader:
+            line = reader.readline(_MAX_REQUEST_SIZE)
+        connection.settimeout(None)
+        try:
+            command = json.loads(line)
+        except ValueError:
+            command = {}
+
+        name = command.get("command") if isinstance(command, dict) else None
+        if name == "run" and command.get("installation") != self._installation:
+            # 更新前に起動したデーモンが古い解析のコードで応答しないようにする
+            _FrameWriter(connection, FRAME_REFUSED).write(self._mismatch().encode())
+            return True
+        if name == "run":
+            self.requests += 1
+            exit_code = self._run(command, connection)
+        elif name in ("status", "stop"):
+            payload = json.dumps(self.status()).encode("utf-8")
+            _FrameWriter(connection, FRAME_STDOUT).write(payload)
+            exit_code = 0
+        else:
+            message = f"Error: unknown daemon request {line[:80]!r}\n".encode()
+            _FrameWriter(connection, FRAME_STDERR).write(message)
+            exit_code = 2
+        connection.sendall(FRAME_HEADER.pack(FRAME_EXIT, exit_code))
+        return name != "stop"
+
+    def _mismatch(self) -> str:
+        """別のインストールからのリクエストを拒否する理由を返します。"""
+        return (
+            f"the cccy daemon (pid {os.getpid()}) runs cccy {self._version} "
+            f"from {self._installation['executable']}, a different installation; "
+            "restart it with 'cccy daemon stop' and 'cccy daemon start'"
+        )
+
+    def _run(self, command: dict[str, Any], connection: socket.socket) -> int:
+        """転送されたコマンドをこのプロセス内で実行します。"""
+        from cccy.presentation.cli.main import main  # noqa: PLC0415
+
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers[:]
+        # クライアントは標準出力が端末の場合にcolorを指定する
+        stdout = _text_stream(connection, FRAME_STDOUT, bool(command.get("color")))
+        stderr = _text_stream(connection, FRAME_STDERR)
+        environment = _client_environment(command.get("env"))
+        with redirect_stdout(stdout), redirect_stderr(stderr), environment:
+            try:
+                os.chdir(command["cwd"])
+                main.main(
+                    args=list(command["argv"]),
+                    prog_name="cccy",
+                    standalone_mode=True,
+                    color=bool(command.get("color")),
+                )
+            except SystemExit as e:
+                return _exit_code(e.code)
+            except Exception:
+                traceback.print_exc()
+                return 1
+            finally:
+                # コマンドごとに追加されるログのハンドラーを取り除く
+                root_logger.handlers[:] = handlers
+                os.chdir(self._cwd)
+
+
+def _ensure_private_directory(socket_path: str) -> None:
+    """ソケットのディレクトリが安全でない場合はコマンドのエラーにします。"""
+    try:
+        check_socket_directory(socket_path)
+    except OSError as e:
+        raise click.ClickException(str(e)) from e
+
+
+def is_running(socket_path: str) -> bool:
+    """デーモンがソケットで待ち受けているかどうかを判定します。"""
+    try:
+        connect(socket_path).close()
+    except OSError:
+        return False
+    return True
+
+
+def spawn_daemon(
+    socket_path: str, cache_size: int, idle_timeout: Optional[float] = None
+) -> dict[str, Any]:
+    """デーモンをバックグラウンドのプロセスとして起動します。
+
+    Args:
+        socket_path: 待ち受けるソケットのパス
+        cache_size: メモリ上に保持するファイルの解析結果の最大数
+        idle_timeout: リクエストがないまま経過すると終了する秒数
+
+    Returns:
+        起動したデーモンの状態
+
+    Raises:
+        click.ClickException: デーモンが起動しなかった場合
+
+    """
+    args = [
+        sys.executable,
+        "-m",
+        "cccy",
+        "daemon",
+        "start",
+        "--foreground",
+        "--socket",
+        socket_path,
+        "--cache-size",
+        str(cache_size),
+    ]
+    if idle_timeout is not None:
+        args += ["--idle-timeout", str(idle_timeout)]
+
+    # デーモンの出力(警告やエラー)はソケットの隣のログファイルに残す
+    log_path = Path(socket_path + ".log")
+    log_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _ensure_private_directory(socket_path)
+    with log_path.open("wb") as log_file:
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = request(socket_path, "status")
+        if status is not None:
+            return status
+        if process.poll() is not None:
+            error = log_path.read_text(errors="replace").strip()
+            raise click.ClickException(
+                f"cccy daemon exited with code {process.returncode}: {error}"
+            )
+        time.sleep(0.02)
+
+    process.kill()
+    raise click.ClickException("timed out waiting for the cccy daemon to start")
+
+
+def run_daemon(
+    socket_path: str, cache_size: int, idle_timeout: Optional[float] = None
+) -> None:
+    """このプロセスでデーモンを実行します(SIGTERMで終了します)。
+
+    Args:
+        socket_path: 待ち受けるソケットのパス
+        cache_size: メモリ上に保持するファイルの解析結果の最大数
+        idle_timeout: リクエストがないまま経過すると終了する秒数
+
+    """
+    Path(socket_path).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _ensure_private_directory(socket_path)
+    server = DaemonServer(socket_path, cache_size, idle_timeout)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    server.serve_forever()
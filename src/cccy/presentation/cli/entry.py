@@ -0,0 +1,20 @@
+"""``cccy`` コマンドのエントリーポイント。
+
+デーモンが起動していれば解析コマンドをそのまま転送し、clickやCLIの
+モジュールを読み込まずに終了します。
+"""
+
+import sys
+
+from cccy.presentation.cli.daemon import forward_to_daemon
+
+
+def run() -> None:
+    """コマンドをデーモンに転送するか、このプロセスで実行します。"""
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from cccy.presentation.cli.main import main  # noqa: PLC0415
+
+    main()
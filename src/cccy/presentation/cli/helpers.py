@@ -1,14 +1,147 @@
 """Helper functions for CLI operations."""
 
+import functools
+import io
 import sys
-from typing import Optional, Union
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, TextIO, TypeVar, Union
 
 import click
 
-from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
-from cccy.domain.interfaces.cli_services import AnalyzerServiceInterface
-from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
-from cccy.presentation.factories.service_factory import PresentationLayerServiceFactory
+from cccy.domain.exceptions.complexity_exceptions import VersionControlError
+
+if TYPE_CHECKING:
+    from cccy.application.services.cli_facade_service import CliFacadeService
+    from cccy.application.services.watch_service import WatchService, WatchUpdate
+    from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
+    from cccy.domain.interfaces.cli_services import AnalyzerServiceInterface
+    from cccy.domain.interfaces.stores import ResultStore
+    from cccy.domain.services.analysis_stats import AnalysisStats
+    from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+    from cccy.domain.services.profiling import ProfileSession
+
+T = TypeVar("T")
+
+# --statsの集計を置くclickのコンテキストのmetaのキー
+STATS_KEY = "cccy.stats"
+# --profileのプロファイルを置くclickのコンテキストのmetaのキー
+PROFILE_KEY = "cccy.profile"
+# --dbの記録先を置くclickのコンテキストのmetaのキー
+DB_KEY = "cccy.db"
+# --outputの書き出し先を置くclickのコンテキストのmetaのキー
+OUTPUT_KEY = "cccy.output"
+# --outputのファイルに書き出すときのバッファーのバイト数
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+
+def current_stats() -> Optional["AnalysisStats"]:
+    """実行中のコマンドの ``--stats`` の集計を返します(無効な場合はNone)。"""
+    ctx = click.get_current_context(silent=True)
+    return None if ctx is None else ctx.meta.get(STATS_KEY)
+
+
+def current_profile() -> Optional["ProfileSession"]:
+    """実行中のコマンドの ``--profile`` のプロファイルを返します(無効な場合はNone)。"""
+    ctx = click.get_current_context(silent=True)
+    return None if ctx is None else ctx.meta.get(PROFILE_KEY)
+
+
+def current_db() -> Optional[str]:
+    """実行中のコマンドの ``--db`` の記録先を返します(無効な場合はNone)。"""
+    ctx = click.get_current_context(silent=True)
+    return None if ctx is None else ctx.meta.get(DB_KEY)
+
+
+def current_output() -> Optional[str]:
+    """実行中のコマンドの ``--output`` の書き出し先を返します(標準出力の場合はNone)。"""
+    ctx = click.get_current_context(silent=True)
+    return None if ctx is None else ctx.meta.get(OUTPUT_KEY)
+
+
+@contextmanager
+def binary_output() -> Iterator[BinaryIO]:
+    """レポートをバイト列で書き出す先を開きます。
+
+    ``--output`` のファイルはバッファー付きのバイナリストリームとして開き、
+    抜けるときに閉じます。指定されていない場合は標準出力です。
+
+    Raises:
+        SystemExit: ファイルを開けない場合
+
+    """
+    path = current_output()
+    if path is None:
+        yield sys.stdout.buffer
+        return
+    from pathlib import Path  # noqa: PLC0415
+
+    try:
+        stream = Path(path).open("wb", buffering=OUTPUT_BUFFER_SIZE)  # noqa: SIM115
+    except OSError as e:
+        click.echo(f"Error: Cannot write {path}: {e.strerror}", err=True)
+        sys.exit(1)
+    with stream:
+        yield stream
+
+
+@contextmanager
+def text_output() -> Iterator[TextIO]:
+    """レポートをテキストで書き出す先を開きます。
+
+    ``--output`` のファイルには ``binary_output`` のストリームを通して
+    UTF-8で書き出し、改行は変換しません(標準出力に書き出した場合と同じバイト列)。
+    指定されていない場合は標準出力です。
+    """
+    if current_output() is None:
+        yield sys.stdout
+        return
+    with (
+        binary_output() as binary,
+        io.TextIOWrapper(binary, encoding="utf-8", newline="") as stream,
+    ):
+        yield stream
+
+
+def measure_phase(phase: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """関数を呼び出し、``--stats`` が有効であればその時間を段階に加算します。"""
+    stats = current_stats()
+    if stats is None:
+        return func(*args, **kwargs)
+    return stats.measure(phase, functools.partial(func, *args, **kwargs))
+
+
+def _output_phase(func: Callable[..., T]) -> Callable[..., T]:
+    """関数の時間を ``--stats`` のoutputに加算するデコレーター。
+
+    結果を逐次受け取って出力する場合も、結果を待つ間の解析の時間は
+    解析の各段階に加算されるため、outputには含まれません。
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return measure_phase("output", func, *args, **kwargs)
+
+    return wrapper
+
+
+def get_cli_facade() -> "CliFacadeService":
+    """CLIファサードを作成します。
+
+    サービスの依存関係(pydantic、解析エンジン、フォーマッターなど)は
+    この関数の初回呼び出し時に読み込まれるため、``--help`` のように
+    解析を行わないコマンドは高速に起動します。
+
+    Returns:
+        CliFacadeServiceインスタンス
+
+    """
+    from cccy.presentation.factories.service_factory import (  # noqa: PLC0415
+        PresentationLayerServiceFactory,
+    )
+
+    return PresentationLayerServiceFactory.create_cli_facade()
 
 
 def load_and_merge_config(
@@ -17,6 +150,11 @@ def load_and_merge_config(
     exclude: Optional[tuple[str, ...]] = None,
     include: Optional[tuple[str, ...]] = None,
     paths: Optional[tuple[str, ...]] = None,
+    jobs: Optional[Union[int, str]] = None,
+    cache: Optional[bool] = None,
+    engine: Optional[str] = None,
+    default_excludes: Optional[bool] = None,
+    respect_gitignore: Optional[bool] = None,
 ) -> dict[str, Union[str, int, list[str], None]]:
     """設定を読み込み、CLIオプションとマージします。
 
@@ -26,45 +164,252 @@ def load_and_merge_config(
         exclude: CLI除外パターン
         include: CLI含めるパターン
         paths: CLIパス
+        jobs: CLIワーカー数または"auto"
+        cache: CLI結果キャッシュの有効/無効
+        engine: CLI複雑度計算エンジン
+        default_excludes: CLI既定の除外ディレクトリの有効/無効
+        respect_gitignore: CLI .gitignoreの尊重の有効/無効
 
     Returns:
         マージされた設定辞書
 
     """
-    cli_facade = PresentationLayerServiceFactory.create_cli_facade()
+    cli_facade = get_cli_facade()
     return cli_facade.load_and_merge_config(
         max_complexity=max_complexity,
         max_cognitive=max_cognitive,
         exclude=exclude,
         include=include,
         paths=paths,
+        jobs=jobs,
+        cache=cache,
+        engine=engine,
+        default_excludes=default_excludes,
+        respect_gitignore=respect_gitignore,
     )
 
 
 def create_analyzer_service(
     max_complexity: Optional[int] = None,
-) -> tuple[ComplexityAnalyzer, AnalyzerServiceInterface]:
+    jobs: Union[int, str] = 1,
+    cache_dir: Optional[str] = None,
+    cache_max_size: Optional[int] = None,
+    engine: str = "builtin",
+    default_excludes: bool = True,
+    respect_gitignore: bool = False,
+    changed_since: Optional[str] = None,
+    staged: bool = False,
+    diff_ref: Optional[str] = None,
+    stats: Optional["AnalysisStats"] = None,
+    profile: Optional["ProfileSession"] = None,
+) -> tuple["ComplexityAnalyzer", "AnalyzerServiceInterface"]:
     """アナライザーとサービスインスタンスを作成します。
 
     Args:
-        max_complexity: アナライザーの最大複雑度闾値
+        max_complexity: アナライザーの最大複雑度閾値
+        jobs: ワーカープロセス数または"auto"
+        cache_dir: 結果キャッシュのディレクトリ(Noneの場合はキャッシュ無効)
+        cache_max_size: 結果キャッシュの最大サイズ(バイト)
+        engine: 複雑度計算エンジン("builtin"または"library")
+        default_excludes: 仮想環境やキャッシュなどのディレクトリを走査しないかどうか
+        respect_gitignore: gitが無視するファイルを解析対象から除外するかどうか
+        changed_since: このgitリビジョン以降に変更されたファイルのみを解析する
+        staged: ステージされた変更のあるファイルのみを解析するかどうか
+        diff_ref: このgitリビジョンとの差分で変更された行に触れる関数のみを残す
+        stats: 段階ごとの時間などの集計先(Noneの場合は集計しない)
+        profile: 並列実行時にワーカーのプロファイルを合算する先(Noneの場合は取らない)
 
     Returns:
         (ComplexityAnalyzer, AnalyzerServiceInterface)のタプル
 
+    Raises:
+        VersionControlError: 変更されたファイルを取得できない場合
+
+    """
+    cli_facade = get_cli_facade()
+    return cli_facade.create_analyzer_service(
+        max_complexity=max_complexity,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        cache_max_size=cache_max_size,
+        engine=engine,
+        default_excludes=default_excludes,
+        respect_gitignore=respect_gitignore,
+        changed_since=changed_since,
+        staged=staged,
+        diff_ref=diff_ref,
+        stats=stats,
+        profile=profile,
+    )
+
+
+def create_watch_service(paths: tuple[str, ...], **options: Any) -> "WatchService":
+    """パスを監視するサービスを作成します。
+
+    Args:
+        paths: 監視・解析するパス
+        **options: PresentationLayerServiceFactory.create_watch_serviceの引数
+
+    Returns:
+        WatchServiceインスタンス
+
+    """
+    from cccy.presentation.factories.service_factory import (  # noqa: PLC0415
+        PresentationLayerServiceFactory,
+    )
+
+    return PresentationLayerServiceFactory.create_watch_service(paths, **options)
+
+
+def run_watch(watch_service: "WatchService", output_format: str) -> None:
+    """最初の解析結果を表示し、変更があるたびに再解析して表示します。
+
+    tableフォーマットでは再解析したファイルの行と削除されたファイルだけを
+    追記し、summaryフォーマットでは全体の集計を表示し直します。
+    Ctrl+Cで監視を終了します。
+
+    Args:
+        watch_service: 監視するサービス
+        output_format: 出力フォーマット("table"または"summary")
+
+    """
+    formatter = get_cli_facade().get_output_formatter()
+    render = (
+        formatter.format_table if output_format == "table" else formatter.format_summary
+    )
+    try:
+        started = time.perf_counter()
+        count = watch_service.scan()
+        _display_watch(
+            render(watch_service.results),
+            f"Analyzed {count} files in {time.perf_counter() - started:.2f}s",
+            clear=True,
+        )
+        while True:
+            changes = watch_service.wait_for_changes()
+            started = time.perf_counter()
+            update = watch_service.apply(changes)
+            if update.updated or update.removed:
+                _display_watch_update(
+                    render,
+                    watch_service,
+                    update,
+                    time.perf_counter() - started,
+                    rows_only=output_format == "table",
+                )
+    except KeyboardInterrupt:
+        click.echo("\nStopped watching.")
+    finally:
+        watch_service.close()
+
+
+def _display_watch_update(
+    render: Callable[[list["FileComplexityResult"]], str],
+    watch_service: "WatchService",
+    update: "WatchUpdate",
+    elapsed: float,
+    *,
+    rows_only: bool,
+) -> None:
+    """再解析の結果を表示します。
+
+    rows_onlyの場合は更新・削除されたファイルの行だけを追記し、それ以外の
+    場合は現在の解析結果全体を表示し直します。
     """
-    cli_facade = PresentationLayerServiceFactory.create_cli_facade()
-    return cli_facade.create_analyzer_service(max_complexity=max_complexity)
+    status = (
+        f"Re-analyzed {len(update.updated)} files, removed "
+        f"{len(update.removed)} in {elapsed:.2f}s"
+    )
+    if rows_only:
+        _display_watch(_render_watch_update(render, update), status)
+    else:
+        _display_watch(render(watch_service.results), status, clear=True)
+
+
+def _render_watch_update(
+    render: Callable[[list["FileComplexityResult"]], str], update: "WatchUpdate"
+) -> str:
+    """再解析したファイルの行と削除されたファイルだけを整形します。"""
+    lines = [render(list(update.updated))] if update.updated else []
+    lines.extend(f"Removed: {path}" for path in update.removed)
+    return "\n".join(lines)
 
 
-def handle_no_results() -> None:
-    """Pythonファイルが見つからない場合を処理します。"""
+def _display_watch(output: str, status: str, clear: bool = False) -> None:
+    """解析結果を表示します(clearの場合、端末では画面を消去します)。"""
+    if clear and sys.stdout.isatty():
+        click.clear()
+    click.echo(output)
+    click.echo(
+        f"\n[{time.strftime('%H:%M:%S')}] {status} "
+        "- watching for changes (Ctrl+C to stop)"
+    )
+
+
+def handle_no_results(changed_only: bool = False) -> None:
+    """Pythonファイルが見つからない場合を処理します。
+
+    Args:
+        changed_only: 変更されたファイルのみを解析していたかどうか
+            (変更がないことはエラーではないため終了コード0で終了します)
+
+    """
+    if changed_only:
+        click.echo("No changed Python files to analyze.")
+        sys.exit(0)
     click.echo("No Python files found to analyze.")
     sys.exit(1)
 
 
+def validate_diff_options(
+    diff_ref: Optional[str], changed_since: Optional[str]
+) -> None:
+    """--diffと--changed-sinceが同時に指定されていないことを検証します。
+
+    Args:
+        diff_ref: --diffで指定されたリビジョン
+        changed_since: --changed-sinceで指定されたリビジョン
+
+    Raises:
+        click.UsageError: 両方が指定されている場合
+
+    """
+    if diff_ref is not None and changed_since is not None:
+        raise click.UsageError("--diff cannot be combined with --changed-since")
+
+
+def resolve_max_failures(fail_fast: bool, max_failures: Optional[int]) -> Optional[int]:
+    """--fail-fastと--max-failuresから打ち切るまでの違反ファイル数を決定します。
+
+    Args:
+        fail_fast: --fail-fastが指定されたかどうか
+        max_failures: --max-failuresで指定されたファイル数
+
+    Returns:
+        違反ファイル数の上限、または打ち切らない場合はNone
+
+    Raises:
+        click.UsageError: 両方が指定されている場合
+
+    """
+    if fail_fast and max_failures is not None:
+        raise click.UsageError("--fail-fast cannot be combined with --max-failures")
+    return 1 if fail_fast else max_failures
+
+
+def handle_version_control_error(error: VersionControlError) -> None:
+    """変更されたファイルを取得できない場合を処理します。
+
+    Args:
+        error: 発生したエラー
+
+    """
+    click.echo(f"Error: {error}", err=True)
+    sys.exit(1)
+
+
 def display_failed_results(
-    failed_results: list[FileComplexityResult],
+    failed_results: list["FileComplexityResult"],
     total_results_count: int,
     max_complexity: int,
     max_cognitive: Optional[int] = None,
@@ -74,8 +419,8 @@ def display_failed_results(
     Args:
         failed_results: チェックに失敗した結果のリスト
         total_results_count: 解析されたファイルの総数
-        max_complexity: 最大循環的複雑度闾値
-        max_cognitive: 最大認知的複雑度闾値(オプション)
+        max_complexity: 最大循環的複雑度閾値
+        max_cognitive: 最大認知的複雑度閾値(オプション)
 
     """
     _display_failure_header()
@@ -93,14 +438,14 @@ def _display_failure_header() -> None:
 
 
 def _display_single_failed_result(
-    result: FileComplexityResult, max_complexity: int, max_cognitive: Optional[int]
+    result: "FileComplexityResult", max_complexity: int, max_cognitive: Optional[int]
 ) -> None:
     """単一の失敗結果の詳細を表示します。
 
     Args:
         result: 失敗したファイル複雑度結果
-        max_complexity: 最大循環的複雑度闾値
-        max_cognitive: 最大認知的複雑度闾値(オプション)
+        max_complexity: 最大循環的複雑度閾値
+        max_cognitive: 最大認知的複雑度閾値(オプション)
 
     """
     click.echo(f"\n📁 {result.file_path}")
@@ -119,14 +464,16 @@ def _display_single_failed_result(
 
 
 def _get_problem_functions(
-    functions: list[ComplexityResult], max_complexity: int, max_cognitive: Optional[int]
+    functions: list["ComplexityResult"],
+    max_complexity: int,
+    max_cognitive: Optional[int],
 ) -> list[str]:
-    """複雑度闾値を超える関数のリストを取得します。
+    """複雑度閾値を超える関数のリストを取得します。
 
     Args:
         functions: 関数複雑度結果のリスト
-        max_complexity: 最大循環的複雑度闾値
-        max_cognitive: 最大認知的複雑度闾値(オプション)
+        max_complexity: 最大循環的複雑度閾値
+        max_cognitive: 最大認知的複雑度閾値(オプション)
 
     Returns:
         フォーマットされた問題のある関数の説明リスト
@@ -160,6 +507,235 @@ def _display_failure_summary(failed_count: int, total_count: int) -> None:
     )
 
 
+@_output_phase
+def check_with_failure_limit(
+    results: Generator["FileComplexityResult", None, None],
+    max_failures: int,
+    max_complexity: int,
+    max_cognitive: Optional[int] = None,
+) -> None:
+    """違反したファイルが上限に達した時点で解析を打ち切ってチェックします。
+
+    上限に達するとジェネレーターを閉じるため、残りのファイルは解析されず、
+    並列実行中の未着手の解析も取り消されます。
+
+    Args:
+        results: 解析が終わったファイルから順に返される結果
+        max_failures: 打ち切るまでの違反ファイル数
+        max_complexity: 最大循環的複雑度閾値
+        max_cognitive: 最大認知的複雑度閾値(オプション)
+
+    Raises:
+        SystemExit: 違反したファイルがある場合(終了コード1)
+
+    """
+    cli_facade = get_cli_facade()
+    checked_files: list[str] = []
+    failed_results: list[FileComplexityResult] = []
+    with closing(results):
+        for result in results:
+            checked_files.append(result.file_path)
+            failed_results += cli_facade.filter_failed_results(
+                [result], max_complexity, max_cognitive
+            )
+            if len(failed_results) >= max_failures:
+                break
+
+    if not failed_results:
+        display_success_results(len(checked_files))
+        return
+
+    display_failed_results(
+        failed_results, len(checked_files), max_complexity, max_cognitive
+    )
+    if len(failed_results) >= max_failures:
+        _display_stopped_early(checked_files, max_failures)
+    sys.exit(1)
+
+
+@_output_phase
+def check_results(
+    results: list["FileComplexityResult"],
+    max_complexity: Optional[int],
+    max_cognitive: Optional[int] = None,
+) -> None:
+    """すべての結果を閾値と比較し、チェックの結果を表示します。
+
+    Args:
+        results: 解析結果のリスト
+        max_complexity: 最大循環的複雑度閾値(Noneの場合はチェックしない)
+        max_cognitive: 最大認知的複雑度閾値(オプション)
+
+    Raises:
+        SystemExit: 違反したファイルがある場合(終了コード1)
+
+    """
+    if max_complexity is None:
+        display_success_results(len(results))
+        return
+
+    failed_results = get_cli_facade().filter_failed_results(
+        results, max_complexity, max_cognitive
+    )
+    if not failed_results:
+        display_success_results(len(results))
+        return
+
+    display_failed_results(failed_results, len(results), max_complexity, max_cognitive)
+    sys.exit(1)
+
+
+def load_reports(report_paths: Iterable[str]) -> list["FileComplexityResult"]:
+    """JSONレポートを読み込み、1つの結果にまとめます。
+
+    Args:
+        report_paths: ``show-list --format json`` または ``jsonl`` の出力ファイル
+
+    Returns:
+        ファイルパス順の結果
+
+    Raises:
+        SystemExit: レポートを読み込めない、または結合できない場合
+
+    """
+    from pathlib import Path  # noqa: PLC0415
+
+    from cccy.domain.exceptions.complexity_exceptions import (  # noqa: PLC0415
+        ReportError,
+    )
+    from cccy.domain.services.report_merger import (  # noqa: PLC0415
+        merge_reports,
+        parse_report,
+    )
+
+    try:
+        return merge_reports(
+            (path, parse_report(Path(path).read_text(encoding="utf-8"), path))
+            for path in report_paths
+        )
+    except (OSError, ReportError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@contextmanager
+def result_store(location: str) -> Iterator["ResultStore"]:
+    """解析結果のストアを開き、終わったら閉じます。
+
+    Args:
+        location: データベースファイルのパス
+
+    Yields:
+        開いたストア
+
+    Raises:
+        SystemExit: ストアを開けない、または読み書きできない場合
+
+    """
+    from cccy.domain.exceptions.complexity_exceptions import (  # noqa: PLC0415
+        ResultStoreError,
+    )
+
+    try:
+        store = get_cli_facade().open_result_store(location)
+        try:
+            yield store
+        finally:
+            store.close()
+    except ResultStoreError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+def record_results(results: list["FileComplexityResult"], engine: str = "") -> None:
+    """``--db`` が指定されていれば、結果を1回の実行として記録します。
+
+    Args:
+        results: 実行の解析結果
+        engine: 結果を計算した複雑度計算エンジン(レポートを結合した場合は空)
+
+    """
+    location = current_db()
+    if location is not None:
+        measure_phase("output", _save_run, location, results, engine)
+
+
+def record_streamed_results(
+    results: Generator["FileComplexityResult", None, None], engine: str = ""
+) -> Generator["FileComplexityResult", None, None]:
+    """結果をそのまま返し、すべて返し終えたら ``--db`` に記録します。
+
+    ``--fail-fast`` などで途中で閉じられた場合、一部のファイルだけの
+    実行が推移に混ざらないよう記録しません。
+
+    Args:
+        results: 解析が終わったファイルから順に返される結果
+        engine: 結果を計算した複雑度計算エンジン
+
+    Returns:
+        同じ結果を返すジェネレーター
+
+    """
+    if current_db() is None:
+        return results
+    return _record_after_last(results, engine)
+
+
+def _record_after_last(
+    results: Generator["FileComplexityResult", None, None], engine: str
+) -> Generator["FileComplexityResult", None, None]:
+    seen = []
+    with closing(results):
+        for result in results:
+            seen.append(result)
+            yield result
+    record_results(seen, engine)
+
+
+def _save_run(
+    location: str, results: list["FileComplexityResult"], engine: str
+) -> None:
+    """結果を実行として保存し、記録したことを標準エラー出力に表示します。"""
+    command = click.get_current_context().info_name or ""
+    with result_store(location) as store:
+        run_id = store.save_run(results, command, engine)
+    click.echo(f"Recorded run {run_id} ({len(results)} files) in {location}", err=True)
+
+
+@_output_phase
+def display_rows(
+    headers: Sequence[str], rows: Sequence[Sequence[object]], output_format: str
+) -> None:
+    """問い合わせの結果の行をフォーマットして表示します。
+
+    Args:
+        headers: 列の名前
+        rows: 行の値
+        output_format: table、json、csvのいずれか
+
+    """
+    formatter = get_cli_facade().get_output_formatter()
+    with text_output() as stream:
+        formatter.write_rows(list(headers), rows, output_format, stream)
+        stream.write("\n")
+
+
+def _display_stopped_early(checked_files: list[str], max_failures: int) -> None:
+    """打ち切りまでにチェックしたファイルを表示します。
+
+    Args:
+        checked_files: 打ち切りまでにチェックしたファイルのパス
+        max_failures: 打ち切るまでの違反ファイル数
+
+    """
+    click.echo(
+        f"\n⏹  Stopped after {max_failures} failing file(s); "
+        f"{len(checked_files)} file(s) checked before the stop:"
+    )
+    for file_path in checked_files:
+        click.echo(f"   {file_path}")
+
+
 def display_success_results(total_results_count: int) -> None:
     """複雑度チェックの成功メッセージを表示します。
 
@@ -170,6 +746,144 @@ def display_success_results(total_results_count: int) -> None:
     click.echo(f"✅ All {total_results_count} files passed complexity check!")
 
 
+def display_cache_stats(stats: dict[str, Union[str, int]]) -> None:
+    """結果キャッシュの統計情報を表示します。
+
+    Args:
+        stats: directory、entries、total_size、max_sizeを含む辞書
+
+    """
+    total_size = int(stats["total_size"])
+    max_size = int(stats["max_size"])
+    click.echo(f"Cache directory: {stats['directory']}")
+    click.echo(f"Entries: {stats['entries']}")
+    click.echo(
+        f"Size: {total_size / (1024 * 1024):.1f} MB / {max_size / (1024 * 1024):.1f} MB"
+    )
+
+
+def display_stats(
+    stats: "AnalysisStats", show: bool, stats_file: Optional[str] = None
+) -> None:
+    """``--stats`` の集計を表示し、JSONとして書き出します。
+
+    Args:
+        stats: 段階ごとの時間などの集計
+        show: 標準エラー出力に表として表示するかどうか
+        stats_file: JSONの書き出し先("-"の場合は標準エラー出力、Noneの場合は書き出さない)
+
+    """
+    report = stats.to_dict()
+    if show:
+        _display_stats_table(report)
+    if stats_file is None:
+        return
+
+    import json  # noqa: PLC0415
+    from pathlib import Path  # noqa: PLC0415
+
+    text = json.dumps(report, indent=2)
+    if stats_file == "-":
+        click.echo(text, err=True)
+    else:
+        Path(stats_file).write_text(text + "\n", encoding="utf-8")
+
+
+def _display_stats_table(report: dict[str, Any]) -> None:
+    """集計を標準エラー出力に表として表示します(時間が0の段階は省略)。"""
+    lines = ["", "Statistics:", f"  {'phase':<12} {'wall':>9} {'cpu':>9}"]
+    lines += [
+        f"  {phase:<12} {times['wall_seconds']:>8.3f}s {times['cpu_seconds']:>8.3f}s"
+        for phase, times in report["phases"].items()
+        if times["wall_seconds"] or times["cpu_seconds"]
+    ]
+    lines.append(
+        f"  {'total':<12} {report['wall_seconds']:>8.3f}s {report['cpu_seconds']:>8.3f}s"
+    )
+    if report["workers"]:
+        lines.append(
+            f"  Per-file phases are summed over {report['workers']} worker processes."
+        )
+    lines.append(
+        f"  Files: {report['files']} analyzed, {report['skipped_files']} skipped, "
+        f"{report['functions']} functions, "
+        f"{report['bytes_read'] / 1024:.1f} KiB read"
+    )
+    lines.append(
+        f"  Throughput: {report['files_per_second']:.1f} files/s, "
+        f"{report['functions_per_second']:.1f} functions/s"
+    )
+    cache = report["cache"]
+    if cache["hit_rate"] is not None:
+        lines.append(
+            f"  Result cache: {cache['hits']} hits, {cache['misses']} misses "
+            f"({cache['hit_rate']:.1%} hit rate)"
+        )
+    if report["slowest_files"]:
+        lines.append("  Slowest files:")
+        lines += [
+            f"    {entry['seconds']:>8.3f}s  {entry['file_path']}"
+            for entry in report["slowest_files"]
+        ]
+    click.echo("\n".join(lines), err=True)
+
+
+def profile_paths(output: str) -> tuple[str, str]:
+    """``--profile`` の出力先から、pstatsと折りたたんだスタックのファイル名を返します。
+
+    Args:
+        output: 出力先(拡張子 ``.pstats`` は省略可能)
+
+    Returns:
+        (pstatsのファイル名, 折りたたんだスタックのファイル名)のタプル
+
+    """
+    base = output[: -len(".pstats")] if output.endswith(".pstats") else output
+    return f"{base}.pstats", f"{base}.collapsed"
+
+
+def write_profile(profile: "ProfileSession", output: str) -> None:
+    """``--profile`` のプロファイルをファイルに書き出します。
+
+    Args:
+        profile: 計測を終えたプロファイル
+        output: 出力先(``profile_paths`` を参照)
+
+    """
+    from pathlib import Path  # noqa: PLC0415
+
+    pstats_path, collapsed_path = profile_paths(output)
+    profile.to_pstats().dump_stats(pstats_path)
+    with Path(collapsed_path).open("w", encoding="utf-8") as stream:
+        for line in profile.iter_collapsed_stacks():
+            stream.write(line + "\n")
+    workers = len(profile.workers)
+    merged = f", merged with {workers} worker processes" if workers else ""
+    click.echo(
+        f"Profile written to {pstats_path}{merged}; "
+        f"collapsed stacks for flame graphs in {collapsed_path}",
+        err=True,
+    )
+
+
+def display_daemon_status(status: dict[str, Any]) -> None:
+    """デーモンの状態を表示します。
+
+    Args:
+        status: pid、socket、version、uptime、requests、cacheを含む辞書
+
+    """
+    cache = status["cache"]
+    lookups = cache["hits"] + cache["misses"]
+    hit_rate = cache["hits"] / lookups * 100 if lookups else 0.0
+    click.echo(f"cccy daemon is running (pid {status['pid']}).")
+    click.echo(f"Socket: {status['socket']}")
+    click.echo(f"Version: {status.get('version', 'unknown')}")
+    click.echo(f"Uptime: {status['uptime']:.0f} s")
+    click.echo(f"Requests: {status['requests']}")
+    click.echo(f"Cached results: {cache['entries']} (hit rate {hit_rate:.1f}%)")
+
+
 def validate_required_config(
     merged_config: dict[str, Union[str, int, list[str], None]],
 ) -> None:
@@ -190,8 +904,101 @@ def validate_required_config(
         sys.exit(1)
 
 
+@_output_phase
+def display_lines(lines: Iterable[str]) -> None:
+    """行を生成されるたびに書き出します。
+
+    標準出力には1行ごとにフラッシュし、パイプの先が解析の完了を
+    待たずに行を受け取れるようにします。
+
+    Args:
+        lines: 出力する行(ジェネレーターでもよい)
+
+    """
+    flush = current_output() is None
+    with text_output() as stream:
+        for line in lines:
+            stream.write(line + "\n")
+            if flush:
+                stream.flush()
+
+
+@_output_phase
+def display_columnar(
+    results: Iterable["FileComplexityResult"],
+    output_format: str,
+    functions: bool = False,
+) -> None:
+    """結果をParquetまたはArrow IPCとして、行グループごとに書き出します。
+
+    書き出し先が端末の場合と、pyarrowがインストールされていない場合は、
+    結果を1件も受け取る前(解析を始める前)にエラーとして終了します。
+
+    Args:
+        results: 解析結果(ジェネレーターでもよい)
+        output_format: parquetまたはarrow
+        functions: 関数ごとの行を書き出すかどうか(Falseの場合はファイルごと)
+
+    """
+    if current_output() is None and sys.stdout.isatty():
+        click.echo(
+            f"Error: {output_format} output is binary; "
+            "redirect it or write it with --output FILE",
+            err=True,
+        )
+        sys.exit(1)
+    formatter = get_cli_facade().get_output_formatter()
+    try:
+        with binary_output() as stream:
+            formatter.write_columnar(
+                results, stream, output_format, functions=functions
+            )
+    except ImportError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@_output_phase
+def display_function_output(
+    results: list["FileComplexityResult"], output_format: str
+) -> None:
+    """関数単位の結果をフォーマットして表示します。
+
+    Args:
+        results: 解析結果のリスト
+        output_format: table、json、csvのいずれか
+
+    """
+    formatter = get_cli_facade().get_output_formatter()
+    write: Callable[[list[FileComplexityResult], TextIO], None]
+    if output_format == "json":
+        write = formatter.write_functions_json
+    elif output_format == "csv":
+        write = formatter.write_functions_csv
+    else:
+        write = formatter.write_detailed_table
+    with text_output() as stream:
+        write(results, stream)
+        stream.write("\n")
+
+
+@_output_phase
+def display_summary(results: list["FileComplexityResult"]) -> None:
+    """結果の要約を表示します。
+
+    Args:
+        results: 解析結果のリスト
+
+    """
+    formatter = get_cli_facade().get_output_formatter()
+    with text_output() as stream:
+        formatter.write_summary(results, stream)
+        stream.write("\n")
+
+
+@_output_phase
 def format_and_display_output(
-    results: list[FileComplexityResult],
+    results: list["FileComplexityResult"],
     output_format: str,
 ) -> None:
     """指定されたフォーマットに基づいて出力をフォーマットし、表示します。
@@ -204,23 +1011,24 @@ def format_and_display_output(
         SystemExit: 不明なフォーマットが指定された場合
 
     """
-    cli_facade = PresentationLayerServiceFactory.create_cli_facade()
+    cli_facade = get_cli_facade()
     formatter = cli_facade.get_output_formatter()
 
     # Sort results by file path for consistent output
     results.sort(key=lambda x: x.file_path)
 
-    # Generate output
-    if output_format.lower() == "table":
-        output = formatter.format_table(results)
-    elif output_format.lower() == "detailed":
-        output = formatter.format_detailed_table(results)
-    elif output_format.lower() == "json":
-        output = formatter.format_json(results)
-    elif output_format.lower() == "csv":
-        output = formatter.format_csv(results)
-    else:
+    # Choose the writer before the output file is created
+    writers = {
+        "table": formatter.write_table,
+        "detailed": formatter.write_detailed_table,
+        "json": formatter.write_json,
+        "csv": formatter.write_csv,
+    }
+    write = writers.get(output_format.lower())
+    if write is None:
         click.echo(f"Error: Unknown format '{output_format}'", err=True)
         sys.exit(1)
 
-    click.echo(output)
+    with text_output() as stream:
+        write(results, stream)
+        stream.write("\n")
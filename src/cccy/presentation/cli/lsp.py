@@ -0,0 +1,320 @@
+"""標準入出力で動作するLanguage Server Protocolのサーバー。
+
+エディタで開かれているPythonファイルについて、関数ごとの循環的複雑度と
+認知的複雑度をコードレンズとして、閾値を超えた関数を診断として返します。
+解析は保存されていないバッファの内容に対して行い、編集のたびに変更された
+トップレベルの定義だけを再解析します。
+"""
+
+import json
+import logging
+import sys
+from typing import Any, BinaryIO, Callable, NamedTuple, Optional
+
+from cccy.domain.entities.records import FunctionRecord
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.incremental_analyzer import (
+    IncrementalSourceAnalyzer,
+    split_lines,
+)
+
+logger = logging.getLogger(__name__)
+
+# 閾値が設定されていない場合に診断を報告する循環的複雑度
+DEFAULT_MAX_COMPLEXITY = 10
+
+# JSON-RPCのエラーコード
+_METHOD_NOT_FOUND = -32601
+_INTERNAL_ERROR = -32603
+# TextDocumentSyncKind.Incremental と DiagnosticSeverity.Warning
+_SYNC_INCREMENTAL = 2
+_SEVERITY_WARNING = 2
+
+
+class Thresholds(NamedTuple):
+    """診断を報告する複雑度の閾値。"""
+
+    max_complexity: int
+    max_cognitive: Optional[int] = None
+
+
+def _read_headers(reader: BinaryIO) -> Optional[dict[str, str]]:
+    """空行までのヘッダーを読み込みます(入力が終わった場合はNone)。"""
+    headers: dict[str, str] = {}
+    while True:
+        line = reader.readline()
+        if not line:
+            return None
+        if not line.strip():
+            return headers
+        name, _, value = line.decode("ascii").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def read_message(reader: BinaryIO) -> Optional[dict[str, Any]]:
+    """``Content-Length`` ヘッダー付きのメッセージを1つ読み込みます。
+
+    Returns:
+        メッセージ、または入力が終わった場合はNone
+
+    """
+    headers = _read_headers(reader)
+    if headers is None or "content-length" not in headers:
+        return None
+    message: dict[str, Any] = json.loads(reader.read(int(headers["content-length"])))
+    return message
+
+
+def write_message(writer: BinaryIO, message: dict[str, Any]) -> None:
+    """メッセージを ``Content-Length`` ヘッダーを付けて書き込みます。"""
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    writer.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    writer.flush()
+
+
+def _code_point_index(line: str, character: int) -> int:
+    """UTF-16のコード単位で数えた列を文字列の添字に変換します。"""
+    content = line.rstrip("\r\n")
+    if content.isascii():
+        return min(character, len(content))
+    prefix = content.encode("utf-16-le")[: character * 2]
+    return len(prefix.decode("utf-16-le", errors="ignore"))
+
+
+def _utf16_length(text: str) -> int:
+    """文字列のUTF-16のコード単位での長さを返します。"""
+    return len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+
+
+def apply_change(lines: list[str], change: dict[str, Any]) -> list[str]:
+    """``TextDocumentContentChangeEvent`` を行のリストに適用します。
+
+    Args:
+        lines: 改行を含む変更前の行
+        change: 範囲付きの差分、または範囲のない全体の内容
+
+    Returns:
+        変更後の行
+
+    """
+    if "range" not in change:
+        return split_lines(change["text"])
+    start, end = change["range"]["start"], change["range"]["end"]
+    head = lines[start["line"]] if start["line"] < len(lines) else ""
+    tail = lines[end["line"]] if end["line"] < len(lines) else ""
+    text = (
+        head[: _code_point_index(head, start["character"])]
+        + change["text"]
+        + tail[_code_point_index(tail, end["character"]) :]
+    )
+    return lines[: start["line"]] + split_lines(text) + lines[end["line"] + 1 :]
+
+
+def _name_range(lines: list[str], function: FunctionRecord) -> dict[str, Any]:
+    """関数名の範囲を返します(見つからない場合は定義の行全体)。"""
+    line = function.lineno - 1
+    text = lines[line].rstrip("\r\n") if line < len(lines) else ""
+    keyword = text.find("def")
+    index = text.find(function.name, keyword + len("def")) if keyword >= 0 else -1
+    if index < 0:
+        start, end = 0, _utf16_length(text)
+    else:
+        start = _utf16_length(text[:index])
+        end = start + _utf16_length(function.name)
+    return {
+        "start": {"line": line, "character": start},
+        "end": {"line": line, "character": end},
+    }
+
+
+def _too_complex(function: FunctionRecord, thresholds: Thresholds) -> list[str]:
+    """閾値を超えている指標の説明を返します。"""
+    problems = []
+    if function.cyclomatic_complexity > thresholds.max_complexity:
+        problems.append(
+            f"cyclomatic {function.cyclomatic_complexity} > {thresholds.max_complexity}"
+        )
+    max_cognitive = thresholds.max_cognitive
+    if max_cognitive is not None and function.cognitive_complexity > max_cognitive:
+        problems.append(f"cognitive {function.cognitive_complexity} > {max_cognitive}")
+    return problems
+
+
+class _Document:
+    """エディタで開かれている1つのファイル。"""
+
+    def __init__(self, text: str, analyzer: ComplexityAnalyzer) -> None:
+        self.lines = split_lines(text)
+        self.analysis = IncrementalSourceAnalyzer(analyzer)
+        self.analysis.update(text)
+
+
+class LanguageServer:
+    """1つのクライアントとやり取りするLanguage Serverです。
+
+    メッセージは受け取った順に1つずつ処理します。
+    """
+
+    def __init__(
+        self,
+        analyzer: ComplexityAnalyzer,
+        thresholds: Thresholds,
+        writer: BinaryIO,
+    ) -> None:
+        """サーバーを初期化します。
+
+        Args:
+            analyzer: 関数の複雑度の計算に使用するアナライザー
+            thresholds: 診断を報告する複雑度の閾値
+            writer: メッセージの書き込み先(通常は標準出力)
+
+        """
+        self.analyzer = analyzer
+        self.thresholds = thresholds
+        self.writer = writer
+        self.documents: dict[str, _Document] = {}
+        self.shutdown_requested = False
+        self._requests: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown,
+            "textDocument/codeLens": self._code_lens,
+        }
+        self._notifications: dict[str, Callable[[dict[str, Any]], None]] = {
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+        }
+
+    def serve(self, reader: BinaryIO) -> int:
+        """``exit`` 通知を受けるか入力が終わるまでメッセージを処理します。
+
+        Returns:
+            終了コード(``shutdown`` の後に終了した場合は0)
+
+        """
+        while True:
+            message = read_message(reader)
+            if message is None or message.get("method") == "exit":
+                return 0 if self.shutdown_requested else 1
+            self.handle(message)
+
+    def handle(self, message: dict[str, Any]) -> None:
+        """1つのリクエストまたは通知を処理します。"""
+        method = message.get("method", "")
+        params = message.get("params") or {}
+        if "id" in message:
+            response = self._respond(method, params)
+            write_message(
+                self.writer, {"jsonrpc": "2.0", "id": message["id"], **response}
+            )
+            return
+
+        notification = self._notifications.get(method)
+        try:
+            if notification is not None:
+                notification(params)
+        except Exception:
+            logger.exception("Failed to handle %s", method)
+
+    def _respond(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """リクエストを処理し、応答の ``result`` または ``error`` を返します。"""
+        handler = self._requests.get(method)
+        if handler is None:
+            message = f"Method not found: {method}"
+            return {"error": {"code": _METHOD_NOT_FOUND, "message": message}}
+        try:
+            return {"result": handler(params)}
+        except Exception as e:
+            logger.exception("Failed to handle %s", method)
+            return {"error": {"code": _INTERNAL_ERROR, "message": str(e)}}
+
+    def _initialize(self, _params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": _SYNC_INCREMENTAL},
+                "codeLensProvider": {"resolveProvider": False},
+            },
+            "serverInfo": {"name": "cccy"},
+        }
+
+    def _shutdown(self, _params: dict[str, Any]) -> None:
+        self.shutdown_requested = True
+
+    def _did_open(self, params: dict[str, Any]) -> None:
+        document = params["textDocument"]
+        self.documents[document["uri"]] = _Document(document["text"], self.analyzer)
+        self._publish_diagnostics(document["uri"])
+
+    def _did_change(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        document = self.documents.get(uri)
+        if document is None:
+            return
+        for change in params["contentChanges"]:
+            document.lines = apply_change(document.lines, change)
+        document.analysis.update("".join(document.lines))
+        self._publish_diagnostics(uri)
+
+    def _did_close(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        if self.documents.pop(uri, None) is not None:
+            self._notify(
+                "textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []}
+            )
+
+    def _code_lens(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return []
+        lines = document.analysis.lines
+        return [
+            {
+                "range": _name_range(lines, function),
+                "command": {
+                    "title": f"cyclomatic {function.cyclomatic_complexity} · "
+                    f"cognitive {function.cognitive_complexity}",
+                    "command": "",
+                },
+            }
+            for function in document.analysis.functions
+        ]
+
+    def _publish_diagnostics(self, uri: str) -> None:
+        """閾値を超えた関数の診断をクライアントに送ります。"""
+        analysis = self.documents[uri].analysis
+        diagnostics = []
+        for function in analysis.functions:
+            problems = _too_complex(function, self.thresholds)
+            if problems:
+                diagnostics.append(
+                    {
+                        "range": _name_range(analysis.lines, function),
+                        "severity": _SEVERITY_WARNING,
+                        "source": "cccy",
+                        "message": f"Function '{function.name}' is too complex "
+                        f"({', '.join(problems)})",
+                    }
+                )
+        self._notify(
+            "textDocument/publishDiagnostics", {"uri": uri, "diagnostics": diagnostics}
+        )
+
+    def _notify(self, method: str, params: dict[str, Any]) -> None:
+        write_message(
+            self.writer, {"jsonrpc": "2.0", "method": method, "params": params}
+        )
+
+
+def run_language_server(analyzer: ComplexityAnalyzer, thresholds: Thresholds) -> int:
+    """標準入出力でクライアントとやり取りするサーバーを実行します。
+
+    Args:
+        analyzer: 関数の複雑度の計算に使用するアナライザー
+        thresholds: 診断を報告する複雑度の閾値
+
+    Returns:
+        終了コード
+
+    """
+    server = LanguageServer(analyzer, thresholds, sys.stdout.buffer)
+    return server.serve(sys.stdin.buffer)
@@ -1,24 +1,58 @@
 """Python複雑度解析ツールのコマンドラインインターフェース。"""
 
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 import click
 
 from cccy.presentation.cli.banner import create_banner, get_main_help_text
 from cccy.presentation.cli.common import (
     CommonProcessor,
+    F,
     analysis_options,
     common_options,
+    db_options,
     format_options,
+    output_options,
+    profile_options,
+    shard_options,
+    stats_options,
+)
+from cccy.presentation.cli.daemon import (
+    DEFAULT_CACHE_SIZE,
+    default_socket_path,
+    is_supported,
+    request,
 )
 from cccy.presentation.cli.helpers import (
-    display_failed_results,
-    display_success_results,
+    check_results,
+    check_with_failure_limit,
+    create_analyzer_service,
+    create_watch_service,
+    display_cache_stats,
+    display_columnar,
+    display_daemon_status,
+    display_function_output,
+    display_lines,
+    display_rows,
+    display_summary,
     format_and_display_output,
+    get_cli_facade,
+    load_reports,
+    measure_phase,
+    record_results,
+    resolve_max_failures,
+    result_store,
+    run_watch,
+    validate_diff_options,
     validate_required_config,
 )
-from cccy.presentation.factories.service_factory import PresentationLayerServiceFactory
+
+if TYPE_CHECKING:
+    from cccy.domain.services.sharding import Shard
+
+# Formats written as each file is analyzed instead of after the whole run
+STREAMED_FORMATS = ("jsonl", "parquet", "arrow")
 
 
 @click.group(
@@ -40,7 +74,30 @@ def main(ctx: click.Context) -> None:  # noqa: D103
 
 
 @main.command()
+@click.option(
+    "--diff",
+    "diff_ref",
+    metavar="REF",
+    default=None,
+    help="Report only functions overlapping lines changed since the merge base with REF",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop at the first file that exceeds the thresholds",
+)
+@click.option(
+    "--max-failures",
+    type=click.IntRange(min=1),
+    metavar="N",
+    default=None,
+    help="Stop once N files exceed the thresholds",
+)
 @analysis_options
+@db_options
+@profile_options
+@stats_options
+@shard_options
 @common_options
 def check(
     paths: tuple[str, ...],
@@ -51,6 +108,17 @@ def check(
     include: tuple[str, ...],
     verbose: bool,
     log_level: str,
+    jobs: Optional[Union[int, str]],
+    cache: Optional[bool],
+    engine: Optional[str],
+    default_excludes: Optional[bool],
+    respect_gitignore: Optional[bool],
+    changed_since: Optional[str],
+    staged: bool,
+    shard: Optional["Shard"],
+    diff_ref: Optional[str],
+    fail_fast: bool,
+    max_failures: Optional[int],
 ) -> None:
     """Check if complexity exceeds thresholds (CI/CD friendly)
 
@@ -66,6 +134,13 @@ def check(
       cccy check --max-complexity 10 src/ # Set threshold explicitly
       cccy check --max-cognitive 7 src/   # Add cognitive limit
       cccy check --exclude "*/tests/*"    # Exclude test files
+      cccy check --jobs auto src/         # Analyze files in parallel
+      cccy check --cache src/             # Reuse results of unchanged files
+      cccy check --changed-since origin/main  # Only files changed in the PR
+      cccy check --diff origin/main       # Only functions touched by the PR
+      cccy check --fail-fast src/         # Stop at the first violation
+      cccy check --shard 2/4 src/         # Check the 2nd of 4 parts (CI fan-out)
+      cccy check --db results.sqlite src/ # Record the run (see 'cccy query')
 
     \b
     CONFIGURATION:
@@ -74,11 +149,23 @@ def check(
     """
     # Setup and load configuration
     merged_config = CommonProcessor.setup_and_load_config(
-        log_level, max_complexity, max_cognitive, exclude, include, paths
+        log_level,
+        max_complexity,
+        max_cognitive,
+        exclude,
+        include,
+        paths,
+        jobs,
+        cache,
+        engine,
+        default_excludes,
+        respect_gitignore,
     )
 
     # Validate required configuration
     validate_required_config(merged_config)
+    validate_diff_options(diff_ref, changed_since)
+    failure_limit = resolve_max_failures(fail_fast, max_failures)
 
     # Extract final configuration
     (
@@ -89,39 +176,53 @@ def check(
         final_paths,
     ) = CommonProcessor.extract_final_config(merged_config)
 
+    execution_options = {
+        **CommonProcessor.extract_execution_options(merged_config),
+        "changed_since": changed_since,
+        "staged": staged,
+        "diff_ref": diff_ref,
+        "shard": shard,
+    }
+
+    # Stop analyzing once enough files exceed the thresholds
+    if final_max_complexity is not None and failure_limit is not None:
+        check_with_failure_limit(
+            CommonProcessor.iter_results(
+                final_paths,
+                recursive,
+                final_exclude,
+                final_include,
+                verbose,
+                max_complexity=final_max_complexity,
+                **execution_options,
+            ),
+            failure_limit,
+            final_max_complexity,
+            final_max_cognitive,
+        )
+        return
+
     # Analyze and get results
-    all_results, service = CommonProcessor.analyze_and_get_results(
+    all_results, _ = CommonProcessor.analyze_and_get_results(
         final_paths,
         recursive,
         final_exclude,
         final_include,
         verbose,
         final_max_complexity,
+        **execution_options,
     )
 
-    # Filter files that exceed thresholds
-    if final_max_complexity is not None:
-        cli_facade = PresentationLayerServiceFactory.create_cli_facade()
-        failed_results = cli_facade.filter_failed_results(
-            all_results, final_max_complexity, final_max_cognitive
-        )
-
-        if failed_results:
-            display_failed_results(
-                failed_results,
-                len(all_results),
-                final_max_complexity,
-                final_max_cognitive,
-            )
-            sys.exit(1)
-        else:
-            display_success_results(len(all_results))
-    else:
-        display_success_results(len(all_results))
+    check_results(all_results, final_max_complexity, final_max_cognitive)
 
 
 @main.command()
 @format_options
+@output_options
+@db_options
+@profile_options
+@stats_options
+@shard_options
 @common_options
 def show_list(
     paths: tuple[str, ...],
@@ -131,6 +232,14 @@ def show_list(
     include: tuple[str, ...],
     verbose: bool,
     log_level: str,
+    jobs: Optional[Union[int, str]],
+    cache: Optional[bool],
+    engine: Optional[str],
+    default_excludes: Optional[bool],
+    respect_gitignore: Optional[bool],
+    changed_since: Optional[str],
+    staged: bool,
+    shard: Optional["Shard"],
 ) -> None:
     """Show detailed complexity metrics for all files
 
@@ -145,19 +254,32 @@ def show_list(
       cccy show-list                    # Use pyproject.toml config
       cccy show-list src/              # Analyze specific directory
       cccy show-list --format json     # JSON output for tools
+      cccy show-list --format jsonl    # One JSON line per file, streamed
       cccy show-list --format csv      # Spreadsheet-friendly
       cccy show-list --format detailed # Function-level details
+      cccy show-list --format parquet > files.parquet
 
     \b
     OUTPUT FORMATS:
       table      Pretty table (default)
       detailed   Function-level breakdown
       json       Machine-readable JSON
+      jsonl      JSON Lines, written as each file finishes
       csv        Comma-separated values
+      parquet    Parquet, one row per file (needs cccy[arrow])
+      arrow      Arrow IPC stream, one row per file (needs cccy[arrow])
     """
     # Setup and load configuration
     merged_config = CommonProcessor.setup_and_load_config(
-        log_level, exclude=exclude, include=include, paths=paths
+        log_level,
+        exclude=exclude,
+        include=include,
+        paths=paths,
+        jobs=jobs,
+        cache=cache,
+        engine=engine,
+        default_excludes=default_excludes,
+        respect_gitignore=respect_gitignore,
     )
 
     # Extract final configuration
@@ -169,9 +291,36 @@ def show_list(
         final_paths,
     ) = CommonProcessor.extract_final_config(merged_config)
 
+    if output_format.lower() in STREAMED_FORMATS:
+        # Stream one line (or one row group) per file as soon as it is analyzed
+        results = CommonProcessor.iter_results(
+            final_paths,
+            recursive,
+            final_exclude,
+            final_include,
+            verbose,
+            **CommonProcessor.extract_execution_options(merged_config),
+            changed_since=changed_since,
+            staged=staged,
+            shard=shard,
+        )
+        if output_format.lower() == "jsonl":
+            display_lines(get_cli_facade().get_output_formatter().iter_jsonl(results))
+        else:
+            display_columnar(results, output_format.lower())
+        return
+
     # Analyze and get results
     all_results, _ = CommonProcessor.analyze_and_get_results(
-        final_paths, recursive, final_exclude, final_include, verbose
+        final_paths,
+        recursive,
+        final_exclude,
+        final_include,
+        verbose,
+        **CommonProcessor.extract_execution_options(merged_config),
+        changed_since=changed_since,
+        staged=staged,
+        shard=shard,
     )
 
     # Format and display output
@@ -182,10 +331,17 @@ def show_list(
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["table", "json", "csv"], case_sensitive=False),
+    type=click.Choice(
+        ["table", "json", "jsonl", "csv", "parquet", "arrow"], case_sensitive=False
+    ),
     default="table",
-    help="Output format: table|json|csv (default: table)",
+    help="Output format: table|json|jsonl|csv|parquet|arrow (default: table)",
 )
+@output_options
+@db_options
+@profile_options
+@stats_options
+@shard_options
 @common_options
 def show_functions(
     paths: tuple[str, ...],
@@ -195,6 +351,14 @@ def show_functions(
     include: tuple[str, ...],
     verbose: bool,
     log_level: str,
+    jobs: Optional[Union[int, str]],
+    cache: Optional[bool],
+    engine: Optional[str],
+    default_excludes: Optional[bool],
+    respect_gitignore: Optional[bool],
+    changed_since: Optional[str],
+    staged: bool,
+    shard: Optional["Shard"],
 ) -> None:
     """Show function-level complexity metrics
 
@@ -209,17 +373,30 @@ def show_functions(
       cccy show-functions                 # Use pyproject.toml config
       cccy show-functions src/           # Analyze specific directory
       cccy show-functions --format json  # JSON output for tools
+      cccy show-functions --format jsonl # One JSON line per function, streamed
       cccy show-functions --format csv   # Spreadsheet-friendly
+      cccy show-functions --format parquet > functions.parquet
 
     \b
     OUTPUT FORMATS:
       table      Function table grouped by file (default)
       json       Machine-readable JSON with function details
+      jsonl      JSON Lines, written as each file finishes
       csv        Function-level CSV data
+      parquet    Parquet, one row per function (needs cccy[arrow])
+      arrow      Arrow IPC stream, one row per function (needs cccy[arrow])
     """
     # Setup and load configuration
     merged_config = CommonProcessor.setup_and_load_config(
-        log_level, exclude=exclude, include=include, paths=paths
+        log_level,
+        exclude=exclude,
+        include=include,
+        paths=paths,
+        jobs=jobs,
+        cache=cache,
+        engine=engine,
+        default_excludes=default_excludes,
+        respect_gitignore=respect_gitignore,
     )
 
     # Extract final configuration
@@ -231,26 +408,50 @@ def show_functions(
         final_paths,
     ) = CommonProcessor.extract_final_config(merged_config)
 
+    output_format = output_format.lower()
+    if output_format in STREAMED_FORMATS:
+        # Stream one line (or row group) per function as soon as its file is analyzed
+        results = CommonProcessor.iter_results(
+            final_paths,
+            recursive,
+            final_exclude,
+            final_include,
+            verbose,
+            **CommonProcessor.extract_execution_options(merged_config),
+            changed_since=changed_since,
+            staged=staged,
+            shard=shard,
+        )
+        if output_format == "jsonl":
+            formatter = get_cli_facade().get_output_formatter()
+            display_lines(formatter.iter_functions_jsonl(results))
+        else:
+            display_columnar(results, output_format, functions=True)
+        return
+
     # Analyze and get results
     all_results, _ = CommonProcessor.analyze_and_get_results(
-        final_paths, recursive, final_exclude, final_include, verbose
+        final_paths,
+        recursive,
+        final_exclude,
+        final_include,
+        verbose,
+        **CommonProcessor.extract_execution_options(merged_config),
+        changed_since=changed_since,
+        staged=staged,
+        shard=shard,
     )
 
-    cli_facade = PresentationLayerServiceFactory.create_cli_facade()
-    formatter = cli_facade.get_output_formatter()
-
     # Format and display function-level output
-    if output_format == "table":
-        output = formatter.format_detailed_table(all_results)
-    elif output_format == "json":
-        output = formatter.format_functions_json(all_results)
-    elif output_format == "csv":
-        output = formatter.format_functions_csv(all_results)
-
-    click.echo(output)
+    display_function_output(all_results, output_format)
 
 
 @main.command()
+@output_options
+@db_options
+@profile_options
+@stats_options
+@shard_options
 @common_options
 def show_summary(
     paths: tuple[str, ...],
@@ -259,6 +460,14 @@ def show_summary(
     include: tuple[str, ...],
     verbose: bool,
     log_level: str,
+    jobs: Optional[Union[int, str]],
+    cache: Optional[bool],
+    engine: Optional[str],
+    default_excludes: Optional[bool],
+    respect_gitignore: Optional[bool],
+    changed_since: Optional[str],
+    staged: bool,
+    shard: Optional["Shard"],
 ) -> None:
     """Show aggregated complexity statistics
 
@@ -283,7 +492,15 @@ def show_summary(
     """
     # Setup and load configuration
     merged_config = CommonProcessor.setup_and_load_config(
-        log_level, exclude=exclude, include=include, paths=paths
+        log_level,
+        exclude=exclude,
+        include=include,
+        paths=paths,
+        jobs=jobs,
+        cache=cache,
+        engine=engine,
+        default_excludes=default_excludes,
+        respect_gitignore=respect_gitignore,
     )
 
     # Extract final configuration
@@ -297,15 +514,528 @@ def show_summary(
 
     # Analyze and get results
     all_results, _ = CommonProcessor.analyze_and_get_results(
-        final_paths, recursive, final_exclude, final_include, verbose
+        final_paths,
+        recursive,
+        final_exclude,
+        final_include,
+        verbose,
+        **CommonProcessor.extract_execution_options(merged_config),
+        changed_since=changed_since,
+        staged=staged,
+        shard=shard,
     )
 
-    cli_facade = PresentationLayerServiceFactory.create_cli_facade()
-    formatter = cli_facade.get_output_formatter()
-
     # Show only summary
-    summary_output = formatter.format_summary(all_results)
-    click.echo(summary_output)
+    display_summary(all_results)
+
+
+@main.command("merge-reports")
+@click.argument(
+    "reports",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(
+        ["table", "json", "jsonl", "csv", "detailed", "summary"], case_sensitive=False
+    ),
+    default="table",
+    help="Output format: table|json|jsonl|csv|detailed|summary (default: table)",
+)
+@click.option(
+    "--check",
+    "check_thresholds",
+    is_flag=True,
+    help="Check the merged results against the thresholds like 'cccy check'",
+)
+@analysis_options
+@output_options
+@db_options
+@profile_options
+@stats_options
+@click.option("--log-level", default="WARNING", help="Set logging level")
+def merge_reports(
+    reports: tuple[str, ...],
+    output_format: str,
+    check_thresholds: bool,
+    max_complexity: Optional[int],
+    max_cognitive: Optional[int],
+    log_level: str,
+) -> None:
+    """Combine JSON reports of sharded runs into one result
+
+    \b
+    PURPOSE:
+      Join the reports of 'show-list --shard I/N --format json' jobs.
+      Files reported by several jobs are counted once.
+      With --check, exit with code 1 if any file exceeds the thresholds.
+
+    \b
+    EXAMPLES:
+      cccy show-list --shard 1/2 --format json src/ > part1.json
+      cccy show-list --shard 2/2 --format json src/ > part2.json
+      cccy merge-reports part1.json part2.json            # Combined table
+      cccy merge-reports --format summary part*.json      # Combined summary
+      cccy merge-reports --check part*.json               # Combined check
+      cccy merge-reports --db results.sqlite part*.json   # Record the combined run
+    """
+    merged_config = CommonProcessor.setup_and_load_config(
+        log_level, max_complexity, max_cognitive
+    )
+    results = measure_phase("read", load_reports, reports)
+    record_results(results)
+
+    if check_thresholds:
+        validate_required_config(merged_config)
+        final_max_complexity, final_max_cognitive, *_ = (
+            CommonProcessor.extract_final_config(merged_config)
+        )
+        check_results(results, final_max_complexity, final_max_cognitive)
+        return
+
+    formatter = get_cli_facade().get_output_formatter()
+    if output_format.lower() == "jsonl":
+        display_lines(formatter.iter_jsonl(results))
+    elif output_format.lower() == "summary":
+        display_summary(results)
+    else:
+        format_and_display_output(results, output_format)
+
+
+@main.command()
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "summary"], case_sensitive=False),
+    default="table",
+    help="Output format",
+)
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=0.2,
+    metavar="SECONDS",
+    help="Wait until changes stop arriving for this long before re-analyzing",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="Poll for changes instead of using inotify",
+)
+@click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    metavar="SECONDS",
+    help="Seconds between scans when polling",
+)
+@common_options
+def watch(
+    paths: tuple[str, ...],
+    output_format: str,
+    debounce: float,
+    poll: bool,
+    poll_interval: float,
+    recursive: bool,
+    exclude: tuple[str, ...],
+    include: tuple[str, ...],
+    verbose: bool,
+    log_level: str,
+    jobs: Optional[Union[int, str]],
+    cache: Optional[bool],
+    engine: Optional[str],
+    default_excludes: Optional[bool],
+    respect_gitignore: Optional[bool],
+    changed_since: Optional[str],
+    staged: bool,
+) -> None:
+    """Re-analyze files as they change
+
+    \b
+    PURPOSE:
+      Keep complexity results on screen while you edit.
+      Only the files reported changed are analyzed again.
+      Uses inotify on Linux and falls back to polling elsewhere.
+
+    \b
+    EXAMPLES:
+      cccy watch                        # Watch the configured paths
+      cccy watch src/                   # Watch a specific directory
+      cccy watch --format summary src/  # Keep the summary on screen
+      cccy watch --poll src/            # Poll, e.g. on network filesystems
+    """
+    if changed_since is not None or staged:
+        raise click.UsageError("--changed-since and --staged cannot be used with watch")
+
+    # Setup and load configuration
+    merged_config = CommonProcessor.setup_and_load_config(
+        log_level,
+        exclude=exclude,
+        include=include,
+        paths=paths,
+        jobs=jobs,
+        cache=cache,
+        engine=engine,
+        default_excludes=default_excludes,
+        respect_gitignore=respect_gitignore,
+    )
+
+    # Extract final configuration
+    (
+        _,  # max_complexity not needed for watch
+        _,  # max_cognitive not needed for watch
+        final_exclude,
+        final_include,
+        final_paths,
+    ) = CommonProcessor.extract_final_config(merged_config)
+
+    watch_service = create_watch_service(
+        tuple(final_paths),
+        recursive=recursive,
+        exclude_patterns=final_exclude,
+        include_patterns=final_include,
+        verbose=verbose,
+        debounce=debounce,
+        poll_interval=poll_interval if poll else None,
+        **CommonProcessor.extract_execution_options(merged_config),
+    )
+    run_watch(watch_service, output_format.lower())
+
+
+@main.command()
+@analysis_options
+@click.option(
+    "--engine",
+    type=click.Choice(["builtin", "library"], case_sensitive=False),
+    default=None,
+    help="Complexity engine (default: builtin)",
+)
+@click.option("--log-level", default="WARNING", help="Set logging level")
+@click.option("--stdio", is_flag=True, hidden=True)
+def lsp(
+    max_complexity: Optional[int],
+    max_cognitive: Optional[int],
+    engine: Optional[str],
+    log_level: str,
+    stdio: bool,  # noqa: ARG001
+) -> None:
+    """Run a Language Server Protocol server on stdio
+
+    \b
+    PURPOSE:
+      Show complexity while you type, without saving.
+      Code lenses show both scores above every function.
+      Functions over the thresholds are reported as warnings.
+
+    \b
+    EXAMPLES:
+      cccy lsp                                        # Thresholds from pyproject.toml
+      cccy lsp --max-complexity 10 --max-cognitive 7  # Explicit thresholds
+
+    \b
+    NOTES:
+      Without a configured --max-complexity, 10 is used.
+      --max-cognitive is only checked when it is set.
+    """
+    from cccy.presentation.cli.lsp import (  # noqa: PLC0415
+        DEFAULT_MAX_COMPLEXITY,
+        Thresholds,
+        run_language_server,
+    )
+
+    merged_config = CommonProcessor.setup_and_load_config(
+        log_level,
+        max_complexity=max_complexity,
+        max_cognitive=max_cognitive,
+        engine=engine,
+    )
+    final_max_complexity, final_max_cognitive, _, _, _ = (
+        CommonProcessor.extract_final_config(merged_config)
+    )
+    analyzer, _ = create_analyzer_service(
+        engine=CommonProcessor.extract_execution_options(merged_config)["engine"]
+    )
+    thresholds = Thresholds(
+        DEFAULT_MAX_COMPLEXITY
+        if final_max_complexity is None
+        else final_max_complexity,
+        final_max_cognitive,
+    )
+    sys.exit(run_language_server(analyzer, thresholds))
+
+
+def query_options(f: F) -> F:
+    """記録した実行を問い合わせるコマンドの共通オプションデコレーター。"""
+    f = click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["table", "json", "csv"], case_sensitive=False),
+        default="table",
+        help="Output format: table|json|csv (default: table)",
+    )(f)
+    return click.option(
+        "--db",
+        metavar="PATH",
+        required=True,
+        type=click.Path(exists=True, dir_okay=False),
+        help="SQLite database written with --db",
+    )(f)
+
+
+def metric_option(f: F) -> F:
+    """問い合わせで比較する指標のオプションデコレーター。"""
+    return click.option(
+        "--metric",
+        type=click.Choice(["cyclomatic", "cognitive"], case_sensitive=False),
+        default="cyclomatic",
+        show_default=True,
+        help="Complexity metric to rank or compare by",
+    )(f)
+
+
+def run_option(f: F) -> F:
+    """問い合わせる実行のオプションデコレーター。"""
+    return click.option(
+        "--run",
+        "run_id",
+        type=int,
+        metavar="ID",
+        default=None,
+        help="Run to query (default: the latest run)",
+    )(f)
+
+
+@main.group()
+def query() -> None:
+    """Query the runs recorded with --db
+
+    \b
+    PURPOSE:
+      Answer common questions from the history of recorded runs.
+      check, show-* and merge-reports record a run with --db PATH;
+      files whose results did not change are stored only once.
+
+    \b
+    EXAMPLES:
+      cccy check --db results.sqlite src/                    # Record a run
+      cccy query runs --db results.sqlite                    # List recorded runs
+      cccy query top-functions --db results.sqlite -n 20     # 20 most complex functions
+      cccy query files-over --db results.sqlite --threshold 10
+      cccy query history --db results.sqlite parse_config    # One function over time
+    """
+
+
+@query.command(name="runs")
+@query_options
+@click.option(
+    "--limit",
+    "-n",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Number of runs to show",
+)
+def query_runs(db: str, output_format: str, limit: int) -> None:
+    """List recorded runs, newest first"""
+    from cccy.domain.entities.history import StoredRun  # noqa: PLC0415
+
+    with result_store(db) as store:
+        rows = store.list_runs(limit)
+    display_rows(StoredRun._fields, rows, output_format.lower())
+
+
+@query.command(name="top-functions")
+@query_options
+@metric_option
+@run_option
+@click.option(
+    "--limit",
+    "-n",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of functions to show",
+)
+def query_top_functions(
+    db: str, output_format: str, metric: str, run_id: Optional[int], limit: int
+) -> None:
+    """Show the most complex functions of a run"""
+    from cccy.domain.entities.history import StoredFunction  # noqa: PLC0415
+
+    with result_store(db) as store:
+        rows = store.top_functions(metric.lower(), limit, run_id)
+    display_rows(StoredFunction._fields, rows, output_format.lower())
+
+
+@query.command(name="files-over")
+@query_options
+@metric_option
+@run_option
+@click.option(
+    "--threshold",
+    type=int,
+    required=True,
+    metavar="N",
+    help="Show files with a function scoring more than N",
+)
+def query_files_over(
+    db: str, output_format: str, metric: str, run_id: Optional[int], threshold: int
+) -> None:
+    """Show the files of a run with a function over a threshold"""
+    from cccy.domain.entities.history import StoredFile  # noqa: PLC0415
+
+    with result_store(db) as store:
+        rows = store.files_over(metric.lower(), threshold, run_id)
+    display_rows(StoredFile._fields, rows, output_format.lower())
+
+
+@query.command(name="history")
+@query_options
+@click.argument("name")
+@click.option(
+    "--file",
+    "file_path",
+    metavar="PATH",
+    default=None,
+    help="Only the function in this file (as recorded)",
+)
+def query_history(
+    db: str, output_format: str, name: str, file_path: Optional[str]
+) -> None:
+    """Show the complexity of a function in every recorded run"""
+    from cccy.domain.entities.history import StoredFunction  # noqa: PLC0415
+
+    with result_store(db) as store:
+        rows = store.function_history(name, file_path)
+    display_rows(StoredFunction._fields, rows, output_format.lower())
+
+
+@main.group()
+def cache() -> None:
+    """Manage the on-disk result cache
+
+    \b
+    PURPOSE:
+      Inspect or reset the cache used by --cache (or cache = true).
+      Entries are keyed by file content, cccy version and calculators.
+
+    \b
+    EXAMPLES:
+      cccy cache stats   # Show entry count and size
+      cccy cache clear   # Remove all cached results
+    """
+
+
+@cache.command(name="clear")
+def cache_clear() -> None:
+    """Remove all cached analysis results"""
+    cli_facade = get_cli_facade()
+    removed = cli_facade.clear_cache()
+    click.echo(f"Removed {removed} cache entries.")
+
+
+@cache.command(name="stats")
+def cache_stats() -> None:
+    """Show result cache statistics"""
+    cli_facade = get_cli_facade()
+    display_cache_stats(cli_facade.get_cache_stats())
+
+
+@main.group()
+def daemon() -> None:
+    """Keep cccy running in the background for fast repeated runs
+
+    \b
+    PURPOSE:
+      Start a long-lived process on a Unix socket that keeps the
+      analysis engine, parsed configuration and an in-memory result
+      cache warm. While it is running, check and show-* commands are
+      forwarded to it automatically (set CCCY_NO_DAEMON=1 to opt out).
+
+    \b
+    EXAMPLES:
+      cccy daemon start    # Start in the background
+      cccy daemon status   # Show pid, uptime and cache statistics
+      cccy daemon stop     # Stop the daemon
+    """
+
+
+def socket_option(f: F) -> F:
+    """デーモンのソケットのパスのオプションデコレーター。"""
+    return click.option(
+        "--socket",
+        "socket_path",
+        metavar="PATH",
+        default=default_socket_path,
+        show_default="$CCCY_DAEMON_SOCKET or a per-user runtime directory",
+        help="Unix socket of the daemon",
+    )(f)
+
+
+@daemon.command(name="start")
+@socket_option
+@click.option(
+    "--foreground", is_flag=True, help="Run in this process instead of detaching"
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    default=None,
+    help="Exit after this many seconds without requests (default: never)",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=1),
+    metavar="N",
+    default=DEFAULT_CACHE_SIZE,
+    show_default=True,
+    help="Maximum number of file results kept in memory",
+)
+def daemon_start(
+    socket_path: str, foreground: bool, idle_timeout: Optional[float], cache_size: int
+) -> None:
+    """Start the analysis daemon"""
+    from cccy.presentation.cli.daemon_server import (  # noqa: PLC0415
+        run_daemon,
+        spawn_daemon,
+    )
+
+    if not is_supported():
+        raise click.ClickException("the daemon requires Unix domain sockets")
+    status = request(socket_path, "status")
+    if status is not None:
+        click.echo(f"cccy daemon is already running (pid {status['pid']}).")
+        return
+    if foreground:
+        run_daemon(socket_path, cache_size, idle_timeout)
+        return
+    status = spawn_daemon(socket_path, cache_size, idle_timeout)
+    click.echo(f"cccy daemon started (pid {status['pid']}) on {socket_path}")
+
+
+@daemon.command(name="stop")
+@socket_option
+def daemon_stop(socket_path: str) -> None:
+    """Stop the analysis daemon"""
+    if request(socket_path, "stop") is None:
+        click.echo("cccy daemon is not running.")
+        return
+    click.echo("cccy daemon stopped.")
+
+
+@daemon.command(name="status")
+@socket_option
+def daemon_status(socket_path: str) -> None:
+    """Show whether the daemon is running (exit code 1 if not)"""
+    status = request(socket_path, "status")
+    if status is None:
+        click.echo("cccy daemon is not running.")
+        sys.exit(1)
+    display_daemon_status(status)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,58 @@
 """Service factory for presentation layer to maintain clean architecture."""
 
-from typing import Optional, Union
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, TextIO, Union
 
 from cccy.application.services.analysis_service import AnalyzerService
 from cccy.application.services.cli_facade_service import CliFacadeService
+from cccy.application.services.watch_service import WatchService
 from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.interfaces.caches import ResultCache
+from cccy.domain.interfaces.calculators import ComplexityCalculator
 from cccy.domain.interfaces.cli_services import (
     AnalyzerFactoryInterface,
     AnalyzerServiceInterface,
+    CacheServiceInterface,
     ConfigServiceInterface,
     LoggingServiceInterface,
     OutputFormatterInterface,
     ResultFilterInterface,
+    ResultStoreFactoryInterface,
 )
+from cccy.domain.interfaces.executors import FileAnalysisExecutor
+from cccy.domain.interfaces.stores import ResultStore
+from cccy.domain.interfaces.watchers import FileWatcher
+from cccy.domain.services.analysis_stats import (
+    AnalysisStats,
+    InstrumentedComplexityAnalyzer,
+)
+from cccy.domain.services.changed_lines import ChangedLines
 from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.file_walker import is_default_excluded_dir
 from cccy.infrastructure.calculators.concrete_calculators import (
-    CognitiveComplexityCalculator,
-    CyclomaticComplexityCalculator,
+    ComplexityCalculatorFactory,
 )
 from cccy.infrastructure.config.manager import CccyConfig
 from cccy.infrastructure.formatters.output import OutputFormatter
 from cccy.infrastructure.logging.config import setup_logging
 
+if TYPE_CHECKING:
+    from cccy.domain.services.profiling import ProfileSession
+    from cccy.infrastructure.cache.file_cache import FileSystemResultCache
+    from cccy.infrastructure.cache.memory_cache import MemoryResultCache
+
+logger = logging.getLogger(__name__)
+
+# Infrastructure that only some options need (the result cache, the process
+# pool, git and the result store) is imported where it is used to keep CLI startup fast.
+
+# In-memory result caches kept for the lifetime of the process, by engine.
+# Only long-lived processes such as the daemon enable them.
+_memory_caches: Optional[dict[str, "MemoryResultCache"]] = None
+_memory_cache_size = 0
+
 
 class _PresentationLoggingService(LoggingServiceInterface):
     """Logging service implementation for presentation layer."""
@@ -41,6 +72,11 @@ class _PresentationConfigService(ConfigServiceInterface):
         exclude: Optional[tuple[str, ...]] = None,
         include: Optional[tuple[str, ...]] = None,
         paths: Optional[tuple[str, ...]] = None,
+        jobs: Optional[Union[int, str]] = None,
+        cache: Optional[bool] = None,
+        engine: Optional[str] = None,
+        default_excludes: Optional[bool] = None,
+        respect_gitignore: Optional[bool] = None,
     ) -> dict[str, Union[str, int, list[str], None]]:
         """Load and merge configuration options."""
         config = CccyConfig()
@@ -50,24 +86,157 @@ class _PresentationConfigService(ConfigServiceInterface):
             exclude=list(exclude) if exclude else None,
             include=list(include) if include else None,
             paths=list(paths) if paths else None,
+            jobs=jobs,
+            cache=cache,
+            engine=engine,
+            default_excludes=default_excludes,
+            respect_gitignore=respect_gitignore,
+        )
+
+
+def _create_executor(jobs: Union[int, str]) -> Optional[FileAnalysisExecutor]:
+    """Create a process pool executor when more than one worker is requested."""
+    if jobs == 1:
+        return None  # Serial analysis never needs multiprocessing
+
+    from cccy.infrastructure.executors.process_pool import (  # noqa: PLC0415
+        ProcessPoolFileAnalysisExecutor,
+        resolve_worker_count,
+    )
+
+    worker_count = resolve_worker_count(jobs)
+    if worker_count > 1:
+        return ProcessPoolFileAnalysisExecutor(max_workers=worker_count)
+    return None
+
+
+def _create_result_cache(
+    engine: str,
+    calculators: tuple[ComplexityCalculator, ComplexityCalculator],
+    cache_dir: Optional[str],
+    cache_max_size: Optional[int],
+) -> Optional[ResultCache]:
+    """Create the on-disk cache and/or the process-wide in-memory cache."""
+    disk_cache = None
+    if cache_dir is not None:
+        from cccy.infrastructure.cache.file_cache import (  # noqa: PLC0415
+            FileSystemResultCache,
+        )
+
+        namespace = FileSystemResultCache.build_namespace(*calculators)
+        disk_cache = FileSystemResultCache(Path(cache_dir), namespace, cache_max_size)
+
+    if _memory_caches is None:
+        return disk_cache
+
+    from cccy.infrastructure.cache.memory_cache import (  # noqa: PLC0415
+        MemoryResultCache,
+        TieredResultCache,
+    )
+
+    memory_cache = _memory_caches.get(engine)
+    if memory_cache is None:
+        memory_cache = _memory_caches[engine] = MemoryResultCache(_memory_cache_size)
+    if disk_cache is None:
+        return memory_cache
+    return TieredResultCache(memory_cache, disk_cache)
+
+
+def _create_file_watcher(
+    roots: list[Path], default_excludes: bool, poll_interval: Optional[float]
+) -> FileWatcher:
+    """Create an inotify watcher, falling back to polling where it is unavailable."""
+    exclude_dir = is_default_excluded_dir if default_excludes else lambda _: False
+
+    if poll_interval is None:
+        from cccy.infrastructure.watchers.inotify import (  # noqa: PLC0415
+            InotifyFileWatcher,
         )
 
+        try:
+            return InotifyFileWatcher(roots, exclude_dir)
+        except OSError as e:
+            logger.warning("inotify is unavailable (%s); polling for changes", e)
+
+    from cccy.infrastructure.watchers.polling import (  # noqa: PLC0415
+        DEFAULT_POLL_INTERVAL,
+        PollingFileWatcher,
+    )
+
+    return PollingFileWatcher(
+        roots, exclude_dir, poll_interval or DEFAULT_POLL_INTERVAL
+    )
+
 
 class _PresentationAnalyzerFactory(AnalyzerFactoryInterface):
     """Analyzer factory implementation for presentation layer."""
 
     def create_analyzer_service(
-        self, max_complexity: Optional[int] = None
+        self,
+        max_complexity: Optional[int] = None,
+        jobs: Union[int, str] = 1,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        engine: str = "builtin",
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+        changed_since: Optional[str] = None,
+        staged: bool = False,
+        diff_ref: Optional[str] = None,
+        stats: Optional[AnalysisStats] = None,
+        profile: Optional["ProfileSession"] = None,
     ) -> tuple[ComplexityAnalyzer, AnalyzerServiceInterface]:
-        """Create analyzer and service instances."""
-        cyclomatic_calculator = CyclomaticComplexityCalculator()
-        cognitive_calculator = CognitiveComplexityCalculator()
+        """Create analyzer and service instances.
+
+        With ``stats``, the analyzer times every phase into it; without, the
+        plain analyzer is used so that analysis carries no measuring overhead.
+        With ``profile``, parallel workers profile their chunks and the
+        executor merges the profiles into it.
+        """
+        cyclomatic_calculator, cognitive_calculator = (
+            ComplexityCalculatorFactory.create_calculators(engine)
+        )
 
-        analyzer = ComplexityAnalyzer(
-            cyclomatic_calculator=cyclomatic_calculator,
-            cognitive_calculator=cognitive_calculator,
-            max_complexity=max_complexity,
+        result_cache = _create_result_cache(
+            engine,
+            (cyclomatic_calculator, cognitive_calculator),
+            cache_dir,
+            cache_max_size,
+        )
+
+        executor = _create_executor(jobs)
+
+        changed_files = None
+        changed_lines = None
+        if diff_ref is not None or changed_since is not None or staged:
+            from cccy.infrastructure.vcs.git import (  # noqa: PLC0415
+                GitChangedFilesProvider,
+            )
+
+            provider = GitChangedFilesProvider()
+            if diff_ref is not None:
+                changed_lines = ChangedLines(provider.changed_lines(diff_ref, staged))
+                changed_files = changed_lines.files()
+            else:
+                changed_files = provider.changed_files(changed_since, staged)
+
+        options: dict[str, Any] = {
+            "max_complexity": max_complexity,
+            "executor": executor,
+            "result_cache": result_cache,
+            "default_excludes": default_excludes,
+            "respect_gitignore": respect_gitignore,
+            "changed_files": changed_files,
+            "changed_lines": changed_lines,
+        }
+        analyzer = (
+            ComplexityAnalyzer(cyclomatic_calculator, cognitive_calculator, **options)
+            if stats is None
+            else InstrumentedComplexityAnalyzer(
+                stats, cyclomatic_calculator, cognitive_calculator, **options
+            )
         )
+        analyzer.profile = profile
         service = AnalyzerService(analyzer)
         return analyzer, service
 
@@ -83,30 +252,140 @@ class _PresentationOutputFormatter(OutputFormatterInterface):
         """Format results as table."""
         return self._formatter.format_table(results)
 
+    def write_table(self, results: list[FileComplexityResult], stream: TextIO) -> None:
+        """Write results as table to a text stream."""
+        self._formatter.write_table(results, stream)
+
     def format_detailed_table(self, results: list[FileComplexityResult]) -> str:
         """Format results as detailed table."""
         return self._formatter.format_detailed_table(results)
 
+    def write_detailed_table(
+        self, results: list[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results as detailed table to a text stream."""
+        self._formatter.write_detailed_table(results, stream)
+
     def format_json(self, results: list[FileComplexityResult]) -> str:
         """Format results as JSON."""
         return self._formatter.format_json(results)
 
+    def write_json(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results as JSON to a text stream, one file at a time."""
+        self._formatter.write_json(results, stream)
+
+    def iter_jsonl(self, results: Iterable[FileComplexityResult]) -> Iterator[str]:
+        """Format results as JSON Lines, one line per file."""
+        return self._formatter.iter_jsonl(results)
+
     def format_csv(self, results: list[FileComplexityResult]) -> str:
         """Format results as CSV."""
         return self._formatter.format_csv(results)
 
+    def write_csv(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results as CSV to a text stream."""
+        self._formatter.write_csv(results, stream)
+
     def format_functions_json(self, results: list[FileComplexityResult]) -> str:
         """Format function-level results as JSON."""
         return self._formatter.format_functions_json(results)
 
+    def write_functions_json(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write function-level results as JSON to a text stream."""
+        self._formatter.write_functions_json(results, stream)
+
+    def iter_functions_jsonl(
+        self, results: Iterable[FileComplexityResult]
+    ) -> Iterator[str]:
+        """Format function-level results as JSON Lines, one line per function."""
+        return self._formatter.iter_functions_jsonl(results)
+
     def format_functions_csv(self, results: list[FileComplexityResult]) -> str:
         """Format function-level results as CSV."""
         return self._formatter.format_functions_csv(results)
 
+    def write_functions_csv(
+        self, results: Iterable[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write function-level results as CSV to a text stream."""
+        self._formatter.write_functions_csv(results, stream)
+
+    def format_rows(
+        self, headers: list[str], rows: Sequence[Sequence[object]], output_format: str
+    ) -> str:
+        """Format arbitrary rows as a table, JSON or CSV."""
+        return self._formatter.format_rows(headers, rows, output_format)
+
+    def write_rows(
+        self,
+        headers: list[str],
+        rows: Sequence[Sequence[object]],
+        output_format: str,
+        stream: TextIO,
+    ) -> None:
+        """Write arbitrary rows as a table, JSON or CSV to a text stream."""
+        self._formatter.write_rows(headers, rows, output_format, stream)
+
+    def write_columnar(
+        self,
+        results: Iterable[FileComplexityResult],
+        sink: BinaryIO,
+        output_format: str,
+        functions: bool = False,
+    ) -> int:
+        """Write results as Parquet or Arrow IPC, one row group at a time."""
+        # pyarrow is an optional extra, imported before the first result is analyzed
+        from cccy.infrastructure.formatters.columnar import (  # noqa: PLC0415
+            write_columnar,
+        )
+
+        return write_columnar(results, sink, output_format, functions=functions)
+
     def format_summary(self, results: list[FileComplexityResult]) -> str:
         """Format results summary."""
         return self._formatter.format_summary(results)
 
+    def write_summary(
+        self, results: list[FileComplexityResult], stream: TextIO
+    ) -> None:
+        """Write results summary to a text stream."""
+        self._formatter.write_summary(results, stream)
+
+
+class _PresentationCacheService(CacheServiceInterface):
+    """Result cache management service implementation for presentation layer."""
+
+    def _create_cache(self) -> "FileSystemResultCache":
+        """Create a cache bound to the configured directory and size limit."""
+        from cccy.infrastructure.cache.file_cache import (  # noqa: PLC0415
+            FileSystemResultCache,
+        )
+
+        config = CccyConfig()
+        return FileSystemResultCache(
+            config.get_cache_dir(), namespace="", max_size=config.get_cache_max_size()
+        )
+
+    def clear_cache(self) -> int:
+        """Remove all cache entries."""
+        return self._create_cache().clear()
+
+    def get_cache_stats(self) -> dict[str, Union[str, int]]:
+        """Get cache statistics."""
+        stats = self._create_cache().stats()
+        return {
+            "directory": stats.directory,
+            "entries": stats.entries,
+            "total_size": stats.total_size,
+            "max_size": stats.max_size,
+        }
+
 
 class _PresentationResultFilter(ResultFilterInterface):
     """Result filter implementation for presentation layer."""
@@ -132,9 +411,38 @@ class _PresentationResultFilter(ResultFilterInterface):
         return failed_results
 
 
+class _PresentationResultStoreFactory(ResultStoreFactoryInterface):
+    """Result store factory implementation for presentation layer."""
+
+    def open_result_store(self, location: str) -> ResultStore:
+        """Open the SQLite result store at location."""
+        from cccy.infrastructure.stores.sqlite_store import (  # noqa: PLC0415
+            SQLiteResultStore,
+        )
+
+        return SQLiteResultStore(location)
+
+
 class PresentationLayerServiceFactory:
     """Factory for creating services in presentation layer."""
 
+    @staticmethod
+    def enable_memory_cache(max_entries: int) -> None:
+        """Share in-memory result caches between all analyzers of this process."""
+        global _memory_caches, _memory_cache_size  # noqa: PLW0603
+        _memory_caches = {}
+        _memory_cache_size = max_entries
+
+    @staticmethod
+    def get_memory_cache_stats() -> dict[str, int]:
+        """Get entry and hit counts of the in-memory result caches."""
+        caches = list((_memory_caches or {}).values())
+        return {
+            "entries": sum(len(cache) for cache in caches),
+            "hits": sum(cache.hits for cache in caches),
+            "misses": sum(cache.misses for cache in caches),
+        }
+
     @staticmethod
     def create_cli_facade() -> CliFacadeService:
         """Create CLI facade with all dependencies."""
@@ -144,6 +452,51 @@ class PresentationLayerServiceFactory:
             analyzer_factory=_PresentationAnalyzerFactory(),
             output_formatter=_PresentationOutputFormatter(),
             result_filter=_PresentationResultFilter(),
+            cache_service=_PresentationCacheService(),
+            result_store_factory=_PresentationResultStoreFactory(),
+        )
+
+    @staticmethod
+    def create_watch_service(
+        paths: tuple[str, ...],
+        recursive: bool = True,
+        exclude_patterns: Optional[list[str]] = None,
+        include_patterns: Optional[list[str]] = None,
+        verbose: bool = False,
+        debounce: float = 0.2,
+        poll_interval: Optional[float] = None,
+        jobs: Union[int, str] = 1,
+        cache_dir: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
+        engine: str = "builtin",
+        default_excludes: bool = True,
+        respect_gitignore: bool = False,
+    ) -> WatchService:
+        """Create a watch service for the given paths.
+
+        Changes are read from inotify, or by polling every ``poll_interval``
+        seconds when it is given or inotify is unavailable.
+        """
+        analyzer, _ = _PresentationAnalyzerFactory().create_analyzer_service(
+            jobs=jobs,
+            cache_dir=cache_dir,
+            cache_max_size=cache_max_size,
+            engine=engine,
+            default_excludes=default_excludes,
+            respect_gitignore=respect_gitignore,
+        )
+        watcher = _create_file_watcher(
+            [Path(path) for path in paths], default_excludes, poll_interval
+        )
+        return WatchService(
+            AnalyzerService(analyzer),
+            watcher,
+            paths,
+            recursive=recursive,
+            exclude_patterns=exclude_patterns,
+            include_patterns=include_patterns,
+            verbose=verbose,
+            debounce=debounce,
         )
 
     @staticmethod
@@ -166,6 +519,16 @@ class PresentationLayerServiceFactory:
         """Create output formatter instance."""
         return _PresentationOutputFormatter()
 
+    @staticmethod
+    def create_cache_service() -> CacheServiceInterface:
+        """Create result cache management service instance."""
+        return _PresentationCacheService()
+
+    @staticmethod
+    def create_result_store_factory() -> ResultStoreFactoryInterface:
+        """Create result store factory instance."""
+        return _PresentationResultStoreFactory()
+
     @staticmethod
     def create_result_filter() -> ResultFilterInterface:
         """Create result filter instance."""
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from cccy.application.services.analysis_service import AnalyzerService
 from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
 from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.sharding import Shard
 
 
 class TestAnalyzerService:
@@ -98,6 +99,87 @@ class TestAnalyzerService:
         assert len(results) >= 1
         assert any("simple.py" in result.file_path for result in results)
 
+    def test_iter_analyze_paths_yields_incrementally(self) -> None:
+        """Test that results are yielded before the remaining files are analyzed."""
+        # Arrange
+        cyclomatic_calc, cognitive_calc = self._create_mock_calculators()
+        analyzer = ComplexityAnalyzer(
+            cyclomatic_calculator=cyclomatic_calc, cognitive_calculator=cognitive_calc
+        )
+        service = AnalyzerService(analyzer)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a.py", "b.py", "c.py"):
+                (Path(tmpdir) / name).write_text("def simple_function(): pass\n")
+
+            # Act
+            results = service.iter_analyze_paths((tmpdir,), True, [], [], False)
+            first = next(results)
+            calls_after_first = cyclomatic_calc.calculate.call_count
+            rest = list(results)
+
+            # Assert
+            assert Path(first.file_path).name == "a.py"
+            assert calls_after_first == 1
+            assert [Path(r.file_path).name for r in rest] == ["b.py", "c.py"]
+
+    def test_select_shard_restricts_analysis(self) -> None:
+        """Test that the shards together analyze each file exactly once."""
+        # Arrange
+        cyclomatic_calc, cognitive_calc = self._create_mock_calculators()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ("a.py", "b.py", "c.py", "skip.py"):
+                (root / name).write_text("def simple_function(): pass\n" * len(name))
+            paths = (str(root), str(root / "a.py"))
+
+            # Act
+            analyzed = []
+            for number in (1, 2):
+                service = AnalyzerService(
+                    ComplexityAnalyzer(
+                        cyclomatic_calculator=cyclomatic_calc,
+                        cognitive_calculator=cognitive_calc,
+                    )
+                )
+                files = service.select_shard(paths, Shard(number, 2), True, ["skip.py"])
+                results = service.analyze_paths(
+                    paths, True, ["skip.py"], [], False, files=files
+                )
+                assert len({result.file_path for result in results}) == len(files)
+                assert service.analyzer.changed_files is None
+                analyzed += [Path(result.file_path).name for result in results]
+
+            # Assert
+            assert sorted(set(analyzed)) == ["a.py", "b.py", "c.py"]
+            assert analyzed.count("b.py") == analyzed.count("c.py") == 1
+
+    def test_analyze_paths_files_restricts_analysis(self) -> None:
+        """Test that files narrows the analysis without touching changed_files."""
+        # Arrange
+        cyclomatic_calc, cognitive_calc = self._create_mock_calculators()
+        analyzer = ComplexityAnalyzer(
+            cyclomatic_calculator=cyclomatic_calc, cognitive_calculator=cognitive_calc
+        )
+        service = AnalyzerService(analyzer)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            for name in ("a.py", "b.py", "c.py"):
+                (root / name).write_text("def simple_function(): pass\n")
+            analyzer.changed_files = frozenset({root / "a.py", root / "b.py"})
+            paths = (str(root), str(root / "c.py"))
+
+            # Act
+            results = service.analyze_paths(
+                paths, True, [], [], False, files=[root / "b.py", root / "c.py"]
+            )
+
+            # Assert
+            assert [Path(result.file_path).name for result in results] == ["b.py"]
+            assert analyzer.changed_files == {root / "a.py", root / "b.py"}
+
     def test_analyze_paths_nonexistent(self) -> None:
         """Test analyzing nonexistent path."""
         # Arrange
@@ -0,0 +1,136 @@
+"""Tests for the watch service."""
+
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from cccy.application.services.analysis_service import AnalyzerService
+from cccy.application.services.watch_service import WatchService
+from cccy.domain.interfaces.watchers import FileWatcher
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.infrastructure.calculators.concrete_calculators import (
+    ComplexityCalculatorFactory,
+)
+
+
+class _ScriptedWatcher(FileWatcher):
+    """Watcher that returns prepared batches of changes."""
+
+    def __init__(self, batches: list[set[Path]]) -> None:
+        self.batches = batches
+        self.timeouts: list[Optional[float]] = []
+        self.closed = False
+
+    def read_changes(self, timeout: Optional[float] = None) -> set[Path]:
+        self.timeouts.append(timeout)
+        return self.batches.pop(0) if self.batches else set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory with two Python files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "a.py").write_text("def a():\n    return 1\n")
+        (root / "b.py").write_text("def b():\n    return 2\n")
+        yield root
+
+
+def _create_service(root: Path, watcher: FileWatcher) -> WatchService:
+    analyzer = ComplexityAnalyzer(*ComplexityCalculatorFactory.create_calculators())
+    return WatchService(
+        AnalyzerService(analyzer), watcher, [str(root)], exclude_patterns=["*skip*"]
+    )
+
+
+class TestWatchService:
+    """Test cases for WatchService."""
+
+    def test_scan_analyzes_all_files(self, project: Path) -> None:
+        """Test the initial scan."""
+        # Arrange
+        service = _create_service(project, _ScriptedWatcher([]))
+
+        # Act
+        count = service.scan()
+
+        # Assert
+        assert count == 2
+        assert [Path(r.file_path).name for r in service.results] == ["a.py", "b.py"]
+
+    def test_apply_reanalyzes_only_changed_files(self, project: Path) -> None:
+        """Test that a changed file is updated and the others are kept."""
+        # Arrange
+        service = _create_service(project, _ScriptedWatcher([]))
+        service.scan()
+        kept = service.results[1]
+        (project / "a.py").write_text("def a(x):\n    if x:\n        return 1\n")
+
+        # Act
+        update = service.apply({project / "a.py"})
+
+        # Assert
+        assert [Path(r.file_path).name for r in update.updated] == ["a.py"]
+        assert update.removed == ()
+        assert service.results[0].functions[0].cyclomatic_complexity == 2
+        assert service.results[1] is kept
+        assert update.updated[0] is service.results[0]
+
+    def test_apply_handles_new_directories_and_removals(self, project: Path) -> None:
+        """Test directory changes, deleted files and excluded files."""
+        # Arrange
+        service = _create_service(project, _ScriptedWatcher([]))
+        service.scan()
+        package = project / "pkg"
+        package.mkdir()
+        (package / "c.py").write_text("def c():\n    pass\n")
+        (package / "skip_me.py").write_text("def d():\n    pass\n")
+        (project / "b.py").unlink()
+
+        # Act
+        update = service.apply({package, project / "b.py"})
+
+        # Assert
+        assert [Path(r.file_path).name for r in update.updated] == ["c.py"]
+        assert [Path(path).name for path in update.removed] == ["b.py"]
+        assert [Path(r.file_path).name for r in service.results] == ["a.py", "c.py"]
+
+    def test_apply_removes_files_under_deleted_directory(self, project: Path) -> None:
+        """Test that a deleted directory removes every result below it."""
+        # Arrange
+        package = project / "pkg"
+        package.mkdir()
+        (package / "c.py").write_text("x = 1\n")
+        service = _create_service(project, _ScriptedWatcher([]))
+        service.scan()
+        (package / "c.py").unlink()
+        package.rmdir()
+
+        # Act
+        update = service.apply({package})
+
+        # Assert
+        assert update.updated == ()
+        assert [Path(path).name for path in update.removed] == ["c.py"]
+
+    def test_wait_for_changes_coalesces_batches(self, project: Path) -> None:
+        """Test that changes arriving in quick succession are merged."""
+        # Arrange
+        first, second = project / "a.py", project / "b.py"
+        watcher = _ScriptedWatcher([set(), {first}, {second}, set(), {first}])
+        service = _create_service(project, watcher)
+
+        # Act
+        changes = service.wait_for_changes()
+
+        # Assert
+        assert changes == {first, second}
+        assert watcher.timeouts[:2] == [None, None]
+        assert watcher.timeouts[2] == pytest.approx(service.debounce)
+        assert watcher.batches == [{first}]
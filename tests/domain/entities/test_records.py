@@ -0,0 +1,78 @@
+"""Tests for the lightweight result records."""
+
+import pickle
+
+from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+
+
+def _make_record() -> FileRecord:
+    return FileRecord(
+        "module.py",
+        (
+            FunctionRecord("outer", 4, 3, 1, 0, 10, 12),
+            FunctionRecord("inner", 2, 5, 3, 4, 6, 8),
+        ),
+    )
+
+
+class TestFileRecord:
+    """Test cases for FileRecord."""
+
+    def test_to_result_computes_totals(self) -> None:
+        """Test that the public result has the same functions and aggregates."""
+        # Arrange
+        record = _make_record()
+
+        # Act
+        result = record.to_result()
+
+        # Assert
+        assert isinstance(result, FileComplexityResult)
+        assert result.file_path == "module.py"
+        assert result.functions[1] == ComplexityResult(
+            name="inner",
+            cyclomatic_complexity=2,
+            cognitive_complexity=5,
+            lineno=3,
+            col_offset=4,
+            end_lineno=6,
+            end_col_offset=8,
+        )
+        assert result.total_cyclomatic == 6
+        assert result.total_cognitive == 8
+        assert result.max_cyclomatic == 4
+        assert result.max_cognitive == 5
+
+    def test_empty_record_has_zero_aggregates(self) -> None:
+        """Test that a file without functions converts with zero totals."""
+        # Act
+        result = FileRecord("empty.py", ()).to_result()
+
+        # Assert
+        assert result.functions == []
+        assert result.total_cyclomatic == 0
+        assert result.max_cognitive == 0
+
+    def test_from_result_round_trip(self) -> None:
+        """Test that converting back from the public result is lossless."""
+        # Arrange
+        record = _make_record()
+
+        # Act
+        restored = FileRecord.from_result(record.to_result())
+
+        # Assert
+        assert restored == record
+
+    def test_pickle_round_trip(self) -> None:
+        """Test that records survive the trip to and from worker processes."""
+        # Arrange
+        record = _make_record()
+
+        # Act
+        restored = pickle.loads(pickle.dumps(record))  # noqa: S301
+
+        # Assert
+        assert restored == record
+        assert isinstance(restored.functions[0], FunctionRecord)
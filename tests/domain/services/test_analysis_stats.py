@@ -0,0 +1,174 @@
+"""Tests for the analysis stats module."""
+
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.domain.services.analysis_stats import (
+    PHASES,
+    AnalysisStats,
+    InstrumentedComplexityAnalyzer,
+)
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.infrastructure.cache.memory_cache import MemoryResultCache
+from cccy.infrastructure.calculators.concrete_calculators import (
+    ComplexityCalculatorFactory,
+)
+
+SOURCE = "def first(x):\n    if x:\n        return 1\n    return 0\n\n\ndef second():\n    pass\n"
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory with two modules and a file that does not parse."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "a.py").write_text(SOURCE)
+        (root / "b.py").write_text(SOURCE * 3)
+        (root / "broken.py").write_text("def broken(:\n")
+        yield root
+
+
+def _record(functions: int) -> FileRecord:
+    return FileRecord(
+        "module.py",
+        tuple(
+            FunctionRecord(f"f{index}", 1, 0, index + 1, 0)
+            for index in range(functions)
+        ),
+    )
+
+
+class TestAnalysisStats:
+    """Test cases for AnalysisStats."""
+
+    def test_nested_phases_are_measured_exclusively(self) -> None:
+        """Test that time in an inner phase is not added to the outer phase."""
+        # Arrange
+        stats = AnalysisStats()
+
+        def outer() -> None:
+            time.sleep(0.01)
+            stats.measure("parse", time.sleep, 0.02)
+
+        # Act
+        stats.measure("analysis", outer)
+        report = stats.to_dict()
+
+        # Assert
+        assert 0.01 <= stats.wall["analysis"] < 0.02
+        assert stats.wall["parse"] >= 0.02
+        total = sum(phase["wall_seconds"] for phase in report["phases"].values())
+        assert total == pytest.approx(report["wall_seconds"], abs=1e-3)
+
+    def test_iter_measured_excludes_the_consumer(self) -> None:
+        """Test that only producing the items is added to the phase."""
+        # Arrange
+        stats = AnalysisStats()
+
+        # Act
+        for _ in stats.iter_measured("discovery", range(3)):
+            time.sleep(0.01)
+
+        # Assert
+        assert stats.wall["discovery"] < 0.01
+        assert stats.wall["other"] >= 0.03
+
+    def test_keeps_the_slowest_files(self) -> None:
+        """Test that only the slowest files are kept, slowest first."""
+        # Arrange
+        stats = AnalysisStats(slowest=2)
+
+        # Act
+        for index, seconds in enumerate([0.3, 0.1, 0.5, 0.2]):
+            stats.record_file(f"f{index}.py", seconds, _record(index))
+        stats.record_file("broken.py", 0.0, None)
+        report = stats.to_dict()
+
+        # Assert
+        assert [entry["file_path"] for entry in report["slowest_files"]] == [
+            "f2.py",
+            "f0.py",
+        ]
+        assert (report["files"], report["skipped_files"]) == (4, 1)
+        assert report["functions"] == 6
+
+    def test_drain_and_merge(self) -> None:
+        """Test that drained worker stats add up in the parent."""
+        # Arrange
+        parent = AnalysisStats()
+        worker = AnalysisStats()
+        worker.measure("parse", time.sleep, 0.01)
+        worker.record_file("a.py", 0.01, _record(2))
+        worker.bytes_read = 100
+
+        # Act
+        parent.merge(worker.drain(), worker=42)
+        parent.merge(worker.drain(), worker=42)
+
+        # Assert
+        assert parent.files == 1
+        assert parent.bytes_read == 100
+        assert parent.wall["parse"] >= 0.01
+        assert parent.wall["other"] < 0.01
+        assert parent.workers == {42}
+        assert worker.files == 0
+
+
+class TestInstrumentedComplexityAnalyzer:
+    """Test cases for InstrumentedComplexityAnalyzer."""
+
+    def test_results_match_the_plain_analyzer(self, project: Path) -> None:
+        """Test that measuring does not change the results."""
+        # Arrange
+        plain = ComplexityAnalyzer(
+            *ComplexityCalculatorFactory.create_calculators("builtin")
+        )
+        instrumented = InstrumentedComplexityAnalyzer(
+            AnalysisStats(), *ComplexityCalculatorFactory.create_calculators("builtin")
+        )
+
+        # Act & Assert
+        assert instrumented.analyze_directory(project) == plain.analyze_directory(
+            project
+        )
+
+    def test_counts_files_functions_and_bytes(self, project: Path) -> None:
+        """Test that the analyzed files are counted and every phase is timed."""
+        # Arrange
+        stats = AnalysisStats()
+        analyzer = InstrumentedComplexityAnalyzer(
+            stats, *ComplexityCalculatorFactory.create_calculators("library")
+        )
+
+        # Act
+        analyzer.analyze_directory(project)
+
+        # Assert
+        assert (stats.files, stats.skipped_files, stats.functions) == (2, 1, 8)
+        assert stats.bytes_read == len(SOURCE) * 4 + len("def broken(:\n")
+        for phase in ("discovery", "read", "parse", "cyclomatic", "cognitive"):
+            assert stats.wall[phase] > 0, phase
+        assert set(stats.wall) == set(PHASES)
+
+    def test_counts_cache_hits_and_misses(self, project: Path) -> None:
+        """Test that result cache lookups are counted."""
+        # Arrange
+        stats = AnalysisStats()
+        analyzer = InstrumentedComplexityAnalyzer(
+            stats,
+            *ComplexityCalculatorFactory.create_calculators("builtin"),
+            result_cache=MemoryResultCache(10),
+        )
+
+        # Act
+        analyzer.analyze_directory(project)
+        analyzer.analyze_directory(project)
+
+        # Assert: the file that does not parse is never cached
+        assert (stats.cache_hits, stats.cache_misses) == (2, 4)
+        assert stats.to_dict()["cache"]["hit_rate"] == pytest.approx(1 / 3)
@@ -0,0 +1,79 @@
+"""Tests for the changed lines module."""
+
+from pathlib import Path
+
+import pytest
+
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.domain.services.changed_lines import ChangedLines
+
+FILE = Path("/repo/module.py").resolve()
+
+
+def _function(
+    name: str, lineno: int, end_lineno: int, complexity: int
+) -> FunctionRecord:
+    return FunctionRecord(
+        name=name,
+        cyclomatic_complexity=complexity,
+        cognitive_complexity=complexity - 1,
+        lineno=lineno,
+        col_offset=0,
+        end_lineno=end_lineno,
+    )
+
+
+class TestChangedLines:
+    """Test cases for ChangedLines."""
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected"),
+        [
+            (1, 4, False),
+            (1, 5, True),
+            (7, 9, True),
+            (11, 19, False),
+            (20, 20, True),
+            (21, 30, False),
+            (8, 8, True),
+        ],
+    )
+    def test_overlaps(self, start: int, end: int, expected: bool) -> None:
+        """Test overlap queries against unsorted, overlapping hunks."""
+        index = ChangedLines({FILE: [(20, 20), (5, 8), (7, 10)]})
+
+        assert index.overlaps(FILE, start, end) is expected
+
+    def test_unknown_file_has_no_changes(self) -> None:
+        """Test that files without hunks never overlap."""
+        index = ChangedLines({FILE: [(1, 100)]})
+
+        assert not index.overlaps(Path("/repo/other.py"), 1, 100)
+        assert index.files() == [FILE]
+
+    def test_filter_record_keeps_touched_functions(self) -> None:
+        """Test that functions not touching a changed line are dropped."""
+        # Arrange
+        index = ChangedLines({FILE: [(12, 12)]})
+        record = FileRecord(
+            str(FILE),
+            (
+                _function("untouched", 1, 9, 8),
+                _function("touched", 10, 20, 3),
+                _function("nested", 11, 13, 2),
+            ),
+        )
+
+        # Act
+        filtered = index.filter_record(record)
+
+        # Assert
+        assert [function.name for function in filtered.functions] == [
+            "touched",
+            "nested",
+        ]
+        result = filtered.to_result()
+        assert result.total_cyclomatic == 5
+        assert result.total_cognitive == 3
+        assert result.max_cyclomatic == 3
+        assert result.max_cognitive == 2
@@ -2,7 +2,7 @@
 
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
 from unittest.mock import MagicMock
 
 from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
@@ -410,3 +410,74 @@ def function_with_condition(x):
 
             # Assert
             assert len(results) == 0
+
+    def test_analyze_file_uses_result_cache(self) -> None:
+        """Test that cached results skip the calculators and keep the file path."""
+        # Arrange
+        analyzer = self._create_test_analyzer()
+        stored: dict[str, FileComplexityResult] = {}
+        cache = MagicMock()
+        cache.get.side_effect = stored.get
+        cache.put.side_effect = stored.__setitem__
+        analyzer.result_cache = cache
+        cyclomatic_calc = cast("MagicMock", analyzer.cyclomatic_calculator)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "first.py"
+            second = Path(tmpdir) / "second.py"
+            first.write_text("def simple_function(): pass")
+            second.write_text("def simple_function(): pass")
+
+            # Act
+            first_result = analyzer.analyze_file(first)
+            calls_after_first = cyclomatic_calc.calculate.call_count
+            second_result = analyzer.analyze_file(second)
+
+            # Assert
+            assert first_result is not None
+            assert second_result is not None
+            assert len(stored) == 1
+            assert cyclomatic_calc.calculate.call_count == calls_after_first
+            assert second_result.file_path == str(second)
+            assert second_result.functions == first_result.functions
+
+    def test_analyze_directory_limited_to_changed_files(self) -> None:
+        """Test that only changed files are analyzed when a change set is given."""
+        # Arrange
+        analyzer = self._create_test_analyzer()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for name in ["changed.py", "unchanged.py"]:
+                (root / name).write_text("def simple_function(): pass")
+            analyzer.changed_files = frozenset([(root / "changed.py").resolve()])
+
+            # Act
+            results = analyzer.analyze_directory(root)
+
+            # Assert
+            assert [Path(result.file_path).name for result in results] == ["changed.py"]
+            assert analyzer.is_selected_file(root / "changed.py")
+            assert not analyzer.is_selected_file(root / "unchanged.py")
+
+    def test_iter_analyze_directory_stops_when_closed(self) -> None:
+        """Test that breaking out of the generator skips the remaining files."""
+        # Arrange
+        analyzer = self._create_test_analyzer()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for index in range(5):
+                (root / f"module_{index}.py").write_text("def simple_function(): pass")
+
+            # Act
+            results = analyzer.iter_analyze_directory(root)
+            first = next(results)
+            results.close()
+
+            # Assert
+            calculator = analyzer.cyclomatic_calculator
+            assert isinstance(calculator, MagicMock)
+            assert Path(first.file_path).name == "module_0.py"
+            assert calculator.calculate.call_count == 1
+            assert list(results) == []
@@ -0,0 +1,269 @@
+"""Tests for the file walker module."""
+
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path, PurePosixPath
+
+import pytest
+
+from cccy.domain.services.file_walker import GlobMatcher, PythonFileWalker
+
+
+def _create_tree(root: Path, files: list[str]) -> None:
+    for relative in files:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("def func():\n    pass\n")
+
+
+class TestGlobMatcher:
+    """Test cases for GlobMatcher."""
+
+    @pytest.mark.parametrize(
+        ("path", "pattern"),
+        [
+            ("src/tests/test_a.py", "*/tests/*"),
+            ("src/tests/unit/test_a.py", "*/tests/*"),
+            ("tests/test_a.py", "*/tests/*"),
+            ("src/module.py", "module.py"),
+            ("src/module.py", "*.py"),
+            ("src/test_module.py", "*/test_*"),
+            ("src/a.py", "src/[ab].py"),
+            ("src/c.py", "src/[!ab].py"),
+            ("/abs/src/a.py", "/abs/*/a.py"),
+            ("src/a.py", "/src/a.py"),
+            ("src/a.py", "s?c/*"),
+        ],
+    )
+    def test_match_is_compatible_with_path_match(self, path: str, pattern: str) -> None:
+        """Test that file matching behaves like PurePath.match."""
+        matcher = GlobMatcher([pattern])
+
+        assert matcher.match(path) == PurePosixPath(path).match(pattern)
+
+    def test_patterns_are_combined(self) -> None:
+        """Test that any of several patterns can match."""
+        matcher = GlobMatcher(["*/migrations/*", "setup.py"])
+
+        assert matcher.match("app/migrations/0001.py")
+        assert matcher.match("setup.py")
+        assert not matcher.match("app/models.py")
+
+    def test_directory_matching(self) -> None:
+        """Test that a directory matches a pattern or a pattern ending in /*."""
+        matcher = GlobMatcher(["*/vendor/*", "generated"])
+
+        assert matcher.match_directory("src/vendor")
+        assert matcher.match_directory("src/generated")
+        assert not matcher.match_directory("src/vendored")
+
+    def test_empty_matcher(self) -> None:
+        """Test that a matcher without patterns never matches."""
+        matcher = GlobMatcher([])
+
+        assert matcher.is_empty
+        assert not matcher.match("a.py")
+        assert not matcher.match_directory("a")
+
+    def test_empty_pattern_is_rejected(self) -> None:
+        """Test that an empty pattern raises ValueError like Path.match."""
+        with pytest.raises(ValueError, match="empty pattern"):
+            GlobMatcher([""])
+
+
+class TestPythonFileWalker:
+    """Test cases for PythonFileWalker."""
+
+    def test_walk_matches_sorted_glob(self) -> None:
+        """Test that the walker yields the same files in the same order as glob."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(
+                root,
+                ["b.py", "a/z.py", "a/b/c.py", "a_b.py", "pkg/__init__.py", "x.txt"],
+            )
+
+            # Act
+            walked = list(PythonFileWalker().walk(root))
+
+            # Assert
+            assert walked == sorted(root.glob("**/*.py"))
+
+    def test_non_recursive(self) -> None:
+        """Test that subdirectories are skipped when not recursive."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, ["top.py", "sub/nested.py"])
+
+            # Act
+            walked = list(PythonFileWalker().walk(root, recursive=False))
+
+            # Assert
+            assert walked == [root / "top.py"]
+
+    def test_excluded_directories_are_not_scanned(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that excluded directories are pruned before descending."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, ["app.py", "vendor/lib/deep.py", "src/main.py"])
+            scanned: list[str] = []
+            original_scandir = os.scandir
+
+            def recording_scandir(path: str) -> Iterator[os.DirEntry[str]]:
+                scanned.append(str(path))
+                return original_scandir(path)
+
+            monkeypatch.setattr(os, "scandir", recording_scandir)
+            walker = PythonFileWalker(exclude_patterns=["*/vendor/*"])
+
+            # Act
+            walked = list(walker.walk(root))
+
+            # Assert
+            assert walked == [root / "app.py", root / "src" / "main.py"]
+            assert str(root / "src") in scanned
+            assert not any("vendor" in path for path in scanned)
+
+    def test_default_excludes(self) -> None:
+        """Test that virtualenv and cache directories are skipped by default."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(
+                root,
+                [
+                    "main.py",
+                    ".venv/lib/site.py",
+                    "node_modules/pkg/x.py",
+                    ".tox/py39/y.py",
+                    "pkg.egg-info/z.py",
+                ],
+            )
+
+            # Act
+            default = list(PythonFileWalker().walk(root))
+            everything = list(PythonFileWalker(default_excludes=False).walk(root))
+
+            # Assert
+            assert default == [root / "main.py"]
+            assert len(everything) == 5
+
+    def test_build_packages_are_walked_by_default(self) -> None:
+        """Test that source packages named like build outputs are analyzed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            files = ["src/myproj/build/steps.py", "src/myproj/dist/upload.py"]
+            _create_tree(root, files)
+
+            # Act
+            walked = list(PythonFileWalker().walk(root))
+
+            # Assert
+            assert walked == [root / file for file in files]
+
+    def test_root_is_never_excluded(self) -> None:
+        """Test that an explicitly given directory is walked even if excluded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            venv = Path(tmpdir) / "venv"
+            _create_tree(venv, ["tool.py"])
+
+            # Act
+            walked = list(PythonFileWalker().walk(venv))
+
+            # Assert
+            assert walked == [venv / "tool.py"]
+
+    def test_include_patterns(self) -> None:
+        """Test that include patterns restrict the files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, ["api/views.py", "api/models.py", "core/views.py"])
+            walker = PythonFileWalker(include_patterns=["*/views.py"])
+
+            # Act
+            walked = list(walker.walk(root))
+
+            # Assert
+            assert walked == [root / "api" / "views.py", root / "core" / "views.py"]
+
+    def test_relative_current_directory(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that walking "." yields paths without a leading "./"."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            monkeypatch.chdir(tmpdir)
+            _create_tree(Path(), ["a.py", "sub/b.py"])
+
+            # Act
+            walked = list(PythonFileWalker().walk(Path()))
+
+            # Assert
+            assert [str(path) for path in walked] == ["a.py", str(Path("sub/b.py"))]
+
+
+class TestFilterFiles:
+    """Test cases for PythonFileWalker.filter_files."""
+
+    @pytest.mark.parametrize(
+        ("recursive", "exclude"),
+        [(True, []), (False, []), (True, ["*/skipped/*"]), (True, ["a_*.py"])],
+    )
+    def test_matches_walk(self, recursive: bool, exclude: list[str]) -> None:
+        """Test that filtering candidates agrees with walking the tree."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(
+                root,
+                ["b.py", "a/z.py", "a_b.py", "skipped/c.py", ".venv/lib.py", "d.py"],
+            )
+            candidates = [
+                (root / name).resolve()
+                for name in ["d.py", "a/z.py", "a_b.py", "skipped/c.py", ".venv/lib.py"]
+            ]
+            walker = PythonFileWalker(exclude_patterns=exclude)
+
+            # Act
+            filtered = list(walker.filter_files(root, candidates, recursive))
+
+            # Assert
+            walked = walker.walk(root, recursive)
+            assert filtered == [path for path in walked if path.name != "b.py"]
+
+    def test_candidates_outside_the_directory_are_ignored(self) -> None:
+        """Test that only candidates below the directory are returned."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, ["src/a.py", "tests/test_a.py"])
+            candidates = [(root / "src/a.py").resolve(), (root / "tests/test_a.py")]
+
+            # Act
+            filtered = list(PythonFileWalker().filter_files(root / "src", candidates))
+
+            # Assert
+            assert filtered == [root / "src" / "a.py"]
+
+    def test_respects_nested_gitignore(self) -> None:
+        """Test that .gitignore files along the candidate path apply."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, ["pkg/gen.py", "pkg/keep.py"])
+            (root / "pkg" / ".gitignore").write_text("gen.py\n")
+            candidates = [(root / "pkg/gen.py").resolve(), (root / "pkg/keep.py")]
+            walker = PythonFileWalker(respect_gitignore=True)
+
+            # Act
+            filtered = list(walker.filter_files(root, candidates))
+
+            # Assert
+            assert filtered == [root / "pkg" / "keep.py"]
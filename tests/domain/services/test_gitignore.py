@@ -0,0 +1,215 @@
+"""Tests for the gitignore module."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from cccy.domain.services.file_walker import PythonFileWalker
+from cccy.domain.services.gitignore import (
+    GitIgnoreRules,
+    GitIgnoreTree,
+    create_gitignore_context,
+    parse_gitignore_line,
+)
+
+
+def _create_tree(root: Path, files: dict[str, str]) -> None:
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def _walk(root: Path) -> list[str]:
+    walker = PythonFileWalker(default_excludes=False, respect_gitignore=True)
+    return [path.relative_to(root).as_posix() for path in walker.walk(root)]
+
+
+class TestParseGitIgnoreLine:
+    """Test cases for parse_gitignore_line."""
+
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "/"])
+    def test_lines_without_rules(self, line: str) -> None:
+        """Test that blank lines and comments produce no rule."""
+        assert parse_gitignore_line(line) is None
+
+    def test_negation_and_directory_only(self) -> None:
+        """Test the "!" prefix and the trailing "/" suffix."""
+        rule = parse_gitignore_line("!build/")
+
+        assert rule is not None
+        assert rule.negated
+        assert rule.directory_only
+        assert rule.matches("src/build", is_dir=True)
+        assert not rule.matches("src/build", is_dir=False)
+
+    def test_escaped_prefixes_and_trailing_space(self) -> None:
+        """Test backslash escapes for "#", "!" and trailing spaces."""
+        hash_rule = parse_gitignore_line("\\#file.py")
+        bang_rule = parse_gitignore_line("\\!file.py")
+        space_rule = parse_gitignore_line("name\\ ")
+
+        assert hash_rule is not None
+        assert hash_rule.matches("#file.py", is_dir=False)
+        assert bang_rule is not None
+        assert not bang_rule.negated
+        assert bang_rule.matches("!file.py", is_dir=False)
+        assert space_rule is not None
+        assert space_rule.matches("name ", is_dir=False)
+
+    @pytest.mark.parametrize(
+        ("pattern", "path", "expected"),
+        [
+            ("*.py", "a/b/c.py", True),
+            ("gen", "src/gen", True),
+            ("/gen", "src/gen", False),
+            ("/gen", "gen", True),
+            ("src/*.py", "src/a.py", True),
+            ("src/*.py", "src/sub/a.py", False),
+            ("**/fixtures", "a/b/fixtures", True),
+            ("a/**/c.py", "a/c.py", True),
+            ("a/**/c.py", "a/x/y/c.py", True),
+            ("a/**", "a/x/y.py", True),
+            ("a/**", "b/a/x.py", False),
+            ("[!a]*.py", "b.py", True),
+            ("[!a]*.py", "a.py", False),
+            ("?.py", "ab.py", False),
+        ],
+    )
+    def test_pattern_matching(self, pattern: str, path: str, expected: bool) -> None:
+        """Test gitignore wildcard semantics."""
+        rule = parse_gitignore_line(pattern)
+
+        assert rule is not None
+        assert rule.matches(path, is_dir=False) == expected
+
+
+class TestGitIgnoreRules:
+    """Test cases for GitIgnoreRules."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("pkg/a_pb2.py", True),
+            ("pkg/keep_pb2.py", False),
+            ("pkg/module.py", None),
+        ],
+    )
+    def test_last_matching_rule_wins(self, path: str, expected: Optional[bool]) -> None:
+        """Test that later rules override earlier ones relative to the base."""
+        rules = GitIgnoreRules.from_lines("pkg", ["*_pb2.py", "!keep_pb2.py"])
+
+        assert rules.match(path, is_dir=False) is expected
+
+
+class TestGitIgnoreTree:
+    """Test cases for GitIgnoreTree."""
+
+    def test_rules_are_cached_until_modified(self) -> None:
+        """Test that a .gitignore is re-read only when its mtime changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            gitignore = root / "sub" / ".gitignore"
+            _create_tree(root, {"sub/.gitignore": "a.py\n"})
+            tree = GitIgnoreTree(root)
+
+            # Act
+            first = tree.rules_for("sub")
+            second = tree.rules_for("sub")
+            gitignore.write_text("b.py\n")
+            os.utime(gitignore, ns=(0, 1))
+            third = tree.rules_for("sub")
+
+            # Assert
+            assert first is second
+            assert third is not first
+            assert third is not None
+            assert third.match("sub/b.py", is_dir=False) is True
+
+
+class TestGitIgnoreWalking:
+    """Test cases for walking with .gitignore rules."""
+
+    def test_nested_gitignore_files(self) -> None:
+        """Test root, nested and info/exclude rules together."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(
+                root,
+                {
+                    ".git/info/exclude": "local.py\n",
+                    ".git/hooks/hook.py": "",
+                    ".gitignore": "*_pb2.py\nvendor/\n",
+                    "main.py": "",
+                    "local.py": "",
+                    "api_pb2.py": "",
+                    "vendor/lib.py": "",
+                    "src/.gitignore": "!keep_pb2.py\ngenerated/\n",
+                    "src/keep_pb2.py": "",
+                    "src/other_pb2.py": "",
+                    "src/generated/models.py": "",
+                    "src/app.py": "",
+                },
+            )
+
+            # Act
+            walked = _walk(root)
+
+            # Assert
+            assert walked == ["main.py", "src/app.py", "src/keep_pb2.py"]
+
+    def test_rules_above_the_walked_directory_apply(self) -> None:
+        """Test that .gitignore files between the repository root and the walk root apply."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(
+                root,
+                {
+                    ".git/HEAD": "",
+                    ".gitignore": "*_pb2.py\n",
+                    "pkg/.gitignore": "/legacy.py\n",
+                    "pkg/sub/a_pb2.py": "",
+                    "pkg/sub/legacy.py": "",
+                    "pkg/sub/module.py": "",
+                },
+            )
+
+            # Act
+            walked = _walk(root / "pkg" / "sub")
+
+            # Assert
+            assert walked == ["legacy.py", "module.py"]
+
+    def test_outside_repository_uses_walk_root(self) -> None:
+        """Test that .gitignore files are honoured without a repository."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, {".gitignore": "/skip.py\n", "skip.py": "", "a.py": ""})
+
+            # Act
+            with os.scandir(root) as entries:
+                context = create_gitignore_context(root).enter(list(entries))
+
+            # Assert
+            assert context.is_ignored("skip.py", is_dir=False)
+            assert not context.is_ignored("a.py", is_dir=False)
+
+    def test_disabled_by_default(self) -> None:
+        """Test that the walker ignores .gitignore unless asked to respect it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            root = Path(tmpdir)
+            _create_tree(root, {".gitignore": "*.py\n", "a.py": ""})
+
+            # Act
+            walked = list(PythonFileWalker().walk(root))
+
+            # Assert
+            assert walked == [root / "a.py"]
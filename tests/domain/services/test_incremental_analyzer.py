@@ -0,0 +1,307 @@
+"""Tests for the incremental source analyzer."""
+
+import ast
+import random
+from collections.abc import Iterator, Sequence
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.incremental_analyzer import (
+    IncrementalSourceAnalyzer,
+    split_lines,
+)
+from cccy.infrastructure.calculators.concrete_calculators import (
+    ComplexityCalculatorFactory,
+)
+
+SOURCE = """\
+import os
+
+
+def first(x):
+    if x:
+        return 1
+    return 0
+
+
+@decorator
+def second(items):
+    for item in items:
+        if item:
+            return item
+    return None
+
+
+class Third:
+    def method(self):
+        return os.sep
+"""
+
+
+@pytest.fixture
+def analyzer() -> ComplexityAnalyzer:
+    """Provide an analyzer with the built-in calculators."""
+    return ComplexityAnalyzer(*ComplexityCalculatorFactory.create_calculators())
+
+
+def _full(analyzer: ComplexityAnalyzer, source: str) -> list[tuple[object, ...]]:
+    record = analyzer._analyze_source("module.py", source)
+    assert record is not None
+    return sorted(record.functions)
+
+
+def _edit(source: str, old: str, new: str) -> str:
+    assert old in source
+    return source.replace(old, new, 1)
+
+
+# A small file for exhaustive edit sequences
+SMALL_SOURCE = """\
+def a(x):
+    if x:
+        return 1
+    return 0
+
+def zz():
+    pass
+
+def b():
+    pass
+"""
+# Lines inserted or substituted by the exhaustive edits
+SMALL_EDIT_LINES = ["def zz():\n", "    return 0\n", "\n", "@decorator\n"]
+# Lines inserted or substituted by the random edits, valid or not on their own
+EDIT_LINES = [
+    *SMALL_EDIT_LINES,
+    "def a(x):\n",
+    "    pass\n",
+    "    if x:\n",
+    "        return 1\n",
+    "x = (\n",
+    ")\n",
+    "else:\n",
+    "    else:\n",
+    '"""\n',
+    "class K:\n",
+    "    def inner(self):\n",
+    "    try:\n",
+    "    finally:\n",
+]
+
+
+def _tree_functions(
+    analyzer: ComplexityAnalyzer, source: str
+) -> Optional[list[tuple[object, ...]]]:
+    """Analyze the whole source at once, or return None if it does not parse."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    return sorted(analyzer.analyze_tree(tree))
+
+
+def _line_edits(lines: list[str], edit_lines: Sequence[str]) -> Iterator[list[str]]:
+    """Yield every insertion, deletion and replacement of one line."""
+    for index in range(len(lines) + 1):
+        for line in edit_lines:
+            yield [*lines[:index], line, *lines[index:]]
+    for index in range(len(lines)):
+        yield [*lines[:index], *lines[index + 1 :]]
+        for line in edit_lines:
+            yield [*lines[:index], line, *lines[index + 1 :]]
+
+
+def _differs_from_full_analysis(
+    analyzer: ComplexityAnalyzer, steps: Sequence[list[str]]
+) -> bool:
+    """Apply the steps incrementally and compare the last one with a full analysis."""
+    incremental = IncrementalSourceAnalyzer(analyzer)
+    for lines in steps:
+        valid = incremental.update("".join(lines))
+    expected = _tree_functions(analyzer, "".join(steps[-1]))
+    if expected is None:
+        return valid
+    return not valid or sorted(incremental.functions) != expected
+
+
+class TestIncrementalSourceAnalyzer:
+    """Test cases for IncrementalSourceAnalyzer."""
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ("        return 1\n", "        if x > 1:\n            return 2\n"),
+            ("    return 0\n\n\n", "    return 0\n    x = 1\n\n\n"),
+            ("@decorator\n", ""),
+            ("\nclass Third", "\n@decorator\nclass Third"),
+            ("import os\n", ""),
+            (
+                "        return os.sep\n",
+                "        return os.sep\n\n    def added(self):\n        pass\n",
+            ),
+        ],
+    )
+    def test_matches_full_analysis_after_edit(
+        self, analyzer: ComplexityAnalyzer, old: str, new: str
+    ) -> None:
+        """Test that incremental results equal a full analysis."""
+        # Arrange
+        incremental = IncrementalSourceAnalyzer(analyzer)
+        incremental.update(SOURCE)
+        edited = _edit(SOURCE, old, new)
+
+        # Act
+        valid = incremental.update(edited)
+
+        # Assert
+        assert valid
+        assert sorted(incremental.functions) == _full(analyzer, edited)
+
+    def test_reparses_only_blocks_around_the_edit(self) -> None:
+        """Test that unchanged definitions far from the edit are reused."""
+        # Arrange
+        calculator = MagicMock()
+        calculator.calculate.return_value = 1
+        incremental = IncrementalSourceAnalyzer(
+            ComplexityAnalyzer(calculator, calculator)
+        )
+        source = "".join(f"def f{i}():\n    pass\n\n" for i in range(10))
+        incremental.update(source)
+        calculator.calculate.reset_mock()
+
+        # Act
+        incremental.update(_edit(source, "def f5():\n", "def f5():\n    x = 1\n"))
+
+        # Assert
+        # Only f5 (edited) and f6 (after it) are analyzed, by both calculators
+        assert calculator.calculate.call_count == 4
+        assert [f.lineno for f in incremental.functions][6:] == [20, 23, 26, 29]
+
+    def test_syntax_error_keeps_results_of_other_definitions(
+        self, analyzer: ComplexityAnalyzer
+    ) -> None:
+        """Test editing another definition while one is invalid."""
+        # Arrange
+        incremental = IncrementalSourceAnalyzer(analyzer)
+        incremental.update(SOURCE)
+        broken = _edit(SOURCE, "    if x:\n", "    if x\n")
+        incremental.update(broken)
+        edited = _edit(
+            broken,
+            "        return os.sep\n",
+            "        if self:\n            return os.sep\n",
+        )
+
+        # Act
+        valid = incremental.update(edited)
+
+        # Assert
+        assert not valid
+        assert not incremental.is_valid
+        functions = {f.name: f for f in incremental.functions}
+        assert functions["method"].cyclomatic_complexity == 2
+        assert functions["method"].lineno == 19
+        assert functions["first"].cyclomatic_complexity == 2  # Last known result
+
+    def test_recovers_after_syntax_error(self, analyzer: ComplexityAnalyzer) -> None:
+        """Test that fixing the error restores exact results."""
+        # Arrange
+        incremental = IncrementalSourceAnalyzer(analyzer)
+        incremental.update(SOURCE)
+        incremental.update(_edit(SOURCE, "    if x:\n", "    if x\n"))
+        fixed = _edit(SOURCE, "    if x:\n", "    if x or x:\n")
+
+        # Act
+        valid = incremental.update(fixed)
+
+        # Assert
+        assert valid
+        assert sorted(incremental.functions) == _full(analyzer, fixed)
+
+    def test_string_spanning_definitions_reparses_the_rest(
+        self, analyzer: ComplexityAnalyzer
+    ) -> None:
+        """Test an unterminated string that is closed in a later definition."""
+        # Arrange
+        incremental = IncrementalSourceAnalyzer(analyzer)
+        source = _edit(SOURCE, "    return None\n", '    return """\n')
+        source = _edit(source, "        return os.sep\n", '        return """\n')
+        incremental.update(SOURCE)
+
+        # Act
+        valid = incremental.update(source)
+
+        # Assert
+        assert valid
+        assert sorted(incremental.functions) == _full(analyzer, source)
+        assert "method" not in {f.name for f in incremental.functions}
+
+    def test_edit_next_to_syntax_error_continues_previous_definition(
+        self, analyzer: ComplexityAnalyzer
+    ) -> None:
+        """Test an edit at the start of an invalid range that completes the file."""
+        # Arrange
+        source = "def a(x):\n    if x:\n        return 1\n    return 0\n\n"
+        source += "def zz():\n    pass\n\ndef b():\n    pass\n"
+        broken = _edit(source, "def zz():\n", "def zz():\ndef zz():\n")
+        fixed = _edit(broken, "def zz():\ndef zz():\n", "    return 0\ndef zz():\n")
+        incremental = IncrementalSourceAnalyzer(analyzer)
+        incremental.update(source)
+        incremental.update(broken)
+
+        # Act
+        valid = incremental.update(fixed)
+
+        # Assert
+        assert valid
+        assert sorted(incremental.functions) == _tree_functions(analyzer, fixed)
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_random_edits_match_full_analysis(
+        self, analyzer: ComplexityAnalyzer, seed: int
+    ) -> None:
+        """Test that every step of a random edit sequence equals a full analysis."""
+        # Arrange
+        rng = random.Random(seed)  # noqa: S311
+        lines = split_lines(SOURCE)
+        incremental = IncrementalSourceAnalyzer(analyzer)
+        incremental.update(SOURCE)
+
+        for _ in range(40):
+            # Act
+            lines = split_lines(SOURCE) if rng.random() < 0.1 else lines
+            lines = rng.choice(list(_line_edits(lines, EDIT_LINES)))
+            source = "".join(lines)
+            valid = incremental.update(source)
+
+            # Assert
+            expected = _tree_functions(analyzer, source)
+            assert valid == (expected is not None), source
+            if expected is not None:
+                assert sorted(incremental.functions) == expected, source
+
+    def test_every_two_line_edits_match_full_analysis(
+        self, analyzer: ComplexityAnalyzer
+    ) -> None:
+        """Test every pair of one-line edits whose first edit breaks the file."""
+        # Arrange
+        source = split_lines(SMALL_SOURCE)
+        broken_sources = [
+            broken
+            for broken in _line_edits(source, SMALL_EDIT_LINES)
+            if _tree_functions(analyzer, "".join(broken)) is None
+        ]
+
+        # Act
+        mismatches = [
+            "".join(edited)
+            for broken in broken_sources
+            for edited in _line_edits(broken, SMALL_EDIT_LINES)
+            if _differs_from_full_analysis(analyzer, [source, broken, edited])
+        ]
+
+        # Assert
+        assert mismatches == []
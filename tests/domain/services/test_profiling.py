@@ -0,0 +1,112 @@
+"""Tests for the profiling module."""
+
+import pickle
+import time
+
+from cccy.domain.services.profiling import (
+    WORKER_FRAME,
+    ProfileSession,
+    StackSampler,
+    collapse_stacks,
+    frame_label,
+)
+
+
+def _busy(seconds: float) -> None:
+    """Keep the CPU busy so that the sampler sees this frame."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _profile_busy_work() -> ProfileSession:
+    session = ProfileSession()
+    session.start()
+    _busy(0.05)
+    session.stop()
+    return session
+
+
+class TestStackSampler:
+    """Test cases for StackSampler."""
+
+    def test_samples_the_calling_thread(self) -> None:
+        """Test that stacks are rooted at the given frame and timed."""
+        # Arrange
+        sampler = StackSampler(interval=0.001)
+
+        # Act
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+
+        # Assert
+        busy = [stack for stack in sampler.stacks if "_busy" in stack[-1]]
+        assert busy
+        assert sum(sampler.stacks[stack] for stack in busy) > 0.01
+
+
+class TestProfileSession:
+    """Test cases for ProfileSession."""
+
+    def test_stacks_start_at_the_caller(self) -> None:
+        """Test that collapsed stacks start at the function that started it."""
+        # Act
+        lines = list(_profile_busy_work().iter_collapsed_stacks())
+
+        # Assert
+        assert lines
+        assert all(line.startswith("_profile_busy_work (") for line in lines)
+        assert any(";_busy (test_profiling.py:" in line for line in lines)
+
+    def test_pickles_as_an_empty_session(self) -> None:
+        """Test that workers receive a session without the parent's profile."""
+        # Arrange
+        session = _profile_busy_work()
+
+        # Act
+        copy = pickle.loads(pickle.dumps(session))  # noqa: S301
+
+        # Assert
+        assert not copy.sampler.stacks
+        assert not copy.worker_stats.stats
+
+    def test_drain_and_merge(self) -> None:
+        """Test that drained worker profiles are merged under the worker frame."""
+        # Arrange
+        parent = ProfileSession()
+        worker = _profile_busy_work()
+        worker.start()
+        _busy(0.05)
+
+        # Act
+        parent.merge(worker.drain(), worker=42)
+        lines = list(parent.iter_collapsed_stacks())
+        functions = {name for _, _, name in parent.to_pstats().stats}  # type: ignore[attr-defined]
+
+        # Assert
+        assert parent.workers == {42}
+        assert lines
+        assert all(line.startswith(f"{WORKER_FRAME};") for line in lines)
+        assert "_busy" in functions
+        assert not worker.sampler.stacks
+
+
+class TestCollapseStacks:
+    """Test cases for collapse_stacks and frame_label."""
+
+    def test_lines_are_in_microseconds(self) -> None:
+        """Test the collapsed stack format used by flame graph tools."""
+        # Arrange
+        stacks = {("main", "parse"): 0.25, ("main",): 0.5, ("tiny",): 1e-7}
+
+        # Act
+        lines = collapse_stacks(stacks, ("root",))
+
+        # Assert
+        assert lines == ["root;main 500000", "root;main;parse 250000"]
+
+    def test_frame_label(self) -> None:
+        """Test that directories are stripped and separators replaced."""
+        assert frame_label("/src/pkg/module.py", 12, "run") == "run (module.py:12)"
+        assert frame_label("<string>", 1, "a;b") == "a:b (<string>:1)"
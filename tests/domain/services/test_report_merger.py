@@ -0,0 +1,106 @@
+"""Tests for the report merger module."""
+
+import pytest
+
+from cccy.domain.entities.complexity import FileComplexityResult
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.domain.exceptions.complexity_exceptions import ReportError
+from cccy.domain.services.report_merger import merge_reports, parse_report
+from cccy.infrastructure.formatters.output import OutputFormatter
+
+
+def _result(file_path: str, *complexities: int) -> FileComplexityResult:
+    functions = tuple(
+        FunctionRecord(
+            name=f"function_{index}",
+            cyclomatic_complexity=complexity,
+            cognitive_complexity=complexity + 1,
+            lineno=index * 10 + 1,
+            col_offset=0,
+            end_lineno=index * 10 + 5,
+        )
+        for index, complexity in enumerate(complexities)
+    )
+    return FileRecord(file_path, functions).to_result()
+
+
+class TestParseReport:
+    """Test cases for parse_report."""
+
+    def test_parses_json_report(self) -> None:
+        """Test that the output of --format json is read back unchanged."""
+        # Arrange
+        results = [_result("a.py", 3, 8), _result("b.py")]
+        text = OutputFormatter.format_json(results)
+
+        # Act
+        parsed = parse_report(text)
+
+        # Assert
+        assert parsed == results
+
+    def test_parses_jsonl_report(self) -> None:
+        """Test that the output of --format jsonl is read back unchanged."""
+        # Arrange
+        results = [_result("a.py", 3, 8), _result("b.py", 1)]
+        text = "\n".join(OutputFormatter.iter_jsonl(results)) + "\n"
+
+        # Act
+        parsed = parse_report(text)
+
+        # Assert
+        assert parsed == results
+
+    @pytest.mark.parametrize(
+        "text",
+        ["not json", '{"x": 1}', '[{"file_path": "a.py"}]', '[{"file_path": 1}]'],
+    )
+    def test_rejects_other_documents(self, text: str) -> None:
+        """Test that documents that are not file-level reports are rejected."""
+        # Act & Assert
+        with pytest.raises(ReportError, match=r"part1\.json"):
+            parse_report(text, "part1.json")
+
+
+class TestMergeReports:
+    """Test cases for merge_reports."""
+
+    def test_merges_results_in_path_order(self) -> None:
+        """Test that the results of all reports are combined and sorted."""
+        # Arrange
+        reports = [
+            ("part1.json", [_result("c.py", 2), _result("a.py", 1)]),
+            ("part2.json", [_result("b.py", 5)]),
+        ]
+
+        # Act
+        merged = merge_reports(reports)
+
+        # Assert
+        assert [result.file_path for result in merged] == ["a.py", "b.py", "c.py"]
+
+    def test_counts_identical_results_once(self) -> None:
+        """Test that a file reported twice with the same result is counted once."""
+        # Arrange
+        reports = [
+            ("part1.json", [_result("a.py", 1)]),
+            ("part2.json", [_result("a.py", 1), _result("b.py", 2)]),
+        ]
+
+        # Act
+        merged = merge_reports(reports)
+
+        # Assert
+        assert len(merged) == 2
+
+    def test_rejects_conflicting_results(self) -> None:
+        """Test that different results for the same file are an error."""
+        # Arrange
+        reports = [
+            ("part1.json", [_result("a.py", 1)]),
+            ("part2.json", [_result("a.py", 4)]),
+        ]
+
+        # Act & Assert
+        with pytest.raises(ReportError, match=r"part2\.json.*a\.py.*part1\.json"):
+            merge_reports(reports)
@@ -0,0 +1,76 @@
+"""Tests for the scheduling module."""
+
+import tempfile
+from pathlib import Path
+
+from cccy.domain.services.scheduling import (
+    FILE_OVERHEAD,
+    MAX_CHUNK_SIZE,
+    file_weight,
+    plan_chunks,
+)
+
+
+class TestFileWeight:
+    """Test cases for file_weight."""
+
+    def test_weight_is_size_plus_overhead(self) -> None:
+        """Test that the weight grows with the file size."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            path = Path(tmpdir) / "module.py"
+            path.write_text("x = 1\n" * 10)
+
+            # Act & Assert
+            assert file_weight(path) == 60 + FILE_OVERHEAD
+
+    def test_missing_file_has_only_the_overhead(self) -> None:
+        """Test that a file that cannot be read still gets a weight."""
+        assert file_weight(Path("/nonexistent/module.py")) == FILE_OVERHEAD
+
+
+class TestPlanChunks:
+    """Test cases for plan_chunks."""
+
+    def test_largest_files_are_sent_first(self) -> None:
+        """Test that chunks are ordered by decreasing weight (LPT)."""
+        # Arrange
+        weights = [2_000, 900_000, 5_000, 400_000, 1_000]
+
+        # Act
+        chunks = plan_chunks(weights, workers=2)
+
+        # Assert
+        order = [index for chunk in chunks for index in chunk]
+        assert order == [1, 3, 2, 0, 4]
+        assert chunks[0] == [1]
+        assert chunks[1] == [3]
+
+    def test_small_files_are_grouped_in_shrinking_chunks(self) -> None:
+        """Test that the long tail of small files is split adaptively."""
+        # Arrange
+        weights = [4_000] * 1_000
+
+        # Act
+        chunks = plan_chunks(weights, workers=4)
+
+        # Assert
+        sizes = [len(chunk) for chunk in chunks]
+        assert sorted(index for chunk in chunks for index in chunk) == list(
+            range(1_000)
+        )
+        assert max(sizes) <= MAX_CHUNK_SIZE
+        assert sizes[0] > sizes[-2]
+        assert sizes == sorted(sizes, reverse=True)
+
+    def test_fixed_chunk_size(self) -> None:
+        """Test that an explicit chunk size groups files by count."""
+        # Act
+        chunks = plan_chunks([1, 5, 3, 4, 2], workers=2, chunk_size=2)
+
+        # Assert
+        assert chunks == [[1, 3], [2, 4], [0]]
+
+    def test_no_files(self) -> None:
+        """Test that nothing is planned for an empty window."""
+        assert plan_chunks([], workers=2) == []
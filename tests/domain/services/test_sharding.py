@@ -0,0 +1,81 @@
+"""Tests for the sharding module."""
+
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cccy.domain.services.sharding import Shard, assign_shards
+
+
+@pytest.fixture
+def files() -> Iterator[list[Path]]:
+    """Provide files of various sizes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        paths = []
+        for index in range(20):
+            path = root / f"module_{index}.py"
+            path.write_text("x = 1\n" * (index * index * 10))
+            paths.append(path)
+        yield paths
+
+
+class TestShard:
+    """Test cases for Shard."""
+
+    def test_parse(self) -> None:
+        """Test that INDEX/COUNT is parsed into a shard."""
+        # Act
+        shard = Shard.parse("2/4")
+
+        # Assert
+        assert shard == Shard(2, 4)
+        assert str(shard) == "2/4"
+
+    @pytest.mark.parametrize("value", ["2", "a/4", "2/", "-1/4", "0/4", "5/4", "1/0"])
+    def test_parse_rejects_invalid_values(self, value: str) -> None:
+        """Test that malformed or out of range shards are rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            Shard.parse(value)
+
+    def test_shards_partition_the_files(self, files: list[Path]) -> None:
+        """Test that every file belongs to exactly one shard."""
+        # Act
+        shards = [Shard(number, 3).select(files) for number in (1, 2, 3)]
+
+        # Assert
+        assert sum(len(shard) for shard in shards) == len(files)
+        assert frozenset().union(*shards) == frozenset(files)
+
+    def test_selection_is_deterministic(self, files: list[Path]) -> None:
+        """Test that the order and duplicates of the input do not matter."""
+        # Act
+        forward = Shard(2, 3).select(files)
+        backward = Shard(2, 3).select(list(reversed(files)) + files)
+
+        # Assert
+        assert forward == backward
+
+    def test_shards_are_balanced_by_size(self, files: list[Path]) -> None:
+        """Test that the total size of each shard is close to the average."""
+        # Act
+        assignments = assign_shards(files, 4)
+
+        # Assert
+        sizes = [0] * 4
+        for path, index in assignments.items():
+            sizes[index] += path.stat().st_size
+        largest_file = max(path.stat().st_size for path in files)
+        assert max(sizes) - min(sizes) <= largest_file
+
+    def test_more_shards_than_files(self, files: list[Path]) -> None:
+        """Test that surplus shards are empty."""
+        # Act
+        shards = [Shard(number, 25).select(files) for number in range(1, 26)]
+
+        # Assert
+        assert sum(1 for shard in shards if not shard) == 5
+        assert all(len(shard) <= 1 for shard in shards)
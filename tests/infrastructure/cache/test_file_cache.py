@@ -0,0 +1,132 @@
+"""Tests for the file system result cache module."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.infrastructure.cache.file_cache import FileSystemResultCache
+from cccy.infrastructure.calculators.concrete_calculators import (
+    CognitiveComplexityCalculator,
+    CyclomaticComplexityCalculator,
+)
+
+
+def _make_result(file_path: str = "module.py") -> FileRecord:
+    function = FunctionRecord(
+        name="func",
+        cyclomatic_complexity=3,
+        cognitive_complexity=2,
+        lineno=1,
+        col_offset=0,
+        end_lineno=5,
+        end_col_offset=10,
+    )
+    return FileRecord(file_path, (function,))
+
+
+class TestFileSystemResultCache:
+    """Test cases for FileSystemResultCache."""
+
+    def test_put_and_get_round_trip(self) -> None:
+        """Test that a stored result is returned unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            cache = FileSystemResultCache(Path(tmpdir) / "cache", namespace="ns")
+            result = _make_result()
+
+            # Act
+            cache.put("abc", result)
+            cached = cache.get("abc")
+
+            # Assert
+            assert cached == result
+            assert cache.get("missing") is None
+            assert (Path(tmpdir) / "cache" / ".gitignore").exists()
+
+    def test_namespace_isolates_entries(self) -> None:
+        """Test that different namespaces do not share entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            cache_dir = Path(tmpdir)
+            FileSystemResultCache(cache_dir, namespace="v1").put("abc", _make_result())
+
+            # Act
+            cached = FileSystemResultCache(cache_dir, namespace="v2").get("abc")
+
+            # Assert
+            assert cached is None
+
+    def test_corrupt_entry_is_a_miss(self) -> None:
+        """Test that an unreadable entry is treated as a cache miss."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            cache = FileSystemResultCache(Path(tmpdir), namespace="ns")
+            cache.put("abc", _make_result())
+            cache._entry_path("abc").write_text("not json")
+
+            # Act & Assert
+            assert cache.get("abc") is None
+
+    def test_malformed_entry_is_a_miss(self) -> None:
+        """Test that valid JSON with the wrong shape is treated as a cache miss."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            cache = FileSystemResultCache(Path(tmpdir), namespace="ns")
+            cache.put("abc", _make_result())
+            entry_path = cache._entry_path("abc")
+
+            for content in ('{"file_path": "a.py"}', '["a.py", [["f", 1]]]'):
+                entry_path.write_text(content)
+
+                # Act & Assert
+                assert cache.get("abc") is None
+
+    def test_prune_evicts_least_recently_used(self) -> None:
+        """Test that pruning removes the oldest entries first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            cache = FileSystemResultCache(Path(tmpdir), namespace="ns")
+            for index, key in enumerate(["old", "middle", "new"]):
+                cache.put(key, _make_result())
+                os.utime(cache._entry_path(key), (1000 + index, 1000 + index))
+            cache.get("old")  # touching "old" makes "middle" the LRU entry
+            entry_size = cache._entry_path("new").stat().st_size
+            cache.max_size = entry_size * 2
+
+            # Act
+            removed = cache.prune()
+
+            # Assert
+            assert removed == 1
+            assert cache.get("middle") is None
+            assert cache.get("old") is not None
+            assert cache.get("new") is not None
+
+    def test_stats_and_clear(self) -> None:
+        """Test statistics and clearing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            cache = FileSystemResultCache(Path(tmpdir) / "cache", namespace="ns")
+            cache.put("a", _make_result())
+            cache.put("b", _make_result())
+
+            # Act
+            stats = cache.stats()
+            removed = cache.clear()
+
+            # Assert
+            assert stats.entries == 2
+            assert stats.total_size > 0
+            assert removed == 2
+            assert cache.stats().entries == 0
+
+    def test_build_namespace_includes_calculators(self) -> None:
+        """Test that the namespace depends on the calculator set."""
+        namespace = FileSystemResultCache.build_namespace(
+            CyclomaticComplexityCalculator(), CognitiveComplexityCalculator()
+        )
+
+        assert namespace.startswith("cccy-")
+        assert "CyclomaticComplexityCalculator" in namespace
+        assert "CognitiveComplexityCalculator" in namespace
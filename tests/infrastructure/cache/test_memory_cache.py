@@ -0,0 +1,79 @@
+"""Tests for the in-memory result cache module."""
+
+import pickle
+
+from cccy.domain.entities.records import FileRecord, FunctionRecord
+from cccy.infrastructure.cache.memory_cache import MemoryResultCache, TieredResultCache
+
+
+def _make_result(file_path: str = "module.py") -> FileRecord:
+    return FileRecord(file_path, (FunctionRecord("func", 3, 2, 1, 0, 5, 10),))
+
+
+class TestMemoryResultCache:
+    """Test cases for MemoryResultCache."""
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        """Test that the oldest untouched entry is removed over the limit."""
+        # Arrange
+        cache = MemoryResultCache(max_entries=2)
+        cache.put("a", _make_result("a.py"))
+        cache.put("b", _make_result("b.py"))
+
+        # Act
+        cache.get("a")
+        cache.put("c", _make_result("c.py"))
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get("a") == _make_result("a.py")
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_pickled_cache_is_empty(self) -> None:
+        """Test that worker processes receive an empty cache."""
+        # Arrange
+        cache = MemoryResultCache(max_entries=10)
+        cache.put("a", _make_result())
+
+        # Act
+        copied = pickle.loads(pickle.dumps(cache))  # noqa: S301
+
+        # Assert
+        assert len(copied) == 0
+        assert copied.max_entries == 10
+        assert len(cache) == 1
+
+
+class TestTieredResultCache:
+    """Test cases for TieredResultCache."""
+
+    def test_secondary_hit_is_promoted(self) -> None:
+        """Test that a result found in the secondary cache is kept in the primary."""
+        # Arrange
+        primary = MemoryResultCache(max_entries=10)
+        secondary = MemoryResultCache(max_entries=10)
+        secondary.put("a", _make_result())
+        cache = TieredResultCache(primary, secondary)
+
+        # Act
+        result = cache.get("a")
+
+        # Assert
+        assert result == _make_result()
+        assert primary.get("a") == _make_result()
+        assert cache.get("missing") is None
+
+    def test_put_stores_in_both_caches(self) -> None:
+        """Test that new results are written through to the secondary cache."""
+        # Arrange
+        primary = MemoryResultCache(max_entries=10)
+        secondary = MemoryResultCache(max_entries=10)
+        cache = TieredResultCache(primary, secondary)
+
+        # Act
+        cache.put("a", _make_result())
+
+        # Assert
+        assert primary.get("a") == _make_result()
+        assert secondary.get("a") == _make_result()
@@ -0,0 +1,139 @@
+# ruff: noqa
+# type: ignore
+"""Conformance corpus for the built-in complexity engine.
+
+Each function exercises a rule of mccabe or cognitive_complexity. The module
+is only parsed by the tests, never imported.
+"""
+
+
+def simple(x):
+    return x
+
+
+def if_elif_else(x):
+    if x > 10:
+        return 1
+    elif x > 5:
+        return 2
+    elif x > 0:
+        return 3
+    else:
+        return 4
+
+
+def nested_loops(items):
+    total = 0
+    for item in items:
+        while item > 0:
+            if item % 2:
+                total += item
+            else:
+                total -= 1
+            item -= 1
+    else:
+        total += 1
+    return total
+
+
+def try_except_finally(path):
+    try:
+        data = open(path).read()
+    except FileNotFoundError:
+        return None
+    except (PermissionError, IsADirectoryError):
+        if path:
+            return ""
+        raise
+    else:
+        data = data.strip()
+    finally:
+        if path:
+            print("done")
+    return data
+
+
+def decorator(func):
+    def wrapper(*args, **kwargs):
+        if args:
+            return func(*args, **kwargs)
+        return None
+
+    return wrapper
+
+
+def decorator_factory(flag):
+    def decorator(func):
+        def wrapper(*args):
+            if flag and args:
+                return func(*args)
+            return None
+
+        return wrapper
+
+    return decorator
+
+
+def nested_functions(values):
+    def inner(value):
+        if value:
+            return value
+        return 0
+
+    class Helper:
+        def method(self):
+            for value in values:
+                if value:
+                    return value
+            return None
+
+    return [inner(v) for v in values if v], Helper
+
+
+def lambdas_and_ternaries(values):
+    key = lambda v: v if v > 0 else -v
+    return sorted(values, key=key) if values else []
+
+
+def boolean_operators(a, b, c, d):
+    if a and b or c and not d:
+        return True
+    return (a or b) and (c or d)
+
+
+def factorial(n):
+    if n <= 1:
+        return 1
+    return n * factorial(n - 1)
+
+
+def recursion_in_default(n, fallback=lambda: recursion_in_default(0)):
+    return n
+
+
+async def async_constructs(session, urls):
+    async with session:
+        async for url in urls:
+            if url:
+                await session.get(url)
+    with open("log") as log:
+        for url in urls:
+            log.write(url)
+
+
+def comprehensions(matrix):
+    flat = [cell for row in matrix for cell in row if cell]
+    lookup = {k: v for k, v in enumerate(flat) if v and k}
+    return any(x for x in flat if x > 0), lookup
+
+
+def while_with_break(queue):
+    while queue:
+        item = queue.pop()
+        if item is None:
+            break
+        elif item < 0:
+            continue
+    else:
+        return False
+    return True
@@ -0,0 +1,206 @@
+"""Tests for the fused complexity calculator module."""
+
+import ast
+import inspect
+import json
+import pickle
+import sys
+from pathlib import Path
+from typing import Union
+
+import pytest
+
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.infrastructure.calculators.concrete_calculators import (
+    CognitiveComplexityCalculator,
+    ComplexityCalculatorFactory,
+    CyclomaticComplexityCalculator,
+)
+from cccy.infrastructure.calculators.fused_calculator import (
+    FusedCognitiveComplexityCalculator,
+    FusedComplexityCalculator,
+    FusedCyclomaticComplexityCalculator,
+    _TreeScorer,
+)
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "conformance.py"
+SOURCE_ROOT = Path(__file__).parents[3] / "src" / "cccy"
+STDLIB_MODULES = [json, inspect, ast]
+
+
+def _function_nodes(
+    source: str,
+) -> list[Union[ast.FunctionDef, ast.AsyncFunctionDef]]:
+    tree = ast.parse(source)
+    return [
+        node
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def _assert_matches_libraries(source: str) -> int:
+    engine = FusedComplexityCalculator()
+    cyclomatic = CyclomaticComplexityCalculator()
+    cognitive = CognitiveComplexityCalculator()
+
+    nodes = _function_nodes(source)
+    for node in nodes:
+        expected = (cyclomatic.calculate(node), cognitive.calculate(node))
+        assert engine.calculate(node) == expected, node.name
+    return len(nodes)
+
+
+class TestFusedComplexityCalculator:
+    """Test cases for FusedComplexityCalculator."""
+
+    def test_matches_libraries_on_conformance_corpus(self) -> None:
+        """Test that every fixture function scores like the libraries."""
+        # Arrange
+        source = FIXTURE_PATH.read_text(encoding="utf-8")
+
+        # Act
+        count = _assert_matches_libraries(source)
+
+        # Assert
+        assert count >= 15
+
+    @pytest.mark.parametrize("module", STDLIB_MODULES, ids=lambda m: m.__name__)
+    def test_matches_libraries_on_stdlib(self, module: object) -> None:
+        """Test conformance on real-world standard library code."""
+        _assert_matches_libraries(inspect.getsource(module))  # type: ignore[arg-type]
+
+    def test_matches_libraries_on_own_source(self) -> None:
+        """Test conformance on cccy's own source tree."""
+        for path in sorted(SOURCE_ROOT.rglob("*.py")):
+            _assert_matches_libraries(path.read_text(encoding="utf-8"))
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="match requires 3.10+")
+    def test_matches_libraries_on_match_statement(self) -> None:
+        """Test that match bodies are ignored by mccabe but scored by cognitive."""
+        source = (
+            "def dispatch(command):\n"
+            "    match command:\n"
+            "        case 'start':\n"
+            "            if command:\n"
+            "                return 1\n"
+            "        case _:\n"
+            "            return 2\n"
+        )
+
+        _assert_matches_libraries(source)
+
+    def test_known_scores(self) -> None:
+        """Test hand-computed scores for a few constructs."""
+        # Arrange
+        source = FIXTURE_PATH.read_text(encoding="utf-8")
+        nodes = {node.name: node for node in _function_nodes(source)}
+        engine = FusedComplexityCalculator()
+
+        # Act & Assert
+        assert engine.calculate(nodes["simple"]) == (1, 0)
+        assert engine.calculate(nodes["if_elif_else"]) == (4, 4)
+        assert engine.calculate(nodes["factorial"]) == (2, 2)
+
+    def test_views_share_one_traversal(self) -> None:
+        """Test that the cyclomatic and cognitive views reuse one engine."""
+        # Arrange
+        cyclomatic, cognitive = ComplexityCalculatorFactory.create_calculators()
+        node = _function_nodes("def f(x):\n    if x:\n        return 1\n")[0]
+
+        # Act
+        cyclomatic_value = cyclomatic.calculate(node)
+        cognitive_value = cognitive.calculate(node)
+
+        # Assert
+        assert isinstance(cyclomatic, FusedCyclomaticComplexityCalculator)
+        assert isinstance(cognitive, FusedCognitiveComplexityCalculator)
+        assert cyclomatic.engine is cognitive.engine
+        assert (cyclomatic_value, cognitive_value) == (2, 1)
+
+
+def _nested_source(depth: int) -> str:
+    lines = []
+    for level in range(depth):
+        indent = "    " * level
+        lines.append(f"{indent}def level_{level}(x):")
+        lines.append(f"{indent}    if x and level_{level}(x - 1):")
+        lines.append(f"{indent}        x -= 1")
+    lines.append("    " * depth + "return x")
+    return "\n".join(lines) + "\n"
+
+
+class TestNestedFunctions:
+    """Test cases for bottom-up scoring of nested functions."""
+
+    def test_nested_scores_match_libraries(self) -> None:
+        """Test that reused inner scores equal the library scores."""
+        # Arrange
+        source = _nested_source(30)
+        builtin = ComplexityAnalyzer(*ComplexityCalculatorFactory.create_calculators())
+        library = ComplexityAnalyzer(
+            *ComplexityCalculatorFactory.create_calculators("library")
+        )
+
+        # Act
+        builtin_result = builtin._analyze_source("nested.py", source)
+        library_result = library._analyze_source("nested.py", source)
+
+        # Assert
+        assert builtin_result is not None
+        assert builtin_result == library_result
+
+    def test_each_node_is_visited_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that analyzing nested functions visits each node at most once."""
+        # Arrange
+        source = _nested_source(60)
+        tree_size = sum(1 for _ in ast.walk(ast.parse(source)))
+        analyzer = ComplexityAnalyzer(*ComplexityCalculatorFactory.create_calculators())
+        original_visit = _TreeScorer._visit
+        visits = 0
+
+        def counting_visit(self: _TreeScorer, *args: object) -> None:
+            nonlocal visits
+            visits += 1
+            original_visit(self, *args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(_TreeScorer, "_visit", counting_visit)
+
+        # Act
+        result = analyzer._analyze_source("nested.py", source)
+
+        # Assert
+        assert result is not None
+        assert len(result.functions) == 60
+        assert visits < tree_size
+
+    def test_engine_is_picklable_after_use(self) -> None:
+        """Test that the memo is dropped when the engine is sent to workers."""
+        # Arrange
+        engine = FusedComplexityCalculator()
+        node = _function_nodes(_nested_source(3))[0]
+        expected = engine.calculate(node)
+
+        # Act
+        restored = pickle.loads(pickle.dumps(engine))  # noqa: S301
+
+        # Assert
+        assert restored.calculate(node) == expected
+
+
+class TestCreateCalculators:
+    """Test cases for ComplexityCalculatorFactory.create_calculators."""
+
+    def test_library_engine(self) -> None:
+        """Test that the library engine returns the library calculators."""
+        cyclomatic, cognitive = ComplexityCalculatorFactory.create_calculators(
+            "library"
+        )
+
+        assert isinstance(cyclomatic, CyclomaticComplexityCalculator)
+        assert isinstance(cognitive, CognitiveComplexityCalculator)
+
+    def test_unknown_engine(self) -> None:
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError, match="Unknown calculator engine"):
+            ComplexityCalculatorFactory.create_calculators("unknown")
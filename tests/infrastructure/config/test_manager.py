@@ -3,6 +3,8 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from cccy.infrastructure.config.manager import CccyConfig
 
 
@@ -146,6 +148,68 @@ exclude = ["*/tests/*"]
             assert merged["exclude"] == ["*/migrations/*"]  # CLI override
             assert merged["paths"] == ["lib/"]  # CLI override
 
+    def test_merge_jobs_from_config_and_cli(self) -> None:
+        """Test jobs setting from config file and CLI override."""
+        config_content = """
+[tool.cccy]
+jobs = "auto"
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write(config_content)
+            f.flush()
+
+            config_manager = CccyConfig(Path(f.name))
+            assert config_manager.get_jobs() == "auto"
+            assert config_manager.merge_with_cli_options()["jobs"] == "auto"
+            assert config_manager.merge_with_cli_options(jobs=4)["jobs"] == 4
+
+    def test_merge_default_excludes_from_config_and_cli(self) -> None:
+        """Test default-excludes setting from config file and CLI override."""
+        config_content = """
+[tool.cccy]
+default-excludes = false
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write(config_content)
+            f.flush()
+
+            config_manager = CccyConfig(Path(f.name))
+            merged = config_manager.merge_with_cli_options()
+            overridden = config_manager.merge_with_cli_options(default_excludes=True)
+
+            assert merged["default_excludes"] is False
+            assert overridden["default_excludes"] is True
+
+    def test_respect_gitignore_defaults_to_false(self) -> None:
+        """Test respect-gitignore default and CLI override."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write("[tool.cccy]\n")
+            f.flush()
+
+            config_manager = CccyConfig(Path(f.name))
+            merged = config_manager.merge_with_cli_options()
+            overridden = config_manager.merge_with_cli_options(respect_gitignore=True)
+
+            assert merged["respect_gitignore"] is False
+            assert overridden["respect_gitignore"] is True
+
+    def test_invalid_jobs_config(self) -> None:
+        """Test that an invalid jobs value is reported."""
+        config_content = """
+[tool.cccy]
+jobs = 0
+"""
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write(config_content)
+            f.flush()
+
+            config_manager = CccyConfig(Path(f.name))
+            with pytest.raises(ValueError, match="Configuration error"):
+                config_manager.get_jobs()
+
     def test_config_with_partial_status_thresholds(self) -> None:
         """Test config with only partial status threshold definitions."""
         config_content = """
@@ -206,3 +270,40 @@ max-complexity = 15
 
             # Assert
             assert paths == ["."]  # Should default to current directory
+
+    def test_settings_are_reloaded_when_file_changes(self) -> None:
+        """Test that settings parsed earlier are reused only for the same content."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "pyproject.toml"
+            config_path.write_text("[tool.cccy]\nmax-complexity = 8\n")
+            first = CccyConfig(config_path).get_max_complexity()
+
+            # Act
+            config_path.write_text("[tool.cccy]\nmax-complexity = 9\n")
+            changed = CccyConfig(config_path).get_max_complexity()
+            config_path.write_text("[tool.cccy]\nmax-complexity = 8\n")
+            restored = CccyConfig(config_path).get_max_complexity()
+
+            # Assert
+            assert (first, changed, restored) == (8, 9, 8)
+
+    def test_settings_are_reloaded_when_environment_changes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CCCY_ variables are part of the reused settings' key."""
+        # Arrange
+        monkeypatch.delenv("CCCY_MAX_COGNITIVE", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "pyproject.toml"
+            config_path.write_text("[tool.cccy]\nmax-complexity = 8\n")
+            first = CccyConfig(config_path).get_max_cognitive()
+
+            # Act
+            monkeypatch.setenv("CCCY_MAX_COGNITIVE", "3")
+            overridden = CccyConfig(config_path).get_max_cognitive()
+            monkeypatch.delenv("CCCY_MAX_COGNITIVE")
+            restored = CccyConfig(config_path).get_max_cognitive()
+
+        # Assert
+        assert (first, overridden, restored) == (None, 3, None)
@@ -0,0 +1,301 @@
+"""Tests for the process pool executor module."""
+
+import tempfile
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from cccy.domain.entities.records import FileRecord
+from cccy.domain.services.analysis_stats import (
+    AnalysisStats,
+    InstrumentedComplexityAnalyzer,
+)
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.domain.services.profiling import ProfileSession
+from cccy.infrastructure.calculators.concrete_calculators import (
+    CognitiveComplexityCalculator,
+    CyclomaticComplexityCalculator,
+)
+from cccy.infrastructure.executors import process_pool
+from cccy.infrastructure.executors.process_pool import (
+    ProcessPoolFileAnalysisExecutor,
+    _Chunk,
+    _ChunkResult,
+    _iter_in_order,
+    resolve_worker_count,
+)
+
+
+def _create_analyzer(executor: ProcessPoolFileAnalysisExecutor) -> ComplexityAnalyzer:
+    return ComplexityAnalyzer(
+        cyclomatic_calculator=CyclomaticComplexityCalculator(),
+        cognitive_calculator=CognitiveComplexityCalculator(),
+        executor=executor,
+    )
+
+
+class _ImmediatePool:
+    """A stand-in for ProcessPoolExecutor that completes chunks on submit."""
+
+    def __init__(self) -> None:
+        self.submitted: list[list[str]] = []
+        self.shutdown_kwargs: dict[str, bool] = {}
+
+    def submit(
+        self,
+        fn: Callable[..., Any],  # noqa: ARG002
+        chunk: list[str],
+    ) -> "Future[_ChunkResult]":
+        self.submitted.append(chunk)
+        future: Future[_ChunkResult] = Future()
+        records = [FileRecord(path, ()) for path in chunk]
+        future.set_result(_ChunkResult(len(self.submitted) % 2, 0.0, list(records)))
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self.shutdown_kwargs = {"wait": wait, "cancel_futures": cancel_futures}
+
+
+class TestResolveWorkerCount:
+    """Test cases for resolve_worker_count."""
+
+    def test_none_is_single_worker(self) -> None:
+        """Test that None resolves to a single worker."""
+        assert resolve_worker_count(None) == 1
+
+    def test_integer_and_digit_string(self) -> None:
+        """Test explicit worker counts."""
+        assert resolve_worker_count(4) == 4
+        assert resolve_worker_count("3") == 3
+
+    def test_auto_uses_cpu_count(self) -> None:
+        """Test that "auto" resolves to at least one worker."""
+        assert resolve_worker_count("auto") >= 1
+
+    @pytest.mark.parametrize("jobs", [0, -1, "many"])
+    def test_invalid_values(self, jobs: object) -> None:
+        """Test that invalid worker counts are rejected."""
+        with pytest.raises(ValueError):
+            resolve_worker_count(jobs)  # type: ignore[arg-type]
+
+
+class TestProcessPoolFileAnalysisExecutor:
+    """Test cases for ProcessPoolFileAnalysisExecutor."""
+
+    def test_invalid_max_workers(self) -> None:
+        """Test that max_workers must be positive."""
+        with pytest.raises(ValueError):
+            ProcessPoolFileAnalysisExecutor(max_workers=0)
+
+    def test_parallel_results_match_serial_results(self) -> None:
+        """Test that parallel analysis returns the same results in path order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            tmpdir_path = Path(tmpdir)
+            for i in range(12):
+                # Later files are larger, so they are sent to the workers first
+                (tmpdir_path / f"module_{i:02d}.py").write_text(
+                    "# padding\n" * (i * 100)
+                    + f"def func_{i}(x):\n    if x > {i}:\n        return 1\n    return 0\n"
+                )
+            (tmpdir_path / "broken.py").write_text("def broken(:\n")
+
+            serial = ComplexityAnalyzer(
+                cyclomatic_calculator=CyclomaticComplexityCalculator(),
+                cognitive_calculator=CognitiveComplexityCalculator(),
+            )
+            parallel = _create_analyzer(
+                ProcessPoolFileAnalysisExecutor(max_workers=2, chunk_size=4)
+            )
+
+            # Act
+            serial_results = serial.analyze_directory(tmpdir_path)
+            parallel_results = parallel.analyze_directory(tmpdir_path)
+
+            # Assert
+            assert len(parallel_results) == 12
+            assert parallel_results == serial_results
+            file_paths = [r.file_path for r in parallel_results]
+            assert file_paths == sorted(file_paths)
+
+    def test_iter_execute_streams_from_a_generator(self) -> None:
+        """Test that results are yielded in order from a lazily produced file list."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            tmpdir_path = Path(tmpdir)
+            for i in range(20):
+                (tmpdir_path / f"module_{i:02d}.py").write_text(
+                    f"def func_{i}(): pass\n"
+                )
+            executor = ProcessPoolFileAnalysisExecutor(max_workers=2, chunk_size=2)
+            analyzer = _create_analyzer(executor)
+            files = (tmpdir_path / f"module_{i:02d}.py" for i in range(20))
+
+            # Act
+            results = executor.iter_execute(analyzer, files)
+            first = next(results)
+            rest = list(results)
+
+            # Assert
+            assert first.functions[0].name == "func_0"
+            assert [r.functions[0].name for r in rest] == [
+                f"func_{i}" for i in range(1, 20)
+            ]
+
+    def test_single_file_runs_in_process(self) -> None:
+        """Test that a single file is analyzed without spawning workers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            file_path = Path(tmpdir) / "only.py"
+            file_path.write_text("def only():\n    return 1\n")
+            executor = ProcessPoolFileAnalysisExecutor(max_workers=4)
+            analyzer = _create_analyzer(executor)
+
+            # Act
+            results = executor.execute(analyzer, [file_path])
+
+            # Assert
+            assert len(results) == 1
+            assert results[0].functions[0].name == "only"
+
+    def test_iter_in_order_limits_pending_chunks(self) -> None:
+        """Test that no more chunks are submitted than the consumer can absorb."""
+        # Arrange
+        pool = _ImmediatePool()
+        chunks = (_Chunk(i, [i], [f"file_{i}.py"]) for i in range(100))
+
+        # Act
+        results = _iter_in_order(pool, chunks, 3, 100)  # type: ignore[arg-type]
+        first = next(results)
+        submitted_after_first = len(pool.submitted)
+        rest = list(results)
+
+        # Assert
+        assert first.file_path == "file_0.py"
+        assert submitted_after_first == 3
+        assert [r.file_path for r in rest] == [f"file_{i}.py" for i in range(1, 100)]
+
+    def test_iter_in_order_restores_input_order(self) -> None:
+        """Test that chunks sent largest first are yielded in input order."""
+        # Arrange
+        pool = _ImmediatePool()
+        chunks = iter(
+            [
+                _Chunk(0, [2], ["file_2.py"]),
+                _Chunk(0, [0, 3], ["file_0.py", "file_3.py"]),
+                _Chunk(0, [1], ["file_1.py"]),
+            ]
+        )
+
+        # Act
+        results = list(_iter_in_order(pool, chunks, 2, 4))  # type: ignore[arg-type]
+
+        # Assert
+        assert [r.file_path for r in results] == [f"file_{i}.py" for i in range(4)]
+
+    def test_iter_in_order_waits_for_the_lookahead(self) -> None:
+        """Test that chunks beyond the lookahead wait for earlier results."""
+        # Arrange
+        pool = _ImmediatePool()
+        chunks = (_Chunk(i, [i], [f"file_{i}.py"]) for i in range(10))
+
+        # Act
+        results = _iter_in_order(pool, chunks, 10, 2)  # type: ignore[arg-type]
+        next(results)
+        submitted_after_first = len(pool.submitted)
+        list(results)
+
+        # Assert
+        assert submitted_after_first == 3
+        assert len(pool.submitted) == 10
+
+    def test_parallel_run_reports_utilization(self) -> None:
+        """Test that a parallel run records the work done by each worker."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            tmpdir_path = Path(tmpdir)
+            for i in range(8):
+                (tmpdir_path / f"module_{i}.py").write_text("x = 1\n" * 100 * i)
+            executor = ProcessPoolFileAnalysisExecutor(max_workers=2)
+            analyzer = _create_analyzer(executor)
+
+            # Act
+            analyzer.analyze_directory(tmpdir_path)
+
+            # Assert
+            workers = executor.last_utilization
+            assert 1 <= len(workers) <= 2
+            assert sum(worker.files for worker in workers) == 8
+            assert all(0.0 <= worker.utilization <= 1.0 for worker in workers)
+
+    def test_parallel_run_merges_worker_stats(self) -> None:
+        """Test that the statistics collected in the workers reach the parent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            tmpdir_path = Path(tmpdir)
+            for i in range(8):
+                (tmpdir_path / f"module_{i}.py").write_text("def f():\n    pass\n")
+            stats = AnalysisStats()
+            analyzer = InstrumentedComplexityAnalyzer(
+                stats,
+                CyclomaticComplexityCalculator(),
+                CognitiveComplexityCalculator(),
+                executor=ProcessPoolFileAnalysisExecutor(max_workers=2),
+            )
+
+            # Act
+            analyzer.analyze_directory(tmpdir_path)
+
+            # Assert
+            assert (stats.files, stats.functions) == (8, 8)
+            assert stats.bytes_read == 8 * len("def f():\n    pass\n")
+            assert 1 <= len(stats.workers) <= 2
+            assert stats.wall["parse"] > 0
+
+    def test_parallel_run_merges_worker_profiles(self) -> None:
+        """Test that the profiles taken in the workers reach the parent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Arrange
+            tmpdir_path = Path(tmpdir)
+            for i in range(8):
+                (tmpdir_path / f"module_{i}.py").write_text("x = 1\n" * 100 * i)
+            analyzer = _create_analyzer(ProcessPoolFileAnalysisExecutor(max_workers=2))
+            analyzer.profile = ProfileSession()
+
+            # Act
+            analyzer.analyze_directory(tmpdir_path)
+
+            # Assert
+            assert 1 <= len(analyzer.profile.workers) <= 2
+            functions = {
+                name
+                for _, _, name in analyzer.profile.to_pstats().stats  # type: ignore[attr-defined]
+            }
+            assert "analyze_file_record" in functions
+
+    def test_closing_iter_execute_cancels_pending_chunks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that closing the generator early shuts the pool down promptly."""
+        # Arrange
+        pools: list[_ImmediatePool] = []
+
+        def create_pool(**kwargs: Any) -> _ImmediatePool:  # noqa: ARG001
+            pools.append(_ImmediatePool())
+            return pools[-1]
+
+        monkeypatch.setattr(process_pool, "ProcessPoolExecutor", create_pool)
+        executor = ProcessPoolFileAnalysisExecutor(max_workers=2, chunk_size=1)
+        analyzer = _create_analyzer(executor)
+        files = (Path(f"file_{i}.py") for i in range(1000))
+
+        # Act
+        results = executor.iter_execute(analyzer, files)
+        next(results)
+        results.close()
+
+        # Assert
+        assert len(pools[0].submitted) <= 4
+        assert pools[0].shutdown_kwargs == {"wait": True, "cancel_futures": True}
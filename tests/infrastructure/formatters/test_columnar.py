@@ -0,0 +1,140 @@
+"""Tests for the columnar (Parquet and Arrow IPC) output module."""
+
+import io
+
+import pytest
+
+from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
+
+pa = pytest.importorskip("pyarrow")
+ipc = pytest.importorskip("pyarrow.ipc")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from cccy.infrastructure.formatters.columnar import (  # noqa: E402
+    FILE_SCHEMA,
+    FUNCTION_SCHEMA,
+    write_columnar,
+)
+
+
+def _result(path: str, scores: list[int]) -> FileComplexityResult:
+    """Create a file result with one function per cyclomatic score."""
+    functions = [
+        ComplexityResult(
+            name=f"func_{index}",
+            cyclomatic_complexity=score,
+            cognitive_complexity=score - 1,
+            lineno=index * 10 + 1,
+            col_offset=4,
+            end_lineno=index * 10 + 5,
+            end_col_offset=20,
+        )
+        for index, score in enumerate(scores)
+    ]
+    return FileComplexityResult(
+        file_path=path,
+        functions=functions,
+        total_cyclomatic=sum(scores),
+        total_cognitive=sum(score - 1 for score in scores),
+        max_cyclomatic=max(scores, default=0),
+        max_cognitive=max((score - 1 for score in scores), default=0),
+    )
+
+
+@pytest.fixture
+def sample_results() -> list[FileComplexityResult]:
+    """Create results for three files, one of them without functions."""
+    return [
+        _result("a.py", [1, 2, 3]),
+        _result("empty.py", []),
+        _result("b.py", [12]),
+    ]
+
+
+class TestWriteColumnar:
+    """Test cases for write_columnar."""
+
+    def test_parquet_functions(
+        self, sample_results: list[FileComplexityResult]
+    ) -> None:
+        """Test that function rows are written with typed, encoded columns."""
+        # Arrange
+        sink = io.BytesIO()
+
+        # Act
+        rows = write_columnar(sample_results, sink, "parquet", functions=True)
+
+        # Assert
+        table = pq.read_table(io.BytesIO(sink.getvalue()))
+        assert rows == 4
+        assert table.schema.equals(FUNCTION_SCHEMA)
+        assert table.column("file_path").to_pylist() == ["a.py"] * 3 + ["b.py"]
+        assert table.column("cyclomatic_complexity").to_pylist() == [1, 2, 3, 12]
+        assert table.column("end_line_number").to_pylist() == [5, 15, 25, 5]
+        assert table.column("col_offset").to_pylist() == [4, 4, 4, 4]
+        assert table.column("file_status").to_pylist() == ["OK"] * 3 + ["HIGH"]
+
+    def test_parquet_files(self, sample_results: list[FileComplexityResult]) -> None:
+        """Test that file rows include files without functions."""
+        # Arrange
+        sink = io.BytesIO()
+
+        # Act
+        rows = write_columnar(sample_results, sink, "parquet")
+
+        # Assert
+        table = pq.read_table(io.BytesIO(sink.getvalue()))
+        assert rows == 3
+        assert table.schema.equals(FILE_SCHEMA)
+        assert table.column("file_path").to_pylist() == ["a.py", "empty.py", "b.py"]
+        assert table.column("function_count").to_pylist() == [3, 0, 1]
+        assert table.column("total_cyclomatic").to_pylist() == [6, 0, 12]
+
+    def test_row_groups(self, sample_results: list[FileComplexityResult]) -> None:
+        """Test that rows are flushed in row groups without splitting a file."""
+        # Arrange
+        sink = io.BytesIO()
+
+        # Act
+        write_columnar(
+            sample_results, sink, "parquet", functions=True, row_group_size=2
+        )
+
+        # Assert
+        metadata = pq.ParquetFile(io.BytesIO(sink.getvalue())).metadata
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        assert sizes == [3, 1]
+
+    def test_arrow_stream(self, sample_results: list[FileComplexityResult]) -> None:
+        """Test that the Arrow IPC stream holds one batch per row group."""
+        # Arrange
+        sink = io.BytesIO()
+
+        # Act
+        write_columnar(sample_results, sink, "arrow", functions=True, row_group_size=1)
+
+        # Assert
+        reader = ipc.open_stream(sink.getvalue())
+        batches = list(reader)
+        assert [batch.num_rows for batch in batches] == [3, 1]
+        table = pa.Table.from_batches(batches)
+        assert table.column("file_path").to_pylist() == ["a.py"] * 3 + ["b.py"]
+
+    def test_empty_results(self) -> None:
+        """Test that no results still write a readable file with the schema."""
+        # Arrange
+        sink = io.BytesIO()
+
+        # Act
+        rows = write_columnar(iter([]), sink, "parquet", functions=True)
+
+        # Assert
+        table = pq.read_table(io.BytesIO(sink.getvalue()))
+        assert rows == 0
+        assert table.num_rows == 0
+        assert table.schema.equals(FUNCTION_SCHEMA)
+
+    def test_unknown_format(self) -> None:
+        """Test that an unknown format is rejected."""
+        with pytest.raises(ValueError, match="Unknown columnar format"):
+            write_columnar([], io.BytesIO(), "orc")
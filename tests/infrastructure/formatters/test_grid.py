@@ -0,0 +1,89 @@
+"""Tests for the built-in grid table renderer."""
+
+from io import StringIO
+
+import pytest
+from tabulate import tabulate
+
+from cccy.infrastructure.formatters.grid import render_table, write_table
+
+HEADERS = ["File", "Cyclomatic", "Cognitive", "Status"]
+
+
+class TestRenderTable:
+    """Test cases for render_table and write_table."""
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [["src/main.py", 3, 2, "OK"], ["src/a_much_longer_path.py", 12, 8, "HIGH"]],
+            [["a.py", -1, 1234567, "MEDIUM"]],
+            [["", 1, 2, "OK"], ["1", 3, 4, "OK"]],
+            [],
+        ],
+        ids=["files", "wide-numbers", "empty-and-numeric-strings", "no-rows"],
+    )
+    def test_matches_tabulate(self, rows: list[list[object]]) -> None:
+        """Test that plain tables are byte-identical to tabulate's grid."""
+        # Arrange
+        expected = tabulate(rows, headers=HEADERS, tablefmt="grid")
+
+        # Act
+        result = render_table(rows, HEADERS)
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [["a.py", None, 1.5, "OK"]],
+            [["1", 1, 2, "OK"], ["2.5", 3, 4, "OK"]],
+            [["données.py", 1, 2, "OK"]],
+            [[" padded.py ", 1, 2, "OK"]],
+            [["multi\nline.py", 1, 2, "OK"]],
+            [["a.py", "3", 2, "True"]],
+        ],
+        ids=[
+            "none-and-float",
+            "numeric-column",
+            "non-ascii",
+            "whitespace",
+            "newline",
+            "mixed",
+        ],
+    )
+    def test_falls_back_to_tabulate(self, rows: list[list[object]]) -> None:
+        """Test that tables the renderer cannot match are drawn by tabulate."""
+        # Arrange
+        expected = tabulate(rows, headers=HEADERS, tablefmt="grid")
+
+        # Act
+        result = render_table(rows, HEADERS)
+
+        # Assert
+        assert result == expected
+
+    def test_other_formats_use_tabulate(self) -> None:
+        """Test that formats other than grid are drawn by tabulate."""
+        # Arrange
+        rows = [["a.py", 1, 2, "OK"]]
+
+        # Act
+        result = render_table(rows, HEADERS, tablefmt="github")
+
+        # Assert
+        assert result == tabulate(rows, headers=HEADERS, tablefmt="github")
+
+    def test_write_table_to_stream(self) -> None:
+        """Test that write_table writes the same table to a stream."""
+        # Arrange
+        rows = [["a.py", 1, 2, "OK"], ["b.py", 10, 20, "HIGH"]]
+        stream = StringIO()
+
+        # Act
+        write_table(stream, rows, HEADERS)
+
+        # Assert
+        assert stream.getvalue() == render_table(rows, HEADERS)
+        assert stream.getvalue().endswith("+")
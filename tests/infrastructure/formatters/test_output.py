@@ -1,6 +1,8 @@
 """Tests for the output formatters module."""
 
 import json
+from collections.abc import Callable, Iterator
+from io import StringIO
 
 import pytest
 
@@ -190,6 +192,42 @@ class TestOutputFormatter:
             f"Expected cognitive complexity 0, got {first_function['cognitive_complexity']}"
         )
 
+    def test_iter_jsonl_matches_json(
+        self, sample_results: list[FileComplexityResult]
+    ) -> None:
+        """Test that each JSON line is the matching element of the JSON array."""
+        # Arrange
+        formatter = OutputFormatter()
+
+        # Act
+        lines = list(formatter.iter_jsonl(iter(sample_results)))
+
+        # Assert
+        assert len(lines) == 2
+        assert [json.loads(line) for line in lines] == json.loads(
+            formatter.format_json(sample_results)
+        )
+
+    def test_iter_jsonl_is_lazy(
+        self, sample_results: list[FileComplexityResult]
+    ) -> None:
+        """Test that a line is produced before later results are requested."""
+        # Arrange
+        formatter = OutputFormatter()
+        consumed: list[str] = []
+
+        def results() -> Iterator[FileComplexityResult]:
+            for result in sample_results:
+                consumed.append(result.file_path)
+                yield result
+
+        # Act
+        first = next(formatter.iter_jsonl(results()))
+
+        # Assert
+        assert json.loads(first)["file_path"] == "simple.py"
+        assert consumed == ["simple.py"]
+
     def test_format_csv_empty(self) -> None:
         """Test formatting empty results as CSV."""
         # Arrange
@@ -393,6 +431,21 @@ class TestOutputFormatter:
         parsed = json.loads(result)
         assert parsed == []  # No functions means empty array
 
+    def test_iter_functions_jsonl_matches_json(
+        self, sample_results: list[FileComplexityResult]
+    ) -> None:
+        """Test that each JSON line is one function of the function-level JSON."""
+        # Arrange
+        formatter = OutputFormatter()
+
+        # Act
+        lines = list(formatter.iter_functions_jsonl(sample_results))
+
+        # Assert
+        assert [json.loads(line) for line in lines] == json.loads(
+            formatter.format_functions_json(sample_results)
+        )
+
     def test_format_functions_csv_empty(self) -> None:
         """Test formatting empty results as functions CSV."""
         # Arrange
@@ -509,3 +562,83 @@ class TestOutputFormatter:
         # Check function names are different
         assert "func1" in lines[1]
         assert "func2" in lines[2]
+
+    def test_format_rows(self) -> None:
+        """Test formatting arbitrary rows as a table, JSON and CSV."""
+        # Arrange
+        headers = ["name", "score"]
+        rows = [("first", 3), ("second", 12)]
+
+        # Act
+        table = OutputFormatter.format_rows(headers, rows, "table")
+        data = json.loads(OutputFormatter.format_rows(headers, rows, "json"))
+        csv_lines = OutputFormatter.format_rows(headers, rows, "csv").splitlines()
+
+        # Assert
+        assert "second" in table
+        assert "score" in table
+        assert data == [{"name": "first", "score": 3}, {"name": "second", "score": 12}]
+        assert csv_lines == ["name,score", "first,3", "second,12"]
+
+    @pytest.mark.parametrize(
+        ("write", "format_"),
+        [
+            (OutputFormatter.write_table, OutputFormatter.format_table),
+            (
+                OutputFormatter.write_detailed_table,
+                OutputFormatter.format_detailed_table,
+            ),
+            (OutputFormatter.write_json, OutputFormatter.format_json),
+            (OutputFormatter.write_csv, OutputFormatter.format_csv),
+            (
+                OutputFormatter.write_functions_json,
+                OutputFormatter.format_functions_json,
+            ),
+            (OutputFormatter.write_functions_csv, OutputFormatter.format_functions_csv),
+            (OutputFormatter.write_summary, OutputFormatter.format_summary),
+        ],
+        ids=[
+            "table",
+            "detailed",
+            "json",
+            "csv",
+            "functions-json",
+            "functions-csv",
+            "summary",
+        ],
+    )
+    @pytest.mark.parametrize("empty", [False, True], ids=["results", "empty"])
+    def test_write_matches_format(
+        self,
+        sample_results: list[FileComplexityResult],
+        write: Callable[[list[FileComplexityResult], StringIO], None],
+        format_: Callable[[list[FileComplexityResult]], str],
+        empty: bool,
+    ) -> None:
+        """Test that each writer streams exactly the formatted string."""
+        # Arrange
+        results = [] if empty else sample_results
+        stream = StringIO()
+
+        # Act
+        write(results, stream)
+
+        # Assert
+        assert stream.getvalue() == format_(results)
+
+    def test_write_json_from_generator(
+        self, sample_results: list[FileComplexityResult]
+    ) -> None:
+        """Test that the JSON array is written from results produced lazily."""
+        # Arrange
+        stream = StringIO()
+
+        # Act
+        OutputFormatter.write_json(iter(sample_results), stream)
+
+        # Assert
+        assert stream.getvalue() == OutputFormatter.format_json(sample_results)
+        assert [item["file_path"] for item in json.loads(stream.getvalue())] == [
+            "simple.py",
+            "complex.py",
+        ]
@@ -0,0 +1,203 @@
+"""Tests for the SQLite result store."""
+
+import sqlite3
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cccy.domain.entities.complexity import ComplexityResult, FileComplexityResult
+from cccy.domain.exceptions.complexity_exceptions import ResultStoreError
+from cccy.infrastructure.stores.sqlite_store import SCHEMA_VERSION, SQLiteResultStore
+
+
+def _result(file_path: str, *scores: tuple[str, int, int]) -> FileComplexityResult:
+    functions = [
+        ComplexityResult(
+            name=name,
+            cyclomatic_complexity=cyclomatic,
+            cognitive_complexity=cognitive,
+            lineno=index * 10 + 1,
+            col_offset=0,
+            end_lineno=index * 10 + 5,
+        )
+        for index, (name, cyclomatic, cognitive) in enumerate(scores)
+    ]
+    return FileComplexityResult(
+        file_path=file_path,
+        functions=functions,
+        total_cyclomatic=sum(function.cyclomatic_complexity for function in functions),
+        total_cognitive=sum(function.cognitive_complexity for function in functions),
+        max_cyclomatic=max(
+            (function.cyclomatic_complexity for function in functions), default=0
+        ),
+        max_cognitive=max(
+            (function.cognitive_complexity for function in functions), default=0
+        ),
+    )
+
+
+RESULTS = [
+    _result("a.py", ("parse", 12, 20), ("load", 2, 1)),
+    _result("b.py", ("render", 7, 9)),
+    _result("empty.py"),
+]
+
+
+@pytest.fixture
+def db_path() -> Iterator[Path]:
+    """Provide the path of a database file that does not exist yet."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir) / "results.sqlite"
+
+
+@pytest.fixture
+def store(db_path: Path) -> Iterator[SQLiteResultStore]:
+    """Provide a store with no runs."""
+    store = SQLiteResultStore(str(db_path))
+    yield store
+    store.close()
+
+
+def _count(db_path: Path, table: str) -> int:
+    with sqlite3.connect(db_path) as connection:
+        (count,) = connection.execute(f"SELECT count(*) FROM {table}").fetchone()  # noqa: S608
+    return int(count)
+
+
+class TestSQLiteResultStore:
+    """Test cases for SQLiteResultStore."""
+
+    def test_save_run_records_files_and_functions(
+        self, store: SQLiteResultStore
+    ) -> None:
+        """Test that a saved run can be listed with its counts."""
+        # Act
+        run_id = store.save_run(RESULTS, "check", "builtin")
+
+        # Assert
+        (run,) = store.list_runs()
+        assert run.run_id == run_id
+        assert (run.command, run.engine) == ("check", "builtin")
+        assert (run.file_count, run.function_count) == (3, 3)
+
+    def test_unchanged_files_are_shared_across_runs(
+        self, store: SQLiteResultStore, db_path: Path
+    ) -> None:
+        """Test that only files with new results add rows."""
+        # Arrange
+        store.save_run(RESULTS, "check")
+        changed = [_result("a.py", ("parse", 4, 3), ("load", 2, 1)), *RESULTS[1:]]
+
+        # Act
+        store.save_run(RESULTS, "check")
+        store.save_run(changed, "check")
+
+        # Assert
+        assert _count(db_path, "files") == 4
+        assert _count(db_path, "functions") == 5
+        assert _count(db_path, "run_files") == 9
+
+    def test_identical_files_share_one_result(
+        self, store: SQLiteResultStore, db_path: Path
+    ) -> None:
+        """Test that files with the same results in one run are stored once."""
+        # Act
+        store.save_run([RESULTS[1], _result("copy.py", ("render", 7, 9))], "check")
+
+        # Assert
+        assert _count(db_path, "files") == 1
+        assert [row.file_path for row in store.top_functions("cyclomatic", 5)] == [
+            "b.py",
+            "copy.py",
+        ]
+
+    def test_top_functions_defaults_to_the_latest_run(
+        self, store: SQLiteResultStore
+    ) -> None:
+        """Test ranking functions by a metric in the latest or a given run."""
+        # Arrange
+        first = store.save_run(RESULTS, "check")
+        store.save_run([_result("a.py", ("parse", 4, 3))], "check")
+
+        # Act
+        latest = store.top_functions("cognitive", 2)
+        earlier = store.top_functions("cognitive", 2, run_id=first)
+
+        # Assert
+        assert [(row.name, row.cognitive_complexity) for row in latest] == [
+            ("parse", 3)
+        ]
+        assert [(row.name, row.cognitive_complexity) for row in earlier] == [
+            ("parse", 20),
+            ("render", 9),
+        ]
+
+    def test_files_over_threshold(self, store: SQLiteResultStore) -> None:
+        """Test selecting the files whose most complex function exceeds a threshold."""
+        # Arrange
+        store.save_run(RESULTS, "check")
+
+        # Act
+        over = store.files_over("cyclomatic", 7)
+        over_cognitive = store.files_over("cognitive", 5)
+
+        # Assert
+        assert [(row.file_path, row.max_cyclomatic) for row in over] == [("a.py", 12)]
+        assert [row.file_path for row in over_cognitive] == ["a.py", "b.py"]
+
+    def test_function_history(self, store: SQLiteResultStore) -> None:
+        """Test following the scores of one function across runs."""
+        # Arrange
+        store.save_run(RESULTS, "check")
+        store.save_run([_result("a.py", ("parse", 4, 3))], "check")
+
+        # Act
+        history = store.function_history("parse", "a.py")
+
+        # Assert
+        assert [(row.run_id, row.cyclomatic_complexity) for row in history] == [
+            (1, 12),
+            (2, 4),
+        ]
+        assert store.function_history("parse", "b.py") == []
+
+    def test_unknown_metric_is_rejected(self, store: SQLiteResultStore) -> None:
+        """Test that only known metrics are put into the SQL."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="unknown metric"):
+            store.top_functions("lines; DROP TABLE runs", 5)
+
+    def test_reopening_keeps_the_runs(self, db_path: Path) -> None:
+        """Test that the schema is created once and runs persist."""
+        # Arrange
+        first = SQLiteResultStore(str(db_path))
+        first.save_run(RESULTS, "check")
+        first.close()
+
+        # Act
+        store = SQLiteResultStore(str(db_path))
+
+        # Assert
+        assert len(store.list_runs()) == 1
+        store.close()
+
+    def test_newer_schema_is_rejected(self, db_path: Path) -> None:
+        """Test that a database written by a newer version is not modified."""
+        # Arrange
+        with sqlite3.connect(db_path) as connection:
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+        # Act & Assert
+        with pytest.raises(ResultStoreError, match="newer"):
+            SQLiteResultStore(str(db_path))
+
+    def test_not_a_database(self, db_path: Path) -> None:
+        """Test that a file that is not a database raises ResultStoreError."""
+        # Arrange
+        db_path.write_text("not a database\n" * 100)
+
+        # Act & Assert
+        with pytest.raises(ResultStoreError, match=str(db_path.name)):
+            SQLiteResultStore(str(db_path))
@@ -0,0 +1 @@
+"""Tests for version control infrastructure."""
@@ -0,0 +1,149 @@
+"""Tests for the git changed files provider module."""
+
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cccy.domain.exceptions.complexity_exceptions import VersionControlError
+from cccy.infrastructure.vcs.git import GitChangedFilesProvider, parse_unified_diff
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repository() -> Iterator[Path]:
+    """Create a repository with a feature branch on top of main."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        _git(root, "init", "-q", "-b", "main")
+        _git(root, "config", "user.email", "cccy@example.com")
+        _git(root, "config", "user.name", "cccy")
+        for name in ["committed.py", "modified.py", "deleted.py", "staged.py"]:
+            (root / name).write_text("x = 1\n")
+        _git(root, "add", ".")
+        _git(root, "commit", "-q", "-m", "initial")
+
+        _git(root, "checkout", "-q", "-b", "feature")
+        (root / "committed.py").write_text("x = 2\n")
+        _git(root, "commit", "-q", "-am", "change")
+        (root / "modified.py").write_text("x = 2\n")
+        (root / "staged.py").write_text("x = 2\n")
+        _git(root, "add", "staged.py")
+        _git(root, "rm", "-q", "deleted.py")
+        (root / "untracked.py").write_text("x = 1\n")
+        yield root
+
+
+class TestParseUnifiedDiff:
+    """Test cases for parse_unified_diff."""
+
+    def test_hunk_ranges(self) -> None:
+        """Test added, modified, deleted and quoted paths."""
+        # Arrange
+        output = b"""diff --git a/a.py b/a.py
+--- a/a.py
++++ b/a.py
+@@ -3 +3 @@ def f():
+@@ -10,0 +11,3 @@ def g():
+@@ -20,2 +22,0 @@ def h():
+diff --git "a/caf\\303\\251.py" "b/caf\\303\\251.py"
+new file mode 100644
+--- /dev/null
++++ "b/caf\\303\\251.py"
+@@ -0,0 +1,2 @@
+diff --git a/removed.py b/removed.py
+--- a/removed.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+"""
+
+        # Act
+        hunks = parse_unified_diff(output, Path("/repo"))
+
+        # Assert
+        assert hunks == {
+            Path("/repo/a.py"): [(3, 3), (11, 13), (22, 22)],
+            Path("/repo/caf\u00e9.py"): [(1, 2)],
+        }
+
+
+@requires_git
+class TestGitChangedFilesProvider:
+    """Test cases for GitChangedFilesProvider."""
+
+    def test_changed_since_merge_base(self, repository: Path) -> None:
+        """Test committed, staged and unstaged changes since the merge base."""
+        # Arrange
+        provider = GitChangedFilesProvider(cwd=repository)
+
+        # Act
+        changed = provider.changed_files("main", staged=False)
+
+        # Assert
+        assert sorted(changed) == [
+            repository / "committed.py",
+            repository / "modified.py",
+            repository / "staged.py",
+        ]
+
+    def test_staged_only(self, repository: Path) -> None:
+        """Test that --staged compares the index with HEAD."""
+        # Arrange
+        provider = GitChangedFilesProvider(cwd=repository)
+
+        # Act
+        changed = provider.changed_files(None, staged=True)
+
+        # Assert
+        assert changed == [repository / "staged.py"]
+
+    def test_paths_are_relative_to_the_repository_root(self, repository: Path) -> None:
+        """Test that running from a subdirectory still yields absolute paths."""
+        # Arrange
+        subdirectory = repository / "sub"
+        subdirectory.mkdir()
+        provider = GitChangedFilesProvider(cwd=subdirectory)
+
+        # Act
+        changed = provider.changed_files(None, staged=True)
+
+        # Assert
+        assert changed == [repository / "staged.py"]
+
+    def test_changed_lines(self, repository: Path) -> None:
+        """Test that changed lines use the same range as changed files."""
+        # Arrange
+        (repository / "modified.py").write_text("x = 1\ny = 2\n")
+        provider = GitChangedFilesProvider(cwd=repository)
+
+        # Act
+        changed = provider.changed_lines("main", staged=False)
+
+        # Assert
+        assert changed == {
+            repository / "committed.py": [(1, 1)],
+            repository / "modified.py": [(2, 2)],
+            repository / "staged.py": [(1, 1)],
+        }
+
+    def test_unknown_revision(self, repository: Path) -> None:
+        """Test that an unknown revision raises VersionControlError."""
+        provider = GitChangedFilesProvider(cwd=repository)
+
+        with pytest.raises(VersionControlError, match="git diff failed"):
+            provider.changed_files("no-such-branch", staged=False)
+
+    def test_missing_git_executable(self, repository: Path) -> None:
+        """Test that a missing git executable raises VersionControlError."""
+        provider = GitChangedFilesProvider(cwd=repository, git="no-such-git")
+
+        with pytest.raises(VersionControlError, match="failed to run"):
+            provider.changed_files(None, staged=False)
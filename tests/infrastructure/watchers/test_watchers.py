@@ -0,0 +1,92 @@
+"""Tests for the file system watchers."""
+
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from cccy.domain.services.file_walker import is_default_excluded_dir
+from cccy.infrastructure.watchers.inotify import InotifyFileWatcher
+from cccy.infrastructure.watchers.polling import PollingFileWatcher
+
+
+@pytest.fixture
+def root() -> Iterator[Path]:
+    """Provide a directory with one Python file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir).resolve()
+        (path / "a.py").write_text("x = 1\n")
+        yield path
+
+
+class TestPollingFileWatcher:
+    """Test cases for PollingFileWatcher."""
+
+    def test_detects_modified_created_and_deleted_files(self, root: Path) -> None:
+        """Test that differences between scans are reported."""
+        # Arrange
+        watcher = PollingFileWatcher([root], is_default_excluded_dir, interval=0.01)
+        (root / "a.py").write_text("x = 22\n")
+        (root / "b.py").write_text("y = 1\n")
+        (root / ".venv").mkdir()
+        (root / ".venv" / "c.py").write_text("z = 1\n")
+
+        # Act
+        changes = watcher.read_changes(0.05)
+        (root / "b.py").unlink()
+        removed = watcher.read_changes(0.05)
+
+        # Assert
+        assert changes == {root / "a.py", root / "b.py"}
+        assert removed == {root / "b.py"}
+
+    def test_returns_empty_set_on_timeout(self, root: Path) -> None:
+        """Test that nothing is reported when nothing changes."""
+        # Arrange
+        watcher = PollingFileWatcher([root], is_default_excluded_dir, interval=0.01)
+
+        # Act
+        changes = watcher.read_changes(0.02)
+
+        # Assert
+        assert changes == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires inotify")
+class TestInotifyFileWatcher:
+    """Test cases for InotifyFileWatcher."""
+
+    def test_detects_writes_and_new_directories(self, root: Path) -> None:
+        """Test file writes and files in a directory created after startup."""
+        # Arrange
+        watcher = InotifyFileWatcher([root], is_default_excluded_dir)
+        try:
+            (root / "a.py").write_text("x = 2\n")
+            first = watcher.read_changes(1.0)
+            (root / "pkg").mkdir()
+            created = watcher.read_changes(1.0)
+
+            # Act
+            (root / "pkg" / "b.py").write_text("y = 1\n")
+            nested = watcher.read_changes(1.0)
+        finally:
+            watcher.close()
+
+        # Assert
+        assert root / "a.py" in first
+        assert created == {root / "pkg"}
+        assert root / "pkg" / "b.py" in nested
+
+    def test_returns_empty_set_on_timeout(self, root: Path) -> None:
+        """Test that nothing is reported when nothing changes."""
+        # Arrange
+        watcher = InotifyFileWatcher([root], is_default_excluded_dir)
+
+        # Act
+        changes = watcher.read_changes(0.01)
+        watcher.close()
+
+        # Assert
+        assert changes == set()
@@ -0,0 +1,228 @@
+"""Tests for the analysis daemon and its client."""
+
+import io
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cccy.presentation.cli import daemon
+from cccy.presentation.cli.daemon_server import DaemonServer, spawn_daemon
+from cccy.presentation.cli.main import main
+from cccy.presentation.factories import service_factory
+
+FIXTURE = str(Path(__file__).parent / "fixtures" / "simple.py")
+
+
+@pytest.fixture
+def socket_path(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """Provide a short socket path and point the client at it."""
+    # A daemon enables process-wide memory caches; undo that after the test
+    monkeypatch.setattr(service_factory, "_memory_caches", None)
+    with tempfile.TemporaryDirectory(prefix="cccy-") as tmpdir:
+        path = str(Path(tmpdir) / "daemon.sock")
+        monkeypatch.setenv(daemon.SOCKET_ENV, path)
+        monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+        yield path
+
+
+@pytest.fixture
+def running_daemon(socket_path: str) -> Iterator[DaemonServer]:
+    """Serve requests from a daemon running in a background thread."""
+    server = DaemonServer(socket_path, cache_size=100)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    while not Path(socket_path).exists():
+        thread.join(0.01)
+    yield server
+    daemon.request(socket_path, "stop")
+    thread.join(5)
+
+
+def _forward(*argv: str) -> tuple[int, str, str]:
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+    exit_code = daemon.forward_to_daemon(list(argv), stdout, stderr)
+    assert exit_code is not None
+    return exit_code, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+class TestDaemon:
+    """Test cases for forwarding commands to the daemon."""
+
+    def test_forwarded_command_matches_local_run(
+        self, running_daemon: DaemonServer
+    ) -> None:
+        """Test that the daemon produces the same output and exit code."""
+        # Arrange
+        args = ["check", "--max-complexity", "1", FIXTURE]
+        local = CliRunner().invoke(main, args)
+
+        # Act
+        exit_code, stdout, _ = _forward(*args)
+        _forward(*args)
+
+        # Assert
+        assert exit_code == local.exit_code == 1
+        assert stdout == local.output
+        assert running_daemon.status()["requests"] == 2
+        # The local run above already filled the process-wide memory cache
+        assert running_daemon.status()["cache"] == {
+            "entries": 1,
+            "hits": 2,
+            "misses": 1,
+        }
+
+    def test_client_environment_overrides_settings(
+        self, socket_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CCCY_ variables of the client apply in a daemon started without them."""
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CCCY_MAX_COMPLEXITY", raising=False)
+        spawn_daemon(socket_path, cache_size=10, idle_timeout=60)
+        monkeypatch.setenv("CCCY_MAX_COMPLEXITY", "1")
+        local = CliRunner().invoke(main, ["check", FIXTURE])
+
+        # Act
+        try:
+            exit_code, stdout, stderr = _forward("check", FIXTURE)
+        finally:
+            daemon.request(socket_path, "stop")
+
+        # Assert
+        assert exit_code == local.exit_code == 1
+        assert stdout == local.output
+        assert "required" not in stderr
+
+    def test_other_installation_runs_locally(
+        self, running_daemon: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a daemon started from another installation refuses to run."""
+        # Arrange
+        reinstalled = {**daemon.installation(), "mtime": 0}
+        monkeypatch.setattr(daemon, "installation", lambda: reinstalled)
+        stdout, stderr = io.BytesIO(), io.BytesIO()
+
+        # Act
+        exit_code = daemon.forward_to_daemon(["check", FIXTURE], stdout, stderr)
+
+        # Assert
+        assert exit_code is None
+        assert stdout.getvalue() == b""
+        assert b"a different installation" in stderr.getvalue()
+        assert running_daemon.requests == 0
+
+    @pytest.mark.parametrize("problem", ["mode", "symlink"])
+    def test_insecure_socket_directory_is_not_used(
+        self, socket_path: str, monkeypatch: pytest.MonkeyPatch, problem: str
+    ) -> None:
+        """Test that a socket directory other users could prepare is rejected."""
+        # Arrange
+        directory = Path(socket_path).parent
+        if problem == "mode":
+            directory.chmod(0o755)
+        else:
+            target = directory / "target"
+            target.mkdir(mode=0o700)
+            directory = directory / "link"
+            directory.symlink_to(target)
+            socket_path = str(directory / "daemon.sock")
+            monkeypatch.setenv(daemon.SOCKET_ENV, socket_path)
+        stderr = io.BytesIO()
+
+        # Act
+        exit_code = daemon.forward_to_daemon(["check", FIXTURE], io.BytesIO(), stderr)
+        start = CliRunner().invoke(
+            main, ["daemon", "start", "--foreground", "--socket", socket_path]
+        )
+
+        # Assert
+        assert exit_code is None
+        assert b"insecure cccy daemon directory" in stderr.getvalue()
+        assert start.exit_code == 1
+        assert "insecure cccy daemon directory" in start.output
+        assert not Path(socket_path).exists()
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_usage_errors_are_sent_to_stderr(self) -> None:
+        """Test that click errors keep their exit code and stream."""
+        # Act
+        exit_code, stdout, stderr = _forward("show-list", "--format", "xml", FIXTURE)
+
+        # Assert
+        assert exit_code == 2
+        assert stdout == ""
+        assert "Invalid value for '--format'" in stderr
+
+    def test_status_and_stop(self, running_daemon: DaemonServer) -> None:
+        """Test the management requests."""
+        # Act
+        status = daemon.request(running_daemon.socket_path, "status")
+        stopped = daemon.request(running_daemon.socket_path, "stop")
+
+        # Assert
+        assert status is not None
+        assert status["socket"] == running_daemon.socket_path
+        assert stopped is not None
+        assert daemon.request(running_daemon.socket_path, "status") is None
+
+    def test_idle_timeout_stops_server(self, socket_path: str) -> None:
+        """Test that the daemon exits when no request arrives in time."""
+        # Arrange
+        server = DaemonServer(socket_path, cache_size=10, idle_timeout=0.01)
+
+        # Act
+        server.serve_forever()
+
+        # Assert
+        assert not Path(socket_path).exists()
+
+    def test_commands_run_locally_without_daemon(
+        self, socket_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the cases in which the client does not forward."""
+        # Act
+        without_daemon = daemon.forward_to_daemon(["check", FIXTURE])
+        not_forwarded = daemon.forward_to_daemon(["cache", "stats"])
+        monkeypatch.setenv(daemon.DISABLE_ENV, "1")
+        disabled = daemon.forward_to_daemon(["check", FIXTURE])
+
+        # Assert
+        assert (without_daemon, not_forwarded, disabled) == (None, None, None)
+        assert daemon.request(socket_path, "status") is None
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["check", "--profile", "out", FIXTURE],
+            ["show-list", "--profile=out", FIXTURE],
+        ],
+    )
+    def test_profiled_commands_run_locally(
+        self, running_daemon: DaemonServer, argv: list[str]
+    ) -> None:
+        """Test that --profile measures this process instead of the daemon."""
+        # Act
+        exit_code = daemon.forward_to_daemon(argv)
+
+        # Assert
+        assert exit_code is None
+        assert running_daemon.requests == 0
+
+    def test_cli_status_when_not_running(self, socket_path: str) -> None:
+        """Test the daemon subcommands without a running daemon."""
+        # Arrange
+        runner = CliRunner()
+
+        # Act
+        status = runner.invoke(main, ["daemon", "status", "--socket", socket_path])
+        stop = runner.invoke(main, ["daemon", "stop"])
+
+        # Assert
+        assert status.exit_code == 1
+        assert "cccy daemon is not running." in status.output
+        assert stop.exit_code == 0
+        assert "cccy daemon is not running." in stop.output
@@ -0,0 +1,179 @@
+"""Tests for the Language Server Protocol server."""
+
+import io
+from typing import Any, BinaryIO
+
+import pytest
+
+from cccy.domain.services.complexity_analyzer import ComplexityAnalyzer
+from cccy.infrastructure.calculators.concrete_calculators import (
+    ComplexityCalculatorFactory,
+)
+from cccy.presentation.cli.lsp import (
+    LanguageServer,
+    Thresholds,
+    apply_change,
+    read_message,
+    write_message,
+)
+
+URI = "file:///project/module.py"
+SOURCE = "def simple(x):\n    return x\n\n\ndef branchy(x):\n    return x\n"
+
+
+def _frame(*messages: dict[str, Any]) -> io.BytesIO:
+    stream = io.BytesIO()
+    for message in messages:
+        write_message(stream, {"jsonrpc": "2.0", **message})
+    stream.seek(0)
+    return stream
+
+
+def _read_all(stream: BinaryIO) -> list[dict[str, Any]]:
+    stream.seek(0)
+    messages = []
+    while (message := read_message(stream)) is not None:
+        messages.append(message)
+    return messages
+
+
+def _change(line: int, start: int, end: int, text: str) -> dict[str, Any]:
+    return {
+        "range": {
+            "start": {"line": line, "character": start},
+            "end": {"line": line, "character": end},
+        },
+        "text": text,
+    }
+
+
+@pytest.fixture
+def server() -> LanguageServer:
+    """Provide a server that writes to memory."""
+    analyzer = ComplexityAnalyzer(*ComplexityCalculatorFactory.create_calculators())
+    return LanguageServer(analyzer, Thresholds(1, None), io.BytesIO())
+
+
+class TestApplyChange:
+    """Test cases for applying content changes."""
+
+    def test_range_change_spanning_lines(self) -> None:
+        """Test replacing text across a line break."""
+        # Arrange
+        lines = ["a = 1\n", "b = 2\n", "c = 3\n"]
+        change = {
+            "range": {
+                "start": {"line": 0, "character": 4},
+                "end": {"line": 1, "character": 4},
+            },
+            "text": "10\nbb = ",
+        }
+
+        # Act
+        result = apply_change(lines, change)
+
+        # Assert
+        assert result == ["a = 10\n", "bb = 2\n", "c = 3\n"]
+
+    def test_characters_are_utf16_code_units(self) -> None:
+        """Test that a surrogate pair counts as two characters."""
+        # Arrange
+        lines = ['s = "😀é"\n']
+
+        # Act
+        result = apply_change(lines, _change(0, 7, 8, "e"))
+
+        # Assert
+        assert result == ['s = "😀e"\n']
+
+    def test_full_content_change(self) -> None:
+        """Test a change without a range."""
+        # Act
+        result = apply_change(["old\n"], {"text": "new\nlines"})
+
+        # Assert
+        assert result == ["new\n", "lines"]
+
+
+class TestLanguageServer:
+    """Test cases for LanguageServer."""
+
+    def test_session_publishes_diagnostics_and_code_lenses(
+        self, server: LanguageServer
+    ) -> None:
+        """Test a complete session from initialize to exit."""
+        # Arrange
+        document = {"uri": URI, "languageId": "python", "version": 1, "text": SOURCE}
+        edit = _change(5, 4, 12, "if x:\n        return 1\n    return 0")
+        reader = _frame(
+            {"id": 1, "method": "initialize", "params": {}},
+            {"method": "initialized", "params": {}},
+            {"method": "textDocument/didOpen", "params": {"textDocument": document}},
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": URI, "version": 2},
+                    "contentChanges": [edit],
+                },
+            },
+            {
+                "id": 2,
+                "method": "textDocument/codeLens",
+                "params": {"textDocument": {"uri": URI}},
+            },
+            {"id": 3, "method": "shutdown"},
+            {"method": "exit"},
+        )
+
+        # Act
+        exit_code = server.serve(reader)
+
+        # Assert
+        assert exit_code == 0
+        initialize, opened, changed, lenses, shutdown = _read_all(server.writer)
+        assert initialize["result"]["capabilities"]["codeLensProvider"]
+        assert opened["params"]["diagnostics"] == []
+        (diagnostic,) = changed["params"]["diagnostics"]
+        assert diagnostic["range"]["start"] == {"line": 4, "character": 4}
+        assert diagnostic["range"]["end"] == {"line": 4, "character": 11}
+        assert "'branchy' is too complex (cyclomatic 2 > 1)" in diagnostic["message"]
+        titles = [lens["command"]["title"] for lens in lenses["result"]]
+        assert titles == ["cyclomatic 1 · cognitive 0", "cyclomatic 2 · cognitive 1"]
+        assert shutdown["result"] is None
+
+    def test_unknown_request_and_exit_without_shutdown(
+        self, server: LanguageServer
+    ) -> None:
+        """Test the error response and the exit code of an unclean exit."""
+        # Arrange
+        reader = _frame({"id": 7, "method": "custom/unknown"}, {"method": "exit"})
+
+        # Act
+        exit_code = server.serve(reader)
+
+        # Assert
+        assert exit_code == 1
+        (response,) = _read_all(server.writer)
+        assert response["id"] == 7
+        assert response["error"]["code"] == -32601
+
+    def test_close_clears_diagnostics(self, server: LanguageServer) -> None:
+        """Test that closing a document clears its diagnostics."""
+        # Arrange
+        document = {"uri": URI, "text": "def f(x):\n    if x:\n        return 1\n"}
+        server.handle(
+            {"method": "textDocument/didOpen", "params": {"textDocument": document}}
+        )
+
+        # Act
+        server.handle(
+            {
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": URI}},
+            }
+        )
+
+        # Assert
+        opened, closed = _read_all(server.writer)
+        assert opened["params"]["diagnostics"]
+        assert closed["params"] == {"uri": URI, "diagnostics": []}
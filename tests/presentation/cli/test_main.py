@@ -1,14 +1,27 @@
 """Tests for the CLI module."""
 
+import io
 import json
+import shutil
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
+import cccy
 from cccy.presentation.cli.main import main
 
 
+def _commit_all_to_new_repository() -> None:
+    """Initialize a git repository in the current directory and commit everything."""
+    author = ["-c", "user.name=cccy", "-c", "user.email=cccy@example.com"]
+    for args in (["init", "-q"], ["add", "."], [*author, "commit", "-qm", "init"]):
+        subprocess.run(["git", *args], check=True, capture_output=True)
+
+
 class TestCLI:
     """Test cases for the CLI interface."""
 
@@ -419,3 +432,435 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Cycromatic and Cognitive Complexity" in result.output
         assert "Commands:" in result.output
+
+    def test_cli_jobs_option(self) -> None:
+        """Test parallel analysis with --jobs."""
+        runner = CliRunner()
+        fixtures_dir = Path(__file__).parent / "fixtures"
+
+        serial = runner.invoke(
+            main, ["show-list", "--format", "json", str(fixtures_dir)]
+        )
+        parallel = runner.invoke(
+            main, ["show-list", "--format", "json", "--jobs", "2", str(fixtures_dir)]
+        )
+
+        assert parallel.exit_code == 0
+        assert json.loads(parallel.output) == json.loads(serial.output)
+
+    def test_cli_show_list_jsonl_matches_json(self) -> None:
+        """Test that JSON Lines output has one JSON object per file."""
+        # Arrange
+        runner = CliRunner()
+        fixtures_dir = Path(__file__).parent / "fixtures"
+
+        # Act
+        json_output = runner.invoke(
+            main, ["show-list", "--format", "json", str(fixtures_dir)]
+        )
+        jsonl_output = runner.invoke(
+            main, ["show-list", "--format", "jsonl", "--jobs", "2", str(fixtures_dir)]
+        )
+
+        # Assert
+        assert jsonl_output.exit_code == 0
+        lines = jsonl_output.output.splitlines()
+        assert [json.loads(line) for line in lines] == json.loads(json_output.output)
+
+    def test_cli_show_functions_jsonl(self) -> None:
+        """Test that JSON Lines output has one JSON object per function."""
+        # Arrange
+        runner = CliRunner()
+        fixture_path = Path(__file__).parent / "fixtures" / "simple.py"
+
+        # Act
+        json_output = runner.invoke(
+            main, ["show-functions", "--format", "json", str(fixture_path)]
+        )
+        jsonl_output = runner.invoke(
+            main, ["show-functions", "--format", "jsonl", str(fixture_path)]
+        )
+
+        # Assert
+        assert jsonl_output.exit_code == 0
+        lines = jsonl_output.output.splitlines()
+        assert [json.loads(line) for line in lines] == json.loads(json_output.output)
+
+    def test_cli_show_functions_parquet_matches_json(self) -> None:
+        """Test that Parquet output has one typed row per function."""
+        # Arrange
+        pq = pytest.importorskip("pyarrow.parquet")
+        runner = CliRunner()
+        fixtures_dir = Path(__file__).parent / "fixtures"
+
+        # Act
+        json_output = runner.invoke(
+            main, ["show-functions", "--format", "json", str(fixtures_dir)]
+        )
+        parquet_output = runner.invoke(
+            main, ["show-functions", "--format", "parquet", str(fixtures_dir)]
+        )
+
+        # Assert
+        assert parquet_output.exit_code == 0
+        table = pq.read_table(io.BytesIO(parquet_output.stdout_bytes))
+        expected = json.loads(json_output.output)
+        columns = ["file_path", "function_name", "line_number", "end_line_number"]
+        columns += ["cyclomatic_complexity", "cognitive_complexity", "file_status"]
+        assert table.select(columns).to_pylist() == expected
+
+    def test_cli_show_list_arrow(self) -> None:
+        """Test that Arrow IPC output has one row per file."""
+        # Arrange
+        ipc = pytest.importorskip("pyarrow.ipc")
+        runner = CliRunner()
+        fixture_path = Path(__file__).parent / "fixtures" / "simple.py"
+
+        # Act
+        result = runner.invoke(
+            main, ["show-list", "--format", "arrow", str(fixture_path)]
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        table = ipc.open_stream(result.stdout_bytes).read_all()
+        assert table.column("file_path").to_pylist() == [str(fixture_path)]
+
+    def test_cli_columnar_without_pyarrow(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing pyarrow is reported with the extra to install."""
+        # Arrange
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.delitem(
+            sys.modules, "cccy.infrastructure.formatters.columnar", raising=False
+        )
+        runner = CliRunner()
+        fixture_path = Path(__file__).parent / "fixtures" / "simple.py"
+
+        # Act
+        result = runner.invoke(
+            main, ["show-functions", "--format", "parquet", str(fixture_path)]
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "pip install 'cccy[arrow]'" in result.output
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["show-list", "--format", "csv"],
+            ["show-list", "--format", "jsonl"],
+            ["show-functions", "--format", "table"],
+            ["show-summary"],
+        ],
+        ids=["csv", "jsonl", "functions", "summary"],
+    )
+    def test_cli_output_file(self, tmp_path: Path, args: list[str]) -> None:
+        """Test that --output writes the same report to the file instead of stdout."""
+        # Arrange
+        runner = CliRunner()
+        fixtures_dir = str(Path(__file__).parent / "fixtures")
+        report = tmp_path / "report.txt"
+
+        # Act
+        stdout_result = runner.invoke(main, [*args, fixtures_dir])
+        file_result = runner.invoke(
+            main, [*args, "--output", str(report), fixtures_dir]
+        )
+
+        # Assert
+        assert file_result.exit_code == 0
+        assert file_result.output == ""
+        assert report.read_bytes() == stdout_result.stdout_bytes
+
+    def test_cli_output_file_parquet(self, tmp_path: Path) -> None:
+        """Test that binary output can be written with -o."""
+        # Arrange
+        pq = pytest.importorskip("pyarrow.parquet")
+        runner = CliRunner()
+        fixture_path = Path(__file__).parent / "fixtures" / "simple.py"
+        report = tmp_path / "report.parquet"
+
+        # Act
+        result = runner.invoke(
+            main,
+            ["show-list", "--format", "parquet", "-o", str(report), str(fixture_path)],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        table = pq.read_table(report)
+        assert table.column("file_path").to_pylist() == [str(fixture_path)]
+
+    def test_cli_output_file_unwritable(self, tmp_path: Path) -> None:
+        """Test that an output file that cannot be created is reported."""
+        # Arrange
+        runner = CliRunner()
+        fixture_path = Path(__file__).parent / "fixtures" / "simple.py"
+        report = tmp_path / "missing" / "report.json"
+
+        # Act
+        result = runner.invoke(
+            main,
+            ["show-list", "--format", "json", "-o", str(report), str(fixture_path)],
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert f"Cannot write {report}" in result.output
+
+    def test_cli_invalid_jobs(self) -> None:
+        """Test CLI with invalid --jobs value."""
+        runner = CliRunner()
+        fixture_path = Path(__file__).parent / "fixtures" / "simple.py"
+
+        result = runner.invoke(main, ["show-list", "--jobs", "zero", str(fixture_path)])
+
+        assert result.exit_code != 0
+        assert "Invalid value" in result.output
+
+    def test_cli_cache_commands(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --cache together with the cache stats/clear subcommands."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.chdir(tmpdir)
+            Path("pyproject.toml").write_text("[tool.cccy]\ncache-dir = 'cache'\n")
+            Path("module.py").write_text("def func(x):\n    return x\n")
+
+            first = runner.invoke(main, ["show-list", "--cache", "module.py"])
+            second = runner.invoke(main, ["show-list", "--cache", "module.py"])
+            stats = runner.invoke(main, ["cache", "stats"])
+            cleared = runner.invoke(main, ["cache", "clear"])
+
+            assert first.exit_code == 0
+            assert second.output == first.output
+            assert "Entries: 1" in stats.output
+            assert "Removed 1 cache entries." in cleared.output
+            assert not Path("cache").exists()
+
+    def test_cli_respect_gitignore(self) -> None:
+        """Test that --respect-gitignore skips files ignored by git."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            (tmpdir_path / ".gitignore").write_text("generated_*.py\n")
+            (tmpdir_path / "module.py").write_text("def func():\n    pass\n")
+            (tmpdir_path / "generated_api.py").write_text("def gen():\n    pass\n")
+
+            default = runner.invoke(main, ["show-list", str(tmpdir_path)])
+            respected = runner.invoke(
+                main, ["show-list", "--respect-gitignore", str(tmpdir_path)]
+            )
+
+            assert "generated_api.py" in default.output
+            assert respected.exit_code == 0
+            assert "module.py" in respected.output
+            assert "generated_api.py" not in respected.output
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+    def test_cli_changed_since(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that --changed-since and --staged analyze only changed files."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            monkeypatch.chdir(tmpdir_path)
+            for name in ["changed.py", "unchanged.py"]:
+                (tmpdir_path / name).write_text("def func():\n    pass\n")
+            _commit_all_to_new_repository()
+            (tmpdir_path / "changed.py").write_text("def func(x):\n    return x\n")
+
+            changed = runner.invoke(main, ["show-list", "--changed-since", "HEAD", "."])
+            staged = runner.invoke(
+                main, ["check", "--max-complexity", "5", "--staged", "."]
+            )
+            invalid = runner.invoke(main, ["show-list", "--changed-since", "nope", "."])
+
+            assert changed.exit_code == 0
+            assert "changed.py" in changed.output
+            assert "unchanged.py" not in changed.output
+            assert staged.exit_code == 0
+            assert "No changed Python files to analyze." in staged.output
+            assert invalid.exit_code == 1
+            assert "Error: git diff failed" in invalid.output
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+    def test_check_diff_reports_only_touched_functions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that check --diff ignores violations in untouched functions."""
+        runner = CliRunner()
+        body = "    if x:\n        if x > 1:\n            return 1\n    return {}\n"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            monkeypatch.chdir(tmpdir_path)
+            module = tmpdir_path / "module.py"
+            legacy = "def legacy(x):\n" + body.format(0)
+            module.write_text(f"{legacy}\n\ndef touched(x):\n{body.format(0)}")
+            _commit_all_to_new_repository()
+            module.write_text(f"{legacy}\n\ndef touched(x):\n{body.format(2)}")
+
+            result = runner.invoke(
+                main, ["check", "--max-complexity", "1", "--diff", "HEAD", "."]
+            )
+            conflicting = runner.invoke(
+                main,
+                [
+                    "check",
+                    "--max-complexity",
+                    "1",
+                    "--diff",
+                    "HEAD",
+                    "--changed-since",
+                    "HEAD",
+                    ".",
+                ],
+            )
+
+            assert result.exit_code == 1
+            assert "touched()" in result.output
+            assert "legacy()" not in result.output
+            assert conflicting.exit_code == 2
+            assert (
+                "--diff cannot be combined with --changed-since" in conflicting.output
+            )
+
+    def test_check_fail_fast_stops_at_first_violation(self) -> None:
+        """Test that check --fail-fast reports the files checked before the stop."""
+        # Arrange
+        runner = CliRunner()
+        complex_body = (
+            "    if x:\n        if x > 1:\n            return 1\n    return 0\n"
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            (tmpdir_path / "a_simple.py").write_text("def ok():\n    return 1\n")
+            for name in ("b_complex", "c_complex", "d_complex"):
+                (tmpdir_path / f"{name}.py").write_text(f"def f(x):\n{complex_body}")
+            args = ["check", "--max-complexity", "2", "--jobs", "2", tmpdir]
+
+            # Act
+            fail_fast = runner.invoke(main, [*args, "--fail-fast"])
+            two_failures = runner.invoke(main, [*args, "--max-failures", "2"])
+
+            # Assert
+            assert fail_fast.exit_code == 1
+            assert "Stopped after 1 failing file(s); 2 file(s) checked" in (
+                fail_fast.output
+            )
+            assert "a_simple.py" in fail_fast.output
+            assert "b_complex.py" in fail_fast.output
+            assert "c_complex.py" not in fail_fast.output
+            assert two_failures.exit_code == 1
+            assert "c_complex.py" in two_failures.output
+            assert "d_complex.py" not in two_failures.output
+
+    def test_check_max_failures_not_reached(self) -> None:
+        """Test that check --max-failures passes when no file violates."""
+        # Arrange
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "module.py").write_text("def ok():\n    return 1\n")
+
+            args = ["check", "--max-complexity", "5", "--max-failures", "3", tmpdir]
+
+            # Act
+            result = runner.invoke(main, args)
+            conflicting = runner.invoke(main, [*args, "--fail-fast"])
+
+            # Assert
+            assert result.exit_code == 0
+            assert "All 1 files passed complexity check!" in result.output
+            assert conflicting.exit_code == 2
+            assert "--fail-fast cannot be combined with --max-failures" in (
+                conflicting.output
+            )
+
+    def test_cli_engine_option(self) -> None:
+        """Test that both complexity engines produce the same report."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "module.py"
+            file_path.write_text(
+                "def func(x):\n    if x and x > 1:\n        return 1\n    return 0\n"
+            )
+
+            builtin = runner.invoke(main, ["show-functions", str(file_path)])
+            library = runner.invoke(
+                main, ["show-functions", "--engine", "library", str(file_path)]
+            )
+            invalid = runner.invoke(
+                main, ["show-functions", "--engine", "other", str(file_path)]
+            )
+
+            assert builtin.exit_code == 0
+            assert library.exit_code == 0
+            assert library.output == builtin.output
+            assert invalid.exit_code != 0
+
+
+class TestStartupImports:
+    """Test cases for the modules imported at CLI startup."""
+
+    @staticmethod
+    def _imported_modules(*args: str) -> set[str]:
+        """Run the CLI in a fresh interpreter and return the imported modules."""
+        code = (
+            "import sys\n"
+            "from cccy.presentation.cli.main import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(' '.join(sys.modules), file=sys.stderr)\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code, *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return set(completed.stderr.split())
+
+    def test_help_imports_no_analysis_dependencies(self) -> None:
+        """Test that --help does not import pydantic or the formatting libraries."""
+        modules = self._imported_modules("--help")
+
+        assert "click" in modules
+        assert not modules & {
+            "pydantic",
+            "pydantic_settings",
+            "tabulate",
+            "mccabe",
+            "cognitive_complexity",
+        }
+
+    def test_single_file_check_imports_no_optional_dependencies(self) -> None:
+        """Test that check with the builtin engine skips unused libraries."""
+        fixture = Path(__file__).parent / "fixtures" / "simple.py"
+        modules = self._imported_modules(
+            "check", "--max-complexity", "99", str(fixture)
+        )
+
+        assert "cccy.infrastructure.calculators.fused_calculator" in modules
+        assert not modules & {
+            "tabulate",
+            "mccabe",
+            "cognitive_complexity",
+            "concurrent.futures.process",
+        }
+
+    def test_public_api_is_imported_lazily(self) -> None:
+        """Test the lazy package exports."""
+        assert cccy.FileComplexityResult.__name__ == "FileComplexityResult"
+        assert "ComplexityAnalyzer" in dir(cccy)
+        with pytest.raises(AttributeError):
+            _ = cccy.NoSuchName
@@ -0,0 +1,171 @@
+"""Tests for the --shard option and the merge-reports command."""
+
+import json
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cccy.presentation.cli.main import main
+
+SIMPLE = "def simple(x):\n    return x\n"
+COMPLEX = "def complex_one(x):\n" + "".join(
+    f"    if x == {index}:\n        return {index}\n" for index in range(12)
+)
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory with several modules, one of them too complex."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        for index in range(6):
+            (root / f"module_{index}.py").write_text(SIMPLE * (index + 1))
+        (root / "complex.py").write_text(COMPLEX)
+        yield root
+
+
+def _write_shard_reports(project: Path, count: int) -> list[str]:
+    """Run show-list for every shard and write the JSON reports."""
+    runner = CliRunner()
+    reports = []
+    for number in range(1, count + 1):
+        result = runner.invoke(
+            main,
+            [
+                "show-list",
+                "--shard",
+                f"{number}/{count}",
+                "--format",
+                "json",
+                str(project),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        report = project.parent / f"{project.name}-part{number}.json"
+        report.write_text(result.output)
+        reports.append(str(report))
+    return reports
+
+
+class TestShardOption:
+    """Test cases for the --shard option."""
+
+    def test_shards_cover_all_files_once(self, project: Path) -> None:
+        """Test that the shard reports together contain every file once."""
+        # Arrange
+        reports = _write_shard_reports(project, 3)
+
+        # Act
+        paths = [
+            entry["file_path"]
+            for report in reports
+            for entry in json.loads(Path(report).read_text())
+        ]
+
+        # Assert
+        assert len(paths) == len(set(paths)) == 7
+
+    def test_check_with_empty_shard_passes(self, project: Path) -> None:
+        """Test that a shard without files is not an error."""
+        # Act
+        result = CliRunner().invoke(
+            main, ["check", "--max-complexity", "10", "--shard", "8/8", str(project)]
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "All 0 files passed" in result.output
+
+    def test_rejects_invalid_shard(self, project: Path) -> None:
+        """Test that a shard outside of 1..COUNT is a usage error."""
+        # Act
+        result = CliRunner().invoke(main, ["show-list", "--shard", "0/2", str(project)])
+
+        # Assert
+        assert result.exit_code == 2
+        assert "--shard" in result.output
+
+
+class TestMergeReports:
+    """Test cases for the merge-reports command."""
+
+    def test_merged_report_matches_unsharded_run(self, project: Path) -> None:
+        """Test that merging the shard reports gives the unsharded result."""
+        # Arrange
+        reports = _write_shard_reports(project, 3)
+        runner = CliRunner()
+        full = runner.invoke(main, ["show-list", "--format", "json", str(project)])
+
+        # Act
+        merged = runner.invoke(main, ["merge-reports", "--format", "json", *reports])
+
+        # Assert
+        assert merged.exit_code == 0, merged.output
+        assert json.loads(merged.output) == json.loads(full.output)
+
+    def test_summary_counts_each_file_once(self, project: Path) -> None:
+        """Test that a report given twice does not inflate the summary."""
+        # Arrange
+        reports = _write_shard_reports(project, 2)
+
+        # Act
+        result = CliRunner().invoke(
+            main, ["merge-reports", "--format", "summary", *reports, reports[0]]
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "Analyzed 7 files" in result.output
+
+    def test_check_fails_on_violations(self, project: Path) -> None:
+        """Test that --check exits with 1 when a merged file exceeds the limits."""
+        # Arrange
+        reports = _write_shard_reports(project, 2)
+
+        # Act
+        result = CliRunner().invoke(
+            main, ["merge-reports", "--check", "--max-complexity", "10", *reports]
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "complex.py" in result.output
+        assert "1 out of 7 files failed" in result.output
+
+    def test_check_passes_within_limits(self, project: Path) -> None:
+        """Test that --check exits with 0 when every file is within the limits."""
+        # Arrange
+        reports = _write_shard_reports(project, 2)
+
+        # Act
+        result = CliRunner().invoke(
+            main,
+            [
+                "merge-reports",
+                "--check",
+                "--max-complexity",
+                "20",
+                "--max-cognitive",
+                "20",
+                *reports,
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "All 7 files passed" in result.output
+
+    def test_rejects_invalid_report(self, project: Path) -> None:
+        """Test that a file that is not a report is an error."""
+        # Arrange
+        report = project / "module_0.py"
+
+        # Act
+        result = CliRunner().invoke(main, ["merge-reports", str(report)])
+
+        # Assert
+        assert result.exit_code == 1
+        assert "not a file-level JSON report" in result.output
@@ -0,0 +1,86 @@
+"""Tests for the --profile option."""
+
+import pstats
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cccy.presentation.cli.helpers import profile_paths
+from cccy.presentation.cli.main import main
+
+COMPLEX = "def complex_one(x):\n" + "".join(
+    f"    if x == {index}:\n        return {index}\n" for index in range(12)
+)
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory with modules to analyze and a place for profiles."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "src").mkdir()
+        for index in range(4):
+            (root / "src" / f"module_{index}.py").write_text(COMPLEX)
+        yield root
+
+
+class TestProfileOption:
+    """Test cases for the --profile option."""
+
+    def test_profile_paths(self) -> None:
+        """Test that the .pstats suffix may be given or omitted."""
+        assert profile_paths("out") == ("out.pstats", "out.collapsed")
+        assert profile_paths("dir/out.pstats") == (
+            "dir/out.pstats",
+            "dir/out.collapsed",
+        )
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_writes_pstats_and_collapsed_stacks(self, project: Path, jobs: str) -> None:
+        """Test that the whole command is profiled, including the workers."""
+        # Arrange
+        out = project / "profile"
+
+        # Act
+        result = CliRunner().invoke(
+            main,
+            ["show-list", "--jobs", jobs, "--profile", str(out), str(project / "src")],
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "Profile written to" in result.output
+        functions = {
+            name
+            for _, _, name in pstats.Stats(f"{out}.pstats").stats  # type: ignore[attr-defined]
+        }
+        assert {"load_and_merge_config", "analyze_file_record"} <= functions
+        lines = Path(f"{out}.collapsed").read_text().splitlines()
+        assert lines
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_failed_check_still_writes_the_profile(self, project: Path) -> None:
+        """Test that the profile is written even when the check fails."""
+        # Arrange
+        out = project / "check.pstats"
+
+        # Act
+        result = CliRunner().invoke(
+            main,
+            [
+                "check",
+                "--max-complexity",
+                "5",
+                "--profile",
+                str(out),
+                str(project / "src"),
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert out.exists()
+        assert (project / "check.collapsed").exists()
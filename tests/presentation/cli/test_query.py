@@ -0,0 +1,211 @@
+"""Tests for the --db option and the query commands."""
+
+import json
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cccy.presentation.cli.main import main
+
+SIMPLE = "def simple(x):\n    return x\n"
+COMPLEX = "def complex_one(x):\n" + "".join(
+    f"    if x == {index}:\n        return {index}\n" for index in range(12)
+)
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory with a simple and a complex module."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "simple.py").write_text(SIMPLE)
+        (root / "complex.py").write_text(COMPLEX)
+        yield root
+
+
+def _invoke(*args: str) -> tuple[int, str]:
+    result = CliRunner().invoke(main, list(args))
+    return result.exit_code, result.output
+
+
+def _query(db: Path, *args: str) -> list[dict[str, object]]:
+    exit_code, output = _invoke("query", *args, "--db", str(db), "--format", "json")
+    assert exit_code == 0, output
+    return json.loads(output)  # type: ignore[no-any-return]
+
+
+class TestDbOption:
+    """Test cases for recording runs with --db."""
+
+    def test_check_records_a_failing_run(self, project: Path) -> None:
+        """Test that check records the run even when it exits with violations."""
+        # Arrange
+        db = project / "results.sqlite"
+
+        # Act
+        exit_code, output = _invoke(
+            "check", "--max-complexity", "10", "--db", str(db), str(project)
+        )
+
+        # Assert
+        assert exit_code == 1
+        assert f"Recorded run 1 (2 files) in {db}" in output
+        (run,) = _query(db, "runs")
+        assert (run["command"], run["engine"], run["file_count"]) == (
+            "check",
+            "builtin",
+            2,
+        )
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["show-list", "--format", "jsonl"],
+            ["show-functions", "--format", "jsonl"],
+            ["show-summary"],
+            ["show-list", "--jobs", "2"],
+        ],
+    )
+    def test_show_commands_record_runs(self, project: Path, args: list[str]) -> None:
+        """Test that listed and streamed results are both recorded."""
+        # Arrange
+        db = project / "results.sqlite"
+
+        # Act
+        exit_code, output = _invoke(*args, "--db", str(db), str(project))
+
+        # Assert
+        assert exit_code == 0, output
+        (run,) = _query(db, "runs")
+        assert (run["file_count"], run["function_count"]) == (2, 2)
+
+    def test_stopped_run_is_not_recorded(self, project: Path) -> None:
+        """Test that a run cut short by --fail-fast leaves no partial run."""
+        # Arrange
+        db = project / "results.sqlite"
+        (project / "complex_too.py").write_text(COMPLEX)
+
+        # Act
+        exit_code, _ = _invoke(
+            "check",
+            "--max-complexity",
+            "10",
+            "--fail-fast",
+            "--db",
+            str(db),
+            str(project),
+        )
+
+        # Assert
+        assert exit_code == 1
+        assert not db.exists()
+
+    def test_merge_reports_records_the_merged_run(self, project: Path) -> None:
+        """Test that merge-reports records the combined results."""
+        # Arrange
+        db = project / "results.sqlite"
+        report = project / "report.json"
+        _, output = _invoke("show-list", "--format", "json", str(project))
+        report.write_text(output)
+
+        # Act
+        exit_code, output = _invoke(
+            "merge-reports", "--format", "summary", "--db", str(db), str(report)
+        )
+
+        # Assert
+        assert exit_code == 0, output
+        (run,) = _query(db, "runs")
+        assert (run["command"], run["engine"], run["file_count"]) == (
+            "merge-reports",
+            "",
+            2,
+        )
+
+    def test_unusable_database_is_an_error(self, project: Path) -> None:
+        """Test that a file that is not a database fails the command."""
+        # Arrange
+        db = project / "results.sqlite"
+        db.write_text("not a database\n" * 100)
+
+        # Act
+        exit_code, output = _invoke("show-summary", "--db", str(db), str(project))
+
+        # Assert
+        assert exit_code == 1
+        assert f"Error: {db}:" in output
+
+
+class TestQueryCommands:
+    """Test cases for the query commands."""
+
+    @pytest.fixture
+    def db(self, project: Path) -> Path:
+        """Provide a database with two runs, the second with a simpler module."""
+        db = project / "results.sqlite"
+        _invoke("show-list", "--db", str(db), str(project))
+        (project / "complex.py").write_text(SIMPLE.replace("simple", "complex_one"))
+        _invoke("show-list", "--db", str(db), str(project))
+        return db
+
+    def test_runs_newest_first(self, db: Path) -> None:
+        """Test listing the recorded runs."""
+        # Act
+        runs = _query(db, "runs", "--limit", "1")
+
+        # Assert
+        assert [run["run_id"] for run in runs] == [2]
+
+    def test_top_functions(self, db: Path) -> None:
+        """Test ranking the functions of the latest and of an earlier run."""
+        # Act
+        latest = _query(db, "top-functions", "-n", "1")
+        earlier = _query(db, "top-functions", "-n", "1", "--run", "1")
+
+        # Assert
+        assert latest[0]["cyclomatic_complexity"] == 1
+        assert (earlier[0]["name"], earlier[0]["cyclomatic_complexity"]) == (
+            "complex_one",
+            13,
+        )
+
+    def test_files_over(self, db: Path) -> None:
+        """Test selecting the files over a threshold."""
+        # Act
+        latest = _query(db, "files-over", "--threshold", "10")
+        earlier = _query(db, "files-over", "--threshold", "10", "--run", "1")
+
+        # Assert
+        assert latest == []
+        assert [Path(str(row["file_path"])).name for row in earlier] == ["complex.py"]
+
+    def test_history(self, db: Path) -> None:
+        """Test following one function across runs."""
+        # Act
+        history = _query(db, "history", "complex_one")
+
+        # Assert
+        assert [row["cyclomatic_complexity"] for row in history] == [13, 1]
+
+    def test_table_output(self, db: Path) -> None:
+        """Test that the default output is a table with the column names."""
+        # Act
+        exit_code, output = _invoke("query", "runs", "--db", str(db))
+
+        # Assert
+        assert exit_code == 0
+        assert "function_count" in output
+
+    def test_missing_database(self, project: Path) -> None:
+        """Test that querying a database that does not exist is a usage error."""
+        # Act
+        exit_code, output = _invoke(
+            "query", "runs", "--db", str(project / "missing.sqlite")
+        )
+
+        # Assert
+        assert exit_code == 2
+        assert "does not exist" in output
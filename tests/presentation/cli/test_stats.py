@@ -0,0 +1,87 @@
+"""Tests for the --stats and --stats-file options."""
+
+import json
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from cccy.presentation.cli.main import main
+
+COMPLEX = "def complex_one(x):\n" + "".join(
+    f"    if x == {index}:\n        return {index}\n" for index in range(12)
+)
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory with a simple and a too complex module."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        (root / "simple.py").write_text("def simple(x):\n    return x\n")
+        (root / "complex.py").write_text(COMPLEX)
+        yield root
+
+
+class TestStatsOption:
+    """Test cases for the --stats option."""
+
+    @pytest.mark.parametrize("command", ["show-list", "show-functions", "show-summary"])
+    def test_stats_are_reported(self, project: Path, command: str) -> None:
+        """Test that the statistics follow the normal output."""
+        # Arrange
+        runner = CliRunner()
+
+        # Act
+        result = runner.invoke(main, [command, "--stats", str(project)])
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "Statistics:" in result.output
+        assert "complex.py" in result.output
+
+    def test_failed_check_still_reports_stats(self, project: Path) -> None:
+        """Test that statistics are reported even when the check fails."""
+        # Arrange
+        runner = CliRunner()
+
+        # Act
+        result = runner.invoke(
+            main, ["check", "--max-complexity", "5", "--stats", str(project)]
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "Statistics:" in result.output
+
+    def test_stats_file_is_json(self, project: Path) -> None:
+        """Test that --stats-file writes the statistics as JSON."""
+        # Arrange
+        runner = CliRunner()
+        stats_file = project.parent / f"{project.name}-stats.json"
+
+        # Act
+        result = runner.invoke(
+            main,
+            ["show-list", "--stats-file", str(stats_file), str(project)],
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        assert "Statistics:" not in result.output
+        report = json.loads(stats_file.read_text())
+        stats_file.unlink()
+        assert (report["files"], report["functions"]) == (2, 2)
+        assert report["phases"]["parse"]["wall_seconds"] > 0
+        assert report["phases"]["output"]["wall_seconds"] > 0
+
+    def test_without_stats_nothing_is_reported(self, project: Path) -> None:
+        """Test that no statistics are printed by default."""
+        # Act
+        result = CliRunner().invoke(main, ["show-summary", str(project)])
+
+        # Assert
+        assert result.exit_code == 0
+        assert "Statistics:" not in result.output
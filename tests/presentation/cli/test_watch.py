@@ -0,0 +1,137 @@
+"""Tests for the watch command."""
+
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from click.testing import CliRunner
+
+from cccy.domain.interfaces.watchers import FileWatcher
+from cccy.presentation.cli.main import main
+from cccy.presentation.factories import service_factory
+
+FIXTURE = Path(__file__).parent / "fixtures" / "simple.py"
+
+
+class _InterruptingWatcher(FileWatcher):
+    """Watcher that reports the prepared changes and then stops the command."""
+
+    def __init__(self, batches: list[set[Path]]) -> None:
+        self.batches = batches
+        self.closed = False
+
+    def read_changes(self, timeout: Optional[float] = None) -> set[Path]:  # noqa: ARG002
+        if not self.batches:
+            raise KeyboardInterrupt
+        return self.batches.pop(0)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _DeletingWatcher(_InterruptingWatcher):
+    """Watcher that deletes a file once the command waits for changes."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__([{path}, set()])
+        self.path = path
+
+    def read_changes(self, timeout: Optional[float] = None) -> set[Path]:
+        if self.path.exists():
+            self.path.unlink()
+        return super().read_changes(timeout)
+
+
+@pytest.fixture
+def project() -> Iterator[Path]:
+    """Provide a directory containing the simple fixture."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir).resolve()
+        shutil.copy(FIXTURE, root / "simple.py")
+        yield root
+
+
+class TestWatchCommand:
+    """Test cases for the watch command."""
+
+    def test_renders_initial_and_updated_results(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only the changed rows are rendered again until interrupted."""
+        # Arrange
+        added = project / "added.py"
+        watcher = _InterruptingWatcher([{added}, set()])
+        monkeypatch.setattr(service_factory, "_create_file_watcher", lambda *_: watcher)
+        added.write_text("def added():\n    pass\n")
+
+        # Act
+        result = CliRunner().invoke(main, ["watch", str(project)])
+
+        # Assert
+        assert result.exit_code == 0
+        assert result.output.count("simple.py") == 1
+        assert result.output.count("added.py") == 2
+        assert "Analyzed 2 files" in result.output
+        assert "Re-analyzed 1 files, removed 0" in result.output
+        assert "Stopped watching." in result.output
+        assert watcher.closed
+
+    @pytest.mark.parametrize(
+        ("output_format", "expected"),
+        [("table", "Removed: {}"), ("summary", "Analyzed 1 files with")],
+    )
+    def test_renders_removed_files(
+        self,
+        project: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        output_format: str,
+        expected: str,
+    ) -> None:
+        """Test that table lists removed files and summary is rendered again."""
+        # Arrange
+        removed = project / "removed.py"
+        removed.write_text("def removed():\n    pass\n")
+        watcher = _DeletingWatcher(removed)
+        monkeypatch.setattr(service_factory, "_create_file_watcher", lambda *_: watcher)
+
+        # Act
+        args = ["watch", "--format", output_format, str(project)]
+        result = CliRunner().invoke(main, args)
+
+        # Assert
+        assert result.exit_code == 0
+        assert "Re-analyzed 0 files, removed 1" in result.output
+        assert expected.format(removed) in result.output
+
+    def test_polling_options_are_passed_to_factory(
+        self, project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --poll selects the polling interval."""
+        # Arrange
+        calls = []
+
+        def create_watcher(*args: object) -> FileWatcher:
+            calls.append(args)
+            return _InterruptingWatcher([])
+
+        monkeypatch.setattr(service_factory, "_create_file_watcher", create_watcher)
+
+        # Act
+        args = ["--poll", "--poll-interval", "0.5", "--format", "summary"]
+        result = CliRunner().invoke(main, ["watch", *args, str(project)])
+
+        # Assert
+        assert result.exit_code == 0
+        assert calls == [([project], True, 0.5)]
+
+    def test_rejects_changed_since(self) -> None:
+        """Test that the git change filters are rejected."""
+        # Act
+        result = CliRunner().invoke(main, ["watch", "--staged", str(FIXTURE)])
+
+        # Assert
+        assert result.exit_code == 2
+        assert "cannot be used with watch" in result.output